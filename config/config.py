@@ -10,6 +10,11 @@ class Settings:
     HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
     IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", "0"))
     PAGELOAD_TIMEOUT = int(os.getenv("PAGELOAD_TIMEOUT", "30"))
+    # API del backend (la colección de Postman usa {{base_url}} = .../api)
+    API_URL = os.getenv("API_URL", "")
+    # Clave de localStorage donde la SPA guarda el token (login por API)
+    SESSION_TOKEN_KEY = os.getenv("SESSION_TOKEN_KEY", "token")
+    SESSION_CACHE_TTL = int(os.getenv("SESSION_CACHE_TTL", "1800"))
 
 # >>> esta variable debe existir <<<
 settings = Settings()
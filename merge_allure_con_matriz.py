@@ -1,5 +1,10 @@
+import argparse
 import json
+import os
 import re
+import sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -16,13 +21,16 @@ HOJA_MATRIZ = "MATRIZ DE CASOS DE PRUEBA"
 # Debe coincidir con el --alluredir que usas en pytest
 ALLURE_DIR = "allure-results_prueba"
 
-# Archivo JSON generado por Newman (API)
-# Debe coincidir con el --reporter-json-export que uses
+# Archivo JSON generado por Newman (API). Solo se usa si en ALLURE_DIR no hay
+# resultados de tests/api (la colección ejecutada desde pytest, label layer=api)
 NEWMAN_JSON = "api_test/reports/newman/newman_results_sin_contratacion.json"
 
 # Archivo de salida (nuevo Excel con todas las columnas adicionales)
 OUTPUT_FILE = "MATRIZ_DE_PRUEBAS_CON_AUTOMATIZACION.xlsx"
 
+# Índice local del modo --incremental (archivos ya leídos y último resumen escrito)
+INDEX_DB = "merge_allure_index.sqlite"
+
 # =================================================
 
 
@@ -45,68 +53,97 @@ def infer_cp_from_text(text: str) -> str | None:
     return f"CP_{num:02d}"
 
 
-# ================= ALLURE (UI / SELENIUM) =================
+def inferir_cp(textos: pd.Series) -> pd.Series:
+    """
+    Versión vectorizada de infer_cp_from_text sobre una columna completa
+    (str.extract): CP_XX o NaN si el texto no tiene cpXX.
+    """
+    num = textos.fillna("").astype(str).str.extract(CP_REGEX, expand=False)
+    cp = "CP_" + num.str.lstrip("0").replace("", "0").str.zfill(2)
+    return cp.where(num.notna())
 
 
-def leer_resultados_allure(allure_dir: str) -> pd.DataFrame:
+# Estado de un CP con varias ejecuciones: gana el peor (FAILED > PASSED > SKIPPED)
+ESTADOS_RESUMEN = ["SKIPPED", "PASSED", "FAILED"]
+
+
+def resumir_por_cp(df: pd.DataFrame, duracion: str, status: str, failed: str, passed: str,
+                   col_tiempo: str, col_resultado: str) -> pd.DataFrame:
     """
-    Lee todos los archivos *-result.json de la carpeta de Allure y construye un DataFrame
-    con los tests de UI, incluyendo un ID_CASO inferido a partir de cpXX en fullName/name
-    y propagado por suite cuando aplica.
+    Suma de duraciones y estado resumido por ID_CASO en un solo groupby
+    nativo: el estado se convierte a un rango ordinal (failed=2, passed=1,
+    cualquier otro=0), se toma el máximo por grupo y se vuelve a la etiqueta.
     """
-    rows = []
-    allure_path = Path(allure_dir)
+    rango = (df[status] == failed).astype("int8") * 2 + (df[status] == passed).astype("int8")
+    agg = (
+        df.assign(_rango=rango)
+        .groupby("ID_CASO")
+        .agg(**{col_tiempo: (duracion, "sum"), col_resultado: ("_rango", "max")})
+        .reset_index()
+    )
+    agg[col_resultado] = pd.Categorical.from_codes(agg[col_resultado], ESTADOS_RESUMEN).astype(str)
+    return agg
 
-    if not allure_path.exists():
-        raise FileNotFoundError(f"No se encontró la carpeta {allure_dir}")
 
-    for result_file in allure_path.glob("*-result.json"):
-        with open(result_file, encoding="utf-8") as f:
-            data = json.load(f)
+# ================= ALLURE (UI / SELENIUM) =================
 
-        labels = {
-            label.get("name"): label.get("value")
-            for label in data.get("labels", [])
-            if "name" in label and "value" in label
-        }
 
-        suite = labels.get("suite", "")          # p.ej. 'test_02_create_multiple_users'
-        status = data.get("status")              # passed / failed / skipped
-        name = data.get("name") or ""            # nombre lógico del test
-        full_name = data.get("fullName") or ""   # p.ej. 'functional.test_02...#test_cp03...'
+def _labels(data: dict) -> dict:
+    return {
+        label.get("name"): label.get("value")
+        for label in data.get("labels", [])
+        if "name" in label and "value" in label
+    }
 
-        start = data.get("start")
-        stop = data.get("stop")
 
-        if start is None or stop is None:
-            # Sin tiempos no podemos calcular duración
-            continue
+def fila_ui(data: dict, file_name: str) -> dict | None:
+    """
+    Fila de un *-result.json de UI (None si es de API o no tiene tiempos).
+    """
+    labels = _labels(data)
 
-        duration_sec = (stop - start) / 1000.0
+    if labels.get("layer") == "api":
+        # Requests de la colección de Postman: se leen en leer_ejecuciones_api_allure
+        return None
 
-        # Primera inferencia de CP: priorizar fullName y luego name
-        cp_raw = infer_cp_from_text(full_name)
-        if cp_raw is None:
-            cp_raw = infer_cp_from_text(name)
+    suite = labels.get("suite", "")          # p.ej. 'test_02_create_multiple_users'
+    status = data.get("status")              # passed / failed / skipped
+    name = data.get("name") or ""            # nombre lógico del test
+    full_name = data.get("fullName") or ""   # p.ej. 'functional.test_02...#test_cp03...'
 
-        rows.append(
-            {
-                "file": result_file.name,
-                "suite": suite,
-                "fullName": full_name,
-                "ID_CASO_RAW": cp_raw,  # CP detectado directamente por cpXX (si existe)
-                "test_name": name,
-                "status": status,
-                "duration_sec": duration_sec,
-            }
-        )
+    start = data.get("start")
+    stop = data.get("stop")
+
+    if start is None or stop is None:
+        # Sin tiempos no podemos calcular duración
+        return None
+
+    duration_sec = (stop - start) / 1000.0
+
+    # El CP (ID_CASO_RAW) se infiere después, sobre la columna completa
+    return {
+        "file": file_name,
+        "suite": suite,
+        "fullName": full_name,
+        "test_name": name,
+        "status": status,
+        "duration_sec": duration_sec,
+        "start": start,                      # epoch ms (historial de rendimiento)
+    }
 
-    if not rows:
-        return pd.DataFrame()
 
-    df = pd.DataFrame(rows)
+def propagar_cp_por_suite(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agrega ID_CASO_RAW (cpXX en fullName y, si no hay, en el nombre del test)
+    e ID_CASO: ese CP o, si no hay, el único CP de su suite (archivo) cuando
+    esa suite tiene exactamente uno.
+    """
+    cp_raw = inferir_cp(df["fullName"]).fillna(inferir_cp(df["test_name"]))
+    if "ID_CASO_RAW" in df.columns:
+        df["ID_CASO_RAW"] = cp_raw
+    else:
+        df.insert(df.columns.get_loc("fullName") + 1, "ID_CASO_RAW", cp_raw)
 
-    # Propagar CP por archivo (suite) cuando hay exactamente un CP en esa suite
     suite_to_cps = (
         df.dropna(subset=["ID_CASO_RAW"])
         .groupby("suite")["ID_CASO_RAW"]
@@ -125,6 +162,32 @@ def leer_resultados_allure(allure_dir: str) -> pd.DataFrame:
     return df
 
 
+def leer_resultados_allure(allure_dir: str) -> pd.DataFrame:
+    """
+    Lee todos los archivos *-result.json de la carpeta de Allure y construye un DataFrame
+    con los tests de UI, incluyendo un ID_CASO inferido a partir de cpXX en fullName/name
+    y propagado por suite cuando aplica.
+    """
+    rows = []
+    allure_path = Path(allure_dir)
+
+    if not allure_path.exists():
+        raise FileNotFoundError(f"No se encontró la carpeta {allure_dir}")
+
+    for result_file in allure_path.glob("*-result.json"):
+        with open(result_file, encoding="utf-8") as f:
+            data = json.load(f)
+
+        row = fila_ui(data, result_file.name)
+        if row is not None:
+            rows.append(row)
+
+    if not rows:
+        return pd.DataFrame()
+
+    return propagar_cp_por_suite(pd.DataFrame(rows))
+
+
 def resumir_allure_por_cp(df_results: pd.DataFrame) -> pd.DataFrame:
     """
     A partir del DataFrame de resultados de Allure, agrupa por ID_CASO y devuelve:
@@ -136,24 +199,11 @@ def resumir_allure_por_cp(df_results: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame()
 
-    def resumen_status(series: pd.Series) -> str:
-        if (series == "failed").any():
-            return "FAILED"
-        if (series == "passed").any():
-            return "PASSED"
-        return "SKIPPED"
-
-    agg = (
-        df.groupby("ID_CASO")
-        .agg(
-            Tiempo_Ejecucion_Automatizada_seg=("duration_sec", "sum"),
-            Resultado_Automatizado=("status", resumen_status),
-        )
-        .reset_index()
+    return resumir_por_cp(
+        df, "duration_sec", "status", failed="failed", passed="passed",
+        col_tiempo="Tiempo_Ejecucion_Automatizada_seg", col_resultado="Resultado_Automatizado",
     )
 
-    return agg
-
 
 # ================= NEWMAN (API) =================
 
@@ -168,6 +218,7 @@ def leer_ejecuciones_newman(json_path: str) -> pd.DataFrame:
     - request_name
     - status_api (PASSED/FAILED)
     - duration_api_sec
+    - start (inicio de la corrida, epoch ms)
     """
     path = Path(json_path)
     if not path.exists():
@@ -177,17 +228,13 @@ def leer_ejecuciones_newman(json_path: str) -> pd.DataFrame:
         data = json.load(f)
 
     executions = data.get("run", {}).get("executions", [])
+    started = (data.get("run", {}).get("timings") or {}).get("started")
     rows = []
 
     for exec_ in executions:
         item = exec_.get("item", {}) or {}
         name = item.get("name", "") or ""
 
-        cp_id = infer_cp_from_text(name)
-        if cp_id is None:
-            # Si la request no tiene CP en el nombre, no la consideramos
-            continue
-
         assertions = exec_.get("assertions", []) or []
         failed = any(a.get("error") for a in assertions)
         status = "FAILED" if failed else "PASSED"
@@ -198,17 +245,98 @@ def leer_ejecuciones_newman(json_path: str) -> pd.DataFrame:
 
         rows.append(
             {
-                "ID_CASO": cp_id,
                 "request_name": name,
                 "status_api": status,
                 "duration_api_sec": duration_sec,
+                "start": started,
             }
         )
 
     if not rows:
         return pd.DataFrame()
 
-    return pd.DataFrame(rows)
+    # Si la request no tiene CP en el nombre, no la consideramos
+    return asignar_cp_api(pd.DataFrame(rows))
+
+
+def asignar_cp_api(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agrega ID_CASO (cpXX en request_name) como primera columna y descarta
+    las requests sin CP.
+    """
+    if df.empty:
+        return pd.DataFrame()
+
+    cp = inferir_cp(df["request_name"])
+    df = df[cp.notna()].reset_index(drop=True)
+    if df.empty:
+        return pd.DataFrame()
+
+    cp = cp.dropna().reset_index(drop=True)
+    if "ID_CASO" in df.columns:
+        df["ID_CASO"] = cp
+    else:
+        df.insert(0, "ID_CASO", cp)
+    return df
+
+
+def fila_api(data: dict) -> dict | None:
+    """
+    Fila de un *-result.json de tests/api (label layer=api). El CP se asigna
+    después con asignar_cp_api, sobre la columna completa.
+
+    La duración es la de la request (label elapsed_sec), no start/stop del
+    test: las carpetas se ejecutan antes (postman_prefetch) y el test solo
+    lee el resultado. start/stop queda para resultados sin ese label.
+    """
+    labels = _labels(data)
+    if labels.get("layer") != "api":
+        return None
+
+    name = data.get("name") or ""
+
+    status = (data.get("status") or "").upper()
+    if status == "BROKEN":
+        status = "FAILED"
+
+    start = data.get("start")
+    stop = data.get("stop")
+    if labels.get("elapsed_sec") is not None:
+        duration_sec = float(labels["elapsed_sec"])
+    else:
+        duration_sec = (stop - start) / 1000.0 if start is not None and stop is not None else 0.0
+
+    return {
+        "request_name": name,
+        "status_api": status,
+        "duration_api_sec": duration_sec,
+        "start": start,
+    }
+
+
+def leer_ejecuciones_api_allure(allure_dir: str) -> pd.DataFrame:
+    """
+    Igual que leer_ejecuciones_newman, pero a partir de los resultados de
+    Allure que genera tests/api/test_postman_collections.py (label layer=api).
+    Devuelve las mismas columnas, así el resumen por CP no cambia.
+    """
+    allure_path = Path(allure_dir)
+    if not allure_path.exists():
+        return pd.DataFrame()
+
+    rows = []
+    for result_file in allure_path.glob("*-result.json"):
+        with open(result_file, encoding="utf-8") as f:
+            data = json.load(f)
+
+        row = fila_api(data)
+        if row is not None:
+            rows.append(row)
+
+    if not rows:
+        return pd.DataFrame()
+
+    return asignar_cp_api(pd.DataFrame(rows))
 
 
 def resumir_newman_por_cp(df_exec: pd.DataFrame) -> pd.DataFrame:
@@ -221,62 +349,252 @@ def resumir_newman_por_cp(df_exec: pd.DataFrame) -> pd.DataFrame:
     if df_exec.empty:
         return pd.DataFrame()
 
-    def resumen_status(series: pd.Series) -> str:
-        if (series == "FAILED").any():
-            return "FAILED"
-        if (series == "PASSED").any():
-            return "PASSED"
-        return "SKIPPED"
+    return resumir_por_cp(
+        df_exec, "duration_api_sec", "status_api", failed="FAILED", passed="PASSED",
+        col_tiempo="Tiempo_Ejecucion_API_seg", col_resultado="Resultado_API",
+    )
 
-    agg = (
-        df_exec.groupby("ID_CASO")
-        .agg(
-            Tiempo_Ejecucion_API_seg=("duration_api_sec", "sum"),
-            Resultado_API=("status_api", resumen_status),
+
+# ================= LECTURA PARALELA / STREAMING =================
+
+# Columnas que producen fila_ui / fila_api (antes de propagar el CP por suite)
+COLUMNAS_FILA_UI = ["file", "suite", "fullName", "test_name", "status", "duration_sec", "start"]
+COLUMNAS_FILA_API = ["request_name", "status_api", "duration_api_sec", "start"]
+
+# Archivos por tarea del pool: amortiza el costo de cada envío entre procesos
+LOTE_ALLURE = 500
+
+
+def listar_resultados_allure(allure_dir: str) -> list:
+    allure_path = Path(allure_dir)
+    if not allure_path.exists():
+        raise FileNotFoundError(f"No se encontró la carpeta {allure_dir}")
+    with os.scandir(allure_path) as entries:
+        return [entry.path for entry in entries if entry.name.endswith("-result.json")]
+
+
+def parsear_lote_allure(paths: list) -> tuple[dict, dict]:
+    """
+    Parsea un lote de *-result.json y devuelve dos dicts de columnas (UI, API).
+    Corre en los procesos del pool: de cada JSON solo vuelven al proceso
+    principal los campos de fila_ui/fila_api, no los steps ni los attachments.
+    """
+    ui = {col: [] for col in COLUMNAS_FILA_UI}
+    api = {col: [] for col in COLUMNAS_FILA_API}
+    for path in paths:
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+
+        row = fila_api(data)
+        destino = api
+        if row is None:
+            row = fila_ui(data, os.path.basename(path))
+            destino = ui
+        if row is None:
+            continue
+        for col, value in row.items():
+            destino[col].append(value)
+    return ui, api
+
+
+def iter_columnas_allure(allure_dir: str, workers: int | None = None, lote: int = LOTE_ALLURE):
+    """
+    Genera (columnas_ui, columnas_api) por lote, en el orden del directorio.
+    Con workers=1 (o un solo lote) parsea en este proceso. Con pool mantiene a
+    lo sumo 2 lotes por worker en vuelo, así la memoria no crece con el tamaño
+    del directorio aunque el consumidor sea más lento que el parseo.
+    """
+    paths = listar_resultados_allure(allure_dir)
+    lotes = [paths[i:i + lote] for i in range(0, len(paths), lote)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(lotes) <= 1:
+        for chunk in lotes:
+            yield parsear_lote_allure(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pendientes = deque()
+        for chunk in lotes:
+            if len(pendientes) >= 2 * workers:
+                yield pendientes.popleft().result()
+            pendientes.append(pool.submit(parsear_lote_allure, chunk))
+        while pendientes:
+            yield pendientes.popleft().result()
+
+
+def iter_resultados_allure(allure_dir: str, workers: int | None = None, lote: int = LOTE_ALLURE):
+    """
+    Modo streaming: un par (df_ui, df_api) por lote. La UI trae ID_CASO_RAW
+    pero todavía no ID_CASO: propagarlo por suite necesita ver todos los
+    lotes (usar leer_allure_paralelo si se necesita el DataFrame final).
+    """
+    for ui, api in iter_columnas_allure(allure_dir, workers, lote):
+        df_ui = pd.DataFrame(ui, columns=COLUMNAS_FILA_UI)
+        df_ui.insert(df_ui.columns.get_loc("fullName") + 1, "ID_CASO_RAW",
+                     inferir_cp(df_ui["fullName"]).fillna(inferir_cp(df_ui["test_name"])))
+        yield df_ui, asignar_cp_api(pd.DataFrame(api, columns=COLUMNAS_FILA_API))
+
+
+def leer_allure_paralelo(allure_dir: str, workers: int | None = None,
+                         lote: int = LOTE_ALLURE) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Una sola pasada por la carpeta para UI y API (leer_resultados_allure +
+    leer_ejecuciones_api_allure la recorren dos veces), repartida en un pool
+    de procesos y armando las columnas directamente. Devuelve los mismos
+    DataFrames que esas dos funciones.
+    """
+    ui = {col: [] for col in COLUMNAS_FILA_UI}
+    api = {col: [] for col in COLUMNAS_FILA_API}
+    for ui_lote, api_lote in iter_columnas_allure(allure_dir, workers, lote):
+        for col in COLUMNAS_FILA_UI:
+            ui[col].extend(ui_lote[col])
+        for col in COLUMNAS_FILA_API:
+            api[col].extend(api_lote[col])
+
+    df_ui = propagar_cp_por_suite(pd.DataFrame(ui)) if ui["file"] else pd.DataFrame()
+    df_api = asignar_cp_api(pd.DataFrame(api)) if api["request_name"] else pd.DataFrame()
+    return df_ui, df_api
+
+
+# ================= ÍNDICE INCREMENTAL =================
+
+
+class IndiceAllure:
+    """
+    Índice local (SQLite) de los *-result.json ya leídos: nombre, mtime,
+    tamaño y la fila ya parseada (UI o API). Con cientos de corridas
+    nocturnas en ALLURE_DIR, solo se abren los archivos nuevos o
+    modificados; los borrados salen del índice. Guarda además el último
+    resumen escrito por ID_CASO, para tocar en el Excel solo las filas que
+    cambiaron.
+    """
+
+    def __init__(self, path: str = INDEX_DB):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS archivos (
+                nombre   TEXT PRIMARY KEY,
+                mtime_ns INTEGER,
+                tamano   INTEGER,
+                tipo     TEXT,          -- ui | api | otro | invalido
+                fila     TEXT           -- fila parseada (JSON)
+            );
+            CREATE TABLE IF NOT EXISTS resumen (id_caso TEXT PRIMARY KEY, valores TEXT);
+            CREATE TABLE IF NOT EXISTS meta (clave TEXT PRIMARY KEY, valor TEXT);
+            """
         )
-        .reset_index()
-    )
 
-    return agg
+    def close(self):
+        self.conn.close()
+
+    # ---------- archivos ----------
+    def sincronizar(self, allure_dir: str) -> dict:
+        """Parsea solo lo nuevo o modificado. Devuelve los conteos del escaneo."""
+        allure_path = Path(allure_dir)
+        if not allure_path.exists():
+            raise FileNotFoundError(f"No se encontró la carpeta {allure_dir}")
+
+        vistos = {}
+        with os.scandir(allure_path) as entries:
+            for entry in entries:
+                if entry.name.endswith("-result.json") and entry.is_file():
+                    st = entry.stat()
+                    vistos[entry.name] = (st.st_mtime_ns, st.st_size)
+
+        previos = {
+            nombre: (mtime, tamano)
+            for nombre, mtime, tamano in self.conn.execute("SELECT nombre, mtime_ns, tamano FROM archivos")
+        }
+        cambiados = [nombre for nombre, firma in vistos.items() if previos.get(nombre) != firma]
+        borrados = [nombre for nombre in previos if nombre not in vistos]
+
+        filas = []
+        for nombre in cambiados:
+            try:
+                with open(allure_path / nombre, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                # archivo a medio escribir: se vuelve a leer cuando cambie su mtime
+                filas.append((nombre, *vistos[nombre], "invalido", None))
+                continue
+            row = fila_api(data)
+            tipo = "api" if row is not None else None
+            if row is None:
+                row = fila_ui(data, nombre)
+                tipo = "ui" if row is not None else "otro"
+            filas.append((nombre, *vistos[nombre], tipo, json.dumps(row) if row else None))
+
+        with self.conn:
+            self.conn.executemany("DELETE FROM archivos WHERE nombre = ?", [(n,) for n in borrados])
+            self.conn.executemany("INSERT OR REPLACE INTO archivos VALUES (?, ?, ?, ?, ?)", filas)
+
+        return {
+            "total": len(vistos),
+            "nuevos": sum(1 for n in cambiados if n not in previos),
+            "modificados": sum(1 for n in cambiados if n in previos),
+            "borrados": len(borrados),
+        }
+
+    def _filas(self, tipo: str) -> list:
+        return [json.loads(fila) for (fila,) in
+                self.conn.execute("SELECT fila FROM archivos WHERE tipo = ? ORDER BY nombre", (tipo,))]
+
+    def resultados_ui(self) -> pd.DataFrame:
+        """Mismo DataFrame que leer_resultados_allure, sin abrir los JSON."""
+        rows = self._filas("ui")
+        return propagar_cp_por_suite(pd.DataFrame(rows)) if rows else pd.DataFrame()
+
+    def ejecuciones_api(self) -> pd.DataFrame:
+        """Mismo DataFrame que leer_ejecuciones_api_allure, sin abrir los JSON."""
+        rows = self._filas("api")
+        return asignar_cp_api(pd.DataFrame(rows)) if rows else pd.DataFrame()
+
+    # ---------- resumen escrito ----------
+    def resumen(self) -> dict:
+        return {id_caso: json.loads(valores)
+                for id_caso, valores in self.conn.execute("SELECT id_caso, valores FROM resumen")}
+
+    def guardar_resumen(self, resumen: dict):
+        with self.conn:
+            self.conn.execute("DELETE FROM resumen")
+            self.conn.executemany("INSERT INTO resumen VALUES (?, ?)",
+                                  [(k, json.dumps(v)) for k, v in resumen.items()])
+
+    def meta(self, clave: str):
+        row = self.conn.execute("SELECT valor FROM meta WHERE clave = ?", (clave,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, clave: str, valor):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (clave, str(valor)))
 
 
 # ================= MATRIZ =================
 
 
-def agregar_resultados_a_matriz():
-    # 1. Leer matriz original
-    print(f"Leyendo matriz desde: {MATRIZ_FILE}")
-    matriz = pd.read_excel(MATRIZ_FILE, sheet_name=HOJA_MATRIZ)
+def resumir_api(df_api_exec: pd.DataFrame) -> pd.DataFrame:
+    """tests/api en Allure ya leídos; si no hay, el JSON de Newman como respaldo."""
+    if df_api_exec.empty:
+        try:
+            print(f"Leyendo resultados de Newman desde: {NEWMAN_JSON}")
+            df_api_exec = leer_ejecuciones_newman(NEWMAN_JSON)
+        except FileNotFoundError as e:
+            print(str(e))
+            df_api_exec = pd.DataFrame()
 
-    # 2. UI/Selenium (Allure)
-    print(f"Leyendo resultados de Allure desde: {ALLURE_DIR}")
-    df_allure_raw = leer_resultados_allure(ALLURE_DIR)
+    if df_api_exec.empty:
+        print("No se encontraron ejecuciones de API asociadas a CP")
+        return pd.DataFrame()
 
-    if df_allure_raw.empty:
-        print("No se encontraron resultados en los JSON de Allure")
-        agg_ui = pd.DataFrame()
-    else:
-        agg_ui = resumir_allure_por_cp(df_allure_raw)
-        print("Resumen UI por ID_CASO (primeras filas):")
-        print(agg_ui.head())
+    agg_api = resumir_newman_por_cp(df_api_exec)
+    print("Resumen API por ID_CASO (primeras filas):")
+    print(agg_api.head())
+    return agg_api
 
-    # 3. API (Newman)
-    try:
-        print(f"Leyendo resultados de Newman desde: {NEWMAN_JSON}")
-        df_newman_exec = leer_ejecuciones_newman(NEWMAN_JSON)
-    except FileNotFoundError as e:
-        print(str(e))
-        df_newman_exec = pd.DataFrame()
-
-    if df_newman_exec.empty:
-        print("No se encontraron ejecuciones de API asociadas a CP en Newman")
-        agg_api = pd.DataFrame()
-    else:
-        agg_api = resumir_newman_por_cp(df_newman_exec)
-        print("Resumen API por ID_CASO (primeras filas):")
-        print(agg_api.head())
 
-    # 4. Merge con la matriz
+def construir_matriz_extendida(matriz: pd.DataFrame, agg_ui: pd.DataFrame, agg_api: pd.DataFrame) -> pd.DataFrame:
     matriz_ext = matriz.copy()
 
     if not agg_ui.empty:
@@ -297,18 +615,169 @@ def agregar_resultados_a_matriz():
             validate="1:1",
         )
 
-    # 5. Calcular tiempo total (UI + API) en segundos
+    # Tiempo total (UI + API) en segundos
     if "Tiempo_Ejecucion_Automatizada_seg" in matriz_ext.columns or "Tiempo_Ejecucion_API_seg" in matriz_ext.columns:
         matriz_ext["Tiempo_Total_Automatizado_seg"] = (
             matriz_ext.get("Tiempo_Ejecucion_Automatizada_seg", 0).fillna(0)
             + matriz_ext.get("Tiempo_Ejecucion_API_seg", 0).fillna(0)
         )
 
-    # 6. Guardar nuevo archivo
+    return matriz_ext
+
+
+def agregar_resultados_a_matriz(workers: int | None = None):
+    # 1. Leer matriz original
+    print(f"Leyendo matriz desde: {MATRIZ_FILE}")
+    matriz = pd.read_excel(MATRIZ_FILE, sheet_name=HOJA_MATRIZ)
+
+    # 2. UI/Selenium y API (Allure, una sola pasada)
+    print(f"Leyendo resultados de Allure desde: {ALLURE_DIR}")
+    df_allure_raw, df_api_allure = leer_allure_paralelo(ALLURE_DIR, workers=workers)
+
+    if df_allure_raw.empty:
+        print("No se encontraron resultados en los JSON de Allure")
+        agg_ui = pd.DataFrame()
+    else:
+        agg_ui = resumir_allure_por_cp(df_allure_raw)
+        print("Resumen UI por ID_CASO (primeras filas):")
+        print(agg_ui.head())
+
+    # 3. API (tests/api en Allure; Newman como respaldo)
+    agg_api = resumir_api(df_api_allure)
+
+    # 4. Merge con la matriz y tiempo total
+    matriz_ext = construir_matriz_extendida(matriz, agg_ui, agg_api)
+
+    # 5. Guardar nuevo archivo
     print(f"Guardando matriz extendida en: {OUTPUT_FILE}")
     matriz_ext.to_excel(OUTPUT_FILE, index=False)
     print("Proceso finalizado")
 
 
+# ================= MODO INCREMENTAL =================
+
+COLUMNAS_UI = ["Tiempo_Ejecucion_Automatizada_seg", "Resultado_Automatizado"]
+COLUMNAS_API = ["Tiempo_Ejecucion_API_seg", "Resultado_API"]
+
+
+def resumen_por_caso(agg_ui: pd.DataFrame, agg_api: pd.DataFrame) -> dict:
+    """
+    {ID_CASO: {columna: valor}} con las mismas columnas que agrega
+    construir_matriz_extendida (incluido el tiempo total).
+    """
+    columnas = (COLUMNAS_UI if not agg_ui.empty else []) + (COLUMNAS_API if not agg_api.empty else [])
+    resumen = {}
+    for agg in (agg_ui, agg_api):
+        if agg.empty:
+            continue
+        for rec in agg.to_dict("records"):
+            valores = resumen.setdefault(rec["ID_CASO"], {c: None for c in columnas})
+            valores.update({c: rec[c] for c in columnas if c in rec})
+    if columnas:
+        for valores in resumen.values():
+            valores["Tiempo_Total_Automatizado_seg"] = (
+                (valores.get("Tiempo_Ejecucion_Automatizada_seg") or 0)
+                + (valores.get("Tiempo_Ejecucion_API_seg") or 0)
+            )
+    return resumen
+
+
+def actualizar_filas_excel(output_file: str, cambios: dict) -> bool:
+    """
+    Escribe en el Excel ya generado solo las celdas de los ID_CASO en
+    `cambios`. Devuelve False si el archivo no tiene las columnas
+    necesarias (hay que regenerarlo completo).
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(output_file)
+    ws = wb.active
+    encabezados = {cell.value: cell.column for cell in ws[1] if cell.value}
+    necesarias = {col for valores in cambios.values() for col in valores}
+    if "ID_CASO" not in encabezados or not necesarias <= set(encabezados):
+        return False
+
+    col_id = encabezados["ID_CASO"]
+    for row in ws.iter_rows(min_row=2):
+        valores = cambios.get(row[col_id - 1].value)
+        if valores is None:
+            continue
+        for col, valor in valores.items():
+            row[encabezados[col] - 1].value = valor
+    wb.save(output_file)
+    return True
+
+
+def agregar_resultados_incremental(index_path: str = INDEX_DB, full: bool = False):
+    """
+    Igual que agregar_resultados_a_matriz, pero:
+    - solo parsea los *-result.json nuevos o modificados (IndiceAllure);
+    - si la matriz original no cambió y el Excel de salida existe, actualiza
+      solo las filas de los ID_CASO cuyo resumen cambió.
+    """
+    indice = IndiceAllure(index_path)
+    try:
+        print(f"Sincronizando índice {index_path} con: {ALLURE_DIR}")
+        conteo = indice.sincronizar(ALLURE_DIR)
+        print(f"Resultados: {conteo['total']} (nuevos={conteo['nuevos']}, "
+              f"modificados={conteo['modificados']}, borrados={conteo['borrados']})")
+
+        df_ui = indice.resultados_ui()
+        agg_ui = resumir_allure_por_cp(df_ui) if not df_ui.empty else pd.DataFrame()
+        agg_api = resumir_api(indice.ejecuciones_api())
+        nuevo = resumen_por_caso(agg_ui, agg_api)
+
+        anterior = indice.resumen()
+        afectados = {}
+        for id_caso in set(nuevo) | set(anterior):
+            if nuevo.get(id_caso) == anterior.get(id_caso):
+                continue
+            if id_caso in nuevo:
+                afectados[id_caso] = nuevo[id_caso]
+            else:
+                # CP sin resultados en esta corrida: celdas vacías y total 0, como en la corrida completa
+                vacio = {col: None for col in anterior[id_caso]}
+                vacio["Tiempo_Total_Automatizado_seg"] = 0.0
+                afectados[id_caso] = vacio
+
+        matriz_mtime = os.stat(MATRIZ_FILE).st_mtime_ns
+        puede_parchear = (
+            not full
+            and os.path.exists(OUTPUT_FILE)
+            and indice.meta("matriz_mtime_ns") == str(matriz_mtime)
+        )
+
+        if puede_parchear and not afectados:
+            print("Sin cambios en los resultados: la matriz extendida ya está al día")
+            return
+        if puede_parchear and actualizar_filas_excel(OUTPUT_FILE, afectados):
+            print(f"Actualizadas {len(afectados)} filas de ID_CASO en: {OUTPUT_FILE}")
+        else:
+            print(f"Leyendo matriz desde: {MATRIZ_FILE}")
+            matriz = pd.read_excel(MATRIZ_FILE, sheet_name=HOJA_MATRIZ)
+            matriz_ext = construir_matriz_extendida(matriz, agg_ui, agg_api)
+            print(f"Guardando matriz extendida completa en: {OUTPUT_FILE}")
+            matriz_ext.to_excel(OUTPUT_FILE, index=False)
+
+        indice.guardar_resumen(nuevo)
+        indice.set_meta("matriz_mtime_ns", matriz_mtime)
+        print("Proceso finalizado")
+    finally:
+        indice.close()
+
+
 if __name__ == "__main__":
-    agregar_resultados_a_matriz()
+    parser = argparse.ArgumentParser(description="Agrega los resultados de Allure/Newman a la matriz de casos.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="solo parsea resultados nuevos/modificados y actualiza las filas afectadas")
+    parser.add_argument("--index", default=INDEX_DB, help="índice SQLite del modo incremental")
+    parser.add_argument("--full", action="store_true",
+                        help="con --incremental: regenera el Excel completo (usando el índice)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="procesos para leer los JSON de Allure (por defecto, uno por CPU)")
+    args = parser.parse_args()
+
+    if args.incremental:
+        agregar_resultados_incremental(args.index, full=args.full)
+    else:
+        agregar_resultados_a_matriz(workers=args.workers)
@@ -0,0 +1,300 @@
+"""
+Driver único para los <Select> de Ant Design.
+
+Cada page object tenía su propia heurística para abrir el dropdown, buscar
+la opción (con scrolls y sleeps) y confirmar la selección. `AntSelect` lo
+resuelve igual en todos lados:
+
+- abre el select centrándolo bajo el header fijo;
+- si el select tiene buscador, escribe el texto con el teclado para que
+  AntD filtre la lista antes de elegir;
+- ubica la opción por texto exacto o normalizado, recorriendo la lista
+  virtual (rc-virtual-list) si hace falta, la elige y verifica la
+  selección, todo en un solo `execute_async_script`;
+- guarda la lista de opciones por carga de página: elegir de nuevo en el
+  mismo formulario salta directo a la posición conocida sin recorrer el
+  dropdown;
+- si un select no reacciona al click de JS (solo al mouse real), se
+  recuerda y los picks siguientes van directo a ActionChains.
+"""
+import random
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# (session_id, locator) -> (token de la carga de página, tupla de opciones)
+_OPTIONS_CACHE = {}
+# misma clave: selects que no reaccionaron al click de JS y se eligen con el
+# mouse (vale para toda la sesión, no depende de la carga de página)
+_MOUSE_ONLY = set()
+
+# cuánto esperar a que el click de JS se refleje en el select antes de pasar al mouse
+_VERIFY_MS = 400
+
+_PAGE_TOKEN_JS = "return performance.timeOrigin + '|' + location.pathname;"
+
+_OPEN_JS = """
+const el = arguments[0];
+el.scrollIntoView({block: 'center'});
+window.scrollBy(0, -80);  // header fijo
+"""
+
+_SELECT_JS = """
+const [el, mode, wanted, exact, hint, orFirst, retry, timeoutMs, mouse, verifyMs, done] = arguments;
+const select = el.closest('.ant-select') || el;
+const multiple = select.classList.contains('ant-select-multiple');
+const norm = (s) => (s || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+const frame = () => new Promise(r => requestAnimationFrame(() => setTimeout(r, 0)));
+const t0 = Date.now();
+const late = () => Date.now() - t0 > timeoutMs;
+const token = performance.timeOrigin + '|' + location.pathname;
+
+const input = select.querySelector('input');
+const listId = input && (input.getAttribute('aria-controls') || input.getAttribute('aria-owns'));
+const dropdown = () => {
+    const list = listId && document.getElementById(listId);
+    const own = list && list.closest('.ant-select-dropdown');
+    if (own && !own.classList.contains('ant-select-dropdown-hidden')) return own;
+    const open = document.querySelectorAll('.ant-select-dropdown:not(.ant-select-dropdown-hidden)');
+    return open.length ? open[open.length - 1] : null;
+};
+const label = (o) => (o.getAttribute('title')
+    || (o.querySelector('.ant-select-item-option-content') || o).textContent || '').trim();
+const rendered = (dd) => Array.from(dd.querySelectorAll('.ant-select-item-option'));
+const matches = (t) => exact ? norm(t) === norm(wanted) : norm(t).includes(norm(wanted));
+const chosen = () => Array.from(select.querySelectorAll('.ant-select-selection-item'))
+    .map(s => (s.getAttribute('title') || s.textContent || '').trim());
+
+(async () => {
+    let dd = null;
+    while (!(dd = dropdown()) && !late()) await frame();
+    if (!dd) return done({ error: 'El dropdown no se abrió.', token: token });
+    while (!dd.querySelector('.ant-select-item-option, .ant-select-item-empty, .ant-empty') && !late()) await frame();
+
+    const holder = dd.querySelector('.rc-virtual-list-holder');
+    const seen = [], seenSet = new Set();
+    const collect = () => rendered(dd).forEach(o => {
+        const t = label(o);
+        if (t && !seenSet.has(t)) { seenSet.add(t); seen.push(t); }
+    });
+    const rowHeight = () => ((dd.querySelector('.ant-select-item-option') || {}).offsetHeight || 32);
+    // recorre la lista virtual de arriba a abajo; `visit` corta devolviendo algo
+    const walk = async (visit) => {
+        if (holder) { holder.scrollTop = 0; await frame(); }
+        while (true) {
+            collect();
+            const hit = visit();
+            if (hit) return hit;
+            if (!holder || holder.scrollTop + holder.clientHeight >= holder.scrollHeight - 1 || late()) return null;
+            holder.scrollTop += Math.max(rowHeight(), holder.clientHeight - rowHeight());
+            await frame(); await frame();
+        }
+    };
+    const find = () => rendered(dd).find(o => matches(label(o)));
+
+    const jump = async (ix) => {
+        if (!holder) return;
+        holder.scrollTop = Math.max(0, ix * rowHeight() - holder.clientHeight / 2);
+        await frame(); await frame();
+    };
+
+    if (mode === 'list') {
+        await walk(() => null);
+        return done({ options: seen, complete: true, token: token });
+    }
+
+    if (mode === 'all') {
+        const clicked = [];
+        await walk(() => {
+            rendered(dd).forEach(o => {
+                if (!o.classList.contains('ant-select-item-option-selected')
+                        && !o.classList.contains('ant-select-item-option-disabled')) {
+                    o.click(); clicked.push(label(o));
+                }
+            });
+            return null;
+        });
+        await frame();
+        return done({ options: seen, complete: true, clicked: clicked, selected: chosen(), token: token });
+    }
+
+    // mode === 'pick'
+    let opt = null, complete = false;
+    if (hint >= 0) {
+        // posición conocida por la caché: salto directo, sin recorrer
+        await jump(hint);
+        opt = find();
+    }
+    if (!opt) {
+        // recorrido completo: deja la lista entera en `seen` para la caché
+        await walk(() => null);
+        complete = true;
+        const ix = seen.findIndex(matches);
+        if (ix >= 0) { await jump(ix); opt = find(); }
+    }
+    // con buscador las opciones pueden llegar del servidor: reintentar hasta el timeout
+    while (!opt && retry && !late()) {
+        await frame();
+        opt = find();
+    }
+    if (!opt && orFirst) opt = rendered(dd)[0] || null;
+    if (!opt) return done({ error: 'no-option', options: seen, token: token });
+
+    const picked = label(opt);
+    opt.scrollIntoView({ block: 'nearest' });
+    const isChosen = () => chosen().some(t => norm(t) === norm(picked) || norm(t).includes(norm(picked)));
+    // en un multiselect, volver a clickear una opción elegida la quita
+    const already = multiple && opt.classList.contains('ant-select-item-option-selected');
+    let ok = already;
+    if (!already && !mouse) {
+        // el select solo se actualiza si el click de JS le llega: pocos frames
+        opt.click();
+        const tClick = Date.now();
+        while (!(ok = isChosen()) && Date.now() - tClick < verifyMs) await frame();
+    }
+    done({ picked: picked, verified: ok, option: opt, multiple: multiple,
+           options: seen, complete: complete, token: token });
+})();
+"""
+
+
+class AntSelect:
+    """
+    <Select> de AntD ubicado por `locator` (el `.ant-select` o cualquier
+    elemento dentro de él, p.ej. `.ant-select-selector`).
+    """
+
+    SEARCH_INPUT = (By.CSS_SELECTOR, "input.ant-select-selection-search-input")
+    SELECTION_ITEMS = (By.CSS_SELECTOR, ".ant-select-selection-item")
+
+    def __init__(self, driver, locator, timeout: float = 10):
+        self.driver = driver
+        self.locator = locator
+        self.timeout = timeout
+        self.wait = WebDriverWait(driver, timeout)
+
+    # -----------------------------
+    # API
+    # -----------------------------
+    def pick(self, text: str, exact: bool = True, search: bool = False, or_first: bool = False) -> str:
+        """
+        Elige la opción `text` y devuelve el texto efectivamente seleccionado.
+        exact:    igualdad normalizada (espacios/mayúsculas) o subcadena.
+        search:   escribe `text` en el buscador del select antes de elegir.
+        or_first: si nada coincide, toma la primera opción (filtros "tolerantes").
+        """
+        el = self._open()
+        if search:
+            self._type(el, text)
+        # con buscador la lista está filtrada: ni se usa ni se guarda la caché
+        cached = None if search else self._cached()
+        hint = cached.index(text) if cached and text in cached else -1
+        res = self._run(el, "pick", text, exact, hint, or_first, retry=search)
+        if res.get("error"):
+            raise NoSuchElementException(
+                f"No se encontró opción con texto '{text}'. Opciones visibles: {res.get('options')}"
+            )
+        if not search:
+            self._remember(res)
+        if not res.get("verified"):
+            # algunos selects solo reaccionan a un mouse real: se recuerda para
+            # que los siguientes picks no esperen la verificación del click de JS
+            _MOUSE_ONLY.add(self._key())
+            ActionChains(self.driver).move_to_element(res["option"]).pause(0.05).click().perform()
+            self.wait.until(lambda d: self._is_selected(el, res["picked"]))
+        if res.get("multiple"):
+            self.close()
+        return res["picked"]
+
+    def pick_random(self) -> str:
+        return self.pick(random.choice(self.options()))
+
+    def pick_all(self, max_passes: int = 3) -> tuple:
+        """Multiselect: elige todas las opciones aún no seleccionadas. Devuelve los chips."""
+        el = self._open()
+        for _ in range(max_passes):
+            res = self._run(el, "all", "", True, -1, False)
+            if res.get("error"):
+                raise NoSuchElementException(res["error"])
+            # AntD re-renderiza entre clicks: si alguna opción no quedó, otra pasada
+            if not set(res.get("options") or ()) - set(res.get("selected") or ()):
+                break
+        self._remember(res)
+        self.close()
+        return tuple(res.get("selected") or ())
+
+    def options(self) -> tuple:
+        """Textos de todas las opciones (de la caché si la página no recargó)."""
+        cached = self._cached()
+        if cached is not None:
+            return cached
+        res = self._run(self._open(), "list", "", True, -1, False)
+        self._remember(res)
+        self.close()
+        return tuple(res.get("options") or ())
+
+    def selected(self) -> tuple:
+        el = self.wait.until(EC.presence_of_element_located(self.locator))
+        return tuple((s.get_attribute("title") or s.text or "").strip()
+                     for s in el.find_elements(*self.SELECTION_ITEMS))
+
+    def close(self):
+        try:
+            self.driver.switch_to.active_element.send_keys(Keys.ESCAPE)
+        except Exception:
+            pass
+
+    # -----------------------------
+    # Internos
+    # -----------------------------
+    def _open(self):
+        el = self.wait.until(EC.element_to_be_clickable(self.locator))
+        self.driver.execute_script(_OPEN_JS, el)
+        try:
+            el.click()
+        except Exception:
+            self.driver.execute_script("arguments[0].click();", el)
+        return el
+
+    def _type(self, el, text):
+        inp = el.find_element(*self.SEARCH_INPUT)
+        inp.send_keys(Keys.CONTROL, "a")
+        inp.send_keys(Keys.DELETE)
+        inp.send_keys(text)
+
+    def _is_selected(self, el, text) -> bool:
+        wanted = " ".join(text.split()).lower()
+        for s in el.find_elements(*self.SELECTION_ITEMS):
+            got = " ".join((s.get_attribute("title") or s.text or "").split()).lower()
+            if got and (got == wanted or wanted in got):
+                return True
+        return False
+
+    def _run(self, el, mode, text, exact, hint, or_first, retry: bool = False) -> dict:
+        return self.driver.execute_async_script(
+            _SELECT_JS, el, mode, text, exact, hint, or_first, retry, int(self.timeout * 1000),
+            self._key() in _MOUSE_ONLY, _VERIFY_MS,
+        ) or {}
+
+    def _key(self):
+        return getattr(self.driver, "session_id", id(self.driver)), tuple(self.locator)
+
+    def _cached(self):
+        entry = _OPTIONS_CACHE.get(self._key())
+        if not entry:
+            return None
+        token, options = entry
+        try:
+            current = self.driver.execute_script(_PAGE_TOKEN_JS)
+        except Exception:
+            return None
+        return options if current == token else None
+
+    def _remember(self, res: dict):
+        options = tuple(res.get("options") or ())
+        if options and res.get("complete") and res.get("token"):
+            _OPTIONS_CACHE[self._key()] = (res["token"], options)
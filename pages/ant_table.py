@@ -0,0 +1,218 @@
+"""
+Lectura masiva de tablas de Ant Design.
+
+Leer una tabla celda por celda (`find_elements` + `.text`) cuesta un round-trip
+HTTP al driver por cada llamada: una tabla de 50 filas son cientos. `AntTable`
+toma una foto de encabezados, claves de fila (`data-row-key`) y el texto de
+todas las celdas con un solo `execute_script` y la devuelve como un resultado
+inmutable (`TableSnapshot`), con búsqueda de columnas por encabezado.
+
+Soporta las dos variantes de columnas fijas de AntD: la v3 (tablas separadas
+`.ant-table-fixed-left/right`, se combinan en orden visual) y la v4+ (una sola
+tabla con celdas `.ant-table-cell-fix-*`).
+"""
+from typing import NamedTuple, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+_TABLE_JS = """
+const [rootEl, css, xpath] = arguments;
+let root = rootEl || document;
+if (css) {
+    root = document.querySelector(css);
+} else if (xpath) {
+    root = document.evaluate(xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+}
+if (!root) return null;
+const wrapper = root.matches && root.matches('.ant-table-wrapper')
+    ? root : (root.querySelector('.ant-table-wrapper') || root);
+// ignora tablas anidadas (filas expandidas con otra tabla adentro)
+const own = (el) => !wrapper.classList.contains('ant-table-wrapper') || el.closest('.ant-table-wrapper') === wrapper;
+const txt = (el) => el ? ((el.innerText || el.textContent || '').replace(/\\s+/g, ' ').trim()) : '';
+const leafThs = (scope) => scope
+    ? Array.from(scope.querySelectorAll('.ant-table-thead th'))
+        .filter(th => own(th) && !th.classList.contains('ant-table-cell-scrollbar'))
+        .filter(th => !(parseInt(th.getAttribute('colspan') || '1', 10) > 1))
+    : [];
+const dataRows = (scope) => scope
+    ? Array.from(scope.querySelectorAll('.ant-table-tbody > tr'))
+        .filter(tr => own(tr)
+                   && !tr.classList.contains('ant-table-measure-row')
+                   && !tr.classList.contains('ant-table-expanded-row')
+                   && !tr.classList.contains('ant-table-placeholder')
+                   && tr.getAttribute('aria-hidden') !== 'true')
+    : [];
+const cellsOf = (tr) => tr
+    ? Array.from(tr.children).filter(c => c.tagName === 'TD' || c.getAttribute('role') === 'cell')
+    : [];
+
+const left = wrapper.querySelector('.ant-table-fixed-left');
+const right = wrapper.querySelector('.ant-table-fixed-right');
+// AntD v3: el cuerpo principal repite las columnas fijas ocultas; se toman de su sección
+const hidden = (c) => c.classList.contains('ant-table-fixed-columns-in-body');
+let headerEls, rowSets;
+if (left || right) {
+    const main = wrapper.querySelector('.ant-table-scroll') || wrapper;
+    headerEls = [...leafThs(left), ...leafThs(main).filter(th => !hidden(th)), ...leafThs(right)];
+    const l = dataRows(left), b = dataRows(main), r = dataRows(right);
+    const n = Math.max(l.length, b.length, r.length);
+    rowSets = [];
+    for (let i = 0; i < n; i++) {
+        rowSets.push({
+            el: b[i] || l[i] || r[i],
+            cells: [...cellsOf(l[i]), ...cellsOf(b[i]).filter(c => !hidden(c)), ...cellsOf(r[i])],
+        });
+    }
+} else {
+    headerEls = leafThs(wrapper);
+    rowSets = dataRows(wrapper).map(tr => ({ el: tr, cells: cellsOf(tr) }));
+}
+"""
+
+_SNAPSHOT_JS = _TABLE_JS + """
+return {
+    headers: headerEls.map(txt),
+    rows: rowSets.map(r => ({ key: r.el.getAttribute('data-row-key'), cells: r.cells.map(txt) })),
+    empty: !!wrapper.querySelector('.ant-table-placeholder, .ant-empty'),
+};
+"""
+
+# <tr> de la fila `arguments[3]` (mismo orden que la foto)
+_ROW_JS = _TABLE_JS + """
+const hit = rowSets[arguments[3]];
+return hit ? hit.el : null;
+"""
+
+
+class TableRow(NamedTuple):
+    key: Optional[str]
+    cells: Tuple[str, ...]
+    headers: Tuple[str, ...]
+
+    @property
+    def text(self) -> str:
+        """Texto de la fila completa (celdas separadas por espacio)."""
+        return " ".join(c for c in self.cells if c)
+
+    def get(self, header: str, default: str = "") -> str:
+        """Texto de la celda bajo `header` (ver `column_index`)."""
+        try:
+            ix = column_index(self.headers, header)
+        except KeyError:
+            return default
+        return self.cells[ix] if ix < len(self.cells) else default
+
+    def cell(self, header: str) -> str:
+        """Como `get`, pero falla si la columna o la celda no existen."""
+        ix = column_index(self.headers, header)
+        if ix >= len(self.cells):
+            raise KeyError(f"La fila {self.key!r} no tiene celda para {header!r} ({len(self.cells)} celdas).")
+        return self.cells[ix]
+
+
+class TableSnapshot(NamedTuple):
+    headers: Tuple[str, ...]
+    rows: Tuple[TableRow, ...]
+    empty: bool = False
+
+    @property
+    def keys(self) -> Tuple[Optional[str], ...]:
+        return tuple(r.key for r in self.rows)
+
+    @property
+    def texts(self) -> Tuple[str, ...]:
+        return tuple(r.text for r in self.rows)
+
+    def column_index(self, header: str) -> int:
+        """Índice 0-based de la columna `header` (ver `column_index`)."""
+        return column_index(self.headers, header)
+
+    def column(self, header: str) -> Tuple[str, ...]:
+        """Todos los textos de la columna `header`, en orden de fila."""
+        if not self.rows:
+            return ()
+        ix = self.column_index(header)
+        return tuple(r.cells[ix] if ix < len(r.cells) else "" for r in self.rows)
+
+    def find(self, header: str, value: str, exact: bool = True) -> Optional[TableRow]:
+        """Primera fila cuya celda `header` coincide con `value` (sin mayúsculas/espacios)."""
+        target = (value or "").strip().lower()
+        for row in self.rows:
+            t = row.get(header).strip().lower()
+            if (t == target) if exact else (target in t):
+                return row
+        return None
+
+    def by_key(self, key) -> Optional[TableRow]:
+        for row in self.rows:
+            if row.key == str(key):
+                return row
+        return None
+
+
+def column_index(headers, header: str) -> int:
+    """
+    Índice 0-based de la columna cuyo encabezado coincide con `header`.
+    Primero coincidencia exacta (trim, sin mayúsculas) y luego por subcadena,
+    para tolerar encabezados con iconos de orden o filtros.
+    """
+    wanted = (header or "").strip().lower()
+    normalized = [(h or "").strip().lower() for h in headers]
+    if wanted in normalized:
+        return normalized.index(wanted)
+    for i, h in enumerate(normalized):
+        if wanted and wanted in h:
+            return i
+    raise KeyError(f"No se encontró la columna con encabezado: {header!r} (encabezados: {list(headers)})")
+
+
+class AntTable:
+    """
+    Tabla AntD dentro de `root` (WebElement o locator). Sin `root` se usa la
+    primera `.ant-table-wrapper` del documento.
+    """
+
+    def __init__(self, driver, root=None):
+        self.driver = driver
+        self.root = root
+
+    def _script_args(self):
+        # el locator se resuelve dentro del mismo script: no cuesta un find_element extra
+        if self.root is None or hasattr(self.root, "tag_name"):
+            return self.root, None, None
+        by, value = self.root
+        if by == By.CSS_SELECTOR:
+            return None, value, None
+        if by == By.XPATH:
+            return None, None, value
+        return self.driver.find_element(by, value), None, None
+
+    def snapshot(self, required: bool = True) -> TableSnapshot:
+        """
+        Encabezados, claves y celdas de las filas visibles en un solo round-trip.
+        Si la tabla no está en el DOM falla, o con `required=False` devuelve
+        una foto vacía (como un `find_elements` sin resultados).
+        """
+        raw = self.driver.execute_script(_SNAPSHOT_JS, *self._script_args())
+        if raw is None:
+            if required:
+                raise TimeoutException(f"No se encontró la tabla {self.root!r}.")
+            return TableSnapshot((), (), True)
+        headers = tuple(raw.get("headers") or ())
+        rows = tuple(
+            TableRow(r.get("key"), tuple(r.get("cells") or ()), headers)
+            for r in raw.get("rows") or ()
+        )
+        return TableSnapshot(headers, rows, bool(raw.get("empty")) and not rows)
+
+    def row_element(self, index: int):
+        """WebElement <tr> de la fila `index` de la última foto (None si ya no existe)."""
+        return self.driver.execute_script(_ROW_JS, *self._script_args(), index)
+
+    # Atajos para los casos de uso más comunes
+    def rows_text(self) -> list:
+        return list(self.snapshot(required=False).texts)
+
+    def column(self, header: str) -> list:
+        return list(self.snapshot(required=False).column(header))
@@ -4,13 +4,17 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.keys import Keys
-import time
+from .base_page import wait_first_of, wait_spa_idle
+from .frontend_metrics import mark_navigation, record_navigation, tag_role
+from .row_finder import RowFinder
 
 class AsistenteHomePage:
     """
     Home del Asistente Administrativo.
     Solo navegación y verificación de sesión.
     """
+    ROLE = "asistente"
+
     # Header fijo con el rol (tolerante a variantes de copy)
     HEADER_ROLE = (
         By.XPATH,
@@ -33,34 +37,30 @@ class AsistenteHomePage:
     def __init__(self, driver, base_url, timeout=20):
         self.driver = driver
         self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
 
     def wait_loaded(self):
         self.wait.until(EC.visibility_of_element_located(self.HEADER_ROLE))
+        tag_role(self.driver, self.ROLE)
 
     def go_to_recepcion_solicitudes(self, evidencia=None):
         """
         Ir a: Recepción / 'Solicitudes de contratación' (ruta /recepcion-solicitudes).
         Intenta varios localizadores y hace click seguro.
         """
-        last_exc = None
-        link = None
-
-        # 1) Intento localizar cualquiera de las variantes
-        for loc in self.MENU_RECEPCION_ALTS:
-            try:
-                el = self.wait.until(EC.presence_of_element_located(loc))
-                el = self.wait.until(EC.element_to_be_clickable(loc))
-                link = el
-                break
-            except Exception as e:
-                last_exc = e
-                continue
+        # 1) Todas las variantes a la vez: gana la primera clickeable
+        try:
+            _, link = wait_first_of(self.driver, self.MENU_RECEPCION_ALTS, timeout=self.timeout,
+                                    state="clickable", owner="AsistenteHomePage")
+        except TimeoutException:
+            link = None
 
         if not link:
             # Fallback a navegación directa
             self.driver.get(self.base_url + "/recepcion-solicitudes")
             self.wait.until(EC.url_contains("/recepcion-solicitudes"))
+            record_navigation(self.driver, owner="AsistenteHomePage", role=self.ROLE)
             if evidencia:
                 evidencia("asistente_menu_recepcion_fallback_get")
             return
@@ -73,6 +73,7 @@ class AsistenteHomePage:
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", link)
         except Exception:
             pass
+        mark_navigation(self.driver)
         try:
             link.click()
         except Exception:
@@ -83,6 +84,7 @@ class AsistenteHomePage:
 
         # 3) Confirmar navegación
         self.wait.until(EC.url_contains("/recepcion-solicitudes"))
+        record_navigation(self.driver, owner="AsistenteHomePage", role=self.ROLE)
 
 
 class RecepcionSolicitudesPage:
@@ -104,9 +106,6 @@ class RecepcionSolicitudesPage:
         "//*[contains(@class,'ant-table') or contains(@class,'ant-tabs') or contains(@class,'ant-card')]"
     )
     TABLE = (By.XPATH, "//div[contains(@class,'ant-table') and .//table]")
-    ROW_BY_CODE = lambda self, code: (
-        By.XPATH, f"//table//tbody/tr[.//td[normalize-space()='{code}']]"
-    )
     BTN_VER_EN_ROW = (By.XPATH, ".//button[.//span[normalize-space()='Ver']]")
 
     # Buscadores opcionales (según tu HTML actual hay un input con placeholder)
@@ -120,12 +119,6 @@ class RecepcionSolicitudesPage:
         "//span[contains(@class,'ant-input-clear-icon') and not(contains(@class,'hidden'))]"
     )
 
-    # Paginación AntD
-    PAGINATION_NEXT = (
-        By.XPATH,
-        "//ul[contains(@class,'ant-pagination')]//li[contains(@class,'ant-pagination-next') and not(contains(@class,'disabled'))]"
-    )
-
     # Spinner (por si lo necesitás)
     SPINNER = (By.CSS_SELECTOR, ".ant-spin-spinning")
 
@@ -217,66 +210,18 @@ class RecepcionSolicitudesPage:
                 continue
         return found_any
 
-    def _find_row_on_current_page(self, code: str, timeout=5):
-        w = WebDriverWait(self.driver, timeout)
-        try:
-            return w.until(EC.presence_of_element_located(self.ROW_BY_CODE(code)))
-        except TimeoutException:
-            return None
-
     def ensure_row_visible(self, code: str, evidencia=None):
         """
-        Asegura que la fila con el 'code' sea visible:
-        1) Intenta buscador.
-        2) Si no, recorre paginación 'Siguiente' hasta hallarla.
+        Asegura que la fila con el 'code' sea visible (ver RowFinder):
+        página actual, buscador, tamaño de página máximo y paginación.
         """
         self.wait_loaded_table()
-        used_search = self._try_search_code(code)
-
-        # Intento 1: página actual (un poco más de paciencia si usaste buscador)
-        row = self._find_row_on_current_page(code, timeout=6 if used_search else 4)
-        if row:
-            if evidencia:
-                evidencia(f"asist_row_encontrada__{code}")
-            return row
-
-        # Intento 2: paginación
-        hops = 0
-        while True:
-            row = self._find_row_on_current_page(code, timeout=3)
-            if row:
-                if evidencia:
-                    evidencia(f"asist_row_encontrada__{code}")
-                return row
-
-            # siguiente?
-            try:
-                next_btn = self.driver.find_element(*self.PAGINATION_NEXT)
-            except NoSuchElementException:
-                break  # No hay más páginas
-
-            try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", next_btn)
-            except Exception:
-                pass
-            try:
-                next_btn.click()
-            except Exception:
-                self.driver.execute_script("arguments[0].click();", next_btn)
-
-            hops += 1
-            if evidencia:
-                evidencia(f"asist_paginacion_click_{hops}")
-
-        # Último intento si hubo buscador
-        if used_search:
-            row = self._find_row_on_current_page(code, timeout=8)
-            if row:
-                if evidencia:
-                    evidencia(f"asist_row_encontrada__{code}")
-                return row
-
-        raise AssertionError(f"No se encontró la solicitud con código {code} en Recepción.")
+        finder = RowFinder(self.driver, self.TABLE, search=self._try_search_code,
+                           owner=type(self).__name__, evidencia=evidencia, evidence_prefix="asist")
+        row = finder.find(code)
+        if row is None:
+            raise AssertionError(f"No se encontró la solicitud con código {code} en Recepción. {finder.last}")
+        return row
 
     # ===================== DETALLE =====================
     def _wait_detalle_loaded(self, evidencia=None, require_detalle=True) -> bool:
@@ -400,8 +345,8 @@ class RecepcionSolicitudesPage:
                 evidencia("asistente_recepcion_subir_acuerdo_modal_open")
             return True
         except TimeoutException:
-            # Puede que el flujo navegue a otra ruta; damos un respiro ligero.
-            time.sleep(0.5)
+            # Puede que el flujo navegue a otra ruta; esperamos a que se asiente.
+            wait_spa_idle(self.driver, timeout=5)
             return False
 
     def click_subir_acuerdo_by_code(self, code: str, evidencia=None):
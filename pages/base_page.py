@@ -1,6 +1,10 @@
+import sys
+import time
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
+from . import frontend_metrics
 
 class BasePage:
     def __init__(self, driver, base_url):
@@ -11,6 +15,7 @@ class BasePage:
     def open(self, path: str = ""):
         url = self.base_url.rstrip("/") + "/" + path.lstrip("/")
         self.driver.get(url)
+        frontend_metrics.record_navigation(self.driver, owner=type(self).__name__)
 
     def wait_visible(self, locator):
         return self.wait.until(EC.visibility_of_element_located(locator))
@@ -40,3 +45,241 @@ class BasePage:
 
     def text_of(self, locator) -> str:
         return self.wait_visible(locator).text
+
+    # Espera adaptativa: reemplaza los time.sleep "por animaciones"
+    def wait_idle(self, timeout: float = 15, quiet_ms: int = 300) -> bool:
+        return wait_spa_idle(self.driver, timeout=timeout, quiet_ms=quiet_ms, owner=type(self).__name__)
+
+    # Varios locators alternativos: gana el primero que aparezca (ver wait_first_of)
+    def first_of(self, *locators, timeout: float = 15, state: str = "visible", name: str = None):
+        return wait_first_of(self.driver, locators, timeout=timeout, state=state,
+                             owner=type(self).__name__, name=name or _caller_name())
+
+
+# ==========================================================
+# Motor de espera "SPA idle"
+# ==========================================================
+#
+# La SPA está lista cuando se cumplen TODAS:
+#   1) no hay XHR/fetch pendientes (shim JS inyectado en la página),
+#   2) no hay spinners ni animaciones de Ant Design en curso,
+#   3) el DOM no ha mutado en los últimos `quiet_ms` milisegundos.
+#
+# El shim se (re)instala en cada sondeo si la página navegó; las peticiones
+# que ya estaban en vuelo antes de instalarlo no se cuentan, por eso también
+# se exige quietud del DOM.
+
+_IDLE_PROBE_JS = """
+const w = window;
+if (!w.__qaIdle) {
+    const st = w.__qaIdle = { pending: 0, lastMutation: Date.now() };
+    const XS = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        st.pending++;
+        this.addEventListener('loadend', () => { st.pending = Math.max(0, st.pending - 1); }, { once: true });
+        return XS.apply(this, arguments);
+    };
+    if (w.fetch) {
+        const F = w.fetch;
+        w.fetch = function () {
+            st.pending++;
+            return F.apply(this, arguments).finally(() => { st.pending = Math.max(0, st.pending - 1); });
+        };
+    }
+    new MutationObserver(() => { st.lastMutation = Date.now(); })
+        .observe(document.documentElement, { childList: true, subtree: true, attributes: true, characterData: true });
+}
+const spinning = !!document.querySelector('.ant-spin-spinning, .ant-btn-loading, .ant-skeleton-active');
+const animating = !!document.querySelector(
+    "[class*='ant-motion-'], [class*='-appear-active'], [class*='-enter-active'], [class*='-leave-active']"
+);
+return {
+    ready: document.readyState === 'complete',
+    pending: w.__qaIdle.pending,
+    quietMs: Date.now() - w.__qaIdle.lastMutation,
+    spinning: spinning,
+    animating: animating,
+};
+"""
+
+# owner (clase del page object / test) -> {"calls", "total_sec", "timeouts"}
+WAIT_STATS = {}
+
+
+def _record_wait(owner: str, elapsed: float, timed_out: bool):
+    st = WAIT_STATS.setdefault(owner, {"calls": 0, "total_sec": 0.0, "timeouts": 0})
+    st["calls"] += 1
+    st["total_sec"] += elapsed
+    if timed_out:
+        st["timeouts"] += 1
+
+
+def _caller_name() -> str:
+    # método que llamó a quien llama a esta función; salta los envoltorios
+    # de --page-timing (tests/utils/page_timing.py), que no son del page object
+    frame = sys._getframe(2)
+    while frame.f_code.co_name == "_page_timing_wrapper" and frame.f_back is not None:
+        frame = frame.f_back
+    return frame.f_code.co_name
+
+
+def _caller_owner() -> str:
+    # page object que llamó (si hay `self`) o módulo del test
+    frame = sys._getframe(2)
+    inst = frame.f_locals.get("self")
+    return type(inst).__name__ if inst is not None else frame.f_globals.get("__name__", "test")
+
+
+def wait_spa_idle(driver, timeout: float = 15, quiet_ms: int = 300, owner: str = None, poll: float = 0.1) -> bool:
+    """
+    Espera a que la SPA quede ociosa. Devuelve True si lo logró y False si
+    venció el timeout (tolerante: igual que los sleeps que reemplaza, no truena).
+    Sirve para page objects que no heredan de BasePage y para los tests;
+    el tiempo se acumula por page object (o por módulo de test) en WAIT_STATS.
+    """
+    owner = owner or _caller_owner()
+    t0 = time.perf_counter()
+    end = t0 + timeout
+    while True:
+        try:
+            st = driver.execute_script(_IDLE_PROBE_JS) or {}
+            if (st.get("ready") and not st.get("pending") and not st.get("spinning")
+                    and not st.get("animating") and st.get("quietMs", 0) >= quiet_ms):
+                _record_wait(owner, time.perf_counter() - t0, False)
+                return True
+        except Exception:
+            # navegación en curso / contexto destruido: reintentar
+            pass
+        if time.perf_counter() >= end:
+            _record_wait(owner, time.perf_counter() - t0, True)
+            return False
+        time.sleep(poll)
+
+
+def wait_stats_lines(stats: dict = None) -> list:
+    stats = WAIT_STATS if stats is None else stats
+    rows = sorted(stats.items(), key=lambda kv: kv[1]["total_sec"], reverse=True)
+    return [
+        f"{owner:<40} llamadas={st['calls']:<5} total={st['total_sec']:.2f}s "
+        f"promedio={st['total_sec'] / max(1, st['calls']):.2f}s timeouts={st['timeouts']}"
+        for owner, st in rows
+    ]
+
+
+# ==========================================================
+# Locators alternativos resueltos en paralelo
+# ==========================================================
+#
+# Probar N fallbacks uno por uno, cada uno con su propio timeout, cuesta
+# N x timeout cuando los primeros no existen. `wait_first_of` evalúa todas
+# las alternativas en un solo `execute_script` por sondeo y devuelve la
+# primera (en orden de preferencia) que cumpla el estado pedido.
+
+_FIRST_OF_JS = """
+const [locs, state] = arguments;
+const byCss = (v) => Array.from(document.querySelectorAll(v));
+const byXpath = (v) => {
+    const r = document.evaluate(v, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const out = [];
+    for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+    return out;
+};
+const links = (v, partial) => Array.from(document.getElementsByTagName('a'))
+    .filter(a => partial ? a.innerText.includes(v) : a.innerText.trim() === v);
+const find = {
+    'css selector': byCss,
+    'xpath': byXpath,
+    'id': (v) => byCss('[id="' + CSS.escape(v) + '"]'),
+    'name': (v) => byCss('[name="' + CSS.escape(v) + '"]'),
+    'class name': (v) => byCss('.' + CSS.escape(v)),
+    'tag name': (v) => Array.from(document.getElementsByTagName(v)),
+    'link text': (v) => links(v, false),
+    'partial link text': (v) => links(v, true),
+};
+const visible = (el) => {
+    if (!el.getClientRects().length) return false;
+    const cs = getComputedStyle(el);
+    return cs.visibility !== 'hidden' && cs.opacity !== '0';
+};
+const enabled = (el) => !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+const ok = state === 'present' ? (() => true)
+    : state === 'clickable' ? ((el) => visible(el) && enabled(el))
+    : visible;
+for (let i = 0; i < locs.length; i++) {
+    let els = [];
+    try { els = find[locs[i][0]](locs[i][1]); } catch (e) { continue; }
+    const hit = els.find(ok);
+    if (hit) return [i, hit];
+}
+return null;
+"""
+
+# "Owner.name" -> {"calls", "timeouts", "total_sec", "#i <by>=<valor>": victorias}
+FIRST_OF_STATS = {}
+
+
+def _alt_key(i: int, locator) -> str:
+    return f"#{i} {locator[0]}={locator[1]}"
+
+
+def _record_first_of(group: str, locators, winner, elapsed: float):
+    st = FIRST_OF_STATS.get(group)
+    if st is None:
+        st = FIRST_OF_STATS[group] = {"calls": 0, "timeouts": 0, "total_sec": 0.0}
+        for i, loc in enumerate(locators):
+            st[_alt_key(i, loc)] = 0
+    st["calls"] += 1
+    st["total_sec"] += elapsed
+    if winner is None:
+        st["timeouts"] += 1
+    else:
+        key = _alt_key(winner, locators[winner])
+        st[key] = st.get(key, 0) + 1
+
+
+def wait_first_of(driver, locators, timeout: float = 15, state: str = "visible", owner: str = None,
+                  name: str = None, poll: float = 0.1):
+    """
+    Espera a que alguno de `locators` cumpla `state` (present | visible |
+    clickable) y devuelve `(índice, elemento)` del primero en orden de
+    preferencia. Falla con TimeoutException si ninguno aparece a tiempo.
+    Las victorias de cada alternativa se acumulan en FIRST_OF_STATS para
+    detectar fallbacks que nunca ganan.
+    """
+    locators = [tuple(loc) for loc in locators]
+    if not locators:
+        raise ValueError("wait_first_of necesita al menos un locator.")
+    group = f"{owner or _caller_owner()}.{name or sys._getframe(1).f_code.co_name}"
+    t0 = time.perf_counter()
+    end = t0 + timeout
+    while True:
+        try:
+            hit = driver.execute_script(_FIRST_OF_JS, [list(loc) for loc in locators], state)
+        except Exception:
+            # navegación en curso / contexto destruido: reintentar
+            hit = None
+        if hit:
+            index, element = hit
+            _record_first_of(group, locators, index, time.perf_counter() - t0)
+            return index, element
+        if time.perf_counter() >= end:
+            _record_first_of(group, locators, None, time.perf_counter() - t0)
+            raise TimeoutException(
+                f"Ninguna alternativa quedó {state} en {timeout}s ({group}): {locators}"
+            )
+        time.sleep(poll)
+
+
+def first_of_lines(stats: dict = None) -> list:
+    stats = FIRST_OF_STATS if stats is None else stats
+    lines = []
+    for group, st in sorted(stats.items(), key=lambda kv: kv[1]["total_sec"], reverse=True):
+        lines.append(
+            f"{group:<40} llamadas={st['calls']:<5} timeouts={st['timeouts']:<4} "
+            f"promedio={st['total_sec'] / max(1, st['calls']):.2f}s"
+        )
+        for key, wins in st.items():
+            if key.startswith("#"):
+                share = 100 * wins / max(1, st["calls"] - st["timeouts"])
+                lines.append(f"    {key[:70]:<70} gana={wins:<5} ({share:.0f}%)" + ("  <- nunca gana" if not wins else ""))
+    return lines
@@ -5,6 +5,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException
+from .ant_table import AntTable
+from .ant_select import AntSelect
+from .frontend_metrics import record_navigation
 
 
 class BitacoraPage:
@@ -96,6 +99,7 @@ class BitacoraPage:
         """Abre directamente /bitacora."""
         url = f"{base_url.rstrip('/')}{self.URL_PATH}"
         self.driver.get(url)
+        record_navigation(self.driver, owner="BitacoraPage")
 
     def wait_loaded(self):
         """
@@ -187,7 +191,7 @@ class BitacoraPage:
 
     def get_rows_text(self):
         """Devuelve el texto completo de cada fila (para asserts en tests)."""
-        return [row.text for row in self.get_rows()]
+        return AntTable(self.driver, self.TABLE).rows_text()
 
     # ------------------------------------------------------------------
     # Filtro por usuario (select "Buscar por usuario")
@@ -201,42 +205,9 @@ class BitacoraPage:
         - Selecciona la opción que contenga ese texto
         - Espera a que la tabla se refresque (haya filas o estado vacío)
         """
-        # 1) Abrir el select
-        select = self.wait.until(EC.element_to_be_clickable(self.USER_SELECT))
-        select.click()
-
-        # 2) Escribir en el input de búsqueda
-        input_el = self.wait.until(
-            EC.visibility_of_element_located(self.USER_SEARCH_INPUT)
-        )
-        input_el.clear()
-        input_el.send_keys(text)
-
-        # 3) Esperar opciones filtradas
-        self.wait.until(
-            EC.presence_of_all_elements_located(self.USER_OPTIONS)
-        )
-
-        options = self.driver.find_elements(*self.USER_OPTIONS)
-
-        if not options:
-            raise AssertionError(
-                f"No se encontraron opciones en el combo de usuario para '{text}'"
-            )
-
-        # Buscar opción que contenga el texto
-        target = None
-        for opt in options:
-            if text.lower() in opt.text.lower():
-                target = opt
-                break
-
-        # Fallback: primera opción, si ninguna coincide exactamente
-        if not target:
-            target = options[0]
-
-        # 4) Click en la opción
-        self.driver.execute_script("arguments[0].click();", target)
+        # 1-4) Abrir, escribir y elegir la opción que contenga el texto
+        #      (si ninguna coincide, la primera, como antes)
+        AntSelect(self.driver, self.USER_SELECT).pick(text, exact=False, search=True, or_first=True)
 
         # 5) Esperar a que la tabla se refresque (filas o mensaje vacío)
         def _tabla_filtrada(d):
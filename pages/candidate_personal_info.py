@@ -3,8 +3,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver import ActionChains
-from selenium.common.exceptions import NoSuchElementException
-import random
+from .ant_select import AntSelect
 
 
 class CandidatePersonalInfoStep1Page:
@@ -151,67 +150,6 @@ class CandidatePersonalInfoStep2Page:
         self._type(self.MIDDLE_NAME_INPUT, middle_name)
         self._type(self.LAST_NAME_INPUT, last_name)
 
-    def _open_select(self, select_locator):
-        """
-        Hace scroll al <Select> de AntD y lo abre con click.
-        """
-        container = self.wait.until(EC.element_to_be_clickable(select_locator))
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({block:'center'});", container
-        )
-        try:
-            container.click()
-        except Exception:
-            # fallback por si hay overlays raros
-            self.driver.execute_script("arguments[0].click();", container)
-
-    # ------------------------------------------------------------------
-    # Helper genérico para elegir una opción del dropdown por texto
-    # ------------------------------------------------------------------
-    def _pick_from_dropdown(self, option_text: str):
-        """
-        Selecciona una opción de cualquier dropdown de AntD usando el texto 
-        visible de la opción (lo que tú ves en pantalla).
-        """
-        target_norm = option_text.strip().lower()
-
-        # Esperar a que aparezca al menos UNA opción
-        self.wait.until(
-            EC.presence_of_element_located(
-                (By.XPATH, "//div[contains(@class,'ant-select-item-option')]")
-            )
-        )
-
-        options = self.driver.find_elements(
-            By.XPATH,
-            "//div[contains(@class,'ant-select-item-option')]"
-        )
-
-        visibles = []
-        objetivo = None
-
-        for opt in options:
-            txt = opt.text.strip()
-            if not txt:
-                continue
-            visibles.append(txt)
-            if txt.strip().lower() == target_norm:
-                objetivo = opt
-                break
-
-        if not objetivo:
-            # Debug friendly
-            raise NoSuchElementException(
-                f"No se encontró opción con texto '{option_text}'. "
-                f"Opciones visibles: {visibles}"
-            )
-
-        # Scroll al centro y click
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({block:'center'});", objetivo
-        )
-        objetivo.click()
-
     # ------------------------------------------------------------------
     # Acciones de alto nivel
     # ------------------------------------------------------------------
@@ -219,15 +157,13 @@ class CandidatePersonalInfoStep2Page:
         """
         Selecciona estado civil: 'Soltero', 'Casado/a', 'Viudo/a', etc.
         """
-        self._open_select(self.CIVIL_STATUS_SELECT)
-        self._pick_from_dropdown(option_text)
+        AntSelect(self.driver, self.CIVIL_STATUS_SELECT).pick(option_text)
 
     def select_gender(self, option_text: str):
         """
         Selecciona género: 'Masculino' o 'Femenino'.
         """
-        self._open_select(self.GENDER_SELECT)
-        self._pick_from_dropdown(option_text)
+        AntSelect(self.driver, self.GENDER_SELECT).pick(option_text)
 
     def fill_birth_date(self, date_str: str):
         """
@@ -302,13 +238,6 @@ class CandidatePersonalInfoStep2Page:
         elem.clear()
         elem.send_keys(text)
 
-    def _open_select(self, select_locator):
-        select_elem = self.wait.until(EC.element_to_be_clickable(select_locator))
-        try:
-            select_elem.click()
-        except Exception:
-            self.driver.execute_script("arguments[0].click();", select_elem)
-
 class CandidatePersonalInfoStep3Page:
     def __init__(self, driver, timeout=10):
         self.driver = driver
@@ -345,62 +274,6 @@ class CandidatePersonalInfoStep3Page:
         "//div[contains(@class,'steps-action')]//button[span[normalize-space()='Siguiente']]"
     )
 
-    # --------- Helpers internos para selects (Ant Design) ---------
-
-    def _open_select(self, trigger_locator):
-        trigger = self.wait.until(
-            EC.element_to_be_clickable(trigger_locator)
-        )
-        trigger.click()
-
-    def _get_open_dropdown_options(self):
-        dropdown = self.wait.until(
-            EC.visibility_of_element_located(
-                (
-                    By.CSS_SELECTOR,
-                    ".ant-select-dropdown:not(.ant-select-dropdown-hidden)"
-                )
-            )
-        )
-        options = dropdown.find_elements(
-            By.CSS_SELECTOR,
-            ".ant-select-item-option"
-        )
-        return dropdown, options
-
-    def _pick_from_dropdown_by_text(self, text: str):
-        dropdown, options = self._get_open_dropdown_options()
-
-        for opt in options:
-            span = opt.find_element(
-                By.CSS_SELECTOR,
-                ".ant-select-item-option-content"
-            )
-            if span.text.strip() == text.strip():
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", opt)
-                opt.click()
-                return
-
-        visible = [opt.text for opt in options]
-        raise Exception(
-            f"No se encontró opción con texto '{text}'. Opciones visibles: {visible}"
-        )
-
-    def _pick_from_dropdown_random(self):
-        dropdown, options = self._get_open_dropdown_options()
-        if not options:
-            raise Exception("No hay opciones visibles en el dropdown.")
-
-        opt = random.choice(options)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", opt)
-        opt.click()
-
-    def _pick_from_dropdown(self, text: str):
-        """
-        Wrapper para mantener el mismo nombre que usamos en otros PageObjects.
-        """
-        return self._pick_from_dropdown_by_text(text)
-
     # --------- Acciones de alto nivel ---------
 
     def wait_loaded(self):
@@ -448,17 +321,15 @@ class CandidatePersonalInfoStep3Page:
         el.send_keys(email)
 
     def select_random_bank(self):
-        self._open_select(self.BANK_SELECT_TRIGGER)
-        self._pick_from_dropdown_random()
+        AntSelect(self.driver, self.BANK_SELECT_TRIGGER).pick_random()
 
     def select_account_type_ahorro(self):
         """
         Abre el combo de 'Tipo de cuenta' y selecciona siempre
         la opción 'Cuenta de Ahorro' (tal como aparece en el UI).
         """
-        self._open_select(self.BANK_ACCOUNT_TYPE_TRIGGER)
         # 👇 OJO: coincide con la opción real del dropdown
-        self._pick_from_dropdown("Cuenta de Ahorro")
+        AntSelect(self.driver, self.BANK_ACCOUNT_TYPE_TRIGGER).pick("Cuenta de Ahorro")
 
     def fill_bank_account_number(self, acc_number: str):
         el = self.wait.until(
@@ -4,8 +4,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import Keys
-from selenium.webdriver import ActionChains
 import time
+from .base_page import wait_spa_idle
+from .frontend_metrics import record_navigation
+from .ant_table import AntTable
+from .ant_select import AntSelect
 
 class ContractDetailPage:
     # Encabezado del detalle (para asegurar que cargó la vista)
@@ -31,6 +34,7 @@ class ContractDetailPage:
         self.wait.until(EC.url_contains("/contratos/solicitud/"))
         self.wait.until(EC.visibility_of_element_located(self.DETAIL_TITLE))
         self.wait.until(EC.visibility_of_element_located(self.SECTION_TEACHERS))
+        record_navigation(self.driver, owner="ContractDetailPage")
 
     def click_add_candidate(self):
         btn = self.wait.until(EC.element_to_be_clickable(self.ADD_CANDIDATE_BTN))
@@ -107,9 +111,8 @@ class ContractDetailPage:
         inp.clear()
         inp.send_keys(text)
 
-        # 4) Breve espera para que cargue el dropdown y ENTER sobre la primera coincidencia
-        import time
-        time.sleep(0.4)
+        # 4) Esperar a que cargue el dropdown y ENTER sobre la primera coincidencia
+        wait_spa_idle(self.driver, timeout=5, quiet_ms=150)
         inp.send_keys(Keys.ENTER)
     
     def _candidate_option_by_text(self, text: str):
@@ -164,26 +167,10 @@ class ContractDetailPage:
         #return (sel_text_el.text or sel_text_el.get_attribute("textContent") or "").strip()
     
     # --- CARGO (Ant Select simple) ---
-    CARGO_WRAPPER = (
-        By.XPATH,
-        "//label[normalize-space()='Cargo']/ancestor::div[contains(@class,'ant-form-item')]"
-    )
     CARGO_SELECTOR = (
         By.XPATH,
         "//label[normalize-space()='Cargo']/ancestor::div[contains(@class,'ant-form-item')]//div[contains(@class,'ant-select-selector')]"
     )
-    CARGO_DROPDOWN_OPEN = (
-        By.XPATH,
-        "//div[contains(@class,'ant-select-dropdown') and not(contains(@class,'ant-select-dropdown-hidden'))]"
-    )
-    def _cargo_option_by_text(self, text: str):
-        # opción dentro del dropdown abierto
-        return (By.XPATH,
-            "//div[contains(@class,'ant-select-dropdown') and not(contains(@class,'ant-select-dropdown-hidden'))]"
-            "//div[contains(@class,'ant-select-item') and contains(@class,'option')]"
-            f"[.//div[contains(@class,'ant-select-item-option-content')][normalize-space()='{text}']]"
-        )
-
     # Para verificar el valor elegido (texto en el selector)
     CARGO_SELECTED_TEXT = (
         By.XPATH,
@@ -191,37 +178,13 @@ class ContractDetailPage:
         "//span[contains(@class,'ant-select-selection-item')]")
     
     def select_cargo(self, cargo_text: str = "Profesor"):
-        # Centrar para que no lo tape el header
-        wrap = self.wait.until(EC.visibility_of_element_located(self.CARGO_WRAPPER))
-        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", wrap)
-        self.driver.execute_script("window.scrollBy(0, -80);")
-
-        # Abrir el select
-        box = self.wait.until(EC.element_to_be_clickable(self.CARGO_SELECTOR))
-        try:
-            box.click()
-        except Exception:
-            self.driver.execute_script("arguments[0].click();", box)
+        # AntSelect centra el select bajo el header, elige y verifica el texto en el selector
+        AntSelect(self.driver, self.CARGO_SELECTOR).pick(cargo_text)
 
-        # Esperar dropdown y hacer click en la opción exacta
-        self.wait.until(EC.visibility_of_element_located(self.CARGO_DROPDOWN_OPEN))
-        opt = self.wait.until(EC.element_to_be_clickable(self._cargo_option_by_text(cargo_text)))
-        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", opt)
-        try:
-            opt.click()
-        except Exception:
-            self.driver.execute_script("arguments[0].click();", opt)
-
-        # Verificar que quedó seleccionado (texto en el selector)
         sel = self.wait.until(EC.visibility_of_element_located(self.CARGO_SELECTED_TEXT))
         assert cargo_text.lower() in (sel.text or "").lower(), f"No se seleccionó '{cargo_text}'."
 
     # === Locators para "Funciones a desarrollar" (multiselect) ===
-    FUNCS_WRAPPER = (
-        By.XPATH,
-        "//label[normalize-space()='Seleccione las funciones a desarrollar']"
-        "/ancestor::div[contains(@class,'ant-form-item')]"
-    )
     FUNCS_SELECTOR = (
         By.XPATH,
         # el contenedor clickeable del select múltiple
@@ -229,113 +192,15 @@ class ContractDetailPage:
         "/ancestor::div[contains(@class,'ant-form-item')]"
         "//div[contains(@class,'ant-select') and contains(@class,'ant-select-multiple')]"
     )
-    FUNCS_SELECTED_CHIPS = (
-        By.XPATH,
-        # los chips ya seleccionados dentro del wrapper
-        "//label[normalize-space()='Seleccione las funciones a desarrollar']"
-        "/ancestor::div[contains(@class,'ant-form-item')]"
-        "//span[contains(@class,'ant-select-selection-item')]"
-    )
-    FUNCS_DROPDOWN_OPEN = (
-        By.XPATH,
-        # cualquier dropdown de Ant que esté abierto (no-hidden)
-        "//div[contains(@class,'ant-select-dropdown') and not(contains(@class,'ant-select-dropdown-hidden'))]"
-    )
-    FUNCS_DROPDOWN_OPTIONS = (
-        By.XPATH,
-        # items de opción visibles dentro del dropdown abierto
-        "//div[contains(@class,'ant-select-dropdown') and not(contains(@class,'ant-select-dropdown-hidden'))]"
-        "//div[contains(@class,'ant-select-item') and contains(@class,'option')]"
-    )
-    def _func_option_by_text(self, text: str):
-        return (
-            By.XPATH,
-            "//div[contains(@class,'ant-select-dropdown') and not(contains(@class,'ant-select-dropdown-hidden'))]"
-            f"//div[contains(@class,'ant-select-item-option-content')][normalize-space()='{text}']"
-        )
-
-    def _open_funcs_dropdown(self):
-        wrap = self.wait.until(EC.visibility_of_element_located(self.FUNCS_WRAPPER))
-        # centrar y compensar header fijo
-        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", wrap)
-        self.driver.execute_script("window.scrollBy(0, -80);")
-        box = self.wait.until(EC.element_to_be_clickable(self.FUNCS_SELECTOR))
-        try:
-            box.click()
-        except Exception:
-            self.driver.execute_script("arguments[0].click();", box)
-        self.wait.until(EC.visibility_of_element_located(self.FUNCS_DROPDOWN_OPEN))
-
-    def _snapshot_functions_texts(self):
-        """Lee los textos actuales (página visible del dropdown)."""
-        items = self.driver.find_elements(*self.FUNCS_DROPDOWN_OPTIONS)
-        texts = []
-        for it in items:
-            t = it.text.strip()
-            if t:
-                texts.append(t)
-        # únicos conservando orden
-        seen = set(); uniq = []
-        for t in texts:
-            if t not in seen:
-                seen.add(t); uniq.append(t)
-        return uniq
-
-    def FUNCS_CHIP_BY_TEXT(self, text: str):
-        return (
-            By.XPATH,
-            "//label[normalize-space()='Seleccione las funciones a desarrollar']"
-            "/ancestor::div[contains(@class,'ant-form-item')]"
-            f"//span[contains(@class,'ant-select-selection-item')][normalize-space()='{text}']"
-        )
-
     def select_all_functions(self, max_passes: int = 5):
         """
-        Selecciona todas las opciones visibles del multiselect evitando loops.
-        Trabaja con un snapshot de textos y valida progreso en cada pasada.
+        Selecciona todas las opciones del multiselect (AntSelect recorre la lista
+        virtual en un solo script y reintenta las que no quedaron).
         """
-        self._open_funcs_dropdown()
-        all_texts = self._snapshot_functions_texts()
-        if not all_texts:
-            return
-
-        selected_prev = len(self.driver.find_elements(*self.FUNCS_SELECTED_CHIPS))
-        passes = 0
-        while passes < max_passes:
-            passes += 1
-            # aseguramos dropdown abierto
-            try:
-                self.driver.find_element(*self.FUNCS_DROPDOWN_OPEN)
-            except Exception:
-                self._open_funcs_dropdown()
-
-            for label in all_texts:
-                # si ya está seleccionado, saltar
-                if self.driver.find_elements(*self.FUNCS_CHIP_BY_TEXT(label)):
-                    continue
-
-                loc = self._func_option_by_text(label)
-                opt = self.wait.until(EC.visibility_of_element_located(loc))
-                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", opt)
-                try:
-                    opt.click()
-                except Exception:
-                    ActionChains(self.driver).move_to_element(opt).pause(0.05).click().perform()
-
-            selected_now = len(self.driver.find_elements(*self.FUNCS_SELECTED_CHIPS))
-            if selected_now == selected_prev:
-                break  # no hubo progreso → cortar
-            selected_prev = selected_now
-
-            remaining = [t for t in all_texts if not self.driver.find_elements(*self.FUNCS_CHIP_BY_TEXT(t))]
-            if not remaining:
-                break
-            self._open_funcs_dropdown()
-
-        # validaciones finales
-        chips_texts = [el.text.strip() for el in self.driver.find_elements(*self.FUNCS_SELECTED_CHIPS)]
-        missing = [t for t in all_texts if t not in chips_texts]
-        assert selected_prev > 0, "No se seleccionó ninguna función."
+        select = AntSelect(self.driver, self.FUNCS_SELECTOR)
+        chips_texts = select.pick_all(max_passes=max_passes)
+        missing = [t for t in select.options() if t not in chips_texts]
+        assert chips_texts, "No se seleccionó ninguna función."
         assert not missing, f"No se pudieron seleccionar: {missing}"
     
     # ...
@@ -391,8 +256,8 @@ class ContractDetailPage:
         el.send_keys(Keys.DELETE)
         # Escribir la fecha
         el.send_keys(text)
-        # Pequeña pausa para que React capte el cambio
-        time.sleep(0.1)
+        # Esperar a que React capte el cambio
+        wait_spa_idle(self.driver, timeout=2, quiet_ms=100)
 
     def set_period_dates(self, start_ddmmyyyy: str, end_ddmmyyyy: str):
         """
@@ -414,7 +279,6 @@ class ContractDetailPage:
         start.send_keys(Keys.ENTER)
 
         # esperar a que el overlay (calendario) no interfiera
-        time.sleep(0.05)
         try:
             self.wait.until_not(EC.visibility_of_element_located(self.DATEPICKER_OVERLAY_OPEN))
         except Exception:
@@ -431,7 +295,6 @@ class ContractDetailPage:
         end.send_keys(end_ddmmyyyy)
         end.send_keys(Keys.ENTER)
 
-        time.sleep(0.05)
         try:
             self.wait.until_not(EC.visibility_of_element_located(self.DATEPICKER_OVERLAY_OPEN))
         except Exception:
@@ -445,32 +308,9 @@ class ContractDetailPage:
         "//label[contains(.,'Seleccione la materia y grupo')]/ancestor::div[contains(@class,'ant-form-item')]"
         "//div[contains(@class,'ant-select') and contains(@class,'ant-select-single')]")
 
-    # Input de búsqueda dentro del select (Ant Design)
-    MATERIA_INPUT = (By.XPATH,
-        "//label[contains(.,'Seleccione la materia y grupo')]/ancestor::div[contains(@class,'ant-form-item')]"
-        "//input[@type='search' and contains(@class,'ant-select-selection-search-input')]")
-
     def select_materia_grupo(self, visible_text: str):
-        # Abrir el dropdown y escribir
-        select = self.wait.until(EC.visibility_of_element_located(self.MATERIA_SELECT))
-        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", select)
-        select.click()
-
-        inp = self.wait.until(EC.element_to_be_clickable(self.MATERIA_INPUT))
-        # limpiar por si hay algo
-        inp.send_keys(Keys.CONTROL, "a")
-        inp.send_keys(Keys.DELETE)
-        inp.send_keys(visible_text)
-
-        # Esperar y clickear la opción exacta
-        option = self.wait.until(EC.visibility_of_element_located((
-            By.XPATH,
-            "//div[contains(@class,'ant-select-dropdown') and not(contains(@class,'hidden'))]"
-            "//div[@class='ant-select-item-option-content' and normalize-space()=\"{}\"]"
-            .format(visible_text)
-        )))
-        self.driver.execute_script("arguments[0].scrollIntoView({block:'nearest'});", option)
-        option.click()
+        # Escribe en el buscador del select y elige la opción exacta
+        AntSelect(self.driver, self.MATERIA_SELECT).pick(visible_text, search=True)
     
     # --- Pago y horas (Ant InputNumber) -----------------------------------------
 
@@ -559,10 +399,9 @@ class ContractDetailPage:
         # forzar valor con eventos
         self._set_value_react_input(el, desired_str)
         self._blur_body()
-        time.sleep(0.05)
 
-        # verificación numérica
-        got = self._numeric_of(el.get_attribute("value") or "")
+        # verificación numérica (espera a que el formateo de AntD se asiente)
+        got = self._wait_numeric_value(el, desired_num)
         if got is None or abs(got - desired_num) > 0.005:
             # reintento con tipeo lento si no quedó
             if retries > 0:
@@ -571,13 +410,24 @@ class ContractDetailPage:
                 el.send_keys(Keys.DELETE)
                 for ch in desired_str:
                     el.send_keys(ch)
+                    # pausa por tecla: el formateador de AntD reescribe el valor
+                    # en cada input y a velocidad completa se pierden dígitos
                     time.sleep(0.03)
                 self._blur_body()
-                time.sleep(0.05)
-                got = self._numeric_of(el.get_attribute("value") or "")
+                got = self._wait_numeric_value(el, desired_num)
             if got is None or abs(got - desired_num) > 0.005:
                 raise TimeoutException(f"El valor no quedó en {desired_str}. Actual: {el.get_attribute('value')}")
 
+    def _wait_numeric_value(self, el, desired_num: float, timeout: float = 1.5):
+        """Devuelve el valor numérico del input apenas coincide (o el último leído)."""
+        got = None
+        end = time.time() + timeout
+        while True:
+            got = self._numeric_of(el.get_attribute("value") or "")
+            if (got is not None and abs(got - desired_num) <= 0.005) or time.time() >= end:
+                return got
+            time.sleep(0.05)
+
     def fill_compensation(self, hourly_usd: float, weeks: int, weekly_hours: int):
         """
         Llena de una:
@@ -610,13 +460,8 @@ class ContractDetailPage:
         """Espera a que el table no muestre el spinner de carga."""
         # Espera a que exista el wrapper
         self.wait.until(EC.presence_of_element_located(self.TABLE_WRAPPER))
-        end = time.time() + timeout
-        while time.time() < end:
-            spinners = self.driver.find_elements(*self.TABLE_LOADING)
-            if not spinners or not any(s.is_displayed() for s in spinners):
-                return
-            time.sleep(0.1)
-        # No es crítico si no detectamos spinner; seguimos
+        # spinner + XHR pendientes + DOM quieto; no es crítico si vence, seguimos
+        wait_spa_idle(self.driver, timeout=timeout)
 
     def _go_to_last_page(self):
         """Avanza páginas hasta que el botón 'siguiente' esté deshabilitado."""
@@ -678,12 +523,6 @@ class ContractDetailPage:
         # Espera a que termine cualquier overlay/spinner
         self._wait_table_idle()
 
-        # Si sale toast de éxito, dale un respiro para que el table se repinte
-        try:
-            if self.driver.find_elements(*self.ANT_MESSAGE):
-                time.sleep(0.25)
-        except Exception:
-            pass
 
         # 1) Intento: ¿cambió el contenido del tbody en esta página?
         end = time.time() + 5.0
@@ -729,71 +568,32 @@ class ContractDetailPage:
             digits = "".join(re.findall(r"[0-9.]", s))
             return float(digits) if digits else 0.0
     
-    def _col_index_by_header(self, header_text: str) -> int:
-        """
-        Devuelve el índice (1-based) de la columna cuyo <th> coincide con header_text.
-        Tolerante a espacios y mayúsculas/minúsculas.
-        """
-        thead_ths = self.driver.find_elements(By.CSS_SELECTOR, ".ant-table-thead th")
-        wanted = header_text.strip().lower()
-        for i, th in enumerate(thead_ths, start=1):
-            txt = (th.text or th.get_attribute("textContent") or "").strip().lower()
-            if txt == wanted:
-                return i
-            # tolera encabezados con sufijos/prefijos (p.ej. iconos)
-            if wanted in txt:
-                return i
-        raise TimeoutException(f"No se encontró la columna con encabezado: {header_text!r}")
-
-
-    def _row_cells(self, tr):
-        # normal: <td>
-        tds = tr.find_elements(By.CSS_SELECTOR, "td")
-        if tds:
-            return tds
-        # fallback (algunas tablas virtualizadas): role="cell"
-        cells = tr.find_elements(By.CSS_SELECTOR, "[role='cell']")
-        return cells
-    
     def assert_ultima_fila(self, valor_hora: float, horas_sem: int, semanas: int):
         # Por si hay paginación 1-por-página, vete al final
         self._go_to_last_page()
         self._wait_table_idle()
 
-        # filas disponibles (usa la sección 'body' como referencia al contar)
-        _, body_trs, _, n = self._tbody_trs_all()
-        assert n > 0 and (body_trs or True), "No hay filas en la tabla de materias."
-
-        row_idx = n - 1  # última fila (0-based)
-        celdas = self._row_all_cells_by_index(row_idx)
-        assert celdas, "No se pudieron leer las celdas de la última fila (¿tabla vacía o virtualizada?)."
-
-        # Índices dinámicos por encabezado (1-based)
-        idx_vhora = self._col_index_by_header("Valor por hora")
-        idx_hsem  = self._col_index_by_header("Horas semanales")
-        idx_sem   = self._col_index_by_header("Semanas a pagar")
-        idx_thoras= self._col_index_by_header("Total de horas")
-        idx_tpagar= self._col_index_by_header("Total a pagar")
-
-        # Seguridad: ¿tenemos suficientes celdas?
-        for need, idx in [("Valor por hora", idx_vhora), ("Horas semanales", idx_hsem),
-                        ("Semanas a pagar", idx_sem), ("Total de horas", idx_thoras),
-                        ("Total a pagar", idx_tpagar)]:
-            if idx > len(celdas):
-                raise TimeoutException(
-                    f"La fila no tiene la celda #{idx} para '{need}'. "
-                    f"Celdas visibles combinadas: {len(celdas)}"
-                )
+        # una sola foto de la tabla: encabezados + celdas (left/body/right combinadas)
+        tabla = self._table_snapshot()
+        assert tabla.rows, "No hay filas en la tabla de materias."
+
+        ultima = tabla.rows[-1]
+        assert ultima.cells, "No se pudieron leer las celdas de la última fila (¿tabla vacía o virtualizada?)."
 
-        def get_txt(ix):
-            el = celdas[ix-1]
-            return (el.text or el.get_attribute("textContent") or "").strip()
+        def get_txt(header):
+            try:
+                return ultima.cell(header)
+            except KeyError as e:
+                raise TimeoutException(
+                    f"La fila no tiene la celda para '{header}'. "
+                    f"Celdas visibles combinadas: {len(ultima.cells)}"
+                ) from e
 
-        v_hora = self._num(get_txt(idx_vhora))
-        h_sem  = int(self._num(get_txt(idx_hsem)))
-        sem    = int(self._num(get_txt(idx_sem)))
-        t_horas= self._num(get_txt(idx_thoras))
-        t_pagar= self._num(get_txt(idx_tpagar))
+        v_hora = self._num(get_txt("Valor por hora"))
+        h_sem  = int(self._num(get_txt("Horas semanales")))
+        sem    = int(self._num(get_txt("Semanas a pagar")))
+        t_horas= self._num(get_txt("Total de horas"))
+        t_pagar= self._num(get_txt("Total a pagar"))
 
         exp_total_horas = float(horas_sem * semanas)
         exp_total_pagar = float(valor_hora) * horas_sem * semanas
@@ -809,60 +609,13 @@ class ContractDetailPage:
 
     # --- AntD fixed columns helpers -------------------------------------------------
 
-    def _thead_ths_all(self):
+    def _table_snapshot(self):
         """
-        Devuelve todos los <th> de la tabla combinando left/body/right
-        en el orden visual: left -> body -> right.
+        Foto de la tabla con un solo execute_script. AntTable combina las secciones
+        left/body/right de las columnas fijas en el orden visual.
         """
-        left  = self.driver.find_elements(By.CSS_SELECTOR, ".ant-table-fixed-left .ant-table-thead th")
-        body  = self.driver.find_elements(By.CSS_SELECTOR, ".ant-table-container .ant-table-thead th:not(.ant-table-cell-fix-left):not(.ant-table-cell-fix-right)")
-        right = self.driver.find_elements(By.CSS_SELECTOR, ".ant-table-fixed-right .ant-table-thead th")
-        return [*left, *body, *right]
+        return AntTable(self.driver, self.TABLE_WRAPPER).snapshot()
 
-    def _tbody_trs_all(self):
-        """
-        Devuelve listas paralelas de filas para left/body/right (cada una puede estar vacía).
-        El índice de fila es consistente entre secciones.
-        """
-        left  = self.driver.find_elements(By.CSS_SELECTOR, ".ant-table-fixed-left .ant-table-tbody tr")
-        body  = self.driver.find_elements(By.CSS_SELECTOR, ".ant-table-container .ant-table-tbody tr")
-        right = self.driver.find_elements(By.CSS_SELECTOR, ".ant-table-fixed-right .ant-table-tbody tr")
-        # usa la sección que tenga más filas como referencia visual
-        n = max(len(left), len(body), len(right))
-        return left, body, right, n
-
-    def _cells_of_tr(self, tr):
-        if not tr:
-            return []
-        cells = tr.find_elements(By.CSS_SELECTOR, "td")
-        if cells:
-            return cells
-        return tr.find_elements(By.CSS_SELECTOR, "[role='cell']")
-
-    def _row_all_cells_by_index(self, row_idx):
-        """
-        Concatena las celdas de la fila 'row_idx' de left + body + right
-        en el orden visual.
-        """
-        left, body, right, n = self._tbody_trs_all()
-        tr_left  = left[row_idx]  if row_idx < len(left)  else None
-        tr_body  = body[row_idx]  if row_idx < len(body)  else None
-        tr_right = right[row_idx] if row_idx < len(right) else None
-        return [*self._cells_of_tr(tr_left), *self._cells_of_tr(tr_body), *self._cells_of_tr(tr_right)]
-
-    def _col_index_by_header(self, header_text: str) -> int:
-        """
-        Índice 1-based de la columna cuyo <th> coincide (por texto, case/trim insensitive),
-        combinando left/body/right en orden visual.
-        """
-        wanted = header_text.strip().lower()
-        ths = self._thead_ths_all()
-        for i, th in enumerate(ths, start=1):
-            txt = (th.text or th.get_attribute("textContent") or "").strip().lower()
-            if txt == wanted or wanted in txt:
-                return i
-        raise TimeoutException(f"No se encontró la columna con encabezado: {header_text!r}")
-    
     # --- Post-Guardar: volver al detalle y validar tabla de candidatos ------------
 
     GUARDAR_BTN = (By.XPATH, "//button[.//span[normalize-space()='Guardar']]")
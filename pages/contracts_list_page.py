@@ -12,6 +12,9 @@ from selenium.common.exceptions import (
     NoSuchElementException,
 )
 import time
+from .base_page import wait_spa_idle
+from .row_finder import RowFinder
+from .frontend_metrics import mark_navigation, record_navigation
 
 class ContractsListPage:
     # ====== Locators de la lista ======
@@ -39,6 +42,7 @@ class ContractsListPage:
     # Navegación / estado
     def open(self):
         self.driver.get(f"{self.base_url}/contratos")
+        record_navigation(self.driver, owner="ContractsListPage")
 
     def wait_loaded(self):
         self.wait.until(EC.visibility_of_element_located(self.PAGE_TITLE))
@@ -100,7 +104,7 @@ class ContractsListPage:
             if aria == "descending":
                 break
             hdr.click()
-            time.sleep(0.3)
+            wait_spa_idle(self.driver, timeout=5)
         self._wait_table_ready()
 
     def get_first_code(self) -> str:
@@ -195,46 +199,25 @@ class ContractsListPage:
             f"//div[contains(@class,'ant-table')]//tbody/tr[.//td[1][contains(normalize-space(), '{code}')]]"
     )
     
-    def _row_exists(self, code: str, timeout: int = 6) -> bool:
+    def _try_search_code(self, code: str, timeout: int = 10) -> bool:
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(self._row_by_code_locator(code))
-            )
-            return True
+            self.search_code(code, timeout=timeout)
         except TimeoutException:
-            return False
+            # la búsqueda se aplicó pero no devolvió filas a tiempo: RowFinder sigue esperando
+            pass
+        return True
 
     def ensure_code_visible(self, code: str, timeout: int = 12):
         """
-        Ejecuta search_code(code) y confirma que exista una fila con ese código.
-        Reintenta con ENTER y click JS si la lupa no aplica la búsqueda.
+        Confirma que exista una fila con ese código (ver RowFinder): página actual,
+        search_code(code), tamaño de página máximo y paginación.
         """
-        self.search_code(code, timeout=timeout)
-        if self._row_exists(code, timeout=timeout):
-            return
-
-        # Reintento: ENTER sobre el input
-        try:
-            inp = WebDriverWait(self.driver, 4).until(EC.element_to_be_clickable(self.SEARCH_INPUT))
-            inp.click()
-            inp.send_keys(Keys.ENTER)
-        except Exception:
-            pass
-
-        # Click por JS a la lupa (si está)
-        try:
-            btn = WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located(self.SEARCH_BUTTON)
-            )
-            self.driver.execute_script("arguments[0].click();", btn)
-        except Exception:
-            pass
-
-        self._wait_table_idle(timeout)
-        if not self._row_exists(code, timeout=timeout):
-            time.sleep(0.5)
-            if not self._row_exists(code, timeout=2):
-                raise TimeoutException(f"No aparece la fila con código {code} tras buscar.")
+        finder = RowFinder(self.driver, self.TABLE_WRAPPER,
+                           search=lambda c: self._try_search_code(c, timeout=timeout),
+                           owner=type(self).__name__, timeout=timeout)
+        # 1ª columna = código (tolerante a espacios/caracteres invisibles)
+        if finder.find(code, column=0, exact=False) is None:
+            raise TimeoutException(f"No aparece la fila con código {code} tras buscar. {finder.last}")
 
     def wait_row_visible(self, code: str, timeout: int = 10):
         # Usa el helper robusto
@@ -245,6 +228,7 @@ class ContractsListPage:
         Dentro de la fila del código, clic al botón 'Ver' (con fallback).
         """
         row = self.wait.until(EC.visibility_of_element_located(self._row_by_code_locator(code)))
+        mark_navigation(self.driver)
         try:
             ver_btn = row.find_element(By.XPATH, ".//button[.//span[normalize-space()='Ver']]")
             self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", ver_btn)
@@ -339,7 +323,7 @@ class ContractCreateWizard:
                     document.execCommand('insertText', false, value);
                 """, editable, text)
 
-                time.sleep(0.2)
+                wait_spa_idle(self.driver, timeout=3, quiet_ms=150)
                 return
             except StaleElementReferenceException:
                 if attempt == 2:
@@ -3,7 +3,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.keys import Keys
-import time
+from .base_page import wait_spa_idle
 
 
 class ContratoCandidatoPage:
@@ -145,7 +145,7 @@ class ContratoCandidatoPage:
     def _set_modal_date_and_confirm(self, fecha_ddmmyyyy: str, evidencia=None, etiqueta=""):
         # 1) Modal visible
         self._visible_modal_root()
-        time.sleep(0.15)  # pequeño yield
+        wait_spa_idle(self.driver, timeout=3, quiet_ms=150)  # termina la animación del modal
 
         # 2) Input de fecha
         date_input = self._modal_date_input()
@@ -190,7 +190,7 @@ class ContratoCandidatoPage:
         )
         if evidencia:
             evidencia(f"{etiqueta}estado_actualizado")
-        time.sleep(0.4)  # evitar que el siguiente (+) choque con tooltips
+        wait_spa_idle(self.driver, timeout=5)  # evitar que el siguiente (+) choque con tooltips
 
     # ---------- Helpers para localizar el (+) de cada paso ----------
     def _step_plus_btn_xpath_by_title(self, titulo: str):
@@ -240,7 +240,7 @@ class ContratoCandidatoPage:
         if evidencia and etiqueta:
             evidencia(f"estado_click_plus__{etiqueta}")
 
-        time.sleep(0.15)
+        wait_spa_idle(self.driver, timeout=3, quiet_ms=150)
 
     # ---------- cambiar estado con fecha ----------
     def cambiar_estado(self, titulo_estado: str, fecha_ddmmyyyy: str, evidencia=None):
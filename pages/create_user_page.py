@@ -5,6 +5,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver import ActionChains
 from selenium.common.exceptions import TimeoutException
 import time
+from .ant_select import AntSelect
 
 
 class CreateUserPage:
@@ -23,17 +24,6 @@ class CreateUserPage:
     # Select (Escuela) — aparece/habilita cuando Rol = Candidato o Director Escuela
     SCHOOL_SELECTOR = (By.XPATH, "//label[@for='createUser_school_id']/following::div[contains(@class,'ant-select')][1]")
 
-    # Cualquier dropdown visible de Ant Design (el overlay)
-    DROPDOWN_VISIBLE = (By.XPATH, "//div[contains(@class,'ant-select-dropdown') and not(contains(@class,'ant-select-dropdown-hidden'))]")
-
-    # Opción visible por texto (para usar tanto en Rol como en Escuela)
-    def _OPTION_BY_TEXT(self, text):
-        return (By.XPATH,
-            "//div[contains(@class,'ant-select-dropdown') and not(contains(@class,'ant-select-dropdown-hidden'))]"
-            "//div[contains(@class,'ant-select-item-option')][.//div[contains(@class,'ant-select-item-option-content')][normalize-space(text())="
-            f"'{text}']]"
-        )
-
     # Botón Crear
     CREATE_BUTTON = (By.XPATH, "//button[@type='submit' and contains(@class,'ant-btn-primary')]")
 
@@ -53,46 +43,16 @@ class CreateUserPage:
         el.clear()
         el.send_keys(text)
 
-    def _open_select(self, selector_locator):
-        box = self.wait.until(EC.element_to_be_clickable(selector_locator))
-        box.click()
-        self.wait.until(EC.visibility_of_element_located(self.DROPDOWN_VISIBLE))
-
     def _move_and_click(self, element):
         actions = ActionChains(self.driver)
         actions.move_to_element(element).pause(0.15).click().perform()
 
-    def _scroll_into_view(self, element):
-        try:
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({block:'center', inline:'nearest'});", element
-            )
-        except Exception:
-            pass
-
-    def _pick_from_dropdown(self, visible_text):
-        # Asegurar overlay visible
-        panel = self.wait.until(EC.visibility_of_element_located(self.DROPDOWN_VISIBLE))
-        self._scroll_into_view(panel)
-
-        # Localizar opción por texto
-        opt_locator = self._OPTION_BY_TEXT(visible_text)
-        option = self.wait.until(EC.visibility_of_element_located(opt_locator))
-        self._scroll_into_view(option)
-
-        # Click con movimiento real de mouse (el dropdown no responde a teclas/tap)
-        self._move_and_click(option)
-
-        # Esperar que cierre (confirmación de selección)
-        self.wait.until(EC.invisibility_of_element_located(self.DROPDOWN_VISIBLE))
-
     # -------- Acciones de alto nivel --------
     def select_role(self, role_text: str):
         """
-        Abre el dropdown de Rol y selecciona usando mouse movement (sin TAP/teclas).
+        Abre el dropdown de Rol y selecciona la opción (AntSelect verifica la selección).
         """
-        self._open_select(self.ROLE_SELECTOR)
-        self._pick_from_dropdown(role_text)
+        AntSelect(self.driver, self.ROLE_SELECTOR).pick(role_text)
 
     def wait_school_enabled(self):
         """
@@ -104,10 +64,9 @@ class CreateUserPage:
 
     def select_school(self, school_text: str):
         """
-        Abre el dropdown de Escuela y selecciona usando mouse movement.
+        Abre el dropdown de Escuela y selecciona la opción.
         """
-        self._open_select(self.SCHOOL_SELECTOR)
-        self._pick_from_dropdown(school_text)
+        AntSelect(self.driver, self.SCHOOL_SELECTOR).pick(school_text)
 
     def submit(self):
         btn = self.wait.until(EC.element_to_be_clickable(self.CREATE_BUTTON))
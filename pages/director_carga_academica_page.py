@@ -2,6 +2,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from .ant_table import AntTable
 
 
 class DirectorCargaAcademicaPage:
@@ -84,8 +85,7 @@ class DirectorCargaAcademicaPage:
 
     def get_rows_text(self):
         """Devuelve el texto de cada fila (por si quieres asserts más específicos)."""
-        rows = self.driver.find_elements(*self.TABLE_ROWS)
-        return [r.text for r in rows]
+        return AntTable(self.driver, self.TABLE_WRAPPER).rows_text()
     
      # =============== BÚSQUEDA ===============
 
@@ -1,8 +1,10 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from .frontend_metrics import mark_navigation, record_navigation, tag_role
 
 class DirectorHomePage:
+    ROLE = "director"
     ROLE_BANNER = (By.XPATH, "//header[contains(@class,'ant-layout-header')]//span[contains(normalize-space(),'Sesión iniciada como')]")
     ANY_STAT_CARD = (By.XPATH, "//*[@class='ant-card' and .//div[contains(@class,'ant-statistic')]]")
     ANY_CARD      = (By.CSS_SELECTOR, ".ant-card")  # señal más laxa
@@ -44,6 +46,7 @@ class DirectorHomePage:
             EC.visibility_of_element_located(self.ANY_CARD),
             EC.visibility_of_element_located(self.MENU_CONTRATOS),
         ], timeout=20)
+        tag_role(self.driver, self.ROLE)
 
     def get_role_banner_text(self) -> str:
         try:
@@ -54,4 +57,8 @@ class DirectorHomePage:
             return ""  # no todos los roles muestran banner siempre
 
     def go_to_contratos(self):
-        self.wait.until(EC.element_to_be_clickable(self.MENU_CONTRATOS)).click()
+        link = self.wait.until(EC.element_to_be_clickable(self.MENU_CONTRATOS))
+        mark_navigation(self.driver)
+        link.click()
+        self.wait.until(EC.url_contains("/contratos"))
+        record_navigation(self.driver, owner="DirectorHomePage", role=self.ROLE)
@@ -0,0 +1,196 @@
+"""
+Métricas de carga del frontend tomadas de la Performance API del navegador.
+
+Los page objects llaman a `record_navigation` después de navegar (y
+`mark_navigation` justo antes de un click de menú). En cada medición se lee,
+en un solo execute_script:
+
+- carga completa (primera medición del documento, p.ej. `driver.get`):
+  Navigation Timing (TTFB, DOMContentLoaded, load, bytes del documento),
+  FCP y LCP;
+- navegación de la SPA (cambio de ruta sin recargar): milisegundos desde la
+  marca hasta que la vista quedó ociosa;
+- en ambos casos, desde la medición anterior (o la marca): long tasks
+  (> 50 ms en el hilo principal), llamadas XHR/fetch y bytes transferidos
+  (Resource Timing).
+
+Cada muestra queda en FRONTEND_METRICS con la ruta normalizada
+(/contratos/solicitud/{id}), el rol de la sesión y el page object. El
+conftest la adjunta a Allure, la junta entre workers y la escribe al final
+de la corrida. Los navegadores sin alguna API (Firefox no tiene LCP ni long
+tasks) devuelven None en esos campos; nada de esto hace fallar un test.
+"""
+import csv
+import json
+import math
+import os
+import re
+import time
+from urllib.parse import urlparse
+
+from . import base_page  # import circular: base_page usa record_navigation en open()
+
+# lo apaga el conftest con --frontend-metrics=off
+ENABLED = True
+
+# muestras en orden de medición (dicts planos; ver record_navigation)
+FRONTEND_METRICS = []
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f-]{27,}|[0-9a-f]{16,})$", re.IGNORECASE)
+
+# Los observers con buffered:true recuperan las entradas anteriores a su
+# instalación; takeRecords() las entrega en el mismo script (sin esperar al
+# callback asíncrono). El estado vive en window: se pierde con cada carga
+# completa, que es justo cuando hay que volver a reportar Navigation Timing.
+_PERF_JS = """
+const w = window;
+let st = w.__qaPerf;
+if (!st) {
+    st = w.__qaPerf = { reported: false, last: 0, mark: null, lcp: null, longTasks: [] };
+    // el buffer por defecto (250) se llena en una sesión larga de la SPA
+    if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(5000);
+    const onLcp = (e) => { st.lcp = e.renderTime || e.loadTime || e.startTime; };
+    const onLong = (e) => { st.longTasks.push([e.startTime, e.duration]); };
+    for (const [type, cb] of [['largest-contentful-paint', onLcp], ['longtask', onLong]]) {
+        try {
+            const o = new PerformanceObserver((list) => list.getEntries().forEach(cb));
+            o.observe({ type: type, buffered: true });
+            o.takeRecords().forEach(cb);
+        } catch (e) { /* API no soportada por el navegador */ }
+    }
+}
+const now = performance.now();
+if (arguments[0] === 'mark') { st.mark = now; return null; }
+
+const full = !st.reported;
+const from = full ? 0 : (st.mark !== null ? st.mark : st.last);
+const tasks = st.longTasks.filter((t) => t[0] >= from);
+const resources = performance.getEntriesByType('resource').filter((r) => r.startTime >= from);
+const out = {
+    url: location.href,
+    kind: full ? 'carga' : 'spa',
+    long_tasks: tasks.length,
+    long_task_ms: tasks.reduce((acc, t) => acc + t[1], 0),
+    api_calls: resources.filter((r) => r.initiatorType === 'xmlhttprequest' || r.initiatorType === 'fetch').length,
+    // transferSize es 0 en recursos de otro origen sin Timing-Allow-Origin
+    transfer_bytes: resources.reduce((acc, r) => acc + (r.transferSize || 0), 0),
+};
+if (full) {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    if (nav) {
+        out.ttfb_ms = nav.responseStart;
+        out.dom_content_loaded_ms = nav.domContentLoadedEventEnd;
+        out.load_ms = nav.loadEventEnd || null;
+        out.transfer_bytes += nav.transferSize || 0;
+    }
+    out.fcp_ms = fcp ? fcp.startTime : null;
+    out.lcp_ms = st.lcp;
+} else if (st.mark !== null) {
+    out.duration_ms = now - st.mark;
+}
+st.reported = true;
+st.last = now;
+st.mark = null;
+return out;
+"""
+
+FIELDS = ("ts", "kind", "route", "role", "owner", "ttfb_ms", "dom_content_loaded_ms", "load_ms", "fcp_ms",
+          "lcp_ms", "duration_ms", "long_tasks", "long_task_ms", "api_calls", "transfer_bytes", "url")
+
+
+def route_template(url: str) -> str:
+    """/contratos/solicitud/17 -> /contratos/solicitud/{id} (agrupa por vista)."""
+    parts = urlparse(url).path.rstrip("/").split("/")
+    return "/".join("{id}" if _ID_SEGMENT.match(p) else p for p in parts) or "/"
+
+
+def tag_role(driver, role: str):
+    """Rol de la sesión actual del navegador (lo usan las muestras sin rol explícito)."""
+    if role:
+        driver._gc_role = role
+
+
+def mark_navigation(driver):
+    """Marca el inicio de una navegación de la SPA (antes del click del menú)."""
+    if not ENABLED:
+        return
+    try:
+        driver.execute_script(_PERF_JS, "mark")
+    except Exception:
+        pass  # navegación en curso: la medición usará la anterior como inicio
+
+
+def record_navigation(driver, owner: str = None, role: str = None, settle: bool = True, timeout: float = 5):
+    """
+    Mide la vista actual y guarda la muestra en FRONTEND_METRICS.
+    Con `settle` primero espera a que la SPA quede ociosa (así LCP y las
+    long tasks de la carga ya están). Devuelve la muestra o None.
+    """
+    if not ENABLED:
+        return None
+    if settle:
+        base_page.wait_spa_idle(driver, timeout=timeout, owner=owner)
+    try:
+        raw = driver.execute_script(_PERF_JS) or {}
+    except Exception:
+        return None
+    sample = {key: raw.get(key) for key in FIELDS}
+    sample.update(
+        ts=round(time.time(), 3),
+        route=route_template(raw.get("url", "")),
+        role=role or getattr(driver, "_gc_role", None),
+        owner=owner,
+    )
+    for key in FIELDS:
+        if key.endswith("_ms") and sample[key] is not None:
+            sample[key] = round(sample[key], 1)
+    FRONTEND_METRICS.append(sample)
+    return sample
+
+
+# ==========================================================
+# Resumen
+# ==========================================================
+
+def _p50(values: list):
+    values = sorted(v for v in values if v is not None)
+    return values[max(1, math.ceil(len(values) * 0.5)) - 1] if values else None
+
+
+def _ms(value) -> str:
+    return f"{value:.0f}ms" if value is not None else "-"
+
+
+def write_metrics(path: str, samples: list = None) -> int:
+    """Todas las muestras de la corrida: JSON (lista) o CSV si `path` termina en .csv."""
+    samples = FRONTEND_METRICS if samples is None else samples
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if path.endswith(".csv"):
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=FIELDS + ("test",), extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(samples)
+    else:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(samples, fh, ensure_ascii=False, indent=2)
+    return len(samples)
+
+
+def frontend_metrics_lines(samples: list = None) -> list:
+    samples = FRONTEND_METRICS if samples is None else samples
+    groups = {}
+    for s in samples:
+        groups.setdefault((s["route"], s["kind"]), []).append(s)
+    lines = []
+    for (route, kind), rows in sorted(groups.items(), key=lambda kv: (kv[0][1], kv[0][0])):
+        col = lambda key: [r.get(key) for r in rows]
+        if kind == "carga":
+            detail = (f"ttfb={_ms(_p50(col('ttfb_ms')))} fcp={_ms(_p50(col('fcp_ms')))} "
+                      f"lcp={_ms(_p50(col('lcp_ms')))} load={_ms(_p50(col('load_ms')))}")
+        else:
+            detail = f"navegación={_ms(_p50(col('duration_ms')))}"
+        roles = ",".join(sorted({r["role"] for r in rows if r.get("role")})) or "-"
+        lines.append(f"{route[:40]:<40} {kind:<5} n={len(rows):<4} p50 {detail} "
+                     f"long tasks={sum(r.get('long_tasks') or 0 for r in rows)} roles={roles}")
+    return lines
@@ -2,9 +2,10 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.keys import Keys
 import time
+from .row_finder import RowFinder
 
 class GenerarContratosPage:
     # Encabezado
@@ -33,9 +34,6 @@ class GenerarContratosPage:
 
     # Tabla
     TABLE = (By.XPATH, "//div[contains(@class,'ant-table') and .//table]")
-    ROW_BY_CODE = lambda self, code: (
-        By.XPATH, f"//table//tbody/tr[.//td[normalize-space()='{code}']]"
-    )
     BTN_VER_IN_ROW = (By.XPATH, ".//button[.//span[normalize-space()='Ver']]")
 
     # Buscador
@@ -48,12 +46,6 @@ class GenerarContratosPage:
         "//span[contains(@class,'ant-input-group')]//button[contains(@class,'ant-input-search-button')]"
     )
 
-    # Paginación
-    PAGINATION_NEXT = (
-        By.XPATH,
-        "//ul[contains(@class,'ant-pagination')]//li[contains(@class,'ant-pagination-next') and not(contains(@class,'disabled'))]"
-    )
-
     LIST_TABLE = (By.XPATH, "//div[contains(@class,'ant-table') and .//table]")
     SEARCH_BOX = (By.XPATH, "//input[contains(@placeholder,'Buscar')]")
     SPINNER    = (By.CSS_SELECTOR, ".ant-spin-spinning")  # AntD Spin visible
@@ -123,67 +115,19 @@ class GenerarContratosPage:
                 pass
         return used
 
-    def _find_row_current_page(self, code: str, timeout=5):
-        try:
-            return WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(self.ROW_BY_CODE(code))
-            )
-        except TimeoutException:
-            return None
-
     def ensure_row_visible(self, code: str, evidencia=None):
         """
-        Asegura que la fila con el 'code' sea visible:
-        1) Intenta buscador.
-        2) Si no, recorre paginación 'Siguiente' hasta hallarla.
+        Asegura que la fila con el 'code' sea visible (ver RowFinder):
+        página actual, buscador, tamaño de página máximo y paginación.
         """
-        used_search = self.search_by_code(code, evidencia=evidencia)
-
-        # Intento 1: página actual
-        row = self._find_row_current_page(code, timeout=6 if used_search else 4)
-        if row:
-            if evidencia:
-                evidencia(f"generar_contratos_row_encontrada__{code}")
-            return row
-
-        # Intento 2: paginación
-        page_hops = 0
-        while True:
-            row = self._find_row_current_page(code, timeout=3)
-            if row:
-                if evidencia:
-                    evidencia(f"generar_contratos_row_encontrada__{code}")
-                return row
-
-            # Buscar botón "Siguiente" habilitado
-            try:
-                next_btn = self.driver.find_element(*self.PAGINATION_NEXT)
-            except NoSuchElementException:
-                break  # No hay más páginas
-
-            try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", next_btn)
-            except Exception:
-                pass
-
-            try:
-                next_btn.click()
-            except Exception:
-                self.driver.execute_script("arguments[0].click();", next_btn)
-
-            page_hops += 1
-            if evidencia:
-                evidencia(f"generar_contratos_paginacion_click_{page_hops}")
-
-        # Si se usó buscador, un último intento con espera un poco mayor
-        if used_search:
-            row = self._find_row_current_page(code, timeout=8)
-            if row:
-                if evidencia:
-                    evidencia(f"generar_contratos_row_encontrada__{code}")
-                return row
-
-        raise AssertionError(f"No se encontró el código '{code}' en Generar contratos.")
+        finder = RowFinder(self.driver, self.TABLE,
+                           search=lambda c: self.search_by_code(c, evidencia=evidencia),
+                           owner=type(self).__name__, evidencia=evidencia,
+                           evidence_prefix="generar_contratos")
+        row = finder.find(code)
+        if row is None:
+            raise AssertionError(f"No se encontró el código '{code}' en Generar contratos. {finder.last}")
+        return row
 
     # ---------- Acción: Ver ----------
     def click_ver(self, code: str, evidencia=None):
@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from .frontend_metrics import mark_navigation, record_navigation
 
 class HomePage:
     # Menú lateral (expandido o colapsado, tu HTML está expandido)
@@ -14,8 +15,11 @@ class HomePage:
     def go_to_users(self):
         # Espera a que el menú esté clickeable (ya estás logueado y en /)
         link = self.wait.until(EC.element_to_be_clickable(self.USERS_MENU))
+        mark_navigation(self.driver)
         try:
             link.click()
         except Exception:
             # Fallback JS por si hay overlay de animación
             self.driver.execute_script("arguments[0].click();", link)
+        self.wait.until(EC.url_contains("/usuarios"))
+        record_navigation(self.driver, owner="HomePage")
@@ -24,36 +24,42 @@ class LogoutBar(BasePage):
         (By.XPATH, "//li[contains(@class,'ant-dropdown-menu-item')][.//span[normalize-space()='Cerrar Sesión']]"),
     ]
 
+    DROPDOWN = (By.CSS_SELECTOR, ".ant-dropdown, .ant-dropdown-menu")
+
     def open_menu_if_needed(self):
-        # intenta abrir el menú si aún no está visible
-        for loc in self.TRIGGERS:
+        # intenta abrir el menú si aún no está visible; todos los triggers se
+        # esperan a la vez y, si el elegido no abre el menú, se prueba con los siguientes
+        triggers = list(self.TRIGGERS)
+        while triggers:
+            try:
+                ix, btn = self.first_of(*triggers, state="clickable", timeout=10)
+            except TimeoutException:
+                break
             try:
-                btn = self.wait_clickable(loc)
                 ActionChains(self.driver).move_to_element(btn).pause(0.1).click(btn).perform()
                 # si ya aparece algún item de menú, salimos
-                WebDriverWait(self.driver, 5).until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, ".ant-dropdown, .ant-dropdown-menu"))
-                )
+                WebDriverWait(self.driver, 5).until(EC.visibility_of_element_located(self.DROPDOWN))
                 return
             except Exception:
-                continue
+                triggers = triggers[ix + 1:]
         # si no hay trigger, asumimos que ya está abierto (p. ej. lo abrió la app)
 
     def do_logout(self):
         self.open_menu_if_needed()
 
-        last_err = None
-        for loc in self.MENU_ITEM_XPATHS:
+        items = list(self.MENU_ITEM_XPATHS)
+        while items:
             try:
-                self.click(loc)  # usa el click con espera de BasePage
+                ix, item = self.first_of(*items, state="clickable")
+            except TimeoutException:
+                break
+            try:
+                item.click()
                 # esperar a que el overlay desaparezca (menú cerrado)
-                WebDriverWait(self.driver, 5).until(
-                    EC.invisibility_of_element_located((By.CSS_SELECTOR, ".ant-dropdown, .ant-dropdown-menu"))
-                )
+                WebDriverWait(self.driver, 5).until(EC.invisibility_of_element_located(self.DROPDOWN))
                 return True
-            except Exception as e:
-                last_err = e
-                continue
+            except Exception:
+                items = items[ix + 1:]
 
         raise TimeoutException(
             "No se encontró el item de menú 'Cerrar Sesión'. "
@@ -0,0 +1,290 @@
+"""
+Motor único para ubicar una fila en una tabla paginada de Ant Design.
+
+Cada page object tenía su propio "buscar y, si no, recorrer páginas con
+sleeps" con límites distintos. `RowFinder` aplica siempre la misma
+estrategia, de la más barata a la más cara, y sale apenas encuentra la fila:
+
+1) la página actual (una foto de `AntTable`, un solo round-trip);
+2) el buscador de la vista, si el page object lo provee (`search`);
+3) el tamaño de página máximo que ofrezca el paginador;
+4) "Siguiente" página por página, esperando a que la fila ancla quede
+   stale en lugar de dormir un tiempo fijo.
+
+Cada búsqueda deja en `finder.last` y en `ROW_LOOKUP_STATS` (por page
+object) cuántas páginas y cuántos comandos WebDriver costó.
+"""
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .ant_table import AntTable
+from .base_page import wait_spa_idle
+
+# owner -> {"lookups", "found", "pages", "round_trips", "total_sec"}
+ROW_LOOKUP_STATS = {}
+
+
+class RowLookup:
+    """Resultado y costo de una búsqueda."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.row = None            # WebElement <tr> o None
+        self.strategy = None       # actual | buscador | tamaño | página N
+        self.pages = 1             # páginas inspeccionadas (la actual cuenta)
+        self.round_trips = 0       # comandos WebDriver emitidos
+        self.elapsed_sec = 0.0
+
+    @property
+    def found(self) -> bool:
+        return self.row is not None
+
+    def __repr__(self):
+        return (f"RowLookup({self.text!r}, found={self.found}, strategy={self.strategy!r}, "
+                f"pages={self.pages}, round_trips={self.round_trips}, {self.elapsed_sec:.2f}s)")
+
+
+class RowFinder:
+    PAG_NEXT          = (By.CSS_SELECTOR, ".ant-pagination-next:not(.ant-pagination-disabled)")
+    PAGE_SIZE_SELECT  = (By.CSS_SELECTOR, ".ant-pagination-options .ant-select")
+    PAGE_SIZE_OPTIONS = (By.CSS_SELECTOR, ".ant-select-dropdown:not(.ant-select-dropdown-hidden) .ant-select-item-option")
+    ANCHOR_ROW        = (By.CSS_SELECTOR, ".ant-table-tbody > tr.ant-table-row")
+
+    def __init__(self, driver, table=None, search=None, owner: str = None, max_pages: int = 30,
+                 timeout: float = 8, evidencia=None, evidence_prefix: str = "fila"):
+        """
+        table:  root de la tabla para `AntTable` (locator o WebElement; None = la primera).
+        search: callable(text) -> bool del page object; True si pudo usar el buscador.
+        """
+        self.driver = driver
+        self.table = AntTable(driver, table)
+        self.search = search
+        self.owner = owner or "RowFinder"
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.evidencia = evidencia
+        self.evidence_prefix = evidence_prefix
+        self.last = None
+
+    # -----------------------------
+    # API
+    # -----------------------------
+    def find(self, text: str, column=None, exact: bool = True):
+        """
+        Devuelve el <tr> cuya celda coincide con `text` o None.
+        column: encabezado (str), índice 0-based (int) o None = cualquier celda.
+        exact:  igualdad (sin mayúsculas/espacios) o subcadena.
+        """
+        lookup = self.last = RowLookup(text)
+        t0 = time.perf_counter()
+        with _CommandCounter(self.driver) as counter:
+            try:
+                lookup.row, lookup.strategy = self._run(text, column, exact, lookup)
+            finally:
+                lookup.round_trips = counter.count
+                lookup.elapsed_sec = time.perf_counter() - t0
+                _record_lookup(self.owner, lookup)
+        if lookup.found and self.evidencia:
+            self.evidencia(f"{self.evidence_prefix}_row_encontrada__{text}")
+        return lookup.row
+
+    # -----------------------------
+    # Estrategias
+    # -----------------------------
+    def _run(self, text, column, exact, lookup):
+        row = self._match_row(text, column, exact)
+        if row is not None:
+            return row, "actual"
+
+        if self.search is not None:
+            anchor = self._anchor()
+            if self.search(text):
+                row = self._wait_change(anchor, text, column, exact)
+                if row is not None:
+                    return row, "buscador"
+
+        if self._has_next() and self._maximize_page_size():
+            lookup.pages += 1
+            row = self._match_row(text, column, exact)
+            if row is not None:
+                return row, "tamaño"
+
+        for hop in range(1, self.max_pages + 1):
+            anchor = self._anchor()
+            if not self._click_next():
+                break
+            lookup.pages += 1
+            if self.evidencia:
+                self.evidencia(f"{self.evidence_prefix}_paginacion_click_{hop}")
+            row = self._wait_change(anchor, text, column, exact)
+            if row is not None:
+                return row, f"página {hop + 1}"
+        return None, None
+
+    def _match_row(self, text, column, exact):
+        snap = self.table.snapshot(required=False)
+        target = _norm(text)
+        for i, row in enumerate(snap.rows):
+            if column is None:
+                values = row.cells
+            elif isinstance(column, int):
+                values = row.cells[column:column + 1]
+            else:
+                values = (row.get(column),)
+            if any((_norm(v) == target) if exact else (target in _norm(v)) for v in values):
+                return self.table.row_element(i)
+        return None
+
+    def _anchor(self):
+        rows = self.driver.find_elements(*self.ANCHOR_ROW)
+        return rows[0] if rows else None
+
+    def _wait_change(self, anchor, text, column, exact):
+        """
+        Espera a que la tabla se refresque (la fila ancla queda stale) o a que
+        la fila buscada aparezca, lo que ocurra primero.
+        """
+        def changed_or_found(_):
+            row = self._match_row(text, column, exact)
+            if row is not None:
+                return row
+            if anchor is None:
+                return "cambió"
+            try:
+                anchor.is_enabled()
+                return False
+            except StaleElementReferenceException:
+                return "cambió"
+
+        try:
+            hit = WebDriverWait(self.driver, self.timeout, poll_frequency=0.25).until(changed_or_found)
+        except TimeoutException:
+            hit = None
+        if hit is not None and hit != "cambió":
+            return hit
+        # la tabla cambió (o no se detectó): una última foto con la SPA quieta
+        wait_spa_idle(self.driver, timeout=self.timeout, owner=self.owner)
+        return self._match_row(text, column, exact)
+
+    def _has_next(self) -> bool:
+        return bool(self.driver.find_elements(*self.PAG_NEXT))
+
+    def _click_next(self) -> bool:
+        btns = self.driver.find_elements(*self.PAG_NEXT)
+        if not btns:
+            return False
+        try:
+            btns[0].click()
+        except Exception:
+            self.driver.execute_script("arguments[0].click();", btns[0])
+        return True
+
+    def _maximize_page_size(self) -> bool:
+        """Elige la opción 'N / página' más grande; True si cambió algo."""
+        selects = self.driver.find_elements(*self.PAGE_SIZE_SELECT)
+        if not selects:
+            return False
+        anchor = self._anchor()
+        try:
+            selects[0].click()
+            options = WebDriverWait(self.driver, 3).until(
+                lambda d: d.find_elements(*self.PAGE_SIZE_OPTIONS)
+            )
+        except Exception:
+            return False
+        sizes = [(_page_size(o.get_attribute("title") or o.text), o) for o in options]
+        sizes = [(n, o) for n, o in sizes if n]
+        if not sizes:
+            return False
+        _, best = max(sizes, key=lambda s: s[0])
+        if "ant-select-item-option-selected" in (best.get_attribute("class") or ""):
+            # ya está en el máximo: cerrar el dropdown y seguir con la paginación
+            self.driver.execute_script("document.activeElement && document.activeElement.blur();")
+            return False
+        try:
+            best.click()
+        except Exception:
+            self.driver.execute_script("arguments[0].click();", best)
+        if anchor is not None:
+            try:
+                WebDriverWait(self.driver, self.timeout).until(lambda d: _is_stale(anchor))
+            except TimeoutException:
+                pass
+        wait_spa_idle(self.driver, timeout=self.timeout, owner=self.owner)
+        return True
+
+
+# ==========================================================
+# Helpers
+# ==========================================================
+
+def _norm(s) -> str:
+    return " ".join((s or "").split()).lower()
+
+
+def _page_size(label: str) -> int:
+    digits = "".join(ch for ch in (label or "").split("/")[0] if ch.isdigit())
+    return int(digits) if digits else 0
+
+
+def _is_stale(el) -> bool:
+    try:
+        el.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True
+
+
+class _CommandCounter:
+    """
+    Cuenta los comandos WebDriver (cada uno es un round-trip HTTP) emitidos
+    dentro del bloque. WebElement también pasa por `driver.execute`.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.count = 0
+
+    def __enter__(self):
+        self._shadowed = "execute" in vars(self.driver)
+        original = self.driver.execute
+
+        def counting(*args, **kwargs):
+            self.count += 1
+            return original(*args, **kwargs)
+
+        self._original = original
+        self.driver.execute = counting
+        return self
+
+    def __exit__(self, *exc):
+        if self._shadowed:
+            self.driver.execute = self._original
+        else:
+            del self.driver.execute
+        return False
+
+
+def _record_lookup(owner: str, lookup: RowLookup):
+    st = ROW_LOOKUP_STATS.setdefault(owner, {"lookups": 0, "found": 0, "pages": 0,
+                                             "round_trips": 0, "total_sec": 0.0})
+    st["lookups"] += 1
+    st["found"] += int(lookup.found)
+    st["pages"] += lookup.pages
+    st["round_trips"] += lookup.round_trips
+    st["total_sec"] += lookup.elapsed_sec
+
+
+def row_lookup_lines(stats: dict = None) -> list:
+    stats = ROW_LOOKUP_STATS if stats is None else stats
+    rows = sorted(stats.items(), key=lambda kv: kv[1]["total_sec"], reverse=True)
+    return [
+        f"{owner:<40} búsquedas={st['lookups']:<4} halladas={st['found']:<4} "
+        f"páginas={st['pages']:<5} round-trips={st['round_trips']:<6} "
+        f"promedio={st['round_trips'] / max(1, st['lookups']):.1f} rt, "
+        f"{st['total_sec'] / max(1, st['lookups']):.2f}s"
+        for owner, st in rows
+    ]
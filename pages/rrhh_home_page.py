@@ -3,8 +3,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.common.keys import Keys
+from .row_finder import RowFinder
+from .frontend_metrics import mark_navigation, record_navigation, tag_role
 
 class RRHHHomePage:
+    ROLE = "rrhh"
     HEADER_ROLE = (By.XPATH, "//header//span[contains(.,'Sesión iniciada como') "
                              "and (contains(.,'RRHH') or contains(.,'Recursos Humanos'))]")
     MENU_VALIDACION = (By.XPATH, "//aside//a[@href='/solicitudes' or normalize-space()='Validación de solicitudes']")
@@ -22,6 +25,7 @@ class RRHHHomePage:
 
     def wait_loaded(self):
         self.wait.until(EC.visibility_of_element_located(self.HEADER_ROLE))
+        tag_role(self.driver, self.ROLE)
 
     def go_to_validacion(self, evidencia=None):
         link = self.wait.until(EC.element_to_be_clickable(self.MENU_VALIDACION))
@@ -32,6 +36,7 @@ class RRHHHomePage:
             pass
         if evidencia:
             evidencia("menu_validacion_visible")
+        mark_navigation(self.driver)
         try:
             link.click()
         except Exception:
@@ -41,6 +46,7 @@ class RRHHHomePage:
 
         # Confirma navegación
         self.wait.until(EC.url_contains("/solicitudes"))
+        record_navigation(self.driver, owner="RRHHHomePage", role=self.ROLE)
     
     # === NUEVO: ir a "Generar contratos" ===
     def go_to_generar_contratos(self, evidencia=None):
@@ -56,6 +62,7 @@ class RRHHHomePage:
                     pass
                 if evidencia:
                     evidencia("menu_generar_contratos_visible")
+                mark_navigation(self.driver)
                 try:
                     link.click()
                 except Exception:
@@ -70,6 +77,7 @@ class RRHHHomePage:
         self.wait.until(EC.url_contains("/generar-contratos"))
         self.wait.until(EC.visibility_of_element_located(self.TITLE_GENERAR))
         self.wait.until(EC.presence_of_element_located(self.TABLE_GENERAR))
+        record_navigation(self.driver, owner="RRHHHomePage", role=self.ROLE)
         if evidencia:
             evidencia("generar_contratos_vista_lista")
 
@@ -77,7 +85,6 @@ class ValidacionSolicitudesPage:
     # Encabezado/página
     TITLE = (By.XPATH, "//*[contains(@class,'ant-page-header') and .//*[contains(.,'Solicitudes de contratación')]]")
     TABLE = (By.XPATH, "//div[contains(@class,'ant-table') and .//table]")
-    ROW_BY_CODE = lambda self, code: (By.XPATH, f"//table//tbody/tr[.//td[normalize-space()='{code}']]")
     BTN_VER_EN_ROW = (By.XPATH, ".//button[.//span[normalize-space()='Ver solicitud']]")
 
     # (Opcional) posibles buscadores
@@ -87,9 +94,6 @@ class ValidacionSolicitudesPage:
         (By.CSS_SELECTOR, "input[placeholder*='Buscar'], input[placeholder*='Código']")
     ]
 
-    # Paginación (AntD)
-    PAGINATION_NEXT = (By.XPATH, "//ul[contains(@class,'ant-pagination')]//li[contains(@class,'ant-pagination-next') and not(contains(@class,'disabled'))]")
-
     def __init__(self, driver, timeout=20):
         self.driver = driver
         self.wait = WebDriverWait(driver, timeout)
@@ -117,57 +121,14 @@ class ValidacionSolicitudesPage:
                 continue
         return False
 
-    def _find_row_on_current_page(self, code, timeout=5):
-        w = WebDriverWait(self.driver, timeout)
-        try:
-            return w.until(EC.presence_of_element_located(self.ROW_BY_CODE(code)))
-        except TimeoutException:
-            return None
-
     def ensure_row_visible(self, code, evidencia=None):
-        # 1) Intenta con buscador (si hay)
-        used_search = self._try_search_code(code)
-
-        # 2) Busca en la página actual
-        row = self._find_row_on_current_page(code)
-        if row and evidencia:
-            evidencia(f"rrhh_row_encontrada__{code}")
-            return row
-
-        # 3) Si no hay buscador o no lo encontró, paginar (AntD)
-        #    Recorre páginas hasta encontrar el código o agotar "Siguiente"
-        seen_pages = 0
-        while True:
-            row = self._find_row_on_current_page(code)
-            if row:
-                if evidencia:
-                    evidencia(f"rrhh_row_encontrada__{code}")
-                return row
-
-            # ¿Hay siguiente?
-            try:
-                next_btn = self.driver.find_element(*self.PAGINATION_NEXT)
-            except NoSuchElementException:
-                break
-
-            try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", next_btn)
-            except Exception:
-                pass
-            next_btn.click()
-            seen_pages += 1
-            if evidencia:
-                evidencia(f"rrhh_paginacion_click_{seen_pages}")
-
-        # Si se usó buscador pero no apareció de una, reintenta una vez esperando la tabla refrescada
-        if used_search:
-            row = self._find_row_on_current_page(code, timeout=8)
-            if row:
-                if evidencia:
-                    evidencia(f"rrhh_row_encontrada__{code}")
-                return row
-
-        raise AssertionError(f"No se encontró la solicitud con código {code}.")
+        # buscador (si hay), tamaño de página máximo y paginación: ver RowFinder
+        finder = RowFinder(self.driver, self.TABLE, search=self._try_search_code,
+                           owner=type(self).__name__, evidencia=evidencia, evidence_prefix="rrhh")
+        row = finder.find(code)
+        if row is None:
+            raise AssertionError(f"No se encontró la solicitud con código {code}. {finder.last}")
+        return row
 
     def click_ver_solicitud(self, code, evidencia=None):
         row = self.ensure_row_visible(code, evidencia=evidencia)
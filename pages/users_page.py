@@ -2,7 +2,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-import time 
+from selenium.common.exceptions import TimeoutException
+from .base_page import wait_first_of, wait_spa_idle
+from .ant_table import AntTable
+from .row_finder import RowFinder
 
 class UsersPage:
     PATH = "usuarios"
@@ -41,24 +44,16 @@ class UsersPage:
     def __init__(self, driver, base_url, timeout=20):
         self.driver = driver
         self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
         self.wait = WebDriverWait(driver, timeout)
 
     def wait_loaded(self):
-        # cualquiera de estas señales es válida
-        signals = (
-            EC.visibility_of_element_located(self.HEADER),
-            EC.visibility_of_element_located(self.TABLE_WRAPPER),
-            EC.visibility_of_element_located(self.CREATE_BTN),
-        )
-        last = None
-        for _ in range(2):
-            for sig in signals:
-                try:
-                    self.wait.until(sig)
-                    return
-                except Exception as e:
-                    last = e
-        raise AssertionError("No cargó la página de Usuarios.") from last
+        # cualquiera de estas señales es válida: se esperan las tres a la vez
+        try:
+            wait_first_of(self.driver, (self.HEADER, self.TABLE_WRAPPER, self.CREATE_BTN),
+                          timeout=self.timeout, owner="UsersPage")
+        except TimeoutException as e:
+            raise AssertionError("No cargó la página de Usuarios.") from e
 
     def click_create(self):
         btn = self.wait.until(EC.element_to_be_clickable(self.CREATE_BTN))
@@ -90,10 +85,6 @@ class UsersPage:
         except Exception:
             pass
 
-    def _cell_nombre_in_row(self, row_el):
-        # 1ra columna = "Nombre"
-        return row_el.find_element(By.CSS_SELECTOR, "td:nth-child(1)")
-
     def _edit_btn_in_row(self, row_el):
         # botón Editar en la última celda
         return row_el.find_element(
@@ -101,32 +92,18 @@ class UsersPage:
         )
 
     def _first_row_name(self) -> str:
-        try:
-            row = self.driver.find_elements(*self.ROWS)[0]
-            return self._cell_nombre_in_row(row).text.strip()
-        except Exception:
-            return ""
+        names = self._rows_names()
+        return names[0] if names else ""
+
+    def table(self):
+        """Foto de la tabla (encabezados, claves y celdas) en un solo round-trip."""
+        return AntTable(self.driver, self.TABLE_WRAPPER).snapshot(required=False)
 
     def contains_row_with_name(self, name: str, exact: bool = True) -> bool:
-        target = name.strip().lower()
-        rows = self.driver.find_elements(*self.ROWS)
-        for r in rows:
-            t = self._cell_nombre_in_row(r).text.strip().lower()
-            if exact and t == target:
-                return True
-            if not exact and target in t:
-                return True
-        return False
+        return self.table().find("Nombre", name, exact=exact) is not None
 
     def _rows_names(self):
-        rows = self.driver.find_elements(*self.ROWS)
-        out = []
-        for r in rows:
-            try:
-                out.append(self._cell_nombre_in_row(r).text.strip())
-            except Exception:
-                pass
-        return out
+        return list(self.table().column("Nombre"))
     # -----------------------------
     # Acciones públicas
     # -----------------------------
@@ -189,8 +166,8 @@ class UsersPage:
             except Exception:
                 pass
 
-        # Pequeña espera corta para permitir cualquier actualización (sin suponer staleness)
-        time.sleep(0.5)
+        # Espera a que termine la petición de búsqueda y el repintado (sin suponer staleness)
+        wait_spa_idle(self.driver, timeout=5)
 
 
     def wait_until_filtered_by(self, name_substr: str, timeout: int = 8):
@@ -198,72 +175,30 @@ class UsersPage:
         q = (name_substr or "").strip().lower()
 
         def ok(_):
-            rows = self.driver.find_elements(*self.ROWS)
-            if not rows:
-                return False
-            for r in rows:
-                try:
-                    txt = self._cell_nombre_in_row(r).text.strip().lower()
-                except Exception:
-                    return False
-                if q not in txt:
-                    return False
-            return True
+            names = self._rows_names()
+            return bool(names) and all(q in n.lower() for n in names)
 
         WebDriverWait(self.driver, timeout).until(ok)
 
     def assert_table_filtered_by(self, name_substr: str):
         """Asserta que todas las filas visibles contienen el filtro en la col. Nombre."""
         q = (name_substr or "").strip().lower()
-        rows = self.driver.find_elements(*self.ROWS)
-        assert rows, "No hay filas visibles."
-        for r in rows:
-            txt = self._cell_nombre_in_row(r).text.strip().lower()
-            assert q in txt, f"Fila no coincide con el filtro: '{txt}'"
+        names = self._rows_names()
+        assert names, "No hay filas visibles."
+        for txt in names:
+            assert q in txt.lower(), f"Fila no coincide con el filtro: '{txt.lower()}'"
+
+    def _finder(self, max_pages: int = 5, search=None):
+        return RowFinder(self.driver, self.TABLE_WRAPPER, search=search,
+                         owner=type(self).__name__, max_pages=max_pages)
 
     def _find_row_by_name(self, name: str, exact: bool = False, max_pages: int = 5):
         """Encuentra la fila por (sub)cadena en 'Nombre'. Pagina si no aparece."""
-        target = name.strip().lower()
-
-        def matches(text):
-            t = (text or "").strip().lower()
-            return (t == target) if exact else (target in t)
-
-        for _ in range(max_pages):
-            rows = self.driver.find_elements(*self.ROWS)
-            for r in rows:
-                try:
-                    if matches(self._cell_nombre_in_row(r).text):
-                        return r
-                except Exception:
-                    continue
-            # intentar siguiente página
-            try:
-                nxt = self.driver.find_element(*self.PAG_NEXT_BTN)
-                if nxt.get_attribute("disabled"):
-                    break
-                nxt.click()
-                self._wait_table_ready()
-            except Exception:
-                break
-        return None
+        return self._finder(max_pages).find(name, column="Nombre", exact=exact)
 
     def find_or_paginate_to_name(self, name: str, exact: bool = True, max_pages: int = 5) -> bool:
-        """Si no está en la página actual, pagina hacia adelante hasta hallarlo."""
-        if self.contains_row_with_name(name, exact=exact):
-            return True
-        for _ in range(max_pages):
-            try:
-                nxt = self.driver.find_element(*self.PAG_NEXT_BTN)
-                if nxt.get_attribute("disabled"):
-                    return False
-                nxt.click()
-                self._wait_table_ready()
-                if self.contains_row_with_name(name, exact=exact):
-                    return True
-            except Exception:
-                return False
-        return False
+        """Si no está en la página actual, agranda la página o pagina hasta hallarlo."""
+        return self._find_row_by_name(name, exact=exact, max_pages=max_pages) is not None
 
     def open_edit_by_name(self, name: str, exact: bool = False) -> bool:
         """Abre la pantalla de 'Editar' para la fila cuyo nombre coincide."""
@@ -284,11 +219,7 @@ class UsersPage:
         """
         self.search_by_name(name)
 
-        # por si la tabla no se “filtra” visualmente: intenta match en la página actual
-        if self.contains_row_with_name(name, exact=exact):
-            return True
-
-        # fallback: paginar hasta hallarlo
+        # por si la tabla no se “filtra” visualmente: página actual, tamaño máximo y paginación
         return self.find_or_paginate_to_name(name, exact=exact, max_pages=max_pages)
     
     # Ordenamiento (clic sobre header “Nombre”)
@@ -316,14 +247,7 @@ class UsersPage:
 
     # Muestra de los primeros N nombres (para comparar orden/paginación sin ser frágil)
     def first_names_sample(self, k: int = 5):
-        names = []
-        rows = self.driver.find_elements(*self.ROWS)[:k]
-        for r in rows:
-            try:
-                names.append(self._cell_nombre_in_row(r).text.strip())
-            except Exception:
-                names.append("")
-        return names
+        return self._rows_names()[:k]
 
     # Ir a página exacta
     def go_to_page(self, n: int) -> bool:
@@ -0,0 +1,13 @@
+"""
+Benchmark de la lectura de resultados de Allure en merge_allure_con_matriz.
+
+    python -m performance_test.allure_bench --sizes 10000 100000
+
+Compara la lectura actual (leer_resultados_allure + leer_ejecuciones_api_allure)
+contra la lectura columnar en un proceso, en un pool y en modo streaming,
+sobre carpetas sintéticas con la forma de los *-result.json de la suite.
+"""
+from .bench import VARIANTES, run_bench
+from .synthetic import generar
+
+__all__ = ["VARIANTES", "run_bench", "generar"]
@@ -0,0 +1,53 @@
+"""
+CLI del benchmark de lectura de Allure.
+
+Ejemplos:
+    # 10k y 100k resultados sintéticos en /tmp (se reutilizan entre corridas)
+    python -m performance_test.allure_bench --sizes 10000 100000
+
+    # Sobre una carpeta real, con 4 procesos
+    python -m performance_test.allure_bench --dir allure-results_prueba --workers 4
+"""
+import argparse
+import os
+import tempfile
+
+from .bench import run_bench
+from .synthetic import generar
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m performance_test.allure_bench",
+                                     description="Compara las formas de leer los *-result.json de Allure.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000],
+                        help="cantidades de resultados sintéticos")
+    parser.add_argument("--dir", help="carpeta real de resultados (ignora --sizes)")
+    parser.add_argument("--base", default=os.path.join(tempfile.gettempdir(), "allure_bench"),
+                        help="dónde se generan las carpetas sintéticas")
+    parser.add_argument("--workers", type=int, default=None, help="procesos del pool (por defecto, uno por CPU)")
+    parser.add_argument("--lote", type=int, default=500, help="archivos por tarea del pool")
+    parser.add_argument("--steps", type=int, default=5, help="steps por resultado sintético")
+    parser.add_argument("--repeticiones", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.dir:
+        carpetas = [args.dir]
+    else:
+        carpetas = []
+        for n in args.sizes:
+            carpeta = os.path.join(args.base, f"n{n}")
+            print(f"Generando {n} resultados en {carpeta}...")
+            carpetas.append(generar(carpeta, n, steps=args.steps))
+
+    workers = args.workers or os.cpu_count() or 1
+    for carpeta in carpetas:
+        print(f"\n{carpeta} (workers={workers}, lote={args.lote})")
+        filas = run_bench(carpeta, workers=workers, lote=args.lote, repeticiones=args.repeticiones)
+        base = filas[0]["seg"]
+        for f in filas:
+            print(f"  {f['variante']:<20} {f['seg']:>8.2f}s  x{base / f['seg']:>5.2f}  "
+                  f"ui={f['ui']} api={f['api']}" + ("" if f["ok"] else "  <- DIFIERE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Variantes de lectura medidas sobre una misma carpeta.
+
+Todas deben devolver las mismas filas; run_bench lo verifica comparando la
+cantidad de filas de UI y API y el conteo por ID_CASO.
+"""
+import time
+
+from merge_allure_con_matriz import (
+    iter_resultados_allure,
+    leer_allure_paralelo,
+    leer_ejecuciones_api_allure,
+    leer_resultados_allure,
+)
+
+
+def _actual(directorio, workers, lote):
+    return leer_resultados_allure(directorio), leer_ejecuciones_api_allure(directorio)
+
+
+def _columnar_1(directorio, workers, lote):
+    return leer_allure_paralelo(directorio, workers=1, lote=lote)
+
+
+def _columnar_pool(directorio, workers, lote):
+    return leer_allure_paralelo(directorio, workers=workers, lote=lote)
+
+
+def _streaming(directorio, workers, lote):
+    # el consumidor solo acumula conteos: la memoria queda acotada por los lotes en vuelo
+    ui = api = 0
+    for df_ui, df_api in iter_resultados_allure(directorio, workers=workers, lote=lote):
+        ui += len(df_ui)
+        api += len(df_api)
+    return ui, api
+
+
+VARIANTES = {
+    "actual (2 pasadas)": _actual,
+    "columnar 1 proceso": _columnar_1,
+    "columnar pool": _columnar_pool,
+    "streaming pool": _streaming,
+}
+
+
+def _firma(resultado):
+    df_ui, df_api = resultado
+    if isinstance(df_ui, int):
+        return df_ui, df_api, None
+    por_cp = df_ui["ID_CASO"].value_counts().to_dict() if not df_ui.empty else {}
+    return len(df_ui), len(df_api), por_cp
+
+
+def run_bench(directorio: str, workers: int = None, lote: int = 500, repeticiones: int = 1) -> list:
+    """
+    Mide cada variante (mejor de `repeticiones`). Devuelve filas
+    {"variante", "seg", "ui", "api", "ok"}.
+    """
+    filas = []
+    referencia = None
+    for nombre, fn in VARIANTES.items():
+        mejor = None
+        for _ in range(repeticiones):
+            t0 = time.perf_counter()
+            resultado = fn(directorio, workers, lote)
+            seg = time.perf_counter() - t0
+            mejor = seg if mejor is None else min(mejor, seg)
+        ui, api, por_cp = _firma(resultado)
+        if referencia is None:
+            referencia = (ui, api, por_cp)
+        ok = (ui, api) == referencia[:2] and (por_cp is None or por_cp == referencia[2])
+        filas.append({"variante": nombre, "seg": mejor, "ui": ui, "api": api, "ok": ok})
+    return filas
@@ -0,0 +1,80 @@
+"""
+Carpetas sintéticas de resultados de Allure.
+
+Cada *-result.json imita lo que escribe allure-pytest para la suite: labels
+(suite, parentSuite, layer=api en tests/api), steps anidados con parámetros y
+attachments, y tiempos en milisegundos. La mayor parte del tamaño está en los
+steps, que el merge no usa.
+"""
+import json
+import os
+import random
+import uuid
+
+SUITES = [
+    "test_02_create_multiple_users", "test_05_solicitud_contrato", "test_07_registro_candidato",
+    "test_11_aprobacion_director", "test_14_bitacora", "test_15_flujo_completo",
+]
+STATUS = ["passed"] * 8 + ["failed", "broken", "skipped"]
+
+
+def _step(rnd, depth):
+    start = rnd.randint(0, 10_000)
+    step = {
+        "name": f"Paso {rnd.randint(1, 99)}: completar formulario",
+        "status": "passed",
+        "start": start,
+        "stop": start + rnd.randint(50, 3000),
+        "parameters": [{"name": "valor", "value": "x" * rnd.randint(5, 40)}],
+        "attachments": [{"name": "captura", "source": f"{uuid.UUID(int=rnd.getrandbits(128))}-attachment.png",
+                         "type": "image/png"}],
+        "steps": [],
+    }
+    if depth:
+        step["steps"] = [_step(rnd, depth - 1) for _ in range(2)]
+    return step
+
+
+def _resultado(rnd, i, api_ratio, steps):
+    cp = rnd.randint(1, 120)
+    start = 1_700_000_000_000 + i * 1000
+    if rnd.random() < api_ratio:
+        labels = [{"name": "suite", "value": "test_postman_collections"}, {"name": "layer", "value": "api"}]
+        name, full_name = f"CP{cp:02d} - request {i}", f"api.test_postman_collections#test_request[{i}]"
+    else:
+        suite = rnd.choice(SUITES)
+        labels = [{"name": "parentSuite", "value": "functional"}, {"name": "suite", "value": suite},
+                  {"name": "host", "value": "runner-01"}]
+        name = f"test_cp{cp:02d}_caso_{i}" if rnd.random() < 0.8 else f"test_auxiliar_{i}"
+        full_name = f"functional.{suite}#{name}"
+    return {
+        "uuid": str(uuid.UUID(int=rnd.getrandbits(128))),
+        "historyId": f"{rnd.getrandbits(64):016x}",
+        "name": name,
+        "fullName": full_name,
+        "status": rnd.choice(STATUS),
+        "stage": "finished",
+        "start": start,
+        "stop": start + rnd.randint(200, 90_000),
+        "labels": labels,
+        "parameters": [],
+        "steps": [_step(rnd, 1) for _ in range(steps)],
+        "attachments": [],
+    }
+
+
+def generar(directorio: str, n: int, api_ratio: float = 0.1, steps: int = 5, seed: int = 1) -> str:
+    """
+    Escribe n *-result.json en `directorio` (si ya tiene n, no hace nada).
+    Devuelve el directorio.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    existentes = sum(1 for e in os.scandir(directorio) if e.name.endswith("-result.json"))
+    if existentes == n:
+        return directorio
+    rnd = random.Random(seed)
+    for i in range(n):
+        res = _resultado(rnd, i, api_ratio, steps)
+        with open(os.path.join(directorio, f"{res['uuid']}-result.json"), "w", encoding="utf-8") as f:
+            json.dump(res, f)
+    return directorio
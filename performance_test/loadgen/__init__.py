@@ -0,0 +1,10 @@
+"""
+Generador de carga en Python (asyncio) que importa PRUEBAS_RENDIMIENTO.jmx.
+
+    python -m performance_test.loadgen performance_test/PRUEBAS_RENDIMIENTO.jmx --group CP_48
+"""
+from .histogram import LatencyHistogram
+from .jmx import load_jmx, TestPlan, ThreadGroup, Sampler
+from .runner import LoadRunner, RunResult
+
+__all__ = ["LatencyHistogram", "load_jmx", "TestPlan", "ThreadGroup", "Sampler", "LoadRunner", "RunResult"]
@@ -0,0 +1,91 @@
+"""
+CLI del generador de carga.
+
+Ejemplos:
+    # Lo mismo que JMeter (modelo cerrado), solo los grupos habilitados del plan
+    python -m performance_test.loadgen performance_test/PRUEBAS_RENDIMIENTO.jmx
+
+    # Un grupo deshabilitado en el .jmx, contra un servidor local
+    python -m performance_test.loadgen performance_test/PRUEBAS_RENDIMIENTO.jmx \\
+        --group CP_48 --base-url http://127.0.0.1:8000 --loops 5
+
+    # CP-49 como carga abierta real: 20 iteraciones/s durante 180 s
+    python -m performance_test.loadgen performance_test/PRUEBAS_RENDIMIENTO.jmx \\
+        --group "CP-49 Carga" --model open --rate 20 --duration 180 --max-vus 50 \\
+        --csv contras_proyecto_act.csv=data/credenciales.csv --json artifacts/cp49.json
+"""
+import argparse
+import json
+import os
+import sys
+
+from .jmx import load_jmx
+from .runner import LoadRunner
+
+
+def _pairs(values, flag):
+    out = {}
+    for v in values or []:
+        key, sep, value = v.partition("=")
+        if not sep:
+            if flag == "--csv":
+                out["*"] = v      # un solo CSV para todos los CSV Data Set
+                continue
+            raise SystemExit(f"{flag} espera NOMBRE=VALOR: {v}")
+        out[key] = value
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m performance_test.loadgen",
+                                     description="Ejecuta un plan .jmx con asyncio y reporta p50/p95/p99 por sampler.")
+    parser.add_argument("jmx", help="ruta del .jmx")
+    parser.add_argument("--group", action="append", help="thread group a ejecutar (subcadena del nombre; repetible)")
+    parser.add_argument("--list", action="store_true", help="solo lista los thread groups del plan")
+    parser.add_argument("--model", choices=("closed", "open"), default="closed")
+    parser.add_argument("--base-url", help="reemplaza protocolo/dominio/puerto de todos los samplers")
+    parser.add_argument("--var", action="append", help="variable NOMBRE=VALOR (como -J de JMeter)")
+    parser.add_argument("--csv", action="append", help="ARCHIVO_EN_JMX=RUTA (o solo RUTA) para los CSV Data Set")
+    parser.add_argument("--threads", type=int, help="usuarios virtuales (modelo closed)")
+    parser.add_argument("--loops", type=int, help="iteraciones por usuario (modelo closed, -1 = sin límite)")
+    parser.add_argument("--ramp", type=float, help="ramp-up en segundos (modelo closed)")
+    parser.add_argument("--duration", type=float, help="duración en segundos")
+    parser.add_argument("--rate", type=float, help="iteraciones por segundo (modelo open)")
+    parser.add_argument("--arrival", choices=("constant", "poisson"), default="constant",
+                        help="distribución de llegadas del modelo open")
+    parser.add_argument("--max-vus", type=int, help="usuarios virtuales disponibles (modelo open)")
+    parser.add_argument("--insecure", action="store_true", help="no verifica el certificado TLS")
+    parser.add_argument("--json", help="guarda el resumen (con histogramas) en este archivo")
+    args = parser.parse_args(argv)
+
+    plan = load_jmx(args.jmx)
+    if args.list:
+        for g in plan.groups:
+            estado = "habilitado" if g.enabled else "deshabilitado"
+            print(f"- {g.name} [{estado}] hilos={g.threads} ramp={g.ramp_time}s loops={g.loops} "
+                  f"samplers={[s.name for s in g.samplers]}")
+        return 0
+
+    try:
+        runner = LoadRunner(
+            plan, groups=args.group, model=args.model, base_url=args.base_url,
+            variables=_pairs(args.var, "--var"), csv_overrides=_pairs(args.csv, "--csv"),
+            threads=args.threads, loops=args.loops, ramp=args.ramp, duration=args.duration,
+            rate=args.rate, max_vus=args.max_vus, arrival=args.arrival, verify_tls=not args.insecure,
+        )
+        print(f"Ejecutando {[g.name for g in runner.groups]} (modelo {args.model})")
+        result = runner.run()
+    except (FileNotFoundError, ValueError) as e:
+        parser.error(str(e))
+    print(result.format_table())
+
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"Resumen guardado en {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
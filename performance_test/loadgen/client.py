@@ -0,0 +1,143 @@
+"""
+Cliente HTTP/1.1 mínimo sobre asyncio (sin dependencias externas).
+
+Cada usuario virtual tiene su propio cliente con una conexión keep-alive por
+origen, igual que un hilo de JMeter con "Use KeepAlive". Soporta cuerpos con
+Content-Length, chunked y lectura hasta el cierre.
+"""
+import asyncio
+import socket
+import ssl
+from urllib.parse import urlsplit
+
+
+class HttpResponse:
+    def __init__(self, status: int, headers: dict, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", "replace")
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class AsyncHttpClient:
+    def __init__(self, connect_timeout: float = 5.0, response_timeout: float = 30.0, verify_tls: bool = True):
+        self.connect_timeout = connect_timeout
+        self.response_timeout = response_timeout
+        self._ssl = ssl.create_default_context() if verify_tls else ssl._create_unverified_context()
+        self._conns = {}
+        self.stats = {"connects": 0, "reused": 0}
+
+    async def _connect(self, scheme, host, port, timeout=None):
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self._ssl if scheme == "https" else None),
+            timeout=timeout or self.connect_timeout,
+        )
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            # sin Nagle: las requests son chicas y se mediría el delayed ACK, no el servidor
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stats["connects"] += 1
+        return _Connection(reader, writer)
+
+    async def request(self, method: str, url: str, headers: dict = None, body: bytes = None,
+                      connect_timeout: float = None, response_timeout: float = None) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        key = (scheme, host, port)
+
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc}"]
+        sent = {k.lower() for k in (headers or {})}
+        for k, v in (headers or {}).items():
+            lines.append(f"{k}: {v}")
+        if "connection" not in sent:
+            lines.append("Connection: keep-alive")
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body or b'')}")
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b"")
+
+        # Una conexión reutilizada puede haber sido cerrada por el servidor:
+        # se reintenta una vez con una conexión nueva.
+        for attempt in (0, 1):
+            conn = self._conns.pop(key, None)
+            reused = conn is not None
+            if conn is None:
+                conn = await self._connect(scheme, host, port, connect_timeout)
+            try:
+                conn.writer.write(payload)
+                await conn.writer.drain()
+                resp, keep = await asyncio.wait_for(
+                    self._read_response(conn.reader, method),
+                    timeout=response_timeout or self.response_timeout,
+                )
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise ConnectionError(str(e) or type(e).__name__) from e
+            except BaseException:
+                conn.close()
+                raise
+            if reused:
+                self.stats["reused"] += 1
+            if keep:
+                self._conns[key] = conn
+            else:
+                conn.close()
+            return resp
+        raise ConnectionError("sin respuesta")
+
+    @staticmethod
+    async def _read_response(reader, method):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("conexión cerrada por el servidor")
+        parts = status_line.decode("latin-1").split(" ", 2)
+        status = int(parts[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep = headers.get("connection", "").lower() != "close" and parts[0] == "HTTP/1.1"
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return HttpResponse(status, headers, b""), keep
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            return HttpResponse(status, headers, b"".join(chunks)), keep
+        if "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+            return HttpResponse(status, headers, body), keep
+        return HttpResponse(status, headers, await reader.read()), False
+
+    async def close(self):
+        for conn in self._conns.values():
+            conn.close()
+        self._conns.clear()
@@ -0,0 +1,126 @@
+"""
+Histograma de latencias estilo HDR (log-lineal).
+
+Guarda conteos por cubeta en lugar de cada muestra: memoria constante sin
+importar cuántas requests se hagan y percentiles con error relativo acotado
+(`significant_digits=2` -> ~1 %). Los valores se registran en microsegundos.
+"""
+import math
+
+
+class LatencyHistogram:
+    def __init__(self, significant_digits: int = 2, max_value_us: int = 3_600_000_000):
+        if not 1 <= significant_digits <= 4:
+            raise ValueError("significant_digits debe estar entre 1 y 4")
+        self.significant_digits = significant_digits
+        # sub-cubetas por potencia de 2: suficientes para la precisión pedida
+        self._sub_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._sub_count = 1 << self._sub_bits
+        self._half = self._sub_count >> 1
+        self.max_value_us = max_value_us
+        self._counts = {}          # índice -> conteo (disperso)
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = None
+
+    # -----------------------------
+    # Índices de cubeta
+    # -----------------------------
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        exp = value.bit_length() - self._sub_bits
+        return (exp + 1) * self._half + (value >> exp) - self._half
+
+    def _lowest(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        exp = index // self._half - 1
+        sub = index - exp * self._half
+        return sub << exp
+
+    def _highest(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        exp = index // self._half - 1
+        return self._lowest(index) + (1 << exp) - 1
+
+    # -----------------------------
+    # Registro
+    # -----------------------------
+    def record(self, value_us, count: int = 1):
+        value = max(0, min(int(value_us), self.max_value_us))
+        idx = self._index(value)
+        self._counts[idx] = self._counts.get(idx, 0) + count
+        self.count += count
+        self.total_us += value * count
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+        self.max_us = value if self.max_us is None else max(self.max_us, value)
+
+    def record_seconds(self, seconds: float):
+        self.record(round(seconds * 1_000_000))
+
+    def merge(self, other: "LatencyHistogram"):
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("No se pueden unir histogramas con distinta precisión")
+        for idx, n in other._counts.items():
+            self._counts[idx] = self._counts.get(idx, 0) + n
+        self.count += other.count
+        self.total_us += other.total_us
+        for attr, fn in (("min_us", min), ("max_us", max)):
+            theirs = getattr(other, attr)
+            if theirs is not None:
+                mine = getattr(self, attr)
+                setattr(self, attr, theirs if mine is None else fn(mine, theirs))
+        return self
+
+    # -----------------------------
+    # Consultas
+    # -----------------------------
+    def percentile(self, p: float) -> int:
+        """Valor (us) por debajo del cual queda el p % de las muestras."""
+        if not self.count:
+            return 0
+        target = max(1, math.ceil(self.count * p / 100.0))
+        seen = 0
+        for idx in sorted(self._counts):
+            seen += self._counts[idx]
+            if seen >= target:
+                return min(self._highest(idx), self.max_us)
+        return self.max_us
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_us / self.count if self.count else 0.0
+
+    def summary_ms(self, percentiles=(50, 90, 95, 99)) -> dict:
+        out = {
+            "count": self.count,
+            "min_ms": (self.min_us or 0) / 1000,
+            "mean_ms": self.mean_us / 1000,
+            "max_ms": (self.max_us or 0) / 1000,
+        }
+        for p in percentiles:
+            out[f"p{p:g}_ms"] = self.percentile(p) / 1000
+        return out
+
+    def to_dict(self) -> dict:
+        return {
+            "significant_digits": self.significant_digits,
+            "counts": {str(k): v for k, v in sorted(self._counts.items())},
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        h = cls(data.get("significant_digits", 2))
+        h._counts = {int(k): v for k, v in data.get("counts", {}).items()}
+        h.count = data.get("count", 0)
+        h.total_us = data.get("total_us", 0)
+        h.min_us = data.get("min_us")
+        h.max_us = data.get("max_us")
+        return h
@@ -0,0 +1,289 @@
+"""
+Importador de planes de JMeter (.jmx) al modelo del generador de carga.
+
+Soporta lo que usa PRUEBAS_RENDIMIENTO.jmx:
+- ThreadGroup (hilos, ramp-up, loops, duración/delay del scheduler, enabled)
+- ConfigTestElement "HTTP Request Defaults" (dominio, protocolo, puerto, timeouts)
+- HeaderManager (a nivel de grupo y de sampler; el del sampler gana)
+- CSVDataSet (variables, delimitador, recycle; rutas de Windows se resuelven
+  por nombre de archivo junto al .jmx o se reemplazan con --csv)
+- HTTPSamplerProxy (método, path, body raw o parámetros)
+- JSONPostProcessor ($.a.b[0].c) y ResponseAssertion sobre el código HTTP
+
+Cualquier otro elemento (listeners, timers, controladores) se ignora.
+"""
+import os
+import xml.etree.ElementTree as ET
+
+
+class HttpDefaults:
+    def __init__(self, protocol="https", domain="", port="", connect_timeout_ms=None, response_timeout_ms=None):
+        self.protocol = protocol or "https"
+        self.domain = domain or ""
+        self.port = port or ""
+        self.connect_timeout_ms = connect_timeout_ms
+        self.response_timeout_ms = response_timeout_ms
+
+    def merged(self, other: "HttpDefaults") -> "HttpDefaults":
+        """`other` (más específico) pisa los valores no vacíos."""
+        return HttpDefaults(
+            other.protocol if other.protocol and other.domain else self.protocol,
+            other.domain or self.domain,
+            other.port or self.port,
+            other.connect_timeout_ms or self.connect_timeout_ms,
+            other.response_timeout_ms or self.response_timeout_ms,
+        )
+
+
+class CsvDataSet:
+    def __init__(self, filename, variable_names, delimiter=",", ignore_first_line=False,
+                 recycle=True, quoted=True, share_mode="shareMode.all"):
+        self.filename = filename
+        self.variable_names = [v.strip() for v in variable_names.split(",") if v.strip()]
+        self.delimiter = delimiter or ","
+        self.ignore_first_line = ignore_first_line
+        self.recycle = recycle
+        self.quoted = quoted
+        self.share_mode = share_mode
+
+
+class JsonExtractor:
+    def __init__(self, names, paths, defaults):
+        self.names = [n.strip() for n in names.split(";")]
+        self.paths = [p.strip() for p in paths.split(";")]
+        defaults = [d for d in (defaults or "").split(";")]
+        self.defaults = defaults + [""] * (len(self.names) - len(defaults))
+
+
+class CodeAssertion:
+    """ResponseAssertion sobre Assertion.response_code."""
+
+    # bits de Assertion.test_type en JMeter
+    MATCH, CONTAINS, NOT, EQUALS, SUBSTRING, OR = 1, 2, 4, 8, 16, 32
+
+    def __init__(self, patterns, test_type):
+        self.patterns = [p for p in patterns if p]
+        self.test_type = test_type
+
+    def check(self, status: int) -> bool:
+        if not self.patterns:
+            # JMeter con patrón vacío: se comporta como "código 2xx/3xx"
+            return 200 <= status < 400
+        code = str(status)
+        if self.test_type & self.EQUALS:
+            hits = [code == p for p in self.patterns]
+        else:
+            hits = [p in code for p in self.patterns]
+        ok = any(hits) if self.test_type & self.OR else all(hits)
+        return not ok if self.test_type & self.NOT else ok
+
+
+class Sampler:
+    def __init__(self, name, method, path, http: HttpDefaults, body=None, params=None):
+        self.name = name
+        self.method = method.upper()
+        self.path = path
+        self.http = http
+        self.body = body
+        self.params = params or []
+        self.headers = {}
+        self.extractors = []
+        self.assertions = []
+
+
+class ThreadGroup:
+    def __init__(self, name, enabled, threads, ramp_time, loops, duration=None, delay=0):
+        self.name = name
+        self.enabled = enabled
+        self.threads = threads
+        self.ramp_time = ramp_time
+        self.loops = loops            # -1: infinito (hasta `duration`)
+        self.duration = duration      # s, solo con scheduler activo
+        self.delay = delay
+        self.http = HttpDefaults()
+        self.headers = {}
+        self.csv = []
+        self.samplers = []
+
+    def __repr__(self):
+        return f"ThreadGroup({self.name!r}, threads={self.threads}, loops={self.loops}, samplers={len(self.samplers)})"
+
+
+class TestPlan:
+    def __init__(self, name, groups, source=None):
+        self.name = name
+        self.groups = groups
+        self.source = source
+
+    def select(self, names=None):
+        """Grupos habilitados o, si se indican, los que contienen alguno de `names`."""
+        if not names:
+            return [g for g in self.groups if g.enabled]
+        wanted = [n.lower() for n in names]
+        return [g for g in self.groups if any(w in g.name.lower() for w in wanted)]
+
+
+# ================= Lectura del XML =================
+
+
+def _enabled(el) -> bool:
+    return el.get("enabled", "true") != "false"
+
+
+def _prop(el, name, default=None):
+    for child in el:
+        if child.get("name") == name:
+            if child.tag in ("stringProp", "boolProp", "intProp", "longProp"):
+                return child.text if child.text is not None else default
+            return child
+    return default
+
+
+def _int(value, default=0):
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return default
+
+
+def _bool(value) -> bool:
+    return str(value).strip().lower() == "true"
+
+
+def _children(hash_tree):
+    """Pares (elemento, hashTree con sus hijos) dentro de un hashTree."""
+    items = list(hash_tree)
+    for i, el in enumerate(items):
+        if el.tag == "hashTree":
+            continue
+        sub = items[i + 1] if i + 1 < len(items) and items[i + 1].tag == "hashTree" else None
+        yield el, sub
+
+
+def _http_defaults(el) -> HttpDefaults:
+    return HttpDefaults(
+        _prop(el, "HTTPSampler.protocol", ""),
+        _prop(el, "HTTPSampler.domain", ""),
+        _prop(el, "HTTPSampler.port", ""),
+        _int(_prop(el, "HTTPSampler.connect_timeout"), None),
+        _int(_prop(el, "HTTPSampler.response_timeout"), None),
+    )
+
+
+def _headers(el) -> dict:
+    headers = {}
+    coll = _prop(el, "HeaderManager.headers")
+    if coll is None:
+        return headers
+    for h in coll:
+        name = _prop(h, "Header.name")
+        if name:
+            headers[name] = _prop(h, "Header.value", "")
+    return headers
+
+
+def _sampler(el, http: HttpDefaults) -> Sampler:
+    args = []
+    args_el = _prop(el, "HTTPsampler.Arguments")
+    if args_el is not None:
+        coll = _prop(args_el, "Arguments.arguments")
+        for a in coll if coll is not None else []:
+            args.append((_prop(a, "Argument.name", ""), (_prop(a, "Argument.value", "") or "").replace("\r", "")))
+    raw = _bool(_prop(el, "HTTPSampler.postBodyRaw", "false"))
+    body = args[0][1] if raw and args else None
+    return Sampler(
+        el.get("testname", ""),
+        _prop(el, "HTTPSampler.method", "GET"),
+        _prop(el, "HTTPSampler.path", "/") or "/",
+        http.merged(_http_defaults(el)),
+        body=body,
+        params=[] if raw else [a for a in args if a[0]],
+    )
+
+
+def _resolve_csv_path(filename: str, jmx_dir: str) -> str:
+    if filename and os.path.exists(filename):
+        return filename
+    # rutas absolutas de la máquina de quien grabó el plan (C:/Users/...)
+    base = os.path.basename((filename or "").replace("\\", "/"))
+    for candidate in (os.path.join(jmx_dir, base), os.path.join(jmx_dir, "data", base)):
+        if base and os.path.exists(candidate):
+            return candidate
+    return filename
+
+
+def _thread_group(el, tree, jmx_dir) -> ThreadGroup:
+    loop = _prop(el, "ThreadGroup.main_controller")
+    loops = _int(_prop(loop, "LoopController.loops", "1"), 1) if loop is not None else 1
+    if loop is not None and _bool(_prop(loop, "LoopController.continue_forever", "false")) and loops < 0:
+        loops = -1
+    scheduler = _bool(_prop(el, "ThreadGroup.scheduler", "false"))
+    group = ThreadGroup(
+        el.get("testname", ""),
+        _enabled(el),
+        _int(_prop(el, "ThreadGroup.num_threads", "1"), 1),
+        _int(_prop(el, "ThreadGroup.ramp_time", "0"), 0),
+        loops,
+        duration=_int(_prop(el, "ThreadGroup.duration"), None) if scheduler else None,
+        delay=_int(_prop(el, "ThreadGroup.delay"), 0) if scheduler else 0,
+    )
+    if tree is None:
+        return group
+
+    # Primero los elementos de configuración (aplican a todo el grupo sin importar el orden)
+    for child, _sub in _children(tree):
+        if not _enabled(child):
+            continue
+        if child.tag == "ConfigTestElement":
+            group.http = group.http.merged(_http_defaults(child))
+        elif child.tag == "HeaderManager":
+            group.headers.update(_headers(child))
+        elif child.tag == "CSVDataSet":
+            group.csv.append(CsvDataSet(
+                _resolve_csv_path(_prop(child, "filename", ""), jmx_dir),
+                _prop(child, "variableNames", ""),
+                delimiter=_prop(child, "delimiter", ","),
+                ignore_first_line=_bool(_prop(child, "ignoreFirstLine", "false")),
+                recycle=_bool(_prop(child, "recycle", "true")),
+                quoted=_bool(_prop(child, "quotedData", "true")),
+                share_mode=_prop(child, "shareMode", "shareMode.all"),
+            ))
+
+    for child, sub in _children(tree):
+        if child.tag != "HTTPSamplerProxy" or not _enabled(child):
+            continue
+        sampler = _sampler(child, group.http)
+        for post, _ in _children(sub) if sub is not None else []:
+            if not _enabled(post):
+                continue
+            if post.tag == "HeaderManager":
+                sampler.headers.update(_headers(post))
+            elif post.tag == "JSONPostProcessor":
+                sampler.extractors.append(JsonExtractor(
+                    _prop(post, "JSONPostProcessor.referenceNames", ""),
+                    _prop(post, "JSONPostProcessor.jsonPathExprs", ""),
+                    _prop(post, "JSONPostProcessor.defaultValues", ""),
+                ))
+            elif post.tag == "ResponseAssertion":
+                if _prop(post, "Assertion.test_field") != "Assertion.response_code":
+                    continue
+                coll = _prop(post, "Asserion.test_strings")
+                patterns = [(s.text or "").strip() for s in coll] if coll is not None else []
+                sampler.assertions.append(CodeAssertion(patterns, _int(_prop(post, "Assertion.test_type", "2"), 2)))
+        group.samplers.append(sampler)
+    return group
+
+
+def load_jmx(path: str) -> TestPlan:
+    root = ET.parse(path).getroot()
+    jmx_dir = os.path.dirname(os.path.abspath(path))
+    top = root.find("hashTree")
+    groups, plan_name = [], os.path.basename(path)
+    for plan, plan_tree in _children(top):
+        if plan.tag != "TestPlan":
+            continue
+        plan_name = plan.get("testname") or plan_name
+        for el, sub in _children(plan_tree):
+            if el.tag == "ThreadGroup":
+                groups.append(_thread_group(el, sub, jmx_dir))
+    return TestPlan(plan_name, groups, source=path)
@@ -0,0 +1,397 @@
+"""
+Ejecución de un TestPlan (importado del .jmx) con asyncio.
+
+Dos modelos de carga:
+- closed (el de JMeter): N usuarios virtuales que arrancan repartidos en el
+  ramp-up y repiten la secuencia de samplers `loops` veces (o hasta
+  `duration`). El throughput depende de lo que tarde el servidor.
+- open: llegan `rate` iteraciones por segundo durante `duration`, sin importar
+  cuánto tarde el servidor. Cada llegada toma un usuario virtual libre de un
+  pool de `max_vus`; si no hay ninguno libre la iteración se cuenta como
+  descartada (así se ve la saturación en vez de esconderla).
+
+Cada request registra su latencia en un LatencyHistogram por sampler.
+"""
+import asyncio
+import csv
+import json
+import os
+import random
+import re
+import time
+import uuid
+from urllib.parse import urlencode, urlsplit
+
+from .client import AsyncHttpClient
+from .histogram import LatencyHistogram
+
+_VAR_RE = re.compile(r"\$\{([^{}]+)\}")
+
+
+# ================= Estadísticas =================
+
+
+class SamplerStats:
+    def __init__(self, label: str):
+        self.label = label
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.bytes = 0
+        self.statuses = {}
+
+    @property
+    def count(self) -> int:
+        return self.histogram.count
+
+    def add(self, elapsed_s: float, status, ok: bool, size: int):
+        self.histogram.record_seconds(elapsed_s)
+        self.bytes += size
+        key = str(status)
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        if not ok:
+            self.errors += 1
+
+
+class RunResult:
+    def __init__(self, plan_name: str, model: str):
+        self.plan_name = plan_name
+        self.model = model
+        self.samplers = {}            # label -> SamplerStats
+        self.start = None
+        self.end = None
+        self.iterations = 0
+        self.dropped_iterations = 0
+        self.schedule_lag = LatencyHistogram()   # open: atraso entre la llegada programada y el inicio real
+
+    def stats_for(self, label: str) -> SamplerStats:
+        if label not in self.samplers:
+            self.samplers[label] = SamplerStats(label)
+        return self.samplers[label]
+
+    @property
+    def wall_seconds(self) -> float:
+        return max(1e-9, (self.end or time.perf_counter()) - (self.start or 0))
+
+    def total(self) -> SamplerStats:
+        total = SamplerStats("TOTAL")
+        for s in self.samplers.values():
+            total.histogram.merge(s.histogram)
+            total.errors += s.errors
+            total.bytes += s.bytes
+            for k, v in s.statuses.items():
+                total.statuses[k] = total.statuses.get(k, 0) + v
+        return total
+
+    def rows(self) -> list:
+        out = []
+        for s in list(self.samplers.values()) + [self.total()]:
+            row = {"label": s.label, **s.histogram.summary_ms()}
+            row["errors"] = s.errors
+            row["error_pct"] = 100.0 * s.errors / s.count if s.count else 0.0
+            row["throughput_rps"] = s.count / self.wall_seconds
+            row["statuses"] = dict(s.statuses)
+            out.append(row)
+        return out
+
+    def to_dict(self) -> dict:
+        return {
+            "plan": self.plan_name,
+            "model": self.model,
+            "wall_seconds": self.wall_seconds,
+            "iterations": self.iterations,
+            "dropped_iterations": self.dropped_iterations,
+            "schedule_lag": self.schedule_lag.summary_ms(),
+            "samplers": self.rows(),
+            "histograms": {label: s.histogram.to_dict() for label, s in self.samplers.items()},
+        }
+
+    def format_table(self) -> str:
+        head = f"{'Sampler':<40} {'n':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'req/s':>8}"
+        lines = [head, "-" * len(head)]
+        for r in self.rows():
+            lines.append(
+                f"{r['label'][:40]:<40} {r['count']:>7} {r['error_pct']:>6.1f} {r['p50_ms']:>8.1f} "
+                f"{r['p95_ms']:>8.1f} {r['p99_ms']:>8.1f} {r['max_ms']:>8.1f} {r['throughput_rps']:>8.2f}"
+            )
+        lines.append(f"Duración: {self.wall_seconds:.1f}s | iteraciones: {self.iterations}"
+                     + (f" | descartadas: {self.dropped_iterations}" if self.model == "open" else ""))
+        return "\n".join(lines)
+
+
+# ================= Datos (CSV Data Set) =================
+
+
+class CsvFeeder:
+    def __init__(self, dataset, override_path: str = None):
+        self.dataset = dataset
+        self.path = path = override_path or dataset.filename
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f, delimiter=dataset.delimiter,
+                                quotechar='"' if dataset.quoted else "\0")
+            rows = [r for r in reader if r]
+        self.rows = rows[1:] if dataset.ignore_first_line else rows
+        if not self.rows:
+            raise ValueError(f"El CSV {path} no tiene filas")
+        self._pos = 0
+
+    def next(self):
+        """Siguiente fila como dict, o None si se acabó y no se recicla."""
+        if self._pos >= len(self.rows):
+            if not self.dataset.recycle:
+                return None
+            self._pos = 0
+        row = self.rows[self._pos]
+        self._pos += 1
+        return dict(zip(self.dataset.variable_names, row))
+
+
+# ================= Usuario virtual =================
+
+
+def _json_path(data, expr: str):
+    """Subconjunto de JSONPath: $.a.b[0].c"""
+    if not expr.startswith("$"):
+        return None
+    for key, idx in re.findall(r"\.([^.\[\]]+)|\[(\d+)\]", expr[1:]):
+        if key:
+            data = data.get(key) if isinstance(data, dict) else None
+        else:
+            i = int(idx)
+            data = data[i] if isinstance(data, list) and i < len(data) else None
+        if data is None:
+            return None
+    return data
+
+
+class VirtualUser:
+    def __init__(self, number: int, group, feeders: list, variables: dict, base_url: str = None,
+                 verify_tls: bool = True):
+        self.number = number
+        self.group = group
+        self.feeders = feeders
+        self.vars = dict(variables)
+        self.base_url = base_url
+        self.client = AsyncHttpClient(verify_tls=verify_tls)
+
+    def _function(self, expr: str):
+        name, _, args = expr.partition("(")
+        args = [a.strip() for a in args.rstrip(")").split(",")] if args else []
+        if name == "__threadNum":
+            return str(self.number)
+        if name == "__time":
+            return str(int(time.time() * 1000))
+        if name == "__Random" and len(args) >= 2:
+            return str(random.randint(int(args[0]), int(args[1])))
+        if name == "__UUID":
+            return str(uuid.uuid4())
+        if name == "__P":
+            return self.vars.get(args[0], args[1] if len(args) > 1 else "")
+        return None
+
+    def resolve(self, text: str) -> str:
+        if not text:
+            return text
+
+        def repl(m):
+            key = m.group(1)
+            if key.startswith("__"):
+                value = self._function(key)
+                return m.group(0) if value is None else value
+            return str(self.vars.get(key, m.group(0)))
+
+        return _VAR_RE.sub(repl, text)
+
+    def _url(self, sampler) -> str:
+        path = self.resolve(sampler.path)
+        if self.base_url:
+            base = self.base_url.rstrip("/")
+        else:
+            http = sampler.http
+            base = f"{http.protocol}://{http.domain}" + (f":{http.port}" if http.port else "")
+        url = path if urlsplit(path).scheme else base + (path if path.startswith("/") else "/" + path)
+        if sampler.params and sampler.method == "GET":
+            query = urlencode([(k, self.resolve(v)) for k, v in sampler.params])
+            url += ("&" if "?" in url else "?") + query
+        return url
+
+    def load_data(self) -> bool:
+        for feeder in self.feeders:
+            row = feeder.next()
+            if row is None:
+                return False
+            self.vars.update(row)
+        return True
+
+    async def run_iteration(self, result: RunResult):
+        for sampler in self.group.samplers:
+            headers = {k: self.resolve(v) for k, v in {**self.group.headers, **sampler.headers}.items()}
+            body = None
+            if sampler.body is not None:
+                body = self.resolve(sampler.body).encode("utf-8")
+            elif sampler.params and sampler.method != "GET":
+                body = urlencode([(k, self.resolve(v)) for k, v in sampler.params]).encode("utf-8")
+                headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+
+            http = sampler.http
+            stats = result.stats_for(sampler.name)
+            t0 = time.perf_counter()
+            try:
+                resp = await self.client.request(
+                    sampler.method, self._url(sampler), headers=headers, body=body,
+                    connect_timeout=(http.connect_timeout_ms or 0) / 1000 or None,
+                    response_timeout=(http.response_timeout_ms or 0) / 1000 or None,
+                )
+            except (OSError, asyncio.TimeoutError, ValueError) as e:
+                stats.add(time.perf_counter() - t0, type(e).__name__, False, 0)
+                continue
+            elapsed = time.perf_counter() - t0
+
+            if sampler.assertions:
+                ok = all(a.check(resp.status) for a in sampler.assertions)
+            else:
+                ok = 200 <= resp.status < 400
+            stats.add(elapsed, resp.status, ok, len(resp.body))
+
+            if sampler.extractors:
+                try:
+                    data = json.loads(resp.body or b"null")
+                except ValueError:
+                    data = None
+                for ex in sampler.extractors:
+                    for name, path, default in zip(ex.names, ex.paths, ex.defaults):
+                        value = _json_path(data, path)
+                        self.vars[name] = default if value is None else value
+        result.iterations += 1
+
+    async def close(self):
+        await self.client.close()
+
+
+# ================= Planificadores =================
+
+
+class LoadRunner:
+    def __init__(self, plan, groups=None, model: str = "closed", base_url: str = None,
+                 variables: dict = None, csv_overrides: dict = None, threads: int = None,
+                 loops: int = None, ramp: float = None, duration: float = None, rate: float = None,
+                 max_vus: int = None, arrival: str = "constant", verify_tls: bool = True):
+        if model not in ("closed", "open"):
+            raise ValueError("model debe ser 'closed' u 'open'")
+        if model == "open" and not (rate and duration):
+            raise ValueError("El modelo open necesita rate y duration")
+        self.plan = plan
+        self.groups = plan.select(groups)
+        if not self.groups:
+            raise ValueError("No hay thread groups para ejecutar (¿están deshabilitados? usa --group)")
+        self.model = model
+        self.base_url = base_url
+        self.variables = variables or {}
+        self.csv_overrides = csv_overrides or {}
+        self.threads = threads
+        self.loops = loops
+        self.ramp = ramp
+        self.duration = duration
+        self.rate = rate
+        self.max_vus = max_vus
+        self.arrival = arrival
+        self.verify_tls = verify_tls
+
+    # -----------------------------
+    # Datos
+    # -----------------------------
+    def _feeders(self, group) -> list:
+        """Un feeder por CSV Data Set; None en lugar del feeder si --var ya cubre sus variables."""
+        feeders = []
+        for ds in group.csv:
+            base = os.path.basename(ds.filename.replace("\\", "/"))
+            override = self.csv_overrides.get(base) or self.csv_overrides.get("*")
+            if override or os.path.exists(ds.filename):
+                feeders.append(CsvFeeder(ds, override))
+            elif all(v in self.variables for v in ds.variable_names):
+                continue
+            else:
+                raise FileNotFoundError(
+                    f"No se encontró el CSV '{ds.filename}' del grupo '{group.name}'. "
+                    f"Usa --csv {base}=RUTA o --var " + " --var ".join(f"{v}=..." for v in ds.variable_names)
+                )
+        return feeders
+
+    def _user(self, number, group, shared_feeders):
+        # shareMode.thread: cada usuario recorre el CSV desde el principio
+        feeders = [CsvFeeder(f.dataset, f.path) if f.dataset.share_mode == "shareMode.thread" else f
+                   for f in shared_feeders]
+        return VirtualUser(number, group, feeders, self.variables, self.base_url, self.verify_tls)
+
+    # -----------------------------
+    # Ejecución
+    # -----------------------------
+    def run(self) -> RunResult:
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> RunResult:
+        result = RunResult(self.plan.name, self.model)
+        result.start = time.perf_counter()
+        runner = self._closed_group if self.model == "closed" else self._open_group
+        await asyncio.gather(*(runner(g, result) for g in self.groups))
+        result.end = time.perf_counter()
+        return result
+
+    async def _closed_group(self, group, result: RunResult):
+        threads = self.threads or group.threads
+        loops = self.loops if self.loops is not None else group.loops
+        ramp = self.ramp if self.ramp is not None else group.ramp_time
+        duration = self.duration or group.duration
+        feeders = self._feeders(group)
+        t0 = time.perf_counter() + group.delay
+        deadline = t0 + duration if duration else None
+
+        async def vu(n):
+            user = self._user(n, group, feeders)
+            await asyncio.sleep(max(0.0, t0 + ramp * (n - 1) / max(1, threads) - time.perf_counter()))
+            try:
+                i = 0
+                while loops < 0 or i < loops:
+                    if deadline and time.perf_counter() >= deadline:
+                        break
+                    if not user.load_data():
+                        break
+                    await user.run_iteration(result)
+                    i += 1
+            finally:
+                await user.close()
+
+        await asyncio.gather(*(vu(n) for n in range(1, threads + 1)))
+
+    async def _open_group(self, group, result: RunResult):
+        max_vus = self.max_vus or self.threads or group.threads
+        feeders = self._feeders(group)
+        idle = asyncio.Queue()
+        users = [self._user(n, group, feeders) for n in range(1, max_vus + 1)]
+        for u in users:
+            idle.put_nowait(u)
+
+        async def iteration(user, scheduled):
+            result.schedule_lag.record_seconds(max(0.0, time.perf_counter() - scheduled))
+            try:
+                if user.load_data():
+                    await user.run_iteration(result)
+            finally:
+                idle.put_nowait(user)
+
+        tasks = []
+        start = time.perf_counter() + group.delay
+        next_at = start
+        end = start + self.duration
+        while next_at < end:
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+            try:
+                user = idle.get_nowait()
+            except asyncio.QueueEmpty:
+                result.dropped_iterations += 1
+            else:
+                tasks.append(asyncio.ensure_future(iteration(user, next_at)))
+            gap = random.expovariate(self.rate) if self.arrival == "poisson" else 1.0 / self.rate
+            next_at += gap
+        await asyncio.gather(*tasks)
+        for u in users:
+            await u.close()
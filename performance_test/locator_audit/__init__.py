@@ -0,0 +1,16 @@
+"""
+Auditoría de costo de los locators de los page objects.
+
+    # Solo análisis estático (no necesita navegador)
+    python -m performance_test.locator_audit --static-only
+
+    # Medición real contra los snapshots que guardan los tests al fallar
+    python -m performance_test.locator_audit --snapshots "artifacts/*.html" --json artifacts/locators.json
+"""
+from .collect import Locator, collect
+from .evaluate import measure
+from .report import AuditRow, build_rows, report_lines, summary_lines
+from .rules import static_cost, suggest, xpath_to_css
+
+__all__ = ["Locator", "collect", "measure", "AuditRow", "build_rows", "report_lines", "summary_lines",
+           "static_cost", "suggest", "xpath_to_css"]
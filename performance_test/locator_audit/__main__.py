@@ -0,0 +1,76 @@
+"""
+CLI de la auditoría de locators.
+
+Ejemplos:
+    # Ranking por costo estático de todos los locators de pages/
+    python -m performance_test.locator_audit --static-only --top 40
+
+    # Medición en Chrome headless contra los snapshots de artifacts/
+    python -m performance_test.locator_audit --snapshots "artifacts/*.html"
+
+    # Solo un page object, en Firefox, con el detalle completo en JSON
+    python -m performance_test.locator_audit --owner ContractDetailPage --browser firefox \\
+        --json artifacts/locators_contract_detail.json
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+from selenium.common.exceptions import WebDriverException
+
+from .collect import collect
+from .report import build_rows, report_lines, summary_lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m performance_test.locator_audit",
+                                     description="Rankea los locators de los page objects por costo de evaluación.")
+    parser.add_argument("--package", default="pages", help="paquete con los page objects")
+    parser.add_argument("--snapshots", action="append",
+                        help="glob de snapshots HTML (repetible; por defecto artifacts/*.html)")
+    parser.add_argument("--browser", choices=("chrome", "firefox", "edge"), default="chrome")
+    parser.add_argument("--static-only", action="store_true", help="no abre navegador: solo costo estático")
+    parser.add_argument("--owner", action="append", help="solo locators de esta clase (subcadena; repetible)")
+    parser.add_argument("--sample", default="Ejemplo", help="texto de ejemplo para las fábricas de locators")
+    parser.add_argument("--min-ms", type=float, default=5.0, help="muestra mínima por locator y snapshot")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", help="guarda todas las filas en este archivo")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    locators = collect(args.package, sample_text=args.sample)
+    if args.owner:
+        locators = [l for l in locators if any(o in l.owner for o in args.owner)]
+    if not locators:
+        raise SystemExit("No se encontraron locators.")
+
+    measurements = None
+    if not args.static_only:
+        snapshots = sorted({p for g in (args.snapshots or ["artifacts/*.html"]) for p in glob.glob(g)})
+        if not snapshots:
+            raise SystemExit("No hay snapshots HTML; usá --snapshots o --static-only.")
+        from .evaluate import measure
+        print(f"Midiendo {len(locators)} locators en {len(snapshots)} snapshots ({args.browser})...")
+        try:
+            measurements = measure(locators, snapshots, browser=args.browser, min_ms=args.min_ms)
+        except WebDriverException as e:
+            raise SystemExit(f"No se pudo medir en {args.browser}: {e.msg or e}\nUsá --static-only sin navegador.")
+
+    rows = build_rows(locators, measurements)
+    for line in report_lines(rows, top=args.top):
+        print(line)
+    print()
+    for line in summary_lines(rows):
+        print(line)
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump([r.as_dict() for r in rows], fh, ensure_ascii=False, indent=2)
+        print(f"\nDetalle en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Recolección de locators de los page objects.
+
+Importa cada módulo de `pages/` y recorre las clases que define:
+
+- atributos de clase que son un locator `(By.X, "valor")` o una lista/tupla
+  de locators (p.ej. `LogoutBar.MENU_ITEM_XPATHS`);
+- fábricas de locators: lambdas de clase (`ROW_BY_CODE`, `PAGE_ITEM`) y
+  métodos que solo arman un locator (`_candidate_option_by_text`). Se llaman
+  con argumentos de ejemplo sobre una instancia sin `__init__`, así que solo
+  se consideran los que no tocan el driver.
+"""
+import importlib
+import inspect
+import pkgutil
+
+from selenium.webdriver.common.by import By
+
+BY_VALUES = frozenset(v for k, v in vars(By).items() if k.isupper() and isinstance(v, str))
+
+# una fábrica que use alguno de estos no es "pura": llamarla sin driver fallaría o esperaría
+_IMPURE = ("self.driver", "self.wait", "find_element", "execute_script", "time.sleep", "WebDriverWait")
+_INT_PARAMS = {"n", "i", "ix", "idx", "index", "page", "row", "row_idx", "col", "col_idx", "position"}
+
+
+class Locator:
+    """Un locator encontrado en un page object."""
+
+    def __init__(self, owner: str, name: str, by: str, value: str, factory: bool = False):
+        self.owner = owner        # "pages.logout_bar.LogoutBar"
+        self.name = name          # "MENU_ITEM_XPATHS[1]" o "_candidate_option_by_text(...)"
+        self.by = by
+        self.value = value
+        self.factory = factory    # armado con argumentos de ejemplo
+
+    @property
+    def key(self) -> str:
+        return f"{self.owner.rsplit('.', 1)[-1]}.{self.name}"
+
+    @property
+    def expects_many(self) -> bool:
+        """Por el nombre, el locator busca una colección (ROWS, OPTIONS, ...)."""
+        base = self.name.split("[", 1)[0].split("(", 1)[0].rstrip("_").upper()
+        return base.endswith("S") and not base.endswith(("XPATHS", "LOCATORS", "TRIGGERS", "SS"))
+
+    def __repr__(self):
+        return f"Locator({self.key}, {self.by!r}, {self.value!r})"
+
+
+def is_locator(obj) -> bool:
+    return (isinstance(obj, tuple) and len(obj) == 2 and obj[0] in BY_VALUES
+            and isinstance(obj[1], str))
+
+
+def _locators_in(value):
+    """Locators dentro de un atributo: uno solo, o una lista/tupla de ellos."""
+    if is_locator(value):
+        return [(None, value)]
+    if isinstance(value, (list, tuple)) and value and all(is_locator(v) for v in value):
+        return list(enumerate(value))
+    return []
+
+
+def _sample_args(func, sample_text: str):
+    args = []
+    params = list(inspect.signature(func).parameters.values())[1:]  # sin self
+    for p in params:
+        if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) or p.default is not p.empty:
+            continue
+        if p.annotation is int or p.name in _INT_PARAMS:
+            args.append(1)
+        else:
+            args.append(sample_text)
+    return args
+
+
+def _is_pure_factory(func) -> bool:
+    try:
+        src = inspect.getsource(func)
+    except (OSError, TypeError):
+        return False
+    return ("By." in src) and not any(tok in src for tok in _IMPURE)
+
+
+def _from_factory(cls, name, func, sample_text):
+    if not _is_pure_factory(func):
+        return []
+    try:
+        result = func(object.__new__(cls), *_sample_args(func, sample_text))
+    except Exception:
+        return []
+    return _locators_in(result)
+
+
+def classes_in(package: str = "pages"):
+    """(módulo, clase) de cada clase definida en los módulos del paquete."""
+    pkg = importlib.import_module(package)
+    for info in pkgutil.iter_modules(pkg.__path__):
+        module = importlib.import_module(f"{package}.{info.name}")
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__:
+                yield module, cls
+
+
+def collect(package: str = "pages", sample_text: str = "Ejemplo") -> list:
+    """Todos los locators (de clase y de fábricas puras) de los page objects."""
+    found = []
+    for module, cls in classes_in(package):
+        owner = f"{module.__name__}.{cls.__name__}"
+        for name, value in vars(cls).items():
+            if name.startswith("__"):
+                continue
+            if inspect.isfunction(value):
+                pairs = _from_factory(cls, name, value, sample_text)
+                label, factory = f"{name}(...)", True
+            else:
+                pairs = _locators_in(value)
+                label, factory = name, False
+            for ix, (by, loc_value) in pairs:
+                suffix = "" if ix is None else f"[{ix}]"
+                found.append(Locator(owner, label + suffix, by, loc_value, factory=factory))
+    return found
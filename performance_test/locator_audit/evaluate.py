@@ -0,0 +1,101 @@
+"""
+Medición de locators contra snapshots de DOM en un navegador headless.
+
+Cada snapshot (`artifacts/*.html`, el `page_source` que guardan los tests al
+fallar) se carga en una pestaña en blanco con `DOMParser`: sus <script> no se
+ejecutan y la SPA no re-renderiza nada mientras se mide. Luego un solo
+`execute_script` evalúa todos los locators en el motor del navegador, cada
+uno repetido hasta juntar `min_ms` de muestra, y devuelve por locator el
+tiempo medio de evaluación, la cantidad de coincidencias y el error de
+sintaxis si lo hubo. El tiempo es el del motor (document.evaluate /
+querySelectorAll), sin el round-trip del driver, que es igual para todos.
+"""
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+_LOAD_JS = """
+const doc = new DOMParser().parseFromString(arguments[0], 'text/html');
+document.replaceChild(document.adoptNode(doc.documentElement), document.documentElement);
+return document.getElementsByTagName('*').length;
+"""
+
+# Mismas traducciones que hace Selenium para id/name/class name/link text
+_MEASURE_JS = """
+const [locs, minMs, maxRuns] = arguments;
+const xpath = (v) => document.evaluate(v, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+const css = (v) => document.querySelectorAll(v).length;
+const links = (v, partial) => Array.from(document.getElementsByTagName('a'))
+    .filter(a => partial ? a.innerText.includes(v) : a.innerText.trim() === v).length;
+const run = {
+    'xpath': xpath,
+    'css selector': css,
+    'id': (v) => css('[id="' + CSS.escape(v) + '"]'),
+    'name': (v) => css('[name="' + CSS.escape(v) + '"]'),
+    'class name': (v) => css('.' + CSS.escape(v)),
+    'tag name': (v) => document.getElementsByTagName(v).length,
+    'link text': (v) => links(v, false),
+    'partial link text': (v) => links(v, true),
+};
+return locs.map(([by, value]) => {
+    const fn = run[by];
+    if (!fn) return { us: null, count: null, error: 'estrategia no soportada: ' + by };
+    let count = 0, runs = 0;
+    const t0 = performance.now();
+    try {
+        do { count = fn(value); runs++; } while (runs < maxRuns && (runs < 3 || performance.now() - t0 < minMs));
+    } catch (e) {
+        return { us: null, count: null, error: String(e && e.message || e).split('\\n')[0] };
+    }
+    return { us: (performance.now() - t0) * 1000 / runs, count: count, runs: runs, error: null };
+});
+"""
+
+
+def build_driver(browser: str = "chrome"):
+    """Navegador headless mínimo: sin perfil de la suite ni esperas implícitas."""
+    if browser == "chrome":
+        options = ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        drv = webdriver.Chrome(options=options)
+    elif browser == "firefox":
+        options = FirefoxOptions()
+        options.add_argument("-headless")
+        drv = webdriver.Firefox(options=options)
+    elif browser == "edge":
+        options = EdgeOptions()
+        options.add_argument("headless")
+        drv = webdriver.Edge(options=options)
+    else:
+        raise ValueError(f"Navegador no soportado: {browser}")
+    drv.set_script_timeout(600)
+    return drv
+
+
+def measure(locators, snapshots, browser: str = "chrome", min_ms: float = 5.0, max_runs: int = 2000,
+            driver=None) -> dict:
+    """
+    Evalúa cada locator distinto en cada snapshot.
+    Devuelve {(by, value): {snapshot_name: {"us", "count", "error"}}}.
+    """
+    unique = list(dict.fromkeys((loc.by, loc.value) for loc in locators))
+    results = {key: {} for key in unique}
+    own = driver is None
+    drv = build_driver(browser) if own else driver
+    try:
+        for snap in snapshots:
+            path = Path(snap)
+            drv.get("about:blank")
+            drv.execute_script(_LOAD_JS, path.read_text(encoding="utf-8", errors="replace"))
+            rows = drv.execute_script(_MEASURE_JS, [list(k) for k in unique], min_ms, max_runs)
+            for key, row in zip(unique, rows):
+                results[key][path.name] = row
+    finally:
+        if own:
+            drv.quit()
+    return results
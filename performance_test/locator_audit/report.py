@@ -0,0 +1,122 @@
+"""
+Ranking de locators: combina el análisis estático con las mediciones.
+
+Un locator repetido en varios page objects se reporta una sola vez con todos
+sus dueños. Con mediciones se ordena por tiempo medio de evaluación; sin
+ellas, por costo estático.
+"""
+from .rules import by_name, static_cost, suggest
+
+
+class AuditRow:
+    def __init__(self, by: str, value: str):
+        self.by = by
+        self.value = value
+        self.owners = []             # "Clase.NOMBRE"
+        self.factory = False
+        self.expects_many = False
+        self.cost, self.notes = static_cost(by, value)
+        self.suggestions = suggest(by, value)
+        self.samples = {}            # snapshot -> {"us", "count", "error"}
+
+    @property
+    def measured(self) -> list:
+        return [s for s in self.samples.values() if s.get("us") is not None]
+
+    @property
+    def mean_us(self):
+        m = self.measured
+        return sum(s["us"] for s in m) / len(m) if m else None
+
+    @property
+    def max_us(self):
+        m = self.measured
+        return max(s["us"] for s in m) if m else None
+
+    @property
+    def matches(self) -> dict:
+        return {name: s["count"] for name, s in self.samples.items() if s.get("count") is not None}
+
+    @property
+    def error(self):
+        return next((s["error"] for s in self.samples.values() if s.get("error")), None)
+
+    @property
+    def flags(self) -> list:
+        flags = []
+        if self.error:
+            flags.append("inválido")
+        counts = list(self.matches.values())
+        if counts and max(counts) > 1 and not self.expects_many and not self._first_only():
+            flags.append(f"ambiguo (hasta {max(counts)})")
+        if counts and not any(counts):
+            flags.append("sin coincidencias")
+        if self.factory:
+            flags.append("fábrica")
+        return flags
+
+    def _first_only(self) -> bool:
+        # (//...)[1] ya elige el primero explícitamente
+        return self.value.startswith("(") and self.value.rstrip().endswith("[1]")
+
+    def as_dict(self) -> dict:
+        return {
+            "owners": self.owners, "by": self.by, "value": self.value, "factory": self.factory,
+            "static_cost": self.cost, "notes": self.notes, "suggestions": self.suggestions,
+            "mean_us": self.mean_us, "max_us": self.max_us, "matches": self.matches,
+            "error": self.error, "flags": self.flags,
+        }
+
+
+def build_rows(locators, measurements: dict = None) -> list:
+    rows = {}
+    for loc in locators:
+        row = rows.get((loc.by, loc.value))
+        if row is None:
+            row = rows[(loc.by, loc.value)] = AuditRow(loc.by, loc.value)
+        row.owners.append(loc.key)
+        row.factory = row.factory or loc.factory
+        row.expects_many = row.expects_many or loc.expects_many
+    for key, samples in (measurements or {}).items():
+        if key in rows:
+            rows[key].samples = samples
+    measured = bool(measurements)
+    return sorted(rows.values(), key=lambda r: (
+        -(r.mean_us or 0) if measured else 0, -r.cost, r.owners[0]))
+
+
+def report_lines(rows, top: int = 25) -> list:
+    measured = any(r.measured for r in rows)
+    lines = []
+    for rank, r in enumerate(rows[:top], 1):
+        owners = ", ".join(r.owners[:3]) + (f" (+{len(r.owners) - 3})" if len(r.owners) > 3 else "")
+        head = f"{rank:>3}. {owners}  {by_name(r.by)}  costo={r.cost}"
+        if measured and r.mean_us is not None:
+            counts = sorted(set(r.matches.values()))
+            head += f"  medio={r.mean_us:.1f}µs  máx={r.max_us:.1f}µs  coincidencias={counts}"
+        if r.flags:
+            head += "  [" + ", ".join(r.flags) + "]"
+        lines.append(head)
+        lines.append(f"     {r.value}")
+        if r.error:
+            lines.append(f"     error: {r.error}")
+        for note in r.notes:
+            lines.append(f"     - {note}")
+        for s in r.suggestions:
+            lines.append(f"     => {s}")
+    return lines
+
+
+def summary_lines(rows) -> list:
+    flagged = lambda name: sum(1 for r in rows if any(f.startswith(name) for f in r.flags))
+    xpath = sum(1 for r in rows if by_name(r.by) == "By.XPATH")
+    css = sum(1 for r in rows if any(s.startswith("(By.CSS_SELECTOR") or s.startswith("(By.ID") for s in r.suggestions))
+    lines = [f"locators distintos: {len(rows)} (XPath: {xpath}, con equivalente CSS/ID directo: {css})"]
+    if any(r.samples for r in rows):
+        lines.append(f"inválidos: {flagged('inválido')}  ambiguos: {flagged('ambiguo')}  "
+                     f"sin coincidencias en los snapshots: {flagged('sin coincidencias')}")
+    measured = [r for r in rows if r.mean_us is not None]
+    if measured:
+        total = sum(r.mean_us for r in measured)
+        lines.append(f"suma de tiempos medios: {total / 1000:.2f} ms por pasada completa de todos los locators")
+    return lines
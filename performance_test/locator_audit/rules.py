@@ -0,0 +1,197 @@
+"""
+Análisis estático del costo de un locator y equivalentes más baratos.
+
+El costo es una estimación relativa (no milisegundos): suma un peso por cada
+construcción que obliga al motor a recorrer o serializar más DOM del
+necesario. Sirve para ordenar cuando no hay navegador para medir.
+"""
+import re
+
+from selenium.webdriver.common.by import By
+
+def _class_note(classes) -> str:
+    """Nota de contains(@class, ...) con las clases que usa el selector."""
+    classes = dict.fromkeys(c.strip() or "..." for c in classes)
+    return "contains(@class, ...) es subcadena: " + "; ".join(
+        f"'{cls}' también coincide con '{cls}-…'" for cls in classes)
+
+
+# (patrón, peso, nota); la nota puede ser una función de lo que capturó el patrón
+_XPATH_RULES = [
+    (re.compile(r"translate\("), 5,
+     "translate() copia y transforma el texto de cada candidato"),
+    (re.compile(r"(following|preceding)(-sibling)?::"), 4,
+     "eje following/preceding: recorre el resto del documento"),
+    (re.compile(r"ancestor(-or-self)?::"), 2,
+     "eje ancestor: sube por cada candidato"),
+    (re.compile(r"//\*"), 3,
+     "comodín //*: evalúa todos los elementos del subárbol"),
+    (re.compile(r"\[\.?//"), 3,
+     "predicado con búsqueda descendiente (.//) por cada candidato"),
+    (re.compile(r"normalize-space\(|text\(\)|contains\(\s*\.\s*,|\[\s*\.\s*="), 2,
+     "compara texto: serializa el subárbol de cada candidato"),
+    (re.compile(r"contains\(\s*@class\s*,\s*(?:['\"]([^'\"]*)['\"])?"), 1,
+     _class_note),
+    (re.compile(r"\s\|\s|\)\s*\|\s*\("), 2,
+     "unión (|): evalúa varias expresiones y ordena el resultado"),
+]
+
+_CSS_RULES = [
+    (re.compile(r"(^|[\s>+~(,])\*"), 2, "selector universal *"),
+    (re.compile(r":has\("), 3, ":has() evalúa un subárbol por candidato"),
+    (re.compile(r"\[[\w-]+[*~|$^]="), 1, "coincidencia parcial de atributo"),
+]
+
+_BY_NAMES = {v: k for k, v in vars(By).items() if k.isupper() and isinstance(v, str)}
+
+
+def by_name(by: str) -> str:
+    return f"By.{_BY_NAMES.get(by, by)}"
+
+
+def static_cost(by: str, value: str):
+    """(costo relativo, notas) de un locator."""
+    notes = []
+    cost = 0
+    if by == By.XPATH:
+        cost = 1
+        if value.lstrip("(").startswith("//"):
+            notes.append("búsqueda global desde la raíz del documento")
+        for rx, weight, note in _XPATH_RULES:
+            found = rx.findall(value)
+            hits = len(found)
+            if hits:
+                cost += weight * hits
+                note = note(found) if callable(note) else note
+                notes.append(note if hits == 1 else f"{note} (x{hits})")
+        steps = len(re.findall(r"(?<!\[)(?<!\.)//", value))
+        if steps > 2:
+            cost += steps - 2
+            notes.append(f"{steps} pasos descendientes (//) encadenados")
+    elif by == By.CSS_SELECTOR:
+        for rx, weight, note in _CSS_RULES:
+            hits = len(rx.findall(value))
+            if hits:
+                cost += weight * hits
+                notes.append(note)
+        alternatives = len(_split_top(value, ","))
+        if alternatives > 1:
+            cost += alternatives - 1
+            notes.append(f"{alternatives} selectores alternativos (,)")
+        depth = max(len(part.split()) for part in _split_top(value, ","))
+        if depth > 3:
+            cost += depth - 3
+            notes.append(f"cadena de {depth} combinadores")
+    elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        cost = 2
+        notes.append("link text: compara el texto de todos los <a>")
+    return cost, notes
+
+
+def suggest(by: str, value: str) -> list:
+    """Equivalentes más baratos (o consejos) para el locator."""
+    out = []
+    if by != By.XPATH:
+        return out
+    m = re.fullmatch(r"//(?:\*|\w+)\[@id\s*=\s*(['\"])([^'\"]+)\1\]", value.strip())
+    if m:
+        return [f"(By.ID, {m.group(2)!r})"]
+    css = xpath_to_css(value)
+    if css:
+        out.append(f"(By.CSS_SELECTOR, {css!r})")
+        if "[class*=" in css:
+            out.append("si la clase es un token completo, `.clase` es más estricto que [class*=...]")
+        return out
+    if re.search(r"//tr\[|tbody.*tr\[", value) and "normalize-space" in value:
+        out.append("fila por texto: AntTable/RowFinder leen la tabla en un round-trip y comparan en Python")
+    elif "ant-select" in value and "translate(" in value:
+        out.append("opción por texto: AntSelect.pick(exact=False) normaliza y elige en el navegador")
+    elif "translate(" in value:
+        out.append("mover la normalización de mayúsculas/acentos a Python o JS y buscar por un atributo estable")
+    if re.search(r"(following|preceding)::", value):
+        out.append("anclar a un contenedor cercano y usar find_element relativo en lugar de following::")
+    elif value.lstrip("(").startswith("//") and "[.//" in value:
+        out.append("ubicar primero el contenedor con CSS y evaluar el resto relativo a él")
+    return out
+
+
+# -----------------------------
+# XPath simple -> CSS
+# -----------------------------
+_COND_PATTERNS = [
+    (re.compile(r"contains\(\s*@([\w-]+)\s*,\s*'([^']+)'\s*\)"), lambda m: f"[{m.group(1)}*='{m.group(2)}']"),
+    (re.compile(r"starts-with\(\s*@([\w-]+)\s*,\s*'([^']+)'\s*\)"), lambda m: f"[{m.group(1)}^='{m.group(2)}']"),
+    (re.compile(r"@([\w-]+)\s*=\s*'([^']*)'"), lambda m: f"[{m.group(1)}='{m.group(2)}']"),
+    (re.compile(r"@([\w-]+)"), lambda m: f"[{m.group(1)}]"),
+]
+
+
+def _split_top(text: str, sep: str) -> list:
+    """Divide por `sep` fuera de corchetes, paréntesis y comillas."""
+    parts, depth, quote, cur, i = [], 0, None, "", 0
+    while i < len(text):
+        ch = text[i]
+        if quote:
+            quote = None if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif depth == 0 and text.startswith(sep, i):
+            parts.append(cur)
+            cur, i = "", i + len(sep)
+            continue
+        cur += ch
+        i += 1
+    parts.append(cur)
+    return [p.strip() for p in parts]
+
+
+def _cond_to_css(cond: str):
+    cond = cond.strip()
+    neg = re.fullmatch(r"not\((.*)\)", cond)
+    if neg:
+        inner = _cond_to_css(neg.group(1))
+        return f":not({inner})" if inner else None
+    for rx, fmt in _COND_PATTERNS:
+        m = rx.fullmatch(cond)
+        if m:
+            return fmt(m)
+    return None
+
+
+def xpath_to_css(xpath: str):
+    """
+    CSS equivalente de un XPath "simple" (pasos / y // con etiqueta o *,
+    predicados sobre atributos unidos por `and`). None si usa texto,
+    posiciones, ejes o funciones que CSS no expresa.
+    """
+    xpath = xpath.strip()
+    if not xpath.startswith("/") or "|" in xpath:
+        return None
+    steps = re.findall(r"(//?)((?:[^/\[]|\[(?:[^\[\]'\"]|'[^']*'|\"[^\"]*\")*\])+)", xpath)
+    if "".join(sep + step for sep, step in steps) != xpath:
+        return None   # predicados anidados u otra sintaxis
+    out = []
+    for i, (sep, step) in enumerate(steps):
+        m = re.fullmatch(r"([\w-]+|\*)((?:\[.*\])*)", step)
+        if not m:
+            return None
+        tag, preds = m.groups()
+        css = "" if tag == "*" else tag
+        for pred in re.findall(r"\[((?:[^\[\]'\"]|'[^']*'|\"[^\"]*\")*)\]", preds):
+            for cond in _split_top(pred, " and "):
+                piece = _cond_to_css(cond)
+                if piece is None:
+                    return None
+                css += piece
+        css = css or "*"
+        if i == 0:
+            if sep == "/":
+                return None   # ruta absoluta desde <html>: rara, no vale la pena
+            out.append(css)
+        else:
+            out.append(("> " if sep == "/" else "") + css)
+    return " ".join(out)
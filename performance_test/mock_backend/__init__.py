@@ -0,0 +1,16 @@
+"""
+Backend simulado del API de contratos para benchmarks deterministas y sin red.
+
+    python -m performance_test.mock_backend --port 8000 --latency-ms 20
+
+Desde código (fixtures, CI):
+
+    from performance_test.mock_backend import MockBackend
+    server = MockBackend(latency_ms=5).start()
+    ...  # server.api_url -> http://127.0.0.1:<puerto>/api
+    server.stop()
+"""
+from .server import MockBackend
+from .store import MockStore, paginate
+
+__all__ = ["MockBackend", "MockStore", "paginate"]
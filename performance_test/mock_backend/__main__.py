@@ -0,0 +1,87 @@
+"""
+CLI del backend simulado.
+
+Ejemplos:
+    python -m performance_test.mock_backend --port 8000
+    python -m performance_test.mock_backend --port 8000 --latency-ms 30 --jitter-ms 10 \\
+        --error-rate 0.01 --route-latency worklog=200 --route-error hiringRequest=0.05
+
+Con el servidor arriba:
+    python -m performance_test.loadgen performance_test/PRUEBAS_RENDIMIENTO.jmx --base-url http://127.0.0.1:8000
+    pytest tests/api --mock-backend
+    curl http://127.0.0.1:8000/__mock/stats      # tiempo de servidor por ruta
+"""
+import argparse
+import json
+import sys
+
+from .server import MockBackend
+from .store import MockStore
+
+
+def _pairs(values, cast):
+    out = {}
+    for v in values or []:
+        key, sep, value = v.partition("=")
+        if not sep:
+            raise SystemExit(f"Se esperaba RUTA=VALOR: {v}")
+        out[key] = cast(value)
+    return out
+
+
+def _role_users(env_path):
+    """Usuarios por rol tomados del environment de Postman (user_<rol>/pass_<rol>)."""
+    if not env_path:
+        return {}
+    with open(env_path, encoding="utf-8") as f:
+        values = {v["key"]: v.get("value", "") for v in json.load(f).get("values", [])}
+    return {
+        role: {"email": values[f"user_{role}"], "password": values.get(f"pass_{role}", "password")}
+        for role in ("admin", "director", "rrhh", "secretaria", "candidato")
+        if values.get(f"user_{role}")
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m performance_test.mock_backend",
+                                     description="Backend simulado del API de contratos (en memoria).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="latencia agregada a cada request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="variación uniforme +/- sobre la latencia")
+    parser.add_argument("--error-rate", type=float, default=0, help="probabilidad (0-1) de responder error")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--route-latency", action="append", help="RUTA=MS, p. ej. worklog=200")
+    parser.add_argument("--route-error", action="append", help="RUTA=PROB, p. ej. hiringRequest=0.05")
+    parser.add_argument("--users", type=int, default=120, help="usuarios generados para la paginación")
+    parser.add_argument("--worklog", type=int, default=300, help="registros de bitácora generados")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--strict-login", action="store_true",
+                        help="solo acepta usuarios sembrados con su contraseña (por defecto cualquier correo entra)")
+    parser.add_argument("--postman-env", default="api_test/QA_GESTION_CONTRATOS.postman_environment.json",
+                        help="environment de Postman del que se toman los usuarios por rol ('' para omitir)")
+    args = parser.parse_args(argv)
+
+    try:
+        role_users = _role_users(args.postman_env)
+    except FileNotFoundError:
+        role_users = {}
+    store = MockStore(seed=args.seed, users=args.users, worklog=args.worklog, role_users=role_users)
+    server = MockBackend(
+        (args.host, args.port), store=store, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, error_status=args.error_status,
+        route_latency=_pairs(args.route_latency, float), route_errors=_pairs(args.route_error, float),
+        strict_login=args.strict_login, seed=args.seed,
+    )
+    print(f"Backend simulado en {server.api_url} (Ctrl+C para detener)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
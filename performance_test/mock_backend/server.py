@@ -0,0 +1,615 @@
+"""
+Servidor HTTP del backend simulado (solo librería estándar).
+
+Implementa el subconjunto del API de contratos que usan las suites (mismas
+rutas y formas de respuesta que el API real: paginador de Laravel, objetos
+envueltos en "user"/"person"/"faculty"/"hiringRequest", etc.), con:
+- latencia inyectada (global y por ruta) y jitter,
+- errores inyectados con una probabilidad (global y por ruta),
+- cabecera `Server-Timing` con el tiempo de servidor de cada respuesta y
+  GET /__mock/stats con el acumulado por ruta, para separar el tiempo del
+  servidor del overhead del arnés.
+
+La "ruta" para latencias/errores/estadísticas es el primer segmento después
+de /api (users, worklog, auth, hiringRequest, ...).
+"""
+import json
+import random
+import re
+import socket
+import threading
+import time
+from datetime import date
+from email.parser import BytesParser
+from email.policy import default as email_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .store import MockStore, ROLES, paginate
+
+# Recursos de catálogo: tabla -> (clave con la que se envuelve un registro, formato del listado)
+CATALOGS = {
+    "banks": (None, "paginated"),
+    "semesters": ("semester", "paginated"),
+    "positions": (None, "paginated"),
+    "formats": (None, "paginated"),
+    "faculties": ("faculty", "array"),
+    "schools": (None, "array"),
+    "activities": (None, "array"),
+    "groupTypes": (None, "array"),
+    "contract-types": (None, "array"),
+    "escalafones": (None, "array"),
+}
+
+# Roles sin acceso de lectura a los catálogos y roles que pueden modificarlos
+CATALOG_NO_READ = ("secretaria",)
+CATALOG_WRITE = ("admin", "director")
+
+# Alta con un nombre que ya existe: tabla -> (status, mensaje)
+DUPLICATE_NAME = {
+    "activities": (400, "Ya existe una actividad con ese nombre"),
+    "faculties": (422, "Ya existe una facultad con ese nombre"),
+}
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Mensaje del DELETE de catálogo (el resto: "Registro eliminado")
+DELETE_MESSAGES = {
+    "schools": "Escuela eliminada",
+    "faculties": "Facultad eliminada",
+}
+
+# Campos de la persona que GET /persons/me no expone
+PERSON_PRIVATE = ("dui_number", "nit_number", "isss_number", "nup", "bank_account_number")
+
+# Flujo de la solicitud: acción -> (estado requerido, estado nuevo)
+HIRING_FLOW = {
+    "details": ("Creada", "Creada"),
+    "sendToHR": ("Creada", "Enviada a RRHH"),
+    "validateHR": ("Enviada a RRHH", "Validada por RRHH"),
+    "pdf": ("Validada por RRHH", "Enviada a Secretaría"),
+    "reception": ("Enviada a Secretaría", "Recibida por Secretaría"),
+    "agreement": ("Recibida por Secretaría", "Aprobada por Junta"),
+    "finalize": ("Aprobada por Junta", "Finalizada"),
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str, **extra):
+        super().__init__(message)
+        self.status = status
+        self.body = {"message": message, **extra}
+
+
+def _public(user: dict) -> dict:
+    return {k: v for k, v in user.items() if k != "password"}
+
+
+class MockBackend(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256      # el default (5) provoca reintentos de SYN con carga
+    allow_reuse_address = True
+
+    def __init__(self, address=("127.0.0.1", 0), store: MockStore = None, latency_ms: float = 0,
+                 jitter_ms: float = 0, error_rate: float = 0, error_status: int = 500,
+                 route_latency: dict = None, route_errors: dict = None, strict_login: bool = False,
+                 seed: int = 1):
+        super().__init__(address, _Handler)
+        self.store = store or MockStore(seed=seed)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.route_latency = route_latency or {}
+        self.route_errors = route_errors or {}
+        self.strict_login = strict_login
+        self._rnd = random.Random(seed)
+        self._stats_lock = threading.Lock()
+        self.stats = {}
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return self.url + "/api"
+
+    # -----------------------------
+    # Inyección de latencia / errores
+    # -----------------------------
+    def injected_delay(self, route: str) -> float:
+        base = self.route_latency.get(route, self.latency_ms)
+        jitter = self._rnd.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+        return max(0.0, (base + jitter) / 1000.0)
+
+    def should_fail(self, route: str) -> bool:
+        rate = self.route_errors.get(route, self.error_rate)
+        return rate > 0 and self._rnd.random() < rate
+
+    def record(self, route: str, status: int, server_s: float, injected_s: float):
+        with self._stats_lock:
+            s = self.stats.setdefault(route, {"count": 0, "errors": 0, "server_ms": 0.0, "injected_ms": 0.0})
+            s["count"] += 1
+            s["errors"] += status >= 500
+            s["server_ms"] += server_s * 1000
+            s["injected_ms"] += injected_s * 1000
+
+    # -----------------------------
+    # Ciclo de vida
+    # -----------------------------
+    def start(self):
+        """Arranca en un hilo (para fixtures y CI) y devuelve el propio servidor."""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-backend", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockContratos/1.0"
+
+    def setup(self):
+        super().setup()
+        # una respuesta = un write: sin Nagle no aparece el delayed ACK del cliente
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *args):
+        pass
+
+    # -----------------------------
+    # Despacho
+    # -----------------------------
+    def _handle(self):
+        t0 = time.perf_counter()
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/") or "/"
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        self.body = {}
+        route = path[len("/api/"):].split("/")[0] if path.startswith("/api/") else path.strip("/").split("/")[0]
+
+        injected = 0.0
+        try:
+            self.body = self._read_body()
+            if self.command == "OPTIONS":
+                status, payload = 204, None
+            elif path.startswith("/__mock/"):
+                status, payload = self._mock_admin(path)
+            else:
+                if not path.startswith("/api/"):
+                    raise HttpError(404, "Ruta no encontrada")
+                injected = self.server.injected_delay(route)
+                if injected:
+                    time.sleep(injected)
+                if self.server.should_fail(route):
+                    raise HttpError(self.server.error_status, "Error inyectado por el backend simulado")
+                status, payload = self._route(path[len("/api"):])
+        except HttpError as e:
+            status, payload = e.status, e.body
+        except Exception as e:  # un bug del mock no debe tumbar el hilo del servidor
+            status, payload = 500, {"message": f"{type(e).__name__}: {e}"}
+
+        elapsed = time.perf_counter() - t0
+        if not path.startswith("/__mock/"):
+            self.server.record(route, status, elapsed, injected)
+        self._send(status, payload, elapsed)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = _handle
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        ctype = self.headers.get("Content-Type", "")
+        if not raw:
+            return {}
+        if "application/json" in ctype:
+            try:
+                return json.loads(raw)
+            except ValueError:
+                raise HttpError(400, "JSON inválido")
+        if "multipart/form-data" in ctype:
+            msg = BytesParser(policy=email_policy).parsebytes(
+                f"Content-Type: {ctype}\r\n\r\n".encode("latin-1") + raw)
+            out = {}
+            for part in msg.iter_parts():
+                name = part.get_param("name", header="content-disposition")
+                if part.get_filename():
+                    out[name] = {"filename": part.get_filename(), "size": len(part.get_payload(decode=True) or b"")}
+                else:
+                    out[name] = part.get_content().strip()
+            return out
+        if "application/x-www-form-urlencoded" in ctype:
+            return {k: v[-1] for k, v in parse_qs(raw.decode("utf-8")).items()}
+        return {}
+
+    def _send(self, status: int, payload, elapsed: float):
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        head = [
+            f"HTTP/1.1 {status} {self.responses.get(status, ('',))[0]}",
+            f"Server: {self.server_version}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+            f"Server-Timing: app;dur={elapsed * 1000:.2f}",
+            "X-Content-Type-Options: nosniff",
+            "Access-Control-Allow-Origin: *",
+            "Access-Control-Allow-Headers: Authorization, Content-Type, Accept, X-Contract-Version",
+            "Access-Control-Allow-Methods: GET, POST, PUT, PATCH, DELETE, OPTIONS",
+        ]
+        if self.close_connection:
+            head.append("Connection: close")
+        self.wfile.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    @property
+    def store(self) -> MockStore:
+        return self.server.store
+
+    def _user(self) -> dict:
+        auth = self.headers.get("Authorization", "")
+        token = auth[7:].strip() if auth.lower().startswith("bearer ") else ""
+        user = self.store.user_for_token(token) if token else None
+        if user is None:
+            raise HttpError(401, "Unauthenticated.")
+        return user
+
+    def _require(self, user, *roles):
+        if user["role"] not in [ROLES[r] for r in roles]:
+            raise HttpError(403, "Forbidden: no tiene permisos para esta acción.")
+
+    def _deny(self, user, *roles):
+        if user["role"] in [ROLES[r] for r in roles]:
+            raise HttpError(403, "Forbidden: no tiene permisos para esta acción.")
+
+    @staticmethod
+    def _validate_dates(body) -> dict:
+        return {k: [f"El campo {k} no es una fecha válida (AAAA-MM-DD)."]
+                for k, v in body.items() if k.endswith("_date") and v and not _DATE_RE.match(str(v))}
+
+    def _list(self, items, path, key=None):
+        per_page = self.query.get("per_page") or self.query.get("paginate") or 15
+        page = paginate(items, self.query.get("page", 1), per_page, "/api" + path)
+        return {key: page} if key else page
+
+    def _search(self, items, *fields):
+        term = (self.query.get("search") or self.query.get("name") or "").strip().lower()
+        if not term:
+            return items
+        return [i for i in items if any(term in str(i.get(f, "")).lower() for f in fields)]
+
+    # -----------------------------
+    # Rutas de administración del mock
+    # -----------------------------
+    def _mock_admin(self, path):
+        if path == "/__mock/stats":
+            with self.server._stats_lock:
+                return 200, {k: dict(v) for k, v in self.server.stats.items()}
+        if path == "/__mock/reset" and self.command == "POST":
+            self.store.reset()
+            with self.server._stats_lock:
+                self.server.stats.clear()
+            return 200, {"message": "reset"}
+        raise HttpError(404, "Ruta no encontrada")
+
+    # -----------------------------
+    # Rutas del API
+    # -----------------------------
+    def _route(self, path):
+        m, seg = self.command, path.strip("/").split("/")
+
+        if seg[0] == "auth":
+            return self._auth(seg)
+
+        user = self._user()
+
+        if seg[0] == "users":
+            return self._users(user, seg, path)
+        if seg[0] == "persons":
+            return self._persons(user, seg)
+        if seg[0] == "candidates" and seg[1:] == ["all"] and m == "GET":
+            self._deny(user, "candidato")
+            candidates = [_public(u) for u in self.store.all("users") if u["role"] == ROLES["candidato"]]
+            return 200, self._list(self._search(candidates, "name", "email"), path)
+        if seg[0] == "worklog" and m == "GET":
+            self._require(user, "admin")
+            items = self.store.all("worklog")
+            if self.query.get("relevance"):
+                items = [i for i in items if i["relevance"] == self.query["relevance"]]
+            if self.query.get("date"):
+                items = [i for i in items if i["date"] == self.query["date"]]
+            items.sort(key=lambda i: i["id"], reverse=True)
+            return 200, self._list(items, path, key="worklog")
+        if seg[0] == "faculties" and len(seg) == 3 and seg[2] == "schools":
+            if not seg[1].isdigit() or self.store.get("faculties", seg[1]) is None:
+                raise HttpError(404, "Facultad no encontrada")
+            if m == "GET":
+                return 200, [s for s in self.store.all("schools") if s["faculty_id"] == int(seg[1])]
+            self._require(user, "admin")
+            school = self.store.insert("schools", {**self.body, "faculty_id": int(seg[1])})
+            return 201, {"message": "Escuela creada", "school": school}
+        if seg[0] in ("academicLoad", "groups"):
+            return self._groups(user, seg)
+        if seg[0] in ("hiringRequest", "hiringRequestSPNP"):
+            return self._hiring(user, seg, path)
+        if seg[0] == "contract" and len(seg) == 4 and seg[1] == "hiringRequestDetail":
+            return self._contract(user, seg)
+        if seg[:3] == ["formats", "excel", "download"] and m == "GET":
+            return 200, {"file": "formatos.xlsx", "rows": len(self.store.all("formats"))}
+        if seg[0] in CATALOGS:
+            return self._catalog(user, seg, path)
+        raise HttpError(404, "Ruta no encontrada")
+
+    def _auth(self, seg):
+        if seg[1:] == ["login"] and self.command == "POST":
+            email = (self.body.get("email") or "").strip()
+            password = self.body.get("password") or ""
+            if not email or not password:
+                raise HttpError(422, "The given data was invalid.",
+                                errors={"email": ["Requerido"], "password": ["Requerido"]})
+            user = self.store.user_by_email(email)
+            if user is None and not self.server.strict_login:
+                # login abierto: cualquier correo entra; el rol se deduce del correo
+                role = next((r for r in ("admin", "director", "rrhh", "secretaria") if r in email.lower()), "candidato")
+                if "asistente" in email.lower():
+                    role = "secretaria"
+                user = self.store.insert("users", {"name": email.split("@")[0], "email": email,
+                                                   "password": password, "role": ROLES[role], "status": True})
+            if user is None or (self.server.strict_login and user["password"] != password):
+                raise HttpError(401, "Credenciales inválidas")
+            token = self.store.issue_token(user)
+            self.store.log(user, "Inicio de sesión")
+            return 200, {"token": token, "access_token": token, "token_type": "bearer",
+                         "user": {**_public(user), "roles": [{"name": user["role"]}]}}
+        if seg[1:] == ["logout"] and self.command == "POST":
+            auth = self.headers.get("Authorization", "")
+            self._user()
+            self.store.revoke(auth[7:].strip())
+            return 200, {"message": "Sesión cerrada"}
+        raise HttpError(404, "Ruta no encontrada")
+
+    def _users(self, user, seg, path):
+        m = self.command
+        if seg[1:] == ["me", "has-registered"]:
+            person = next((p for p in self.store.all("persons") if p.get("user_id") == user["id"]), None)
+            return 200, {"has_registered": person is not None}
+        if len(seg) == 1:
+            if m == "GET":
+                self._require(user, "admin")
+                users = sorted((_public(u) for u in self.store.all("users")), key=lambda u: u["id"], reverse=True)
+                return 200, self._list(self._search(users, "name", "email"), path)
+            if m == "POST":
+                self._require(user, "admin")
+                self._validate_user()
+                name, email = str(self.body["name"]).strip(), str(self.body["email"]).strip()
+                new = self.store.insert("users", {"name": name, "email": email, "password": "password",
+                                                  "role": self.body["role"],
+                                                  "school_id": self.body.get("school_id"), "status": True})
+                self.store.log(user, "Creación de usuario", "medium")
+                return 201, {"message": "Usuario creado", "user": _public(new)}
+        elif len(seg) == 2:
+            target = self.store.get("users", seg[1]) if seg[1].isdigit() else None
+            if target is None:
+                raise HttpError(404, "Usuario no encontrado")
+            if m == "GET":
+                return 200, {"user": _public(target)}
+            self._require(user, "admin")
+            if m in ("PUT", "PATCH"):
+                self._validate_user(target)
+                return 200, {"message": "Usuario actualizado",
+                             "user": _public(self.store.update("users", target["id"], self.body))}
+            if m == "DELETE":
+                self.store.delete("users", target["id"])
+                return 200, {"message": "Usuario eliminado"}
+        raise HttpError(405, "Método no permitido")
+
+    def _validate_user(self, current: dict = None):
+        """Reglas de POST/PUT /users; en PUT el correo puede ser el del propio usuario."""
+        name = str(self.body.get("name") or "").strip()
+        email = str(self.body.get("email") or "").strip()
+        school_id = self.body.get("school_id")
+        errors = {}
+        if not name:
+            errors["name"] = ["El nombre es obligatorio."]
+        if not email:
+            errors["email"] = ["El correo es obligatorio."]
+        elif not re.match(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", email):
+            errors["email"] = ["El correo no es válido."]
+        else:
+            owner = self.store.user_by_email(email)
+            if owner and (current is None or owner["id"] != current["id"]):
+                errors["email"] = ["El correo ya está registrado."]
+        if not str(self.body.get("role") or "").strip():
+            errors["role"] = ["El rol es obligatorio."]
+        if school_id not in (None, "") and not str(school_id).isdigit():
+            errors["school_id"] = ["El campo school_id debe ser numérico."]
+        if errors:
+            raise HttpError(422, "The given data was invalid.", errors=errors)
+
+    def _persons(self, user, seg):
+        m = self.command
+        mine = next((p for p in self.store.all("persons") if p.get("user_id") == user["id"]), None)
+        if len(seg) == 1 and m == "POST":
+            if mine:
+                raise HttpError(400, "El usuario ya ha registrado sus datos personales")
+            return 201, {"message": "Datos registrados", "person": self.store.insert("persons", {**self.body, "user_id": user["id"]})}
+        if seg[1:2] == ["me"]:
+            if len(seg) == 3 and seg[2] == "validations":
+                return 200, {"validations": [v for v in self.store.all("validations") if mine and v["person_id"] == mine["id"]]}
+            if mine is None:
+                raise HttpError(404, "Sin datos personales")
+            if m == "GET":
+                # plano y con el correo del usuario, sin los documentos personales
+                return 200, {**{k: v for k, v in mine.items() if k not in PERSON_PRIVATE}, "email": user["email"]}
+            if m in ("PUT", "PATCH"):
+                return 200, {"person": self.store.update("persons", mine["id"], self.body)}
+        if seg[1:2] == ["files"] and m == "POST":
+            if mine is None:
+                raise HttpError(404, "Sin datos personales")
+            return 201, {"file": self.store.insert("files", {"person_id": mine["id"], **self.body})}
+        if len(seg) >= 2 and seg[1].isdigit():
+            person = self.store.get("persons", seg[1])
+            # un candidato solo ve su persona: 403 antes del 404 para no revelar qué ids existen
+            if user["role"] == ROLES["candidato"] and (person is None or person.get("user_id") != user["id"]):
+                raise HttpError(403, "Forbidden: no tiene permisos para esta acción.")
+            if person is None:
+                raise HttpError(404, "Persona no encontrada")
+            if len(seg) == 5 and seg[2] == "validations" and m == "POST":
+                return 201, {"validation": self.store.insert("validations", {"person_id": person["id"], "document": seg[3], **self.body})}
+            if len(seg) == 2 and m == "GET":
+                return 200, {"person": person}
+            if len(seg) == 2 and m in ("PUT", "PATCH"):
+                return 200, {"person": self.store.update("persons", person["id"], self.body)}
+            if len(seg) == 2 and m == "DELETE":
+                self._require(user, "admin")
+                self.store.delete("persons", person["id"])
+                return 200, {"message": "Persona eliminada"}
+        raise HttpError(405, "Método no permitido")
+
+    def _catalog(self, user, seg, path):
+        table = seg[0]
+        wrap, style = CATALOGS[table]
+        m = self.command
+        if m == "GET":
+            self._deny(user, *CATALOG_NO_READ)
+        else:
+            self._require(user, *CATALOG_WRITE)
+        if len(seg) == 1:
+            if m == "GET":
+                items = self._search(self.store.all(table), "name")
+                if table == "semesters" and "status" in self.query:
+                    items = [i for i in items if bool(i.get("status")) == (self.query["status"] in ("1", "true"))]
+                return 200, (self._list(items, path) if style == "paginated" else items)
+            if m == "POST":
+                name = str(self.body.get("name") or self.body.get("code") or "").strip()
+                errors = self._validate_dates(self.body)
+                if not name:
+                    errors["name"] = ["El campo name es obligatorio."]
+                if errors:
+                    raise HttpError(422, "The given data was invalid.", errors=errors)
+                if table in DUPLICATE_NAME and any(
+                        str(r.get("name") or "").strip().lower() == name.lower() for r in self.store.all(table)):
+                    raise HttpError(*DUPLICATE_NAME[table])
+                rec = self.store.insert(table, dict(self.body))
+                self.store.log(user, f"Creación en {table}", "medium")
+                return 201, ({wrap: rec} if wrap else rec)
+        elif len(seg) == 2 and seg[1].isdigit():
+            rec = self.store.get(table, seg[1])
+            if rec is None:
+                raise HttpError(404, "Registro no encontrado")
+            if m == "GET":
+                return 200, ({wrap: rec} if wrap else rec)
+            if m in ("PUT", "PATCH"):
+                errors = self._validate_dates(self.body)
+                if errors:
+                    raise HttpError(422, "The given data was invalid.", errors=errors)
+                rec = self.store.update(table, rec["id"], self.body)
+                return 200, ({wrap: rec} if wrap else rec)
+            if m == "DELETE":
+                self.store.delete(table, rec["id"])
+                return 200, {"message": DELETE_MESSAGES.get(table, "Registro eliminado")}
+        raise HttpError(405, "Método no permitido")
+
+    def _groups(self, user, seg):
+        m = self.command
+        if seg[0] == "academicLoad" and len(seg) == 3 and seg[1].isdigit() and seg[2] == "groups" and m == "POST":
+            self._require(user, "director", "admin")
+            load_id = int(seg[1])
+            if any(g["academic_load_id"] == load_id and g.get("number") == self.body.get("number")
+                   and g.get("course_id") == self.body.get("course_id") for g in self.store.all("groups")):
+                raise HttpError(400, "ya existe un grupo registrado con ese numero de grupo registrado en el sistema")
+            group = self.store.insert("groups", {**self.body, "academic_load_id": load_id})
+            return 201, {"message": "Grupo registrado", "group": group}
+        if seg[0] == "groups" and len(seg) == 3 and seg[2] == "professor" and m in ("PUT", "PATCH"):
+            group = self.store.get("groups", seg[1]) if seg[1].isdigit() else None
+            if group is None:
+                raise HttpError(404, "Grupo no encontrado")
+            if not self.body.get("people_id"):
+                raise HttpError(422, "The given data was invalid.", errors={"people_id": ["Requerido"]})
+            return 200, {"message": "Profesor asignado",
+                         "group": self.store.update("groups", group["id"], {"people_id": self.body["people_id"]})}
+        raise HttpError(404, "Ruta no encontrada")
+
+    # -----------------------------
+    # Solicitudes de contratación
+    # -----------------------------
+    def _advance(self, hr, action, **changes):
+        required, new = HIRING_FLOW[action]
+        if hr["request_status"] != required:
+            raise HttpError(422, f"La solicitud está en '{hr['request_status']}' y se esperaba '{required}'.")
+        history = hr["statuses"] + [{"code": new, "date": date.today().isoformat()}]
+        return self.store.update("hiringRequests", hr["id"], {"request_status": new, "statuses": history,
+                                                               "last_status": {"code": new}, **changes})
+
+    def _hiring(self, user, seg, path):
+        m = self.command
+        if seg[0] == "hiringRequest" and len(seg) == 1:
+            if m == "GET":
+                return 200, self._list(sorted(self.store.all("hiringRequests"), key=lambda h: -h["id"]), path)
+            if m == "POST":
+                self._require(user, "director", "admin")
+                hr = self.store.insert("hiringRequests", {**self.body, "request_status": "Creada",
+                                                          "statuses": [{"code": "Creada"}],
+                                                          "last_status": {"code": "Creada"}, "details": []})
+                hr = self.store.update("hiringRequests", hr["id"],
+                                       {"code": f"SOL-{date.today().year}-{hr['id']:05d}"})
+                return 201, {"message": "Solicitud creada", "hiringRequest": hr}
+        if seg[0] == "hiringRequest" and seg[1:3] == ["all", "petitions"]:
+            items = [h for h in self.store.all("hiringRequests") if h["request_status"] == "Enviada a RRHH"]
+            return 200, self._list(items, path)
+
+        hr = self.store.get("hiringRequests", seg[1]) if len(seg) > 1 and seg[1].isdigit() else None
+        if hr is None:
+            raise HttpError(404, "Solicitud no encontrada")
+        action = "/".join(seg[2:])
+
+        if seg[0] == "hiringRequestSPNP" and action == "create/PDF/store" and m == "GET":
+            hr = self._advance(hr, "pdf", pdf=f"solicitud_{hr['id']}.pdf")
+            return 200, {"message": "PDF generado", "hiringRequest": hr}
+        if not action and m == "GET":
+            return 200, {"hiringRequest": hr}
+        if action == "details/SPNP" and m == "POST":
+            self._advance(hr, "details")
+            detail = self.store.insert("requestDetails", {**self.body, "hiring_request_id": hr["id"]})
+            self.store.update("hiringRequests", hr["id"], {"details": hr["details"] + [detail["id"]]})
+            return 201, {"message": "Detalle agregado", "data": detail}
+        if action == "sendToHR" and m == "POST":
+            self._require(user, "director", "admin")
+            return 200, {"message": "Enviada a RRHH", "hiringRequest": self._advance(hr, "sendToHR")}
+        if action == "validateHR" and m == "POST":
+            self._require(user, "rrhh", "admin")
+            return 200, {"message": "Validada", "hiringRequest": self._advance(hr, "validateHR", hr_comments=self.body.get("comments"))}
+        if action == "secretary/reception" and m in ("PUT", "POST"):
+            self._require(user, "secretaria", "admin")
+            return 200, {"message": "Recibida", "hiringRequest": self._advance(hr, "reception")}
+        if action == "agreement" and m == "POST":
+            hr = self._advance(hr, "agreement", agreement={k: v for k, v in self.body.items()})
+            return 201, {"message": "Acuerdo registrado", "data": hr["agreement"], "hiringRequest": hr}
+        if action == "finalize" and m == "POST":
+            return 200, {"message": "Proceso finalizado", "hiringRequest": self._advance(hr, "finalize")}
+        raise HttpError(404, "Ruta no encontrada")
+
+    def _contract(self, user, seg):
+        detail = self.store.get("requestDetails", seg[2]) if seg[2].isdigit() else None
+        if detail is None:
+            raise HttpError(404, "Detalle de solicitud no encontrado")
+        if seg[3] == "generate" and self.command == "GET":
+            self._require(user, "rrhh", "admin")
+            detail = self.store.update("requestDetails", detail["id"], {
+                "contract_file": f"contrato_{detail['id']}.docx", "contract_status": "Generado"})
+            return 200, {"message": "Contrato generado", "file": detail["contract_file"], "status": "Generado"}
+        if seg[3] == "status" and self.command == "POST":
+            status = self.body.get("contract_status_id") or self.body.get("status")
+            if not status:
+                raise HttpError(422, "The given data was invalid.", errors={"contract_status_id": ["Requerido"]})
+            return 200, {"message": "Estado actualizado",
+                         "data": self.store.update("requestDetails", detail["id"], {"contract_status": status})}
+        raise HttpError(405, "Método no permitido")
@@ -0,0 +1,211 @@
+"""
+Almacenamiento en memoria del backend simulado.
+
+Cada recurso es un dict id -> registro protegido por un único lock (el
+servidor atiende cada request en un hilo). Los datos iniciales son
+deterministas (`seed`) para que dos corridas de benchmark vean lo mismo.
+"""
+import random
+import threading
+from datetime import date, datetime, timedelta
+from math import ceil
+
+ROLES = {
+    "admin": "Administrador",
+    "director": "Director",
+    "rrhh": "Recursos Humanos",
+    "secretaria": "Asistente Administrativo",
+    "candidato": "Candidato",
+}
+
+
+def paginate(items: list, page, per_page, path: str) -> dict:
+    """Mismo formato que el paginador de Laravel que devuelve el API real."""
+    per_page = max(1, min(int(per_page or 15), 500))
+    total = len(items)
+    last_page = max(1, ceil(total / per_page))
+    page = max(1, int(page or 1))
+    start = (page - 1) * per_page
+    chunk = items[start:start + per_page]
+
+    def url(p):
+        return f"{path}?page={p}" if 1 <= p <= last_page else None
+
+    return {
+        "current_page": page,
+        "data": chunk,
+        "first_page_url": url(1),
+        "from": start + 1 if chunk else None,
+        "last_page": last_page,
+        "last_page_url": url(last_page),
+        "links": [{"url": url(p), "label": str(p), "active": p == page} for p in range(1, last_page + 1)],
+        "next_page_url": url(page + 1),
+        "path": path,
+        "per_page": per_page,
+        "prev_page_url": url(page - 1),
+        "to": start + len(chunk) if chunk else None,
+        "total": total,
+    }
+
+
+class MockStore:
+    def __init__(self, seed: int = 1, users: int = 120, worklog: int = 300, role_users: dict = None):
+        self.lock = threading.RLock()
+        self.seed_value = seed
+        self.n_users = users
+        self.n_worklog = worklog
+        self.role_users = role_users or {}
+        self.reset()
+
+    # -----------------------------
+    # Genérico
+    # -----------------------------
+    def reset(self):
+        with self.lock:
+            self.tables = {}
+            self._ids = {}
+            self.tokens = {}           # token -> user_id
+            self.seed()
+
+    def insert(self, table: str, record: dict) -> dict:
+        with self.lock:
+            self._ids[table] = self._ids.get(table, 0) + 1
+            rec = {"id": self._ids[table], **record}
+            now = datetime.now().isoformat(timespec="seconds")
+            rec.setdefault("created_at", now)
+            rec.setdefault("updated_at", now)
+            self.tables.setdefault(table, {})[rec["id"]] = rec
+            return rec
+
+    def get(self, table: str, id_) -> dict:
+        with self.lock:
+            return self.tables.get(table, {}).get(int(id_))
+
+    def update(self, table: str, id_, changes: dict) -> dict:
+        with self.lock:
+            rec = self.get(table, id_)
+            if rec is None:
+                return None
+            changes = {k: v for k, v in changes.items() if k != "id"}
+            rec.update(changes, updated_at=datetime.now().isoformat(timespec="seconds"))
+            return rec
+
+    def delete(self, table: str, id_) -> bool:
+        with self.lock:
+            return self.tables.get(table, {}).pop(int(id_), None) is not None
+
+    def all(self, table: str) -> list:
+        with self.lock:
+            return list(self.tables.get(table, {}).values())
+
+    # -----------------------------
+    # Usuarios y sesiones
+    # -----------------------------
+    def user_by_email(self, email: str):
+        email = (email or "").strip().lower()
+        for u in self.all("users"):
+            if u["email"].lower() == email:
+                return u
+        return None
+
+    def issue_token(self, user: dict) -> str:
+        token = f"mock-{user['id']}-{random.getrandbits(48):012x}"
+        with self.lock:
+            self.tokens[token] = user["id"]
+        return token
+
+    def user_for_token(self, token: str):
+        with self.lock:
+            uid = self.tokens.get(token)
+        return self.get("users", uid) if uid else None
+
+    def revoke(self, token: str):
+        with self.lock:
+            self.tokens.pop(token, None)
+
+    def log(self, user, action: str, relevance: str = "low"):
+        self.insert("worklog", {
+            "user_id": user["id"] if user else None,
+            "user_name": user["name"] if user else None,
+            "action": action,
+            "relevance": relevance,
+            "date": date.today().isoformat(),
+        })
+
+    # -----------------------------
+    # Datos iniciales
+    # -----------------------------
+    def seed(self):
+        rnd = random.Random(self.seed_value)
+        nombres = ["Ana", "Carlos", "María", "José", "Lucía", "Mario", "Sofía", "Luis", "Elena", "Jorge"]
+        apellidos = ["Rivera", "Hernández", "López", "Martínez", "Pérez", "Gómez", "Flores", "Cruz"]
+
+        self.insert("faculties", {"name": "Facultad de Ingeniería y Arquitectura"})
+        for name in ("Ingeniería de Sistemas Informáticos", "Ingeniería Civil", "Ingeniería Industrial",
+                     "Ingeniería Eléctrica", "Ingeniería Mecánica", "Ingeniería Química", "Arquitectura",
+                     "Ingeniería de Alimentos"):
+            self.insert("schools", {"name": name, "faculty_id": 1})
+        # existe en el ambiente QA: la colección la usa para el alta duplicada (CP_88)
+        self.insert("faculties", {"name": "Facultad de Ciencias"})
+
+        # role_users: rol -> credenciales, o lista de credenciales si el rol
+        # entra con más de un correo (.env de la UI y environment de Postman)
+        for role, creds in {**{r: None for r in ROLES}, **self.role_users}.items():
+            for c in (creds if isinstance(creds, list) else [creds]):
+                email = (c or {}).get("email") or f"{role}@ues.edu.sv"
+                if self.user_by_email(email):
+                    continue
+                user = self.insert("users", {
+                    "name": f"Usuario {ROLES.get(role, role)}", "email": email,
+                    "password": (c or {}).get("password") or "password",
+                    "role": ROLES.get(role, role), "school_id": 8, "status": True,
+                })
+                if role != "candidato":
+                    # los empleados ya tienen datos personales (GET /persons/me)
+                    self.insert("persons", {
+                        "user_id": user["id"], "first_name": "Usuario", "middle_name": "",
+                        "last_name": ROLES.get(role, role), "email": email, "is_employee": True,
+                    })
+        for i in range(self.n_users):
+            name = f"{rnd.choice(nombres)} {rnd.choice(apellidos)} {rnd.choice(apellidos)}"
+            self.insert("users", {
+                "name": name, "email": f"usuario{i + 1}@ues.edu.sv", "password": "password",
+                "role": rnd.choice(list(ROLES.values())), "school_id": rnd.randint(1, 8), "status": True,
+            })
+
+        for i, name in enumerate(("Banco Agrícola", "Banco Cuscatlán", "Banco de América Central",
+                                  "Banco Davivienda", "Banco Hipotecario", "Banco Promerica")):
+            self.insert("banks", {"name": name})
+        for i in range(1, 7):
+            start = date(2022, 1, 10) + timedelta(days=182 * (i - 1))
+            self.insert("semesters", {"name": f"Ciclo {1 + (i - 1) % 2}-{start.year}",
+                                      "start_date": start.isoformat(),
+                                      "end_date": (start + timedelta(days=170)).isoformat(),
+                                      "status": i == 6})
+        for name in ("Profesor Universitario", "Instructor", "Coordinador", "Jefe de Departamento"):
+            self.insert("positions", {"name": name})
+        # las dos últimas existen en el ambiente QA: la colección las usa para el alta duplicada (CP_51, CP_82)
+        for name in ("Impartir clases teoricas de la asignatura", "Preparar material de apoyo de asignatura",
+                     "Elaborar evaluaciones de asignatura", "Atender consultas de asignatura",
+                     "Asesorar el uso de equipo, insumos y materiales diversos", "Ciclo I 2025"):
+            self.insert("activities", {"name": name})
+        for i in range(1, 31):
+            self.insert("formats", {"name": f"Formato {i:02d}", "file": f"formato_{i:02d}.docx"})
+        for name in ("Teórico", "Laboratorio", "Discusión"):
+            self.insert("groupTypes", {"name": name})
+        for code, name in (("SPNP", "Servicios Profesionales No Personales"),
+                           ("TA", "Tiempo Adicional"), ("TI", "Tiempo Integral")):
+            self.insert("contract-types", {"code": code, "name": name})
+        for name in ("Escalafón 1", "Escalafón 2", "Escalafón 3"):
+            self.insert("escalafones", {"name": name})
+
+        users = self.all("users")
+        for i in range(self.n_worklog):
+            u = rnd.choice(users)
+            self.insert("worklog", {
+                "user_id": u["id"], "user_name": u["name"],
+                "action": rnd.choice(["Inicio de sesión", "Creación de usuario", "Actualización de banco",
+                                      "Envío de solicitud", "Validación RRHH"]),
+                "relevance": rnd.choice(["low", "medium", "high"]),
+                "date": (date(2025, 11, 1) + timedelta(days=i % 30)).isoformat(),
+            })
@@ -0,0 +1,13 @@
+"""
+Historial de rendimiento: duración de cada test de UI y de cada request de
+API en todas las corridas (la matriz solo guarda la última).
+
+    python -m performance_test.perf_history ingest --allure allure-results_prueba
+    python -m performance_test.perf_history regresiones --ventana 10 --umbral 0.2 --fail
+"""
+from .analysis import nuevos_lentos, regresiones, tendencias
+from .ingest import ingest_allure, ingest_newman
+from .store import COLUMNAS, HistoryStore
+
+__all__ = ["HistoryStore", "COLUMNAS", "ingest_allure", "ingest_newman", "tendencias", "regresiones",
+           "nuevos_lentos"]
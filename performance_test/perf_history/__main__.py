@@ -0,0 +1,130 @@
+"""
+CLI del historial de rendimiento.
+
+Ejemplos:
+    # Después de cada corrida nocturna (solo entra lo nuevo)
+    python -m performance_test.perf_history ingest --allure allure-results_prueba \\
+        --newman api_test/reports/newman/newman_results_sin_contratacion.json
+
+    # Tendencia por CP en las últimas 10 corridas de UI
+    python -m performance_test.perf_history tendencias --kind ui --ultimas 10
+
+    # En CI: falla si algún CP empeoró su p90 más de 20% contra las 10 corridas anteriores
+    python -m performance_test.perf_history regresiones --ventana 10 --umbral 0.2 --fail
+
+    # Tests que pasaron a tardar más de 60 s
+    python -m performance_test.perf_history lentos --umbral-seg 60
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+from .analysis import nuevos_lentos, regresiones, tendencias
+from .ingest import ingest_allure, ingest_newman
+from .store import HistoryStore
+
+
+def _fmt(v, fmt="{:.1f}"):
+    return "-" if v is None or pd.isna(v) else fmt.format(v)
+
+
+def _cargar(store, args):
+    df = store.load(desde=args.desde, kind=args.kind)
+    if df.empty:
+        raise SystemExit(f"El historial {store.root} está vacío; corré primero `ingest`.")
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m performance_test.perf_history",
+                                     description="Historial de duraciones de tests y requests por corrida.")
+    parser.add_argument("--store", default="perf_history", help="carpeta del historial")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("ingest", help="agrega los resultados nuevos de Allure/Newman")
+    p.add_argument("--allure", help="carpeta de *-result.json")
+    p.add_argument("--newman", help="JSON exportado por Newman")
+    p.add_argument("--run-id", help="id de la corrida (por defecto, su fecha y hora de inicio)")
+    p.add_argument("--workers", type=int, default=None, help="procesos para leer Allure")
+
+    for nombre, ayuda in (("tendencias", "duración por corrida de cada CP o test"),
+                          ("regresiones", "CPs cuyo p90 empeoró contra las corridas anteriores"),
+                          ("lentos", "tests que pasaron a superar un umbral de duración")):
+        p = sub.add_parser(nombre, help=ayuda)
+        p.add_argument("--kind", choices=("ui", "api"), help="solo UI o solo API")
+        p.add_argument("--desde", help="ignora particiones anteriores a esta fecha (YYYY-MM-DD)")
+        p.add_argument("--top", type=int, default=30)
+
+    sub.choices["tendencias"].add_argument("--ultimas", type=int, default=10)
+    sub.choices["tendencias"].add_argument("--por-test", action="store_true", help="por test en vez de por CP")
+    sub.choices["tendencias"].add_argument("--cp", action="append", help="solo este ID_CASO (repetible)")
+    p = sub.choices["regresiones"]
+    p.add_argument("--ventana", type=int, default=10, help="corridas anteriores de referencia")
+    p.add_argument("--umbral", type=float, default=0.20, help="aumento relativo del p90 (0.2 = 20%%)")
+    p.add_argument("--min-runs", type=int, default=3, help="corridas mínimas en la ventana")
+    p.add_argument("--min-delta", type=float, default=0.5, help="aumento mínimo del p90 en segundos")
+    p.add_argument("--fail", action="store_true", help="termina con código 1 si hay regresiones")
+    p = sub.choices["lentos"]
+    p.add_argument("--umbral-seg", type=float, default=30.0)
+    p.add_argument("--ventana", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    store = HistoryStore(args.store)
+
+    if args.cmd == "ingest":
+        if not args.allure and not args.newman:
+            parser.error("ingest necesita --allure y/o --newman")
+        escritos = []
+        if args.allure:
+            escritos += ingest_allure(store, args.allure, run_id=args.run_id, workers=args.workers)
+        if args.newman:
+            escritos += ingest_newman(store, args.newman, run_id=args.run_id)
+        for path in escritos:
+            print(f"+ {path}")
+        print(f"{len(escritos)} archivos nuevos; corridas en el historial: {len({r[0] for r in store.runs()})}")
+        return
+
+    df = _cargar(store, args)
+
+    if args.cmd == "tendencias":
+        nivel = "test" if args.por_test else "ID_CASO"
+        if args.cp:
+            df = df[df["ID_CASO"].isin(args.cp)]
+        res = tendencias(df, nivel=nivel, ultimas=args.ultimas)
+        if res.empty:
+            print("Sin datos para mostrar.")
+            return
+        res = res.sort_values("variacion_pct", ascending=False, na_position="last").head(args.top)
+        for r in res.itertuples(index=False):
+            clave = getattr(r, nivel)
+            print(f"{r.kind:<4} {str(clave)[:60]:<60} {r.serie:<{args.ultimas}} "
+                  f"última={_fmt(r.ultima_seg)}s mediana={_fmt(r.mediana_previa_seg)}s "
+                  f"({_fmt(r.variacion_pct, '{:+.0f}')}%) n={r.corridas}")
+
+    elif args.cmd == "regresiones":
+        res = regresiones(df, ventana=args.ventana, umbral=args.umbral, min_runs=args.min_runs,
+                          min_delta=args.min_delta)
+        if res.empty:
+            print(f"Sin regresiones de p90 > {args.umbral:.0%} contra las últimas {args.ventana} corridas.")
+            return
+        print(f"Regresiones (p90 > {args.umbral:.0%} contra las últimas {args.ventana} corridas):")
+        for r in res.head(args.top).itertuples(index=False):
+            print(f"  {r.kind:<4} {r.ID_CASO:<10} p90 {_fmt(r.p90_base_seg)}s -> {_fmt(r.p90_ultima_seg)}s "
+                  f"({_fmt(r.variacion_pct, '{:+.0f}')}%, {r.runs_base} corridas de referencia)")
+        if args.fail:
+            sys.exit(1)
+
+    elif args.cmd == "lentos":
+        res = nuevos_lentos(df, umbral_seg=args.umbral_seg, ventana=args.ventana)
+        if res.empty:
+            print(f"Ningún test pasó a superar {args.umbral_seg:g}s en la última corrida.")
+            return
+        print(f"Tests que ahora superan {args.umbral_seg:g}s:")
+        for r in res.head(args.top).itertuples(index=False):
+            antes = "nuevo" if r.nuevo else f"máx. previo {_fmt(r.max_base_seg)}s"
+            print(f"  {r.kind:<4} {str(r.test)[:70]:<70} {_fmt(r.ultima_seg)}s ({antes})")
+
+
+if __name__ == "__main__":
+    main()
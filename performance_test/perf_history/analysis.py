@@ -0,0 +1,124 @@
+"""
+Tendencias y regresiones sobre el historial.
+
+Las corridas se ordenan por su inicio. Para cada kind (ui/api), la última
+corrida se compara contra las `ventana` anteriores del mismo kind:
+
+- regresiones por CP: p90 de las duraciones de sus tests/requests en la
+  última corrida vs. p90 de las mismas en la ventana (umbral relativo y
+  diferencia mínima en segundos, para no alertar por ruido de milisegundos);
+- tests que se volvieron lentos: superan `umbral_seg` en la última corrida
+  y no lo superaban en ninguna corrida de la ventana (o son nuevos).
+"""
+import pandas as pd
+
+BLOQUES = "▁▂▃▄▅▆▇█"
+
+
+def orden_corridas(df: pd.DataFrame) -> pd.DataFrame:
+    """(kind, run_id, inicio) de cada corrida, de la más vieja a la más nueva."""
+    return (
+        df.groupby(["kind", "run_id"], as_index=False)["start"].min()
+        .sort_values(["kind", "start"])
+        .reset_index(drop=True)
+    )
+
+
+def marcar_ventana(df: pd.DataFrame, ventana: int = 10) -> pd.DataFrame:
+    """
+    Agrega `grupo`: "ultima", "base" (las `ventana` corridas anteriores) o
+    None (más viejas), por kind.
+    """
+    corridas = orden_corridas(df)
+    corridas["pos"] = corridas.groupby("kind").cumcount(ascending=False)  # 0 = última
+    corridas["grupo"] = None
+    corridas.loc[corridas["pos"] == 0, "grupo"] = "ultima"
+    corridas.loc[corridas["pos"].between(1, ventana), "grupo"] = "base"
+    return df.merge(corridas[["kind", "run_id", "grupo"]], on=["kind", "run_id"], how="left")
+
+
+def sparkline(valores) -> str:
+    valores = [v for v in valores if pd.notna(v)]
+    if not valores:
+        return ""
+    lo, hi = min(valores), max(valores)
+    if hi == lo:
+        return BLOQUES[0] * len(valores)
+    return "".join(BLOQUES[int((v - lo) / (hi - lo) * (len(BLOQUES) - 1))] for v in valores)
+
+
+def tendencias(df: pd.DataFrame, nivel: str = "ID_CASO", ultimas: int = 10) -> pd.DataFrame:
+    """
+    Duración total por corrida de cada CP (o test, con nivel="test") en las
+    últimas `ultimas` corridas: última, mediana de las anteriores y variación.
+    """
+    df = df.dropna(subset=[nivel])
+    corridas = orden_corridas(df)
+    corridas = corridas.groupby("kind").tail(ultimas)
+    df = df.merge(corridas[["kind", "run_id"]], on=["kind", "run_id"])
+    por_corrida = (
+        df.groupby(["kind", nivel, "run_id"], as_index=False)
+        .agg(duracion=("duration_sec", "sum"), start=("start", "min"))
+        .sort_values("start")
+    )
+    filas = []
+    for (kind, clave), g in por_corrida.groupby(["kind", nivel], sort=True):
+        serie = g["duracion"].tolist()
+        previas = serie[:-1]
+        mediana = pd.Series(previas).median() if previas else None
+        filas.append({
+            "kind": kind,
+            nivel: clave,
+            "corridas": len(serie),
+            "ultima_seg": serie[-1],
+            "mediana_previa_seg": mediana,
+            "variacion_pct": (serie[-1] / mediana - 1) * 100 if mediana else None,
+            "serie": sparkline(serie),
+        })
+    return pd.DataFrame(filas)
+
+
+def regresiones(df: pd.DataFrame, ventana: int = 10, umbral: float = 0.20, min_runs: int = 3,
+                min_delta: float = 0.5, nivel: str = "ID_CASO") -> pd.DataFrame:
+    """
+    CPs cuyo p90 en la última corrida supera en más de `umbral` (y en al menos
+    `min_delta` segundos) al p90 de las `ventana` corridas anteriores. Solo se
+    evalúan los que tienen al menos `min_runs` corridas en la ventana.
+    """
+    df = marcar_ventana(df.dropna(subset=[nivel]), ventana)
+    df = df[df["grupo"].notna()]
+    if df.empty:
+        return pd.DataFrame()
+
+    p90 = df.groupby(["kind", nivel, "grupo"])["duration_sec"].quantile(0.9).unstack("grupo")
+    runs_base = df[df["grupo"] == "base"].groupby(["kind", nivel])["run_id"].nunique()
+    res = p90.reindex(columns=["base", "ultima"]).assign(runs_base=runs_base).reset_index()
+    res = res.rename(columns={"base": "p90_base_seg", "ultima": "p90_ultima_seg"})
+    res["runs_base"] = res["runs_base"].fillna(0).astype(int)
+    res["variacion_pct"] = (res["p90_ultima_seg"] / res["p90_base_seg"] - 1) * 100
+
+    regresion = (
+        (res["runs_base"] >= min_runs)
+        & (res["p90_ultima_seg"] > res["p90_base_seg"] * (1 + umbral))
+        & (res["p90_ultima_seg"] - res["p90_base_seg"] >= min_delta)
+    )
+    return res[regresion].sort_values("variacion_pct", ascending=False).reset_index(drop=True)
+
+
+def nuevos_lentos(df: pd.DataFrame, umbral_seg: float = 30.0, ventana: int = 10) -> pd.DataFrame:
+    """
+    Tests (o requests) que en la última corrida tardaron más de `umbral_seg`
+    y en la ventana anterior nunca lo habían superado o no existían.
+    """
+    df = marcar_ventana(df, ventana)
+    df = df[df["grupo"].notna()]
+    if df.empty:
+        return pd.DataFrame()
+
+    maximos = df.groupby(["kind", "test", "ID_CASO", "grupo"], dropna=False)["duration_sec"].max().unstack("grupo")
+    maximos = maximos.reindex(columns=["base", "ultima"]).reset_index()
+    lentos = maximos[
+        (maximos["ultima"] > umbral_seg) & ~(maximos["base"] > umbral_seg)
+    ].rename(columns={"base": "max_base_seg", "ultima": "ultima_seg"})
+    lentos["nuevo"] = lentos["max_base_seg"].isna()
+    return lentos.sort_values("ultima_seg", ascending=False).reset_index(drop=True)
@@ -0,0 +1,84 @@
+"""
+Ingesta de resultados de Allure y Newman en el historial.
+
+Usa la misma lectura que merge_allure_con_matriz (mismas reglas de CP). De
+cada fuente solo entran los resultados que empezaron después de lo último
+guardado, así una carpeta de allure-results que se acumula entre corridas se
+puede ingerir todas las noches sin duplicar filas.
+"""
+from datetime import datetime
+
+import pandas as pd
+
+from merge_allure_con_matriz import leer_allure_paralelo, leer_ejecuciones_newman
+
+from .store import HistoryStore
+
+
+def _ts(start_ms) -> datetime:
+    return datetime.fromtimestamp(start_ms / 1000)
+
+
+def run_id_de(start_ms) -> str:
+    """Id de corrida por defecto: inicio del primer resultado (20261018T021500)."""
+    return _ts(start_ms).strftime("%Y%m%dT%H%M%S")
+
+
+def normalizar(df: pd.DataFrame, kind: str, source: str, test: pd.Series, status: str, duracion: str,
+               run_id: str) -> pd.DataFrame:
+    """Lleva un DataFrame de merge_allure_con_matriz al esquema del historial."""
+    out = pd.DataFrame({
+        "start": df["start"].astype("int64"),
+        "kind": kind,
+        "source": source,
+        "ID_CASO": df["ID_CASO"],
+        "test": test,
+        "status": df[status].astype(str).str.upper(),
+        "duration_sec": df[duracion].astype(float),
+    })
+    out.insert(0, "run_id", run_id)
+    out.insert(1, "fecha", _ts(out["start"].min()).strftime("%Y-%m-%d"))
+    return out.reset_index(drop=True)
+
+
+def _nuevos(store: HistoryStore, df: pd.DataFrame, kind: str, source: str) -> pd.DataFrame:
+    if df.empty or "start" not in df.columns:
+        return pd.DataFrame()
+    df = df.dropna(subset=["start"])  # sin inicio no se puede ubicar en el tiempo
+    ultimo = store.last_start(kind, source)
+    return df[df["start"] > ultimo] if ultimo is not None else df
+
+
+def ingest_allure(store: HistoryStore, allure_dir: str, run_id: str = None, workers: int = None) -> list:
+    """
+    Agrega los tests de UI y las requests de tests/api de `allure_dir` que
+    todavía no están en el historial. Devuelve los archivos escritos.
+    """
+    df_ui, df_api = leer_allure_paralelo(allure_dir, workers=workers)
+    df_ui = _nuevos(store, df_ui, "ui", "allure")
+    df_api = _nuevos(store, df_api, "api", "allure")
+    if df_ui.empty and df_api.empty:
+        return []
+
+    run_id = run_id or run_id_de(min(d["start"].min() for d in (df_ui, df_api) if not d.empty))
+    escritos = []
+    if not df_ui.empty:
+        # fullName identifica al test entre módulos; sin él, el nombre
+        test = df_ui["fullName"].where(df_ui["fullName"] != "", df_ui["test_name"])
+        escritos.append(store.append(
+            normalizar(df_ui, "ui", "allure", test, "status", "duration_sec", run_id), run_id, "ui", "allure"))
+    if not df_api.empty:
+        escritos.append(store.append(
+            normalizar(df_api, "api", "allure", df_api["request_name"], "status_api", "duration_api_sec", run_id),
+            run_id, "api", "allure"))
+    return escritos
+
+
+def ingest_newman(store: HistoryStore, json_path: str, run_id: str = None) -> list:
+    """Agrega las requests con CP de un JSON de Newman (si esa corrida no está ya)."""
+    df = _nuevos(store, leer_ejecuciones_newman(json_path), "api", "newman")
+    if df.empty:
+        return []
+    run_id = run_id or run_id_de(df["start"].min())
+    hist = normalizar(df, "api", "newman", df["request_name"], "status_api", "duration_api_sec", run_id)
+    return [store.append(hist, run_id, "api", "newman")]
@@ -0,0 +1,107 @@
+"""
+Historial de duraciones, append-only y particionado por fecha.
+
+    perf_history/
+        fecha=2026-10-18/
+            run=20261018T021500-ui-allure.parquet
+            run=20261018T021500-api-allure.parquet
+            run=20261018T023000-api-newman.parquet
+        fecha=2026-10-19/
+            ...
+
+Cada ingesta escribe archivos nuevos y nunca reescribe los existentes. Con
+pyarrow instalado las particiones son Parquet; sin él, CSV comprimido con
+las mismas columnas (se pueden mezclar: load lee ambos). Filtrar por fecha
+solo abre las carpetas de ese rango.
+"""
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pyarrow es opcional: sin él las particiones son CSV comprimido
+    pyarrow = None
+
+# Una fila por test (UI) o request (API) en una corrida
+COLUMNAS = ["run_id", "fecha", "start", "kind", "source", "ID_CASO", "test", "status", "duration_sec"]
+EXTENSIONES = (".parquet", ".csv.gz")
+
+
+class HistoryStore:
+    def __init__(self, root: str = "perf_history"):
+        self.root = Path(root)
+
+    # ---------- escritura ----------
+    def append(self, df: pd.DataFrame, run_id: str, kind: str, source: str) -> Path:
+        """
+        Agrega una corrida (`kind` = ui/api, `source` = allure/newman). Falla
+        si esa corrida ya existe: el historial no se reescribe.
+        """
+        if self.has_run(run_id, kind, source):
+            raise FileExistsError(f"La corrida {run_id} ({kind}/{source}) ya está en {self.root}")
+        fecha = df["fecha"].iloc[0]
+        carpeta = self.root / f"fecha={fecha}"
+        carpeta.mkdir(parents=True, exist_ok=True)
+        df = df[COLUMNAS]
+
+        destino = carpeta / f"run={run_id}-{kind}-{source}{'.parquet' if pyarrow else '.csv.gz'}"
+        tmp = destino.with_name("." + destino.name + ".tmp")
+        if pyarrow:
+            df.to_parquet(tmp, index=False)
+        else:
+            df.to_csv(tmp, index=False, compression="gzip")
+        os.replace(tmp, destino)  # nunca queda una partición a medio escribir
+        return destino
+
+    # ---------- lectura ----------
+    def _archivos(self, desde: str = None, hasta: str = None) -> list:
+        if not self.root.exists():
+            return []
+        out = []
+        for carpeta in sorted(self.root.glob("fecha=*")):
+            fecha = carpeta.name.split("=", 1)[1]
+            if (desde and fecha < desde) or (hasta and fecha > hasta):
+                continue
+            out.extend(sorted(p for p in carpeta.iterdir() if p.name.endswith(EXTENSIONES)))
+        return out
+
+    @staticmethod
+    def _run_kind(path: Path) -> tuple:
+        """(run_id, kind, source) a partir del nombre del archivo."""
+        nombre = path.name.split("=", 1)[1]
+        for ext in EXTENSIONES:
+            nombre = nombre.removesuffix(ext)
+        return tuple(nombre.rsplit("-", 2))
+
+    def runs(self) -> list:
+        """[(run_id, kind, source)] ya guardados, en orden de fecha."""
+        return [self._run_kind(path) for path in self._archivos()]
+
+    def has_run(self, run_id: str, kind: str, source: str) -> bool:
+        return (run_id, kind, source) in self.runs()
+
+    def load(self, desde: str = None, hasta: str = None, kind: str = None) -> pd.DataFrame:
+        """Todas las filas (opcionalmente de un rango de fechas YYYY-MM-DD y un kind)."""
+        partes = []
+        for path in self._archivos(desde, hasta):
+            if kind and self._run_kind(path)[1] != kind:
+                continue
+            if path.name.endswith(".parquet"):
+                partes.append(pd.read_parquet(path))
+            else:
+                partes.append(pd.read_csv(path, dtype={"run_id": str, "fecha": str, "ID_CASO": str, "test": str}))
+        if not partes:
+            return pd.DataFrame(columns=COLUMNAS)
+        return pd.concat(partes, ignore_index=True)
+
+    def last_start(self, kind: str, source: str):
+        """Inicio (epoch ms) más reciente ya guardado para kind/source, o None."""
+        for carpeta in sorted(self.root.glob("fecha=*"), reverse=True) if self.root.exists() else []:
+            fecha = carpeta.name.split("=", 1)[1]
+            df = self.load(desde=fecha, hasta=fecha, kind=kind)
+            df = df[df["source"] == source]
+            if not df.empty:
+                return int(df["start"].max())
+        return None
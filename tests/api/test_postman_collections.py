@@ -0,0 +1,108 @@
+"""
+Colección de Postman de api_test/ ejecutada desde pytest (sin Newman).
+
+Cada request de la colección es un test: `CARPETA::nombre`. Las carpetas de
+primer nivel se ejecutan en paralelo dentro del fixture `postman_runner`; el
+test solo espera el resultado de su carpeta, lo adjunta a Allure y valida las
+aserciones que la colección declara.
+
+Un `pytest` sin opciones no los ejecuta (la colección crea y borra datos en
+el API real): hay que pedirlos con --run-api, o con --mock-backend para ir
+contra el backend simulado.
+
+Ejemplos:
+    pytest tests/api --run-api --alluredir=allure-results_prueba
+    pytest tests/api --run-api --postman-collection "api_test/SIN MODULO CONTRATOS/GESTION_CONTRATOS_SIN_CONTRATACION.postman_collection.json"
+    pytest tests/api --run-api -n 4 --dist loadgroup     # una carpeta (y las que dependen de ella) por worker
+    pytest tests/api --mock-backend                      # sin red
+"""
+import json
+import os
+
+import allure
+import pytest
+
+from utils.postman_runner import folder_group, load_collection
+
+pytestmark = pytest.mark.api
+
+# Casos que dependen de datos que el backend simulado no tiene (la request se
+# ejecuta igual, para no romper la cadena de variables de su carpeta)
+MOCK_UNSUPPORTED = {
+    "USUARIOS::CP_04 BLOQUEAR ACTUALIZACION CON CORREO EN USO":
+        "el correo duplicado (nacionalues@ues.edu.sv) es de un usuario del ambiente QA",
+    "SEGURIDAD::CP 97 YO MISMO PRUEBA DE CONTROL":
+        "candidatoA ya tiene datos personales en QA; el mock solo siembra personas para empleados",
+    "EMPLEADO::CP_43 ACTUALIZAR_STATUS_CONTRATO":
+        "contractFlow está vacío en la colección (el pre-request no tiene estados que enviar)",
+}
+
+
+def pytest_generate_tests(metafunc):
+    if "postman_case" not in metafunc.fixturenames:
+        return
+    collection = metafunc.config.getoption("--postman-collection")
+    cases = load_collection(collection) if os.path.exists(collection) else []
+    mock = metafunc.config.getoption("--mock-backend")
+
+    def marks(case_id, folder):
+        out = [pytest.mark.xdist_group(folder_group(folder))]
+        if mock and case_id in MOCK_UNSUPPORTED:
+            out.append(pytest.mark.skip(reason=f"--mock-backend: {MOCK_UNSUPPORTED[case_id]}"))
+        return out
+
+    metafunc.parametrize(
+        "postman_case",
+        [pytest.param(c, id=f"{c.folder}::{c.name}", marks=marks(f"{c.folder}::{c.name}", c.folder)) for c in cases],
+    )
+
+
+@pytest.fixture(scope="session")
+def postman_prefetch(request, postman_runner):
+    """
+    Sin xdist, lanza de una vez todas las carpetas seleccionadas para que
+    corran en paralelo mientras los tests van leyendo resultados en orden.
+    Con xdist cada worker ejecuta a demanda las carpetas que le tocan.
+    """
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        folders = []
+        for item in request.session.items:
+            case = getattr(item, "callspec", None) and item.callspec.params.get("postman_case")
+            if case is not None and case.folder not in folders:
+                folders.append(case.folder)
+        postman_runner.prefetch(folders)
+    return postman_runner
+
+
+def _attach(name, body, mime=allure.attachment_type.TEXT):
+    if body:
+        allure.attach(body, name=name, attachment_type=mime)
+
+
+def test_postman_request(postman_case, postman_prefetch):
+    result = postman_prefetch.result(postman_case)
+
+    allure.dynamic.title(postman_case.name)
+    allure.dynamic.suite(postman_case.folder)
+    allure.dynamic.sub_suite("/".join(postman_case.path[1:]) or postman_case.folder)
+    allure.dynamic.label("layer", "api")
+    # start/stop del test no sirven como duración: con postman_prefetch el
+    # primer test de cada carpeta espera a toda la carpeta y el resto lee ~0s
+    allure.dynamic.label("elapsed_sec", f"{result.elapsed_sec:.6f}")
+
+    request_info = {
+        "method": result.method,
+        "url": result.url,
+        "headers": result.request_headers,
+        "body": result.request_body.decode("utf-8", "replace")
+        if isinstance(result.request_body, bytes) else result.request_body,
+    }
+    _attach("request", json.dumps(request_info, ensure_ascii=False, indent=2, default=str),
+            allure.attachment_type.JSON)
+    _attach(f"response {result.status} ({result.elapsed_sec * 1000:.0f} ms)", result.response_text[:20000])
+
+    if result.skipped:
+        pytest.skip(result.skipped)
+    if result.error:
+        pytest.fail(result.error)
+    assert not result.failures, "; ".join(result.failures)
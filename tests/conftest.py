@@ -7,13 +7,50 @@ if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 # --------------------------------------
 
+import json
 import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from config.config import settings
+from pages.base_page import WAIT_STATS, FIRST_OF_STATS, first_of_lines, wait_stats_lines
+from pages.row_finder import ROW_LOOKUP_STATS, row_lookup_lines
 from datetime import datetime
+from utils.driver_pool import DriverPool
+from utils.session_cache import SessionCache, session_cache_lines
+from utils.api_client import ApiClient
+from utils.provisioning import SolicitudProvisioner
+from utils.factories import DataFactory
+from utils.postman_runner import PostmanRunner, environment_users, load_environment
+from utils.lpt_scheduler import DurationStore, LptScheduling, parse_chains
+from utils.command_profiler import COMMAND_STATS, CommandProfiler, profile_lines, write_folded
+from utils.page_timing import (
+    PAGE_TIMINGS,
+    MODES as PAGE_TIMING_MODES,
+    instrument_pages,
+    merge_timings,
+    page_timing_lines,
+    write_summary as write_page_timing,
+)
+from utils.network_capture import NETWORK_STATS, NetworkCapture, network_lines
+from pages import frontend_metrics
+from pages.frontend_metrics import FRONTEND_METRICS, frontend_metrics_lines, write_metrics as write_frontend_metrics
+from utils.perf_budgets import (
+    BUDGET_VIOLATIONS,
+    MODES as PERF_BUDGET_MODES,
+    Budgets,
+    budget_lines,
+    describe as describe_violation,
+    effective_mode,
+)
+from utils.evidence import (
+    EvidenceBuffer,
+    EvidenceWriter,
+    compress_png,
+    COMPRESS_FORMATS as EVIDENCE_COMPRESS_FORMATS,
+    POLICIES as EVIDENCE_POLICIES,
+)
 
 # ========================
 # Opciones de pytest
@@ -24,6 +61,61 @@ def pytest_addoption(parser):
                      help="chrome|firefox|edge")
     parser.addoption("--headless", action="store", default=str(settings.HEADLESS).lower(),
                      help="true|false")
+    parser.addoption("--driver-pool", action="store_true", default=False,
+                     help="reutiliza navegadores entre tests (limpiando estado) en lugar de abrir uno por test")
+    parser.addoption("--driver-pool-size", action="store", type=int, default=2,
+                     help="navegadores inactivos que se mantienen abiertos por worker")
+    parser.addoption("--driver-pool-max-uses", action="store", type=int, default=25,
+                     help="tests atendidos por un navegador antes de reciclarlo")
+    parser.addoption("--login-mode", action="store", default="ui",
+                     help="ui|api: cómo obtiene la sesión el fixture logged_in_as")
+    parser.addoption("--evidence-policy", action="store", default="always", choices=EVIDENCE_POLICIES,
+                     help="always|on-failure|ring-buffer: cuándo se guardan los screenshots del fixture evidencia")
+    parser.addoption("--evidence-buffer-size", action="store", type=int, default=5,
+                     help="screenshots que se conservan en memoria por test con --evidence-policy=ring-buffer")
+    parser.addoption("--evidence-compress", action="store", default="none", choices=EVIDENCE_COMPRESS_FORMATS,
+                     help="none|jpeg|webp: adjunta miniaturas comprimidas en lugar del PNG completo (requiere Pillow)")
+    parser.addoption("--evidence-max-width", action="store", type=int, default=960,
+                     help="ancho máximo en px de las miniaturas de evidencia")
+    parser.addoption("--postman-collection", action="store",
+                     default=os.path.join(ROOT_DIR, "api_test", "GESTION_CONTRATOS.postman_collection.json"),
+                     help="colección de Postman que ejecuta tests/api (sin Newman)")
+    parser.addoption("--postman-env", action="store",
+                     default=os.path.join(ROOT_DIR, "api_test", "QA_GESTION_CONTRATOS.postman_environment.json"),
+                     help="environment de Postman (base_url, credenciales por rol)")
+    parser.addoption("--postman-workers", action="store", type=int, default=4,
+                     help="carpetas de la colección que se ejecutan en paralelo")
+    parser.addoption("--run-api", action="store_true", default=False,
+                     help="incluye tests/api (marker api): ejecuta la colección de Postman contra el API real, "
+                          "con altas y bajas")
+    parser.addoption("--mock-backend", action="store_true", default=False,
+                     help="levanta el backend simulado en memoria y apunta a él las pruebas de API")
+    parser.addoption("--mock-latency-ms", action="store", type=float, default=0,
+                     help="latencia inyectada por el backend simulado en cada request")
+    parser.addoption("--lpt", action="store_true", default=False,
+                     help="con -n: reparte los módulos por duración histórica (el más largo primero)")
+    parser.addoption("--lpt-allure", action="store", default=os.path.join(ROOT_DIR, "allure-results"),
+                     help="allure-results para estimar los tests que aún no tienen duración registrada")
+    parser.addini("lpt_chains", type="linelist", default=[],
+                  help="módulos encadenados que --lpt ejecuta juntos y en orden (uno por línea, patrones glob)")
+    parser.addoption("--profile-webdriver", action="store", nargs="?", default=None,
+                     const=os.path.join("artifacts", "webdriver_profile.folded"),
+                     help="mide cada comando WebDriver por page object y escribe un perfil folded (flamegraph)")
+    parser.addoption("--profile-webdriver-top", action="store", type=int, default=15,
+                     help="filas de los rankings de --profile-webdriver en el resumen")
+    parser.addoption("--page-timing", action="store", default="off", choices=PAGE_TIMING_MODES,
+                     help="off|metrics|steps: mide cada método público de pages/ (steps: además como step de Allure)")
+    parser.addoption("--page-timing-out", action="store", default=os.path.join("artifacts", "page_timing.json"),
+                     help="resumen p50/p95 por método de --page-timing (.json o .csv)")
+    parser.addoption("--frontend-metrics", action="store", default="on", choices=("on", "off"),
+                     help="lee Navigation/Paint Timing y long tasks del navegador en cada navegación de los page objects")
+    parser.addoption("--frontend-metrics-out", action="store",
+                     default=os.path.join("artifacts", "frontend_metrics.json"),
+                     help="muestras de --frontend-metrics de la corrida (.json o .csv)")
+    parser.addoption("--perf-budgets", action="store", default=os.path.join(ROOT_DIR, "performance_budgets.yaml"),
+                     help="presupuestos por ruta que aplica el marker perf_budget")
+    parser.addoption("--perf-budget-mode", action="store", default=None, choices=PERF_BUDGET_MODES + ("off",),
+                     help="pisa el mode del YAML/marker: fail|xfail|warn, u off para no controlar presupuestos")
 
 # ========================
 # Fixtures base
@@ -96,12 +188,69 @@ def admin_creds():
     }
 
 
-@pytest.fixture(scope="function")
-def driver(request):
-    browser  = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless") == "true"
-    keep_open = os.getenv("KEEP_BROWSER_OPEN", "0") == "1"
+ROLE_ENV = {
+    "director": ("DIRECTOR_EMAIL", "DIRECTOR_PASSWORD"),
+    "rrhh": ("RRHH_EMAIL", "RRHH_PASSWORD"),
+    "asistente": ("ASISTENTE_EMAIL", "ASISTENTE_PASSWORD"),
+}
+
+
+@pytest.fixture(scope="session")
+def role_creds(qa_creds, candidate_creds):
+    """
+    Credenciales por rol para `logged_in_as` y el cliente de API.
+    Director, RRHH y asistente salen del .env (ROLE_ENV); si faltan, el rol
+    no se registra y el test que lo pida falla indicando la variable, igual
+    que `rrhh_creds` (no se intenta un login con una contraseña supuesta).
+    """
+    creds = {"admin": qa_creds, "candidato": candidate_creds}
+    for role, (email_var, pass_var) in ROLE_ENV.items():
+        if os.getenv(email_var) and os.getenv(pass_var):
+            creds[role] = {"email": os.getenv(email_var), "password": os.getenv(pass_var)}
+    return creds
+
+
+def require_creds(role_creds: dict, role: str) -> dict:
+    if role not in role_creds:
+        email_var, pass_var = ROLE_ENV.get(role, ("?", "?"))
+        raise AssertionError(f"Faltan las variables de entorno {email_var}/{pass_var} en el .env (rol {role})")
+    return role_creds[role]
+
+
+@pytest.fixture(scope="session")
+def session_cache(request, base_url):
+    """Una caché por worker de xdist (los fixtures de sesión viven por proceso)."""
+    cache = SessionCache(
+        base_url,
+        api_url=settings.API_URL or base_url.rstrip("/") + "/api",
+        mode=request.config.getoption("--login-mode"),
+        token_key=settings.SESSION_TOKEN_KEY,
+        ttl_sec=settings.SESSION_CACHE_TTL,
+    )
+    yield cache
+    if cache.stats:
+        request.config.stash[SESSION_CACHE_STATS] = cache.stats
+
 
+@pytest.fixture
+def logged_in_as(driver, session_cache, role_creds):
+    """
+    Helper:
+        logged_in_as("rrhh")                      # queda en "/"
+        logged_in_as("director", "/contratos")    # entra directo a la ruta
+        logged_in_as("candidato", creds={...})    # otro usuario del mismo rol
+
+    Reutiliza la sesión cacheada del rol; solo hace login la primera vez
+    (o cuando la sesión cacheada ya no es válida).
+    """
+    def _login(role: str, path: str = "/", creds: dict = None):
+        creds = creds or require_creds(role_creds, role)
+        return session_cache.open_as(driver, role, creds, path)
+
+    return _login
+
+
+def _build_driver(browser: str, headless: bool):
     if browser == "chrome":
         options = ChromeOptions()
         if headless:
@@ -131,7 +280,76 @@ def driver(request):
 
     drv.implicitly_wait(settings.IMPLICIT_WAIT)
     drv.set_page_load_timeout(settings.PAGELOAD_TIMEOUT)
+    return drv
+
+
+DRIVER_POOL_STATS = pytest.StashKey[dict]()
+SESSION_CACHE_STATS = pytest.StashKey[dict]()
+COMMAND_PROFILER = pytest.StashKey[CommandProfiler]()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Pool de navegadores por worker (solo con --driver-pool).
+    Con KEEP_BROWSER_OPEN=1 no se usa pool, para poder inspeccionar cada navegador.
+    """
+    config = request.config
+    if not config.getoption("--driver-pool") or os.getenv("KEEP_BROWSER_OPEN", "0") == "1":
+        yield None
+        return
+
+    browser  = config.getoption("--browser")
+    headless = config.getoption("--headless") == "true"
+    pool = DriverPool(
+        factory=lambda: _build_driver(browser, headless),
+        size=config.getoption("--driver-pool-size"),
+        max_uses=config.getoption("--driver-pool-max-uses"),
+    )
+    yield pool
+
+    pool.close_all()
+    config.stash[DRIVER_POOL_STATS] = dict(pool.stats)
+
+
+METRICS_FROM = pytest.StashKey[int]()
+
+
+def _attach_frontend_metrics(node, start: int):
+    # muestras de este test: se etiquetan con el nodeid y se adjuntan a Allure
+    samples = FRONTEND_METRICS[start:]
+    if not samples:
+        return
+    for sample in samples:
+        sample["test"] = node.nodeid
+    allure.attach(json.dumps(samples, ensure_ascii=False, indent=2), name="frontend_metrics",
+                  attachment_type=allure.attachment_type.JSON)
+
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool):
+    browser  = request.config.getoption("--browser")
+    headless = request.config.getoption("--headless") == "true"
+    keep_open = os.getenv("KEEP_BROWSER_OPEN", "0") == "1"
+    profiler = request.config.stash.get(COMMAND_PROFILER, None)
+
+    metrics_from = request.node.stash[METRICS_FROM] = len(FRONTEND_METRICS)
+
+    if driver_pool is not None:
+        drv = driver_pool.acquire()
+        drv._gc_role = None  # el navegador del pool puede venir de otro rol
+        if profiler is not None:
+            profiler.install(drv)
+        yield drv
+        _attach_frontend_metrics(request.node, metrics_from)
+        driver_pool.release(drv)
+        return
+
+    drv = _build_driver(browser, headless)
+    if profiler is not None:
+        profiler.install(drv)
     yield drv
+    _attach_frontend_metrics(request.node, metrics_from)
 
     if not keep_open:
         drv.quit()
@@ -150,6 +368,77 @@ def cod_cache(request):
 
     return {"set": set_code, "get": get_code}
 
+@pytest.fixture(scope="session")
+def mock_backend(request, role_creds):
+    """
+    Backend simulado (un servidor por worker) si se pasa --mock-backend; si no, None.
+    Los usuarios por rol se siembran con las credenciales de `role_creds` y
+    con las del environment de Postman (user_<rol>/pass_<rol>), así los tokens
+    de la colección tienen el rol que esperan sus requests.
+    """
+    if not request.config.getoption("--mock-backend"):
+        yield None
+        return
+    from performance_test.mock_backend import MockBackend, MockStore
+
+    role_users = {}
+    for role, creds in role_creds.items():
+        role_users.setdefault("secretaria" if role == "asistente" else role, []).append(creds)
+    env = load_environment(request.config.getoption("--postman-env"))
+    for role, creds in environment_users(env).items():
+        role_users.setdefault(role, []).extend(creds)
+    server = MockBackend(
+        store=MockStore(role_users=role_users),
+        latency_ms=request.config.getoption("--mock-latency-ms"),
+        strict_login=True,
+    ).start()
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session")
+def api_client(base_url, role_creds, mock_backend):
+    """Cliente HTTP con sesión keep-alive para preparar datos por API (uno por worker)."""
+    api_url = mock_backend.api_url if mock_backend else settings.API_URL or base_url.rstrip("/") + "/api"
+    client = ApiClient(api_url, role_creds)
+    yield client
+    client.close()
+
+@pytest.fixture(scope="session")
+def solicitudes(request, api_client):
+    """
+    Solicitudes de contratación para la cadena de test_15.
+    Cada etapa pide la solicitud en el estado que necesita: la toma de la
+    etapa anterior (mismo worker) o la crea por API si no hay.
+    """
+    return SolicitudProvisioner(api_client, cache=request.config.cache)
+
+@pytest.fixture(scope="session")
+def postman_runner(request, mock_backend):
+    """
+    Ejecutor de la colección de Postman (un Session keep-alive por worker).
+    Las carpetas se ejecutan en paralelo; cada test lee el resultado de su request.
+    """
+    config = request.config
+    runner = PostmanRunner(
+        config.getoption("--postman-collection"),
+        config.getoption("--postman-env"),
+        workers=config.getoption("--postman-workers"),
+        overrides={"base_url": mock_backend.api_url} if mock_backend else None,
+    )
+    yield runner
+    runner.close()
+
+@pytest.fixture
+def data_factory(api_client, solicitudes):
+    """
+    Crea precondiciones por API (usuarios, personas, ciclos, bancos,
+    solicitudes). Al terminar borra lo que el API permite borrar y avisa
+    (DataFactoryWarning) lo que quedó en el ambiente o no se pudo borrar.
+    """
+    factory = DataFactory(api_client, provisioner=solicitudes)
+    yield factory
+    factory.cleanup()
+
 @pytest.fixture
 def candidate_name_cache(request):
     """
@@ -186,44 +475,94 @@ def materia_grupo_label():
 
 # screenshot automático en fallas
 
+# un solo hilo por proceso escribe todas las evidencias a disco
+EVIDENCE_WRITER = EvidenceWriter()
+
 def _ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
-def save_screenshot_file(driver, name: str) -> str:
+def save_screenshot_file(driver, name: str, png_bytes: bytes = None) -> str:
     """
     Guarda un PNG en disco (para conservar archivo físico).
-    Retorna la ruta.
+    Si ya se tienen los bytes del screenshot se reutilizan; la escritura
+    se hace en segundo plano. Retorna la ruta.
     """
-    _ensure_dir("reports/screenshots")
+    if png_bytes is None:
+        png_bytes = driver.get_screenshot_as_png()
     ts = time.strftime("%Y%m%d_%H%M%S")
-    path = f"reports/screenshots/{ts}_{name}.png"
-    driver.save_screenshot(path)
-    return path
+    return EVIDENCE_WRITER.write(f"reports/screenshots/{ts}_{name}.png", png_bytes)
+
+def _attach_png_html(pytest_html, node, png_bytes: bytes, name: str):
+    extra = getattr(node, "extra", [])
+    extra.append(pytest_html.extras.png(png_bytes, name))
+    node.extra = extra
+
+def _attach_png_allure(png_bytes: bytes, name: str):
+    try:
+        allure.attach(
+            png_bytes,
+            name=name,
+            attachment_type=allure.attachment_type.PNG,
+        )
+    except Exception:
+        # Por si se ejecuta sin allure-pytest, que no truene
+        pass
 
-def snap_and_attach(request, driver, name: str) -> str:
+def _publish_evidence(config, node, name: str, png_bytes: bytes) -> str:
     """
-    Guarda el archivo y también lo adjunta embebido al HTML.
-    Devuelve la ruta del archivo guardado.
+    Guarda y adjunta un punto de evidencia (disco + Allure + HTML),
+    comprimido como miniatura si se pidió con --evidence-compress.
     """
-    path = save_screenshot_file(driver, name)
-    attach_png_to_report(request, driver, name)
+    img = compress_png(
+        png_bytes,
+        config.getoption("--evidence-compress"),
+        config.getoption("--evidence-max-width"),
+    )
+    ts = time.strftime("%Y%m%d_%H%M%S")
+    path = EVIDENCE_WRITER.write(f"reports/screenshots/{ts}_{name}.{img.extension}", img.data)
+
+    try:
+        allure.attach(img.data, name=name, attachment_type=img.mime_type, extension=img.extension)
+    except Exception:
+        pass
+
+    pytest_html = config.pluginmanager.getplugin("html")
+    if pytest_html is not None:
+        extra = getattr(node, "extra", [])
+        extra.append(pytest_html.extras.image(img.data, name, mime_type=img.mime_type, extension=img.extension))
+        node.extra = extra
+
     print(f"[EVIDENCIA] {name} -> {path}")
     return path
 
-def attach_png_to_report(request, driver, name: str):
+EVIDENCE_BUFFER = pytest.StashKey[EvidenceBuffer]()
+
+
+@pytest.fixture
+def network_capture(driver):
     """
-    Adjunta PNG embebido al reporte HTML (pytest-html).
-    Requiere ejecutar con:
-      --html=reports/report.html --self-contained-html
+    Requests XHR/fetch del navegador durante el test (Chrome/Edge, vía CDP):
+
+        resp = network_capture.wait_for("/users", method="POST")
+        if resp is not None:
+            assert resp["status"] in (200, 201)
+
+    Al final adjunta todo como network.har a Allure y acumula tiempos por
+    endpoint para el resumen de la sesión. En Firefox no captura nada
+    (`available` queda en False y `wait_for` devuelve None).
     """
-    png_bytes = driver.get_screenshot_as_png()
-    pytest_html = request.config.pluginmanager.getplugin("html")
-    if pytest_html is None:
-        # pytest-html no está activo; evitar crash
-        return
-    extra = getattr(request.node, "extra", [])
-    extra.append(pytest_html.extras.png(png_bytes, name))
-    request.node.extra = extra
+    capture = NetworkCapture(driver).start()
+    if not capture.available:
+        print(f"[NETWORK] {capture.error}")
+    yield capture
+
+    capture.stop()
+    har = capture.har()
+    if har["log"]["entries"]:
+        allure.attach(json.dumps(har, ensure_ascii=False, indent=2), name="network.har",
+                      attachment_type=allure.attachment_type.JSON)
+        capture.record_stats()
+
 
 @pytest.fixture
 def evidencia(request, driver):
@@ -231,31 +570,79 @@ def evidencia(request, driver):
     Helper:
         evidencia("antes_de_submit")
 
-    Hace 3 cosas:
+    Con --evidence-policy=always (default) hace 3 cosas:
     - Guarda PNG en reports/screenshots
     - Lo adjunta al reporte HTML (pytest-html)
     - Lo adjunta al reporte de Allure
+
+    Con on-failure no captura nada (queda el screenshot automático de la falla)
+    y con ring-buffer guarda los últimos N en memoria y solo los vuelca si el
+    test falla (ver pytest_runtest_makereport).
     """
+    policy = request.config.getoption("--evidence-policy")
+
+    if policy == "ring-buffer":
+        buffer = EvidenceBuffer(request.config.getoption("--evidence-buffer-size"))
+        request.node.stash[EVIDENCE_BUFFER] = buffer
+
     def _take(name: str):
-        # 1) Screenshot como bytes (para Allure)
+        if policy == "on-failure":
+            return None
+
+        # Un solo screenshot por punto de evidencia
         png_bytes = driver.get_screenshot_as_png()
 
-        # 2) Adjuntar a Allure
-        try:
-            allure.attach(
-                png_bytes,
-                name=name,
-                attachment_type=allure.attachment_type.PNG,
-            )
-        except Exception:
-            # Por si se ejecuta sin allure-pytest, que no truene
-            pass
+        if policy == "ring-buffer":
+            buffer.add(name, png_bytes)
+            return None
 
-        # 3) Mantener tu flujo actual (disco + pytest-html)
-        return snap_and_attach(request, driver, name)
+        return _publish_evidence(request.config, request.node, name, png_bytes)
 
     return _take
 
+# ========================
+# Presupuestos de rendimiento (marker perf_budget)
+# ========================
+
+PERF_BUDGETS = pytest.StashKey[Budgets]()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    Con @pytest.mark.perf_budget(*rutas, mode=None): si el test pasó, compara
+    sus muestras de --frontend-metrics con performance_budgets.yaml y, si
+    algo se pasa, lo hace fallar, lo deja como xfail o solo lo reporta.
+    """
+    outcome = yield
+    marker = item.get_closest_marker("perf_budget")
+    start = item.stash.get(METRICS_FROM, None)
+    mode = item.config.getoption("--perf-budget-mode")
+    if marker is None or start is None or mode == "off" or outcome.excinfo is not None:
+        return
+
+    budgets = item.config.stash.get(PERF_BUDGETS, None)
+    if budgets is None:
+        budgets = item.config.stash[PERF_BUDGETS] = Budgets.load(item.config.getoption("--perf-budgets"))
+    violations = budgets.check(FRONTEND_METRICS[start:], routes=marker.args,
+                               mode=mode or marker.kwargs.get("mode"))
+    if not violations:
+        return
+    for v in violations:
+        v["test"] = item.nodeid
+    BUDGET_VIOLATIONS.extend(violations)
+
+    msg = "presupuesto de rendimiento excedido:\n  " + "\n  ".join(describe_violation(v) for v in violations)
+    allure.attach(msg, name="perf_budget", attachment_type=allure.attachment_type.TEXT)
+    worst = effective_mode(violations)
+    if worst == "fail":
+        outcome.force_exception(pytest.fail.Exception(msg, pytrace=False))
+    elif worst == "xfail":
+        outcome.force_exception(pytest.xfail.Exception(msg))
+    else:
+        print(f"[PRESUPUESTO] {msg}")
+
+
 # ========================
 # Screenshot automático en fallas
 # (adjunta al HTML y guarda archivo)
@@ -266,38 +653,247 @@ def pytest_runtest_makereport(item, call):
     """
     - Mantiene tu screenshot en fallas.
     - Además, si pytest-html está activo, adjunta la imagen al reporte.
+
+    El screenshot se toma una sola vez y los mismos bytes van a las
+    carpetas screenshots/ y reports/screenshots/, a Allure y al HTML.
     """
     outcome = yield
     rep = outcome.get_result()
 
+    # ring-buffer: volcar las evidencias retenidas solo si el test falló
+    buffer = item.stash.get(EVIDENCE_BUFFER, None)
+    if buffer is not None and rep.failed and len(buffer):
+        if buffer.dropped:
+            print(f"[EVIDENCIA] {buffer.dropped} evidencias anteriores descartadas (ring-buffer lleno)")
+        for name, png_bytes in buffer.drain():
+            _publish_evidence(item.config, item, name, png_bytes)
+
     if rep.when == "call":
         d = item.funcargs.get("driver")
         if d and rep.failed:
-            # Guardar en carpeta simple (legacy)
-            os.makedirs("screenshots", exist_ok=True)
+            name = f"FAIL_{item.name}"
+            try:
+                png_bytes = d.get_screenshot_as_png()
+            except Exception as e:
+                # navegador caído: no hay nada que capturar
+                print(f"[EVIDENCIA] no se pudo capturar {name}: {e}")
+                return
+
+            # 1) Guardar en carpeta simple (legacy) y en reports/ (en segundo plano)
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            legacy_path = f"screenshots/{item.name}_{ts}.png"
-            d.save_screenshot(legacy_path)
+            EVIDENCE_WRITER.write(f"screenshots/{item.name}_{ts}.png", png_bytes)
+            save_screenshot_file(d, name, png_bytes)
 
             # 2) Adjuntar a Allure
-            try:
-                png_bytes = d.get_screenshot_as_png()
-                allure.attach(
-                    png_bytes,
-                    name=f"FAIL_{item.name}",
-                    attachment_type=allure.attachment_type.PNG,
-                )
-            except Exception:
-                pass
-
-            # 3) Adjuntar al HTML y guardar en reports/
-            try:
-                pytest_html = item.config.pluginmanager.getplugin("html")
-                if pytest_html:
-                    png_bytes = d.get_screenshot_as_png()
-                    extra = getattr(item, "extra", [])
-                    extra.append(pytest_html.extras.png(png_bytes, f"FAIL_{item.name}"))
-                    item.extra = extra
-                    save_screenshot_file(d, f"FAIL_{item.name}")
-            except Exception:
-                pass
\ No newline at end of file
+            _attach_png_allure(png_bytes, name)
+
+            # 3) Adjuntar al HTML
+            pytest_html = item.config.pluginmanager.getplugin("html")
+            if pytest_html:
+                _attach_png_html(pytest_html, item, png_bytes, name)
+
+# ========================
+# Resúmenes de fin de sesión (pool de navegadores, esperas SPA)
+# ========================
+
+WAIT_IDLE_STATS = pytest.StashKey[dict]()
+LPT_SCHEDULER = pytest.StashKey[LptScheduling]()
+ROW_LOOKUP_TOTALS = pytest.StashKey[dict]()
+FIRST_OF_TOTALS = pytest.StashKey[dict]()
+COMMAND_TOTALS = pytest.StashKey[dict]()
+PAGE_TIMING_TOTALS = pytest.StashKey[dict]()
+NETWORK_TOTALS = pytest.StashKey[dict]()
+FRONTEND_METRICS_TOTALS = pytest.StashKey[list]()
+BUDGET_VIOLATION_TOTALS = pytest.StashKey[list]()
+
+
+# Duraciones por test del proceso principal (recibe los reportes de todos los workers)
+DURATIONS = None
+
+
+def pytest_configure(config):
+    global DURATIONS
+    if not hasattr(config, "workerinput") and getattr(config, "cache", None) is not None:
+        DURATIONS = DurationStore(config.cache)
+    if config.getoption("--profile-webdriver"):
+        config.stash[COMMAND_PROFILER] = CommandProfiler()
+    page_timing = config.getoption("--page-timing")
+    if page_timing != "off":
+        instrument_pages(steps=page_timing == "steps")
+    frontend_metrics.ENABLED = config.getoption("--frontend-metrics") == "on"
+
+
+def pytest_collection_modifyitems(config, items):
+    # tests/api crea y borra datos en el API real: solo con --run-api
+    # (o contra el backend simulado con --mock-backend)
+    if config.getoption("--run-api") or config.getoption("--mock-backend"):
+        return
+    api = [item for item in items if item.get_closest_marker("api")]
+    if api:
+        config.hook.pytest_deselected(items=api)
+        items[:] = [item for item in items if not item.get_closest_marker("api")]
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("--lpt") or DURATIONS is None:
+        return None
+    sched = LptScheduling(
+        config, log,
+        store=DURATIONS,
+        chains=parse_chains(config.getini("lpt_chains")),
+        allure_dir=config.getoption("--lpt-allure"),
+    )
+    config.stash[LPT_SCHEDULER] = sched
+    return sched
+
+
+def pytest_runtest_logreport(report):
+    if DURATIONS is not None:
+        DURATIONS.add_report(report)
+
+
+def pytest_sessionfinish(session):
+    # Esperar a que terminen de escribirse los screenshots pendientes
+    EVIDENCE_WRITER.close()
+
+    # En workers de xdist, enviar las estadísticas al proceso principal
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is None:
+        if DURATIONS is not None:
+            DURATIONS.save()
+        return
+    stats = session.config.stash.get(DRIVER_POOL_STATS, None)
+    if stats:
+        workeroutput["driver_pool_stats"] = stats
+    session_stats = session.config.stash.get(SESSION_CACHE_STATS, None)
+    if session_stats:
+        workeroutput["session_cache_stats"] = session_stats
+    if WAIT_STATS:
+        workeroutput["wait_idle_stats"] = WAIT_STATS
+    if ROW_LOOKUP_STATS:
+        workeroutput["row_lookup_stats"] = ROW_LOOKUP_STATS
+    if FIRST_OF_STATS:
+        workeroutput["first_of_stats"] = FIRST_OF_STATS
+    if COMMAND_STATS:
+        workeroutput["command_stats"] = COMMAND_STATS
+    if PAGE_TIMINGS:
+        workeroutput["page_timings"] = PAGE_TIMINGS
+    if NETWORK_STATS:
+        workeroutput["network_stats"] = NETWORK_STATS
+    if FRONTEND_METRICS:
+        workeroutput["frontend_metrics"] = FRONTEND_METRICS
+    if BUDGET_VIOLATIONS:
+        workeroutput["budget_violations"] = BUDGET_VIOLATIONS
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    # Solo existe con pytest-xdist: acumula lo reportado por cada worker
+    workeroutput = getattr(node, "workeroutput", {})
+    stats = workeroutput.get("driver_pool_stats")
+    if stats:
+        total = node.config.stash.get(DRIVER_POOL_STATS, {})
+        node.config.stash[DRIVER_POOL_STATS] = DriverPool.merge_stats(total, stats)
+    for role, st in (workeroutput.get("session_cache_stats") or {}).items():
+        total = node.config.stash.setdefault(SESSION_CACHE_STATS, {})
+        DriverPool.merge_stats(total.setdefault(role, {}), st)
+    for owner, st in (workeroutput.get("wait_idle_stats") or {}).items():
+        total = node.config.stash.setdefault(WAIT_IDLE_STATS, {})
+        DriverPool.merge_stats(total.setdefault(owner, {}), st)
+    for owner, st in (workeroutput.get("row_lookup_stats") or {}).items():
+        total = node.config.stash.setdefault(ROW_LOOKUP_TOTALS, {})
+        DriverPool.merge_stats(total.setdefault(owner, {}), st)
+    for group, st in (workeroutput.get("first_of_stats") or {}).items():
+        total = node.config.stash.setdefault(FIRST_OF_TOTALS, {})
+        DriverPool.merge_stats(total.setdefault(group, {}), st)
+    for stack, st in (workeroutput.get("command_stats") or {}).items():
+        total = node.config.stash.setdefault(COMMAND_TOTALS, {})
+        DriverPool.merge_stats(total.setdefault(stack, {}), st)
+    if workeroutput.get("page_timings"):
+        merge_timings(node.config.stash.setdefault(PAGE_TIMING_TOTALS, {}), workeroutput["page_timings"])
+    for endpoint, st in (workeroutput.get("network_stats") or {}).items():
+        total = node.config.stash.setdefault(NETWORK_TOTALS, {})
+        DriverPool.merge_stats(total.setdefault(endpoint, {}), st)
+    if workeroutput.get("frontend_metrics"):
+        node.config.stash.setdefault(FRONTEND_METRICS_TOTALS, []).extend(workeroutput["frontend_metrics"])
+    if workeroutput.get("budget_violations"):
+        node.config.stash.setdefault(BUDGET_VIOLATION_TOTALS, []).extend(workeroutput["budget_violations"])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = config.stash.get(DRIVER_POOL_STATS, None)
+    if stats:
+        terminalreporter.section("driver pool")
+        for line in DriverPool.summary_lines(stats):
+            terminalreporter.write_line(line)
+
+    session_stats = config.stash.get(SESSION_CACHE_STATS, None)
+    if session_stats:
+        terminalreporter.section("caché de sesiones por rol (logged_in_as)")
+        for line in session_cache_lines(session_stats):
+            terminalreporter.write_line(line)
+
+    wait_stats = config.stash.get(WAIT_IDLE_STATS, None) or WAIT_STATS
+    if wait_stats:
+        terminalreporter.section("esperas SPA idle (por page object)")
+        for line in wait_stats_lines(wait_stats):
+            terminalreporter.write_line(line)
+
+    lookup_stats = config.stash.get(ROW_LOOKUP_TOTALS, None) or ROW_LOOKUP_STATS
+    if lookup_stats:
+        terminalreporter.section("búsqueda de filas en tablas paginadas (por page object)")
+        for line in row_lookup_lines(lookup_stats):
+            terminalreporter.write_line(line)
+
+    first_of_stats = config.stash.get(FIRST_OF_TOTALS, None) or FIRST_OF_STATS
+    if first_of_stats:
+        terminalreporter.section("locators alternativos: cuál gana (first_of)")
+        for line in first_of_lines(first_of_stats):
+            terminalreporter.write_line(line)
+
+    command_stats = config.stash.get(COMMAND_TOTALS, None) or COMMAND_STATS
+    if command_stats:
+        path = config.getoption("--profile-webdriver")
+        terminalreporter.section("perfil de comandos WebDriver")
+        for line in profile_lines(command_stats, top=config.getoption("--profile-webdriver-top")):
+            terminalreporter.write_line(line)
+        if path:
+            n = write_folded(path, command_stats)
+            terminalreporter.write_line(f"perfil folded ({n} pilas, µs) en {path}: flamegraph.pl / speedscope")
+
+    page_timings = config.stash.get(PAGE_TIMING_TOTALS, None) or PAGE_TIMINGS
+    if page_timings:
+        path = config.getoption("--page-timing-out")
+        terminalreporter.section("tiempos por método de page object (--page-timing)")
+        for line in page_timing_lines(page_timings):
+            terminalreporter.write_line(line)
+        n = write_page_timing(path, page_timings)
+        terminalreporter.write_line(f"resumen de {n} métodos en {path}")
+
+    network_stats = config.stash.get(NETWORK_TOTALS, None) or NETWORK_STATS
+    if network_stats:
+        terminalreporter.section("red del navegador por endpoint (network_capture)")
+        for line in network_lines(network_stats):
+            terminalreporter.write_line(line)
+
+    samples = config.stash.get(FRONTEND_METRICS_TOTALS, None) or FRONTEND_METRICS
+    if samples:
+        path = config.getoption("--frontend-metrics-out")
+        terminalreporter.section("carga de vistas en el navegador (--frontend-metrics)")
+        for line in frontend_metrics_lines(samples):
+            terminalreporter.write_line(line)
+        n = write_frontend_metrics(path, samples)
+        terminalreporter.write_line(f"{n} muestras por ruta y rol en {path}")
+
+    violations = config.stash.get(BUDGET_VIOLATION_TOTALS, None) or BUDGET_VIOLATIONS
+    if violations:
+        terminalreporter.section("presupuestos de rendimiento excedidos (perf_budget)")
+        for line in budget_lines(violations):
+            terminalreporter.write_line(line)
+
+    sched = config.stash.get(LPT_SCHEDULER, None)
+    if sched is not None and sched.predicted is not None:
+        terminalreporter.section("planificador LPT (xdist)")
+        for line in sched.summary_lines():
+            terminalreporter.write_line(line)
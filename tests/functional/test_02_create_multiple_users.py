@@ -9,6 +9,7 @@ from pages.login_page import LoginPage
 from pages.home_page import HomePage
 from pages.users_page import UsersPage
 from pages.create_user_page import CreateUserPage
+from pages.base_page import wait_spa_idle
 
 
 # (rol, needs_school, expected_ok)
@@ -51,34 +52,10 @@ ROLES = [
 @pytest.mark.case("USUARIOS_CREAR_POR_ROL_01")
 @pytest.mark.tester("Ronald")  
 @pytest.mark.parametrize("role,needs_school,expected_ok", ROLES)
-def test_cp03_crear_usuario_por_rol_con_resultado(driver, base_url, qa_creds, role, needs_school, expected_ok, evidencia):
+def test_cp03_crear_usuario_por_rol_con_resultado(driver, base_url, qa_creds, role, needs_school, expected_ok, evidencia,
+                                              network_capture):
     fake = Faker()
 
-    # ===== (Opcional) Habilitar captura de red vía CDP para ver el status HTTP =====
-    # Esto no rompe si no está disponible; simplemente no valida status si falla la suscripción.
-    captured_status = {"code": None, "url": None}
-    try:
-        devtools = driver.devtools
-        devtools.create_session()
-        from selenium.webdriver.common.devtools.v129 import network as devtools_network
-        devtools.send(devtools_network.enable())
-
-        def _on_response(resp):
-            try:
-                # Filtra endpoints que contengan "users" y probablemente sea POST del create.
-                # Puedes ajustar el filtro si tu endpoint es, por ejemplo, "/api/users"
-                url = resp.response.url
-                if "user" in url.lower():
-                    captured_status["code"] = resp.response.status
-                    captured_status["url"] = url
-            except Exception:
-                pass
-
-        devtools.add_listener(devtools_network.ResponseReceived, _on_response)
-    except Exception:
-        # Si no se puede, seguimos con aserciones de UI.
-        pass
-
     # pequeño sufijo para diferenciar evidencias por rol en el reporte
     role_slug = role.lower().replace(" ", "_")
 
@@ -134,15 +111,16 @@ def test_cp03_crear_usuario_por_rol_con_resultado(driver, base_url, qa_creds, ro
             evidencia(f"crear_usuario__{role_slug}__ok_redirigido")
             assert "/usuarios" in new_path, f"Se esperaba redirección a /usuarios, quedó en {new_path}"
 
-            # Si capturamos HTTP status, esperamos 200/201
-            if captured_status["code"] is not None:
-                assert captured_status["code"] in (200, 201), f"Se esperaba 200/201, se obtuvo {captured_status}"
+            # Si hubo captura de red (Chrome/Edge), el POST de creación debe dar 200/201
+            resp = network_capture.wait_for("user", method="POST", timeout=5)
+            if resp is not None:
+                assert resp["status"] in (200, 201), f"Se esperaba 200/201, se obtuvo {resp['status']} en {resp['url']}"
         else:
             # FALLA ESPERADA: no debería salir del form
             #  - sigue en la misma página (o vuelve a /usuarios/crear)
             #  - debería aparecer algún mensaje/validación/alert de error
             # Intentamos una heurística de error de AntD: mensajes o no redirección
-            time.sleep(0.5)  # micro-pausing por animaciones
+            wait_spa_idle(driver)  # micro-pausing por animaciones
             new_path = urlparse(driver.current_url).path
             evidencia(f"crear_usuario__{role_slug}__fallo_esperado")
             assert new_path == current_path or "crear" in new_path.lower(), \
@@ -151,6 +129,8 @@ def test_cp03_crear_usuario_por_rol_con_resultado(driver, base_url, qa_creds, ro
             # Puedes agregar validación de toast si tu UI lo muestra:
             # users.assert_error_toast_visible()  # si implementas ese método
 
-            # Si capturamos HTTP status, esperamos 400/422
-            if captured_status["code"] is not None:
-                assert captured_status["code"] in (400, 422), f"Se esperaba 400/422, se obtuvo {captured_status}"
+            # Si el form llegó a enviar el POST, esperamos 400/422 (con validación
+            # del lado del cliente puede no haber request: no se espera de más)
+            resp = network_capture.wait_for("user", method="POST", timeout=0)
+            if resp is not None:
+                assert resp["status"] in (400, 422), f"Se esperaba 400/422, se obtuvo {resp['status']} en {resp['url']}"
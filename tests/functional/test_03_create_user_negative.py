@@ -13,6 +13,7 @@ from pages.login_page import LoginPage
 from pages.home_page import HomePage
 from pages.users_page import UsersPage
 from pages.create_user_page import CreateUserPage
+from pages.base_page import wait_spa_idle
 
 DUP_EMAIL = "rocio_lara@ues.edu.sv"
 
@@ -240,7 +241,7 @@ def test_cp03_crear_usuario_sin_rol(driver, base_url, qa_creds, evidencia):
 
     with allure.step("Login y apertura de formulario de creación de usuario"):
         create = _login_y_abrir_crear(driver, base_url, qa_creds, evidencia, prefix)
-        time.sleep(1.0)
+        wait_spa_idle(driver)
     
     with allure.step("Completar formulario sin seleccionar rol"):
         # Datos válidos en nombre y email
@@ -265,7 +266,7 @@ def test_cp03_crear_usuario_sin_rol(driver, base_url, qa_creds, evidencia):
         # Validar error visual en el campo Rol
         assert create.form_item_has_error("createUser_role"), "Se esperaba error visual en el campo Rol (rol no seleccionado)."
 
-        time.sleep(1.0)
+        wait_spa_idle(driver)
 
         evidencia(f"{prefix}__despues_de_submit")
 
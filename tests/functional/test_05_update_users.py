@@ -7,6 +7,7 @@ from pages.users_page import UsersPage
 from pages.users_edit_page import UserEditPage
 import time
 from selenium.webdriver.common.by import By
+from pages.base_page import wait_spa_idle
 
 @allure.epic("Gestión de Contratos")
 @allure.feature("Administración de Usuarios")
@@ -48,10 +49,9 @@ def test_cp04_buscar_usuario_por_nombre_y_abrir_edicion(driver, base_url, qa_cre
 
         users.reset_to_first_page()  # opcional
 
-    time.sleep(3)
     # 3) Buscar por nombre y hacer CLIC en el botón de búsqueda
     with allure.step(f"Buscar usuario por nombre: {nombre}"):
-        time.sleep(3)
+        wait_spa_idle(driver)
         users.search_by_name(nombre)  # este método ya escribe y hace click en el botón
 
         # 4) Tomar evidencia del resultado tal cual se ve en la tabla (filtrada o no)
@@ -65,7 +65,7 @@ def test_cp04_buscar_usuario_por_nombre_y_abrir_edicion(driver, base_url, qa_cre
         assert users.open_edit_by_name(nombre, exact=True), \
             f"No fue posible abrir 'Editar' para '{nombre}'."
 
-        time.sleep(3)
+        wait_spa_idle(driver)
         # 6) Evidencia de la pantalla de edición (opcional)
         evidencia("buscar_usuario__editar_abierto")
 
@@ -111,11 +111,10 @@ def test_cp04_buscar_usuario_editar_y_actualizar_email(driver, base_url, qa_cred
         users = UsersPage(driver, base_url)
         users.wait_loaded()
         users.reset_to_first_page()  # opcional
-        time.sleep(3)
     
     # 3) Buscar por nombre y hacer CLIC en el botón de búsqueda
     with allure.step(f"Buscar usuario por nombre: {nombre}"):
-        time.sleep(3)
+        wait_spa_idle(driver)
         users.search_by_name(nombre)  # este método ya escribe y hace click en el botón
 
         # 4) Tomar evidencia del resultado tal cual se ve en la tabla (filtrada o no)
@@ -128,7 +127,7 @@ def test_cp04_buscar_usuario_editar_y_actualizar_email(driver, base_url, qa_cred
         assert users.open_edit_by_name(nombre, exact=True), \
             f"No fue posible abrir 'Editar' para '{nombre}'."
 
-        time.sleep(3)
+        wait_spa_idle(driver)
         # 6) Evidencia de la pantalla de edición (opcional)
         evidencia("buscar_usuario__editar_abierto")
 
@@ -146,7 +145,7 @@ def test_cp04_buscar_usuario_editar_y_actualizar_email(driver, base_url, qa_cred
         edit.click_update_and_confirm()
         evidencia("usuario_editar_popconfirm_si")  # (hará la captura justo después del click)
 
-        time.sleep(2)
+        wait_spa_idle(driver)
         # 5) Verificar toast de éxito
         edit.wait_success()
         evidencia("usuario_actualizado_con_exito")
@@ -197,9 +196,8 @@ def test_cp04_nombre_vacio_no_permite_actualizar(driver, base_url, qa_creds, evi
         users.wait_loaded()
         users.reset_to_first_page()  # opcional
     with allure.step(f"Buscar usuario por nombre: {nombre}"):
-        time.sleep(3)
         # 3) Buscar por nombre y hacer CLIC en el botón de búsqueda
-        time.sleep(3)
+        wait_spa_idle(driver)
         users.search_by_name(nombre)  # este método ya escribe y hace click en el botón
 
         # 4) Tomar evidencia del resultado tal cual se ve en la tabla (filtrada o no)
@@ -213,7 +211,7 @@ def test_cp04_nombre_vacio_no_permite_actualizar(driver, base_url, qa_creds, evi
         assert users.open_edit_by_name(nombre, exact=True), \
             f"No fue posible abrir 'Editar' para '{nombre}'."
 
-        time.sleep(3)
+        wait_spa_idle(driver)
         # 6) Evidencia de la pantalla de edición (opcional)
         evidencia("buscar_usuario__editar_abierto")
 
@@ -266,9 +264,8 @@ def test_cp04_email_invalido_no_permite_actualizar(driver, base_url, qa_creds, e
         users.reset_to_first_page()  # opcional
 
     with allure.step(f"Buscar usuario por nombre: {nombre}"):
-        time.sleep(3)
         # 3) Buscar por nombre y hacer CLIC en el botón de búsqueda
-        time.sleep(3)
+        wait_spa_idle(driver)
         users.search_by_name(nombre)  # este método ya escribe y hace click en el botón
 
         # 4) Tomar evidencia del resultado tal cual se ve en la tabla (filtrada o no)
@@ -281,7 +278,7 @@ def test_cp04_email_invalido_no_permite_actualizar(driver, base_url, qa_creds, e
         assert users.open_edit_by_name(nombre, exact=True), \
             f"No fue posible abrir 'Editar' para '{nombre}'."
 
-        time.sleep(3)
+        wait_spa_idle(driver)
         # 6) Evidencia de la pantalla de edición (opcional)
         evidencia("buscar_usuario__editar_abierto")
 
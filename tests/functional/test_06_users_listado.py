@@ -1,11 +1,14 @@
 # tests/functional/test_users_listado.py
 import pytest
-import time
 import allure
 
 from pages.login_page import LoginPage
 from pages.home_page import HomePage
 from pages.users_page import UsersPage
+from pages.base_page import wait_spa_idle
+
+# presupuesto de carga del listado (performance_budgets.yaml)
+pytestmark = pytest.mark.perf_budget("/usuarios")
 
 
 @allure.epic("Gestión de Contratos")
@@ -91,7 +94,7 @@ def test_cp05_listado_paginacion_siguiente_y_anterior(driver, base_url, qa_creds
         home.go_to_users()
 
         users = UsersPage(driver, base_url)
-        time.sleep(4)
+        wait_spa_idle(driver)
         users.wait_loaded()
         users.reset_to_first_page()
         first_sample = users.first_names_sample(k=5)
@@ -148,7 +151,7 @@ def test_cp05_listado_ordenar_por_nombre(driver, base_url, qa_creds, evidencia):
         home.go_to_users()
 
         users = UsersPage(driver, base_url)
-        time.sleep(4)
+        wait_spa_idle(driver)
         users.wait_loaded()
         users.reset_to_first_page()
 
@@ -208,7 +211,7 @@ def test_cp05_listado_cambiar_tamano_pagina(driver, base_url, qa_creds, evidenci
         home.go_to_users()
 
         users = UsersPage(driver, base_url)
-        time.sleep(4)
+        wait_spa_idle(driver)
         users.wait_loaded()
         users.reset_to_first_page()
 
@@ -1,8 +1,8 @@
 import pytest
-import time
 import allure
 
 from pages.login_page import LoginPage
+from pages.base_page import wait_spa_idle
 from pages.rrhh_candidates_registered_page import RRHHCandidatesRegisteredPage
 from pages.rrhh_candidate_documents_page import (
     RRHHCandidateDocumentsPage,
@@ -73,7 +73,7 @@ def test_cp90_rrhh_busca_candidato_y_abre_control_datos(
         assert login_page.is_logged_in()
         evidencia("rrhh_control_datos__login_ok")
 
-        time.sleep(1)
+        wait_spa_idle(driver)
 
     # 3) Ir a Candidatos registrados
     with allure.step("Ir al listado de 'Candidatos registrados' desde el menú RRHH"):
@@ -82,7 +82,7 @@ def test_cp90_rrhh_busca_candidato_y_abre_control_datos(
         evidencia("rrhh_control_datos__lista_candidatos")
         assert page.is_on_page()
 
-        time.sleep(3)
+        wait_spa_idle(driver)
 
     # 4) Buscar candidato por nombre
     with allure.step(f"Buscar candidato por nombre: {candidate_name}"):
@@ -94,7 +94,7 @@ def test_cp90_rrhh_busca_candidato_y_abre_control_datos(
         page.open_control_datos_for_name(candidate_name)
         evidencia("rrhh_control_datos__detalle_candidato")
 
-        time.sleep(2)
+        wait_spa_idle(driver)
 
     # 6) Página de documentos
     with allure.step("Verificar la pantalla de documentos y el header con el nombre del candidato"):
@@ -4,7 +4,6 @@ import allure
 from faker import Faker
 from datetime import date
 from urllib.parse import urljoin
-import time
 from urllib.parse import unquote
 
 from selenium.webdriver.support.ui import WebDriverWait
@@ -14,6 +13,7 @@ from selenium.common.exceptions import TimeoutException
 from pages.login_page import LoginPage
 from pages.candidate_home_page import CandidateHomePage
 from pages.candidate_profile_page import CandidateProfilePage
+from pages.base_page import wait_spa_idle
 
 
 @allure.epic("Portal de Candidatos")
@@ -86,7 +86,7 @@ def test_cp13_candidato_ingresa_datos_personales(driver, base_url, candidate_cre
             f"('/información-personal/editar'), pero la URL actual es: {decoded_url}"
         )
 
-        time.sleep(2)  # pequeña espera para evitar issues de renderizado lento
+        wait_spa_idle(driver)  # pequeña espera para evitar issues de renderizado lento
 
     # 5) Actualizar Teléfono con un valor aleatorio válido
     with allure.step("Actualizar teléfono y guardar cambios"):
@@ -187,7 +187,7 @@ def test_cp13_candidato_no_actualiza_con_campos_obligatorios_vacios(
             f"Se esperaba estar en '/información-personal/editar', pero la URL actual es: {decoded_url}"
         )
 
-        time.sleep(2)  # pequeña espera por renderizado
+        wait_spa_idle(driver)  # pequeña espera por renderizado
 
     # 4) Dejar campos obligatorios vacíos
     with allure.step("Borrar campos obligatorios (teléfono y correo alterno)"):
@@ -1,9 +1,9 @@
 import pytest
-import time
 import allure
 
 from pages.login_page import LoginPage
 from pages.rrhh_candidates_registered_page import RRHHCandidatesRegisteredPage
+from pages.base_page import wait_spa_idle
 
 @allure.epic("Gestión de Contratos")
 @allure.feature("RRHH - Candidatos registrados")
@@ -59,7 +59,7 @@ def test_cp14_rrhh_ve_candidato_en_candidatos_registrados(
         rrhh_page.open_from_sidebar()
         evidencia("rrhh_candidatos__pagina_visible")
 
-        time.sleep(3)
+        wait_spa_idle(driver)
 
 
     # 3) Buscar por el nombre de candidato
@@ -1,6 +1,5 @@
 import pytest
 from urllib.parse import urljoin
-import time
 import allure
 
 
@@ -9,6 +8,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from pages.login_page import LoginPage
 from pages.director_carga_academica_page import DirectorCargaAcademicaPage
+from pages.base_page import wait_spa_idle
 
 @allure.epic("Gestión de Contratos")
 @allure.feature("Seguridad y RBAC en módulos académicos")
@@ -203,14 +203,14 @@ def test_cp66_director_no_puede_generar_carga_academica_duplicada(
         # Aquí creamos el Page Object
         carga_page = DirectorCargaAcademicaPage(driver)
         
-        time.sleep(2)
+        wait_spa_idle(driver)
 
         # (opcional) validar que estamos en la página
         carga_page = DirectorCargaAcademicaPage(driver)
 
         assert carga_page.is_on_page(), "No se cargó correctamente /carga-academica"
 
-        time.sleep(2)
+        wait_spa_idle(driver)
 
     with allure.step("Intentar generar una nueva carga académica"):
         carga_page.click_generar_nueva_carga()
@@ -1,10 +1,13 @@
 import pytest
 from urllib.parse import urlparse
-import time
 import allure
 
 from pages.login_page import LoginPage
 from pages.bitacora_page import BitacoraPage
+from pages.base_page import wait_spa_idle
+
+# presupuesto de carga de la bitácora (performance_budgets.yaml)
+pytestmark = pytest.mark.perf_budget("/bitacora")
 
 
 @allure.epic("Gestión de Contratos")
@@ -46,7 +49,7 @@ def test_cp19_bitacora_listado_muestra_registros(
         assert login_page.is_logged_in(), "El admin no quedó autenticado."
         evidencia("bitacora_listado__login_ok")
 
-        time.sleep(3)
+        wait_spa_idle(driver)
 
     # 2) Ir a bitácora
     with allure.step("Navegar a la pantalla de bitácora"):
@@ -119,7 +122,7 @@ def test_cp20_bitacora_filtrar_por_termino_existente(
         bitacora_page = BitacoraPage(driver)
         bitacora_page.open_direct(base_url)
         bitacora_page.wait_loaded()
-        time.sleep(3)
+        wait_spa_idle(driver)
         evidencia("bitacora_filtro_ok__vista_bitacora")
 
     # 3) Aplicar filtro (usuario existente)
@@ -127,7 +130,7 @@ def test_cp20_bitacora_filtrar_por_termino_existente(
         bitacora_page.search_by_text(SEARCH_TERM)
         evidencia("bitacora_filtro_ok__despues_filtrar")
 
-        time.sleep(2)
+        wait_spa_idle(driver)
 
     # 4) Validar que haya filas y que el texto esté en alguna
     with allure.step("Verificar que las filas filtradas contienen el término buscado"):
@@ -252,7 +255,7 @@ def test_cp21_bitacora_paginacion_siguiente_pagina_cambia_registros(
         bitacora_page.wait_loaded()
         evidencia("bitacora_paginacion__vista_bitacora")
 
-        time.sleep(3)
+        wait_spa_idle(driver)
 
     # 3) Verificar que exista más de una página
     with allure.step("Verificar que el componente de paginación tenga varias páginas"):
@@ -272,12 +275,12 @@ def test_cp21_bitacora_paginacion_siguiente_pagina_cambia_registros(
         bitacora_page.go_to_next_page()
         evidencia("bitacora_paginacion__pagina_siguiente")
 
-        time.sleep(2)
+        wait_spa_idle(driver)
 
         pagina_nueva = bitacora_page.get_active_page_number()
         filas_nuevas = bitacora_page.get_rows_text()
 
-        time.sleep(2)
+        wait_spa_idle(driver)
     
     # 5) Asserts
     with allure.step("Validar que la página activa y los registros cambian"):
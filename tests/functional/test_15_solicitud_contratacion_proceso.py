@@ -1,5 +1,4 @@
 # tests/functional/test_contratos_new_request.py
-import time
 import random
 import pytest
 import allure 
@@ -22,6 +21,12 @@ from pages.subir_acuerdo_page import SubirAcuerdoPage
 from pages.generar_contratos_page import GenerarContratosPage, GenerarContratosDetallePage
 from pages.contrato_candidato_page import ContratoCandidatoPage
 from pages.solicitudes_finalizadas_page import SolicitudesFinalizadasPage
+from pages.base_page import wait_spa_idle
+from utils.provisioning import PreconditionUnavailable
+
+# cada vista del flujo que tenga presupuesto en performance_budgets.yaml
+# (/contratos, detalle, validación RRHH, recepción, generar contratos)
+pytestmark = pytest.mark.perf_budget()
 
 
 def generar_codigo_jp():
@@ -35,6 +40,20 @@ def generar_codigo_jp():
     return f"JP-{parte1:03d}/{parte2:04d}"
 
 
+def _obtener_solicitud(solicitudes, estado: str):
+    """
+    Solicitud en `estado` para esta etapa: la que dejó la etapa anterior en
+    este worker o una nueva preparada por API. Solo se salta el test si el
+    API no está disponible; un error del API al prepararla hace fallar.
+    """
+    try:
+        sol = solicitudes.obtain(estado)
+    except PreconditionUnavailable as e:
+        pytest.skip(f"No hay solicitud en estado '{estado}' y no se pudo preparar por API: {e}")
+    print(f"[QA] Solicitud {sol.code} ({estado}) obtenida desde: {sol.source}")
+    return sol
+
+
 @allure.epic("Gestión de Contratos")
 @allure.feature("Módulo de Contratos")
 @allure.story("Director genera solicitud de contratación desde el wizard")
@@ -48,7 +67,7 @@ def generar_codigo_jp():
 @pytest.mark.e2e
 @pytest.mark.case("CONTRATO_CREAR_SOLICITUD_01")
 @pytest.mark.tester("Ronald")
-def test_cp30_crear_solicitud_contrato(driver, base_url, evidencia, cod_cache ):
+def test_cp30_crear_solicitud_contrato(driver, base_url, evidencia, cod_cache, solicitudes):
     """
     Escenario:
     1. Director inicia sesión.
@@ -84,7 +103,7 @@ def test_cp30_crear_solicitud_contrato(driver, base_url, evidencia, cod_cache ):
     with allure.step("Abrir wizard de 'Generar nueva solicitud de contrato'"):
         contratos.click_new_request()
         evidencia("contratos__click_generar_nueva")
-        time.sleep(1)
+        wait_spa_idle(driver)
 
     # Wizard
     with allure.step("Completar Step 1 del wizard: tipo y modalidad"):
@@ -144,7 +163,8 @@ def test_cp30_crear_solicitud_contrato(driver, base_url, evidencia, cod_cache ):
         assert nuevo_codigo, "No se pudo capturar el código creado."
         evidencia(f"codigo_guardado__{nuevo_codigo}")
 
-        # Guardarlo para el siguiente test
+        # Guardarlo para el siguiente test (por worker) y en el cache legacy
+        solicitudes.publish(nuevo_codigo, "creada")
         cod_cache["set"](nuevo_codigo)
 
 @allure.epic("Gestión de Contratos")
@@ -160,11 +180,12 @@ def test_cp30_crear_solicitud_contrato(driver, base_url, evidencia, cod_cache ):
 @pytest.mark.e2e
 @pytest.mark.case("CONTRATO_AGREGAR_CANDIDATO_01")
 @pytest.mark.tester("Ronald")
-def test_cp_31_agregar_candidato_a_solicitud_contrato(driver, base_url, evidencia, cod_cache, candidate_name_cache, materia_grupo_label):
+def test_cp_31_agregar_candidato_a_solicitud_contrato(driver, base_url, evidencia, solicitudes, materia_grupo_label):
     """
     Escenario:
-    1. Recuperar el código de solicitud creado previamente (cache).
-    2. Recuperar el nombre del candidato ya registrado y validado (cache).
+    1. Obtener la solicitud creada (etapa anterior o API).
+    2. Obtener por API el nombre del candidato (CONTRACT_PERSON_ID), sin
+       depender de que el flujo de test_07 haya corrido antes.
     3. Director inicia sesión.
     4. Busca la solicitud por código y abre el detalle.
     5. Agrega un candidato, su cargo, periodo, materia/grupo y compensación.
@@ -175,20 +196,17 @@ def test_cp_31_agregar_candidato_a_solicitud_contrato(driver, base_url, evidenci
         "Director - Agregar candidato, carga y compensación a una solicitud de contrato"
     )
     
-    # 1) Leemos el código almacenado por la prueba anterior
-    with allure.step("Recuperar código de solicitud desde cache"):
-        codigo = cod_cache["get"](None)
-        if not codigo:
-            pytest.skip("No hay código cacheado desde la prueba anterior (crear_solicitud).")
-
-    # 2) Recuperar el nombre del candidato desde cache
-    with allure.step("Recuperar nombre de candidato desde cache"):
-        nombre_cache = candidate_name_cache["get"](None) 
-        assert nombre_cache, (
-            "No hay nombre de candidato cacheado. "
-            "Asegúrate de que el flujo de candidato (datos personales / docs / validación RRHH) "
-            "se ejecutó antes y guardó el nombre."
-        )
+    # 1) Solicitud que dejó la prueba anterior (o nueva por API)
+    with allure.step("Obtener solicitud en estado 'creada' (etapa anterior o API)"):
+        sol = _obtener_solicitud(solicitudes, "creada")
+        codigo = sol.code
+
+    # 2) Candidato: el mismo que usa el aprovisionamiento por API
+    with allure.step("Obtener nombre del candidato por API"):
+        try:
+            nombre_candidato = solicitudes.candidate_name()
+        except PreconditionUnavailable as e:
+            pytest.skip(f"No se pudo obtener el candidato por API: {e}")
 
     # 3) Login (nueva sesión = nuevo login)
     with allure.step("Iniciar sesión como Director"):
@@ -208,7 +226,7 @@ def test_cp_31_agregar_candidato_a_solicitud_contrato(driver, base_url, evidenci
         contratos.wait_loaded()
         evidencia("contratos_listado_cargado")
 
-        time.sleep(2)  # breve espera por animaciones
+        wait_spa_idle(driver)  # breve espera por animaciones
         # 4) Buscar por el código cacheado y validar resultado
         contratos.search_code(codigo)
         evidencia(f"busqueda_codigo__{codigo}")
@@ -219,7 +237,7 @@ def test_cp_31_agregar_candidato_a_solicitud_contrato(driver, base_url, evidenci
     with allure.step("Abrir el detalle de la solicitud de contrato"):
         contratos.click_view_for_code(codigo)
         evidencia(f"click_ver__{codigo}")
-        time.sleep(2)  # breve espera por animaciones
+        wait_spa_idle(driver)  # breve espera por animaciones
 
         # 6) Asegurar navegación al detalle
         WebDriverWait(driver, 10).until(EC.url_contains("/contratos/solicitud/"))
@@ -246,14 +264,14 @@ def test_cp_31_agregar_candidato_a_solicitud_contrato(driver, base_url, evidenci
     # 7) Seleccionar candidato, cargo y funciones
     with allure.step("Seleccionar candidato, cargo y funciones para la solicitud"):
         detail.select_candidate_by_typing_and_pick(
-        nombre_cache.lower(),
-        exact=nombre_cache)
-        evidencia(f"candidato_{nombre_cache}_seleccionado")
+        nombre_candidato.lower(),
+        exact=nombre_candidato)
+        evidencia(f"candidato_{nombre_candidato}_seleccionado")
 
         detail.select_cargo("Profesor")
         evidencia("cargo_profesor_seleccionado")
 
-        time.sleep(3)  # breve espera por animaciones
+        wait_spa_idle(driver)  # breve espera por animaciones
 
         detail.select_all_functions()
         evidencia("funciones_todas_seleccionadas")
@@ -293,6 +311,8 @@ def test_cp_31_agregar_candidato_a_solicitud_contrato(driver, base_url, evidenci
         detail.wait_success_message()
         evidencia("toast_exito_visible")
 
+    solicitudes.publish(sol, "con_detalle")
+
 
 @allure.epic("Gestión de Contratos")
 @allure.feature("Módulo de Contratos")
@@ -307,10 +327,10 @@ def test_cp_31_agregar_candidato_a_solicitud_contrato(driver, base_url, evidenci
 @pytest.mark.e2e
 @pytest.mark.case("CONTRATO_ENVIAR_RRHH_01")
 @pytest.mark.tester("Ronald")
-def test_cp33_enviar_solicitud_a_rrhh(driver, base_url, evidencia, cod_cache):
+def test_cp33_enviar_solicitud_a_rrhh(driver, base_url, evidencia, solicitudes):
     """
     Escenario:
-    1. Recuperar código de solicitud en curso (cache).
+    1. Obtener la solicitud con candidato agregado (etapa anterior o API).
     2. Director inicia sesión.
     3. Busca la solicitud por código y entra al detalle.
     4. Envía la solicitud a RRHH.
@@ -321,11 +341,10 @@ def test_cp33_enviar_solicitud_a_rrhh(driver, base_url, evidencia, cod_cache):
 
     allure.dynamic.title("Director - Enviar solicitud de contrato a RRHH y validarla en bandeja RRHH")
 
-    # 1) Código cacheado
-    with allure.step("Recuperar código de solicitud desde cache"):
-        codigo = cod_cache["get"](None)
-        if not codigo:
-            pytest.skip("No hay código cacheado de solicitud previa.")
+    # 1) Solicitud de la etapa anterior
+    with allure.step("Obtener solicitud en estado 'con_detalle' (etapa anterior o API)"):
+        sol = _obtener_solicitud(solicitudes, "con_detalle")
+        codigo = sol.code
 
     # 2) Login Director
     with allure.step("Iniciar sesión como Director"):
@@ -345,7 +364,7 @@ def test_cp33_enviar_solicitud_a_rrhh(driver, base_url, evidencia, cod_cache):
         contratos.wait_loaded()
         evidencia("listado_contratos_visible")
 
-        time.sleep(1)  # microespera por animación de tabla/filtros
+        wait_spa_idle(driver)  # microespera por animación de tabla/filtros
         contratos.search_code(codigo)
         evidencia(f"buscar_codigo__{codigo}")
         contratos.ensure_code_visible(codigo)
@@ -369,7 +388,7 @@ def test_cp33_enviar_solicitud_a_rrhh(driver, base_url, evidencia, cod_cache):
         login.open_login()
         login.login_as("rrhh@ues.edu.sv", "Password.1")
 
-        time.sleep(2)  # espera breve por animaciones
+        wait_spa_idle(driver)  # espera breve por animaciones
 
         wait = WebDriverWait(driver, 15)
         wait.until(EC.visibility_of_element_located((
@@ -393,12 +412,14 @@ def test_cp33_enviar_solicitud_a_rrhh(driver, base_url, evidencia, cod_cache):
         except Exception:
             # Si tu vista no tiene header distintivo, al menos quedamos en /solicitudes
             evidencia("validacion_solicitudes_url_ok")
-        time.sleep(2)  # espera breve por animaciones
+        wait_spa_idle(driver)  # espera breve por animaciones
 
         val.click_ver_solicitud(codigo, evidencia)
-        time.sleep(2)  # espera breve por animaciones   
+        wait_spa_idle(driver)  # espera breve por animaciones   
         evidencia(f"rrhh_detalle_abierto__{codigo}")
 
+    solicitudes.publish(sol, "enviada_rrhh")
+
 @allure.epic("Gestión de Contratos")
 @allure.feature("Flujo de Solicitudes")
 @allure.story("RRHH valida solicitud sin observaciones")
@@ -412,10 +433,10 @@ def test_cp33_enviar_solicitud_a_rrhh(driver, base_url, evidencia, cod_cache):
 @pytest.mark.e2e
 @pytest.mark.case("RRHH_VALIDAR_SOLICITUD_01")
 @pytest.mark.tester("Ronald")
-def test_cp34_validar_solicitud_rrhh(driver, base_url, evidencia, cod_cache):
+def test_cp34_validar_solicitud_rrhh(driver, base_url, evidencia, solicitudes):
     """
     Escenario:
-    1. Recuperar el código de la solicitud desde cache.
+    1. Obtener la solicitud enviada a RRHH (etapa anterior o API).
     2. RRHH inicia sesión.
     3. Navega a 'Validación de solicitudes'.
     4. Abre el detalle de la solicitud por código.
@@ -426,10 +447,9 @@ def test_cp34_validar_solicitud_rrhh(driver, base_url, evidencia, cod_cache):
 
     allure.dynamic.title("RRHH - Validar solicitud de contrato sin observaciones")
 
-    with allure.step("Recuperar código de solicitud desde cache"):
-        codigo = cod_cache["get"](None)
-        if not codigo:
-            pytest.skip("No hay código cacheado (gc/ultimo_codigo). Ejecutá antes el flujo que guarda el código.")
+    with allure.step("Obtener solicitud en estado 'enviada_rrhh' (etapa anterior o API)"):
+        sol = _obtener_solicitud(solicitudes, "enviada_rrhh")
+        codigo = sol.code
 
     # 1) Login RRHH
     with allure.step("Iniciar sesión como RRHH"):
@@ -474,7 +494,9 @@ def test_cp34_validar_solicitud_rrhh(driver, base_url, evidencia, cod_cache):
     with allure.step("Verificar mensaje o estado de éxito tras la validación"):
         detalle.esperar_exito(evidencia=evidencia)
         evidencia("rrhh_validacion_sin_obs_exito")
-        time.sleep(1)
+        wait_spa_idle(driver)
+
+    solicitudes.publish(sol, "validada_rrhh")
 
 @allure.epic("Gestión de Contratos")
 @allure.feature("Flujo de Solicitudes")
@@ -489,10 +511,10 @@ def test_cp34_validar_solicitud_rrhh(driver, base_url, evidencia, cod_cache):
 @pytest.mark.e2e
 @pytest.mark.case("CONTRATO_ENVIAR_SECRETARIA_01")
 @pytest.mark.tester("Ronald")
-def test_cp35_enviar_solicitud_a_secretaria(driver, base_url, evidencia, cod_cache):
+def test_cp35_enviar_solicitud_a_secretaria(driver, base_url, evidencia, solicitudes):
     """
     Escenario:
-    1. Recuperar código de la solicitud desde cache.
+    1. Obtener la solicitud validada por RRHH (etapa anterior o API).
     2. Director inicia sesión.
     3. Navega al listado de contratos y busca la solicitud por código.
     4. Abre el detalle de la solicitud.
@@ -502,10 +524,9 @@ def test_cp35_enviar_solicitud_a_secretaria(driver, base_url, evidencia, cod_cac
     allure.dynamic.title("Director - Enviar solicitud de contrato a Secretaría Académica")
 
     # 1) Recuperar código
-    with allure.step("Recuperar código de solicitud desde cache"):
-        codigo = cod_cache["get"](None)
-        if not codigo:
-            pytest.skip("No hay código cacheado desde la prueba anterior.")
+    with allure.step("Obtener solicitud en estado 'validada_rrhh' (etapa anterior o API)"):
+        sol = _obtener_solicitud(solicitudes, "validada_rrhh")
+        codigo = sol.code
 
     # 2) Login Director
     with allure.step("Iniciar sesión como Director"):
@@ -525,7 +546,7 @@ def test_cp35_enviar_solicitud_a_secretaria(driver, base_url, evidencia, cod_cac
         contratos.wait_loaded()
         evidencia("listado_contratos_visible_sec")
 
-        time.sleep(1)  # microespera por animación de tabla/filtros
+        wait_spa_idle(driver)  # microespera por animación de tabla/filtros
         contratos.search_code(codigo)
         evidencia(f"buscar_codigo__{codigo}_sec")
         contratos.ensure_code_visible(codigo)
@@ -534,17 +555,19 @@ def test_cp35_enviar_solicitud_a_secretaria(driver, base_url, evidencia, cod_cac
     # 4) Entrar al detalle
     with allure.step("Abrir detalle de la solicitud para enviarla a Secretaría"):
         contratos.click_view_for_code(codigo)
-        time.sleep(2)  # breve espera por animaciones
+        wait_spa_idle(driver)  # breve espera por animaciones
         WebDriverWait(driver, 12).until(EC.url_contains("/contratos/solicitud/"))
         evidencia(f"detalle_solicitud__{codigo}_sec")
 
     # 5) Pantalla de revisión y envío a Secretaría
     with allure.step("Usar la pantalla de revisión para enviar la solicitud a Secretaría"):
         pagina = SolicitudRevisionPage(driver)
-        time.sleep(2)  # espera breve por animaciones   
+        wait_spa_idle(driver)  # espera breve por animaciones   
         pagina.wait_loaded(evidencia=evidencia)
         pagina.enviar_a_secretaria(evidencia=evidencia)  # listo
 
+    solicitudes.publish(sol, "enviada_secretaria")
+
 @allure.epic("Gestión de Contratos")
 @allure.feature("Bandeja de Recepción - Asistente")
 @allure.story("Asistente Administrativo navega a la bandeja de recepción de solicitudes")
@@ -558,13 +581,13 @@ def test_cp35_enviar_solicitud_a_secretaria(driver, base_url, evidencia, cod_cac
 @pytest.mark.e2e
 @pytest.mark.case("CP_ASISTENTE_Recepcion_Navegar")
 @pytest.mark.tester("Ronald")
-def test_cp40_asistente_navega_a_recepcion(driver, base_url, evidencia, cod_cache):
+def test_cp40_asistente_navega_a_recepcion(driver, base_url, evidencia, solicitudes):
     """
     Escenario:
     1. Asistente inicia sesión.
     2. Navega a la bandeja de 'Recepción de solicitudes'.
     3. Verifica que la vista cargue.
-    4. Da clic en 'Ver' (por código cacheado si existe, o primera fila).
+    4. Da clic en 'Ver' (por código que dejó cp35 en este worker si existe, o primera fila).
        Solo se toma evidencia post-click, sin assert duro.
     """
 
@@ -581,7 +604,7 @@ def test_cp40_asistente_navega_a_recepcion(driver, base_url, evidencia, cod_cach
             "//header//span[contains(.,'Sesión iniciada como') and "
             "(contains(.,'Asistente') or contains(.,'Asistente Administrativo') or contains(.,'Director Escuela'))]"
         )))
-        time.sleep(1)  # Pequeña espera para evitar capturas muy tempranas
+        wait_spa_idle(driver)  # Pequeña espera para evitar capturas muy tempranas
         evidencia("asistente_login_ok")
 
     # 2) Ir a Recepción
@@ -593,18 +616,20 @@ def test_cp40_asistente_navega_a_recepcion(driver, base_url, evidencia, cod_cach
         recep = RecepcionSolicitudesPage(driver)
         recep.wait_loaded(evidencia=evidencia)
 
-        time.sleep(1)  # Pequeña espera para evitar capturas muy tempranas
+        wait_spa_idle(driver)  # Pequeña espera para evitar capturas muy tempranas
     
     # 3) Click en 'Ver' (suave: sin assert duro)
     with allure.step("Hacer clic en 'Ver' para alguna solicitud (por código o primera fila disponible)"):
-        codigo = cod_cache["get"](None)
+        # Solo mira la solicitud que dejó cp35 en este worker (no la consume)
+        sol = solicitudes.peek("enviada_secretaria")
+        codigo = sol.code if sol else None
         if codigo:
             ok = recep.click_ver_by_code(codigo, evidencia=evidencia, require_detalle=False)
         else:
             ok = recep.click_ver_first(evidencia=evidencia, require_detalle=False)
 
         # 4) Solo evidencia post-click (no assert duro)
-        time.sleep(8)  # Pequeña espera para evitar capturas muy tempranas
+        wait_spa_idle(driver)  # Pequeña espera para evitar capturas muy tempranas
         evidencia("asistente_ver_detalle_ok")
 
         # (Opcional) Log suave por si querés ver en reporte si detectó el detalle:
@@ -640,10 +665,10 @@ def _ensure_min_pdf(path: str) -> str:
 @pytest.mark.e2e
 @pytest.mark.case("CP_ASISTENTE_Subir_Acuerdo_Junta")
 @pytest.mark.tester("Ronald")
-def test_cp41_asistente_subir_acuerdo(driver, base_url, evidencia, cod_cache):
+def test_cp41_asistente_subir_acuerdo(driver, base_url, evidencia, solicitudes):
     """
     Escenario:
-    1. Recuperar código de la solicitud desde cache.
+    1. Obtener la solicitud enviada a Secretaría (etapa anterior o API).
     2. Asistente inicia sesión.
     3. Navega a 'Recepción de solicitudes'.
     4. Abre el formulario 'Subir acuerdo' para la solicitud.
@@ -654,10 +679,9 @@ def test_cp41_asistente_subir_acuerdo(driver, base_url, evidencia, cod_cache):
 
     allure.dynamic.title("Asistente - Subir acuerdo de Junta a una solicitud")
 
-    with allure.step("Recuperar código de la solicitud desde cache"):
-        codigo = cod_cache["get"](None)
-        if not codigo:
-            pytest.skip("No hay código cacheado desde la prueba anterior.")
+    with allure.step("Obtener solicitud en estado 'enviada_secretaria' (etapa anterior o API)"):
+        sol = _obtener_solicitud(solicitudes, "enviada_secretaria")
+        codigo = sol.code
 
     # 1) Login Asistente
     with allure.step("Iniciar sesión como Asistente Administrativo"):
@@ -685,7 +709,7 @@ def test_cp41_asistente_subir_acuerdo(driver, base_url, evidencia, cod_cache):
 
 
      # 3) Abrir formulario 'Subir acuerdo' para la solicitud
-    with allure.step("Abrir formulario 'Subir acuerdo' para el código cacheado"):
+    with allure.step("Abrir formulario 'Subir acuerdo' para la solicitud"):
         subir = SubirAcuerdoPage(driver, base_url)
         subir.open_from_recepcion_by_code(codigo)
         evidencia("asistente_form_subir_visible")
@@ -704,13 +728,15 @@ def test_cp41_asistente_subir_acuerdo(driver, base_url, evidencia, cod_cache):
 
     # 5) Guardar (el PageObject espera toast + redirección)
     with allure.step("Guardar acuerdo y esperar redirección a Recepción"):
-        time.sleep(0.5)  # leve respiro visual en evidencias
+        wait_spa_idle(driver)  # leve respiro visual en evidencias
         subir.guardar()
         evidencia("asistente_subir_guardado_ok")
 
         # 6) Afirmación final: estamos de vuelta en recepción
         WebDriverWait(driver, 8).until(EC.url_contains("/recepcion-solicitudes"))
 
+    solicitudes.publish(sol, "acuerdo_subido")
+
 @allure.epic("Gestión de Contratos")
 @allure.feature("Módulo RRHH - Generar contratos")
 @allure.story("RRHH genera contrato de candidato y completa flujo hasta solicitudes finalizadas")
@@ -724,10 +750,10 @@ def test_cp41_asistente_subir_acuerdo(driver, base_url, evidencia, cod_cache):
 @pytest.mark.e2e
 @pytest.mark.case("CP_RRHH_Generar_Contratos")
 @pytest.mark.tester("Ronald")
-def test_cp42_generar_contratos_rrhh(driver, base_url, evidencia, cod_cache):
+def test_cp42_generar_contratos_rrhh(driver, base_url, evidencia, solicitudes):
     """
     Escenario:
-    1. Recuperar código de solicitud desde cache.
+    1. Obtener la solicitud con acuerdo subido (etapa anterior o API).
     2. RRHH inicia sesión y entra a 'Generar contratos'.
     3. Abre el detalle de la solicitud por código.
     4. Abre el contrato del candidato y genera nueva versión.
@@ -738,10 +764,9 @@ def test_cp42_generar_contratos_rrhh(driver, base_url, evidencia, cod_cache):
 
     allure.dynamic.title("RRHH - Generar contrato, completar flujo y marcar solicitud como finalizada")
 
-    with allure.step("Recuperar código de solicitud desde cache"):
-        codigo = cod_cache["get"](None)
-        if not codigo:
-            pytest.skip("No hay código cacheado desde la prueba anterior.")
+    with allure.step("Obtener solicitud en estado 'acuerdo_subido' (etapa anterior o API)"):
+        sol = _obtener_solicitud(solicitudes, "acuerdo_subido")
+        codigo = sol.code
 
     # 1) Login RRHH
     with allure.step("Iniciar sesión como RRHH"):
@@ -774,11 +799,11 @@ def test_cp42_generar_contratos_rrhh(driver, base_url, evidencia, cod_cache):
         )))
         evidencia("rrhh_generar_contratos_listo")
 
-        time.sleep(2)  # breve espera por animaciones
+        wait_spa_idle(driver)  # breve espera por animaciones
 
         gen = GenerarContratosPage(driver)
         gen.wait_loaded(evidencia=evidencia)
-        time.sleep(3)
+        wait_spa_idle(driver)
     
     # 3) Abrir detalle de la solicitud por código
     with allure.step(f"Abrir detalle de generación de contratos para la solicitud {codigo}"):
@@ -0,0 +1,271 @@
+"""
+Regresión del merge de resultados con la matriz (merge_allure_con_matriz).
+
+La inferencia de CP y el resumen por CP se hacen con operaciones vectorizadas
+de pandas. Estos tests comparan contra la implementación original fila por
+fila (copiada abajo como referencia) sobre una carpeta de Allure y un JSON de
+Newman sintéticos con los casos borde conocidos: CP solo en el nombre, suites
+con uno o varios CP, estados mezclados, requests sin CP, cp0/cp003/cp123.
+También cubren el parche en sitio del Excel del modo incremental. No abren
+navegador.
+"""
+import json
+import re
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font, PatternFill
+
+import merge_allure_con_matriz as merge
+
+pytestmark = pytest.mark.regression
+
+
+# ==========================
+# Implementación de referencia (previa a la vectorización)
+# ==========================
+
+_CP_REGEX = re.compile(r"cp[_\s-]?(\d+)", re.IGNORECASE)
+
+
+def _ref_infer_cp(text):
+    if not text:
+        return None
+    match = _CP_REGEX.search(text)
+    if not match:
+        return None
+    return f"CP_{int(match.group(1)):02d}"
+
+
+def _ref_status(failed, passed):
+    def resumen_status(series):
+        if (series == failed).any():
+            return "FAILED"
+        if (series == passed).any():
+            return "PASSED"
+        return "SKIPPED"
+    return resumen_status
+
+
+def _ref_ui(allure_dir):
+    rows = []
+    for path in sorted(allure_dir.glob("*-result.json")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        labels = {l["name"]: l["value"] for l in data.get("labels", [])}
+        if labels.get("layer") == "api" or data.get("start") is None or data.get("stop") is None:
+            continue
+        cp_raw = _ref_infer_cp(data.get("fullName") or "") or _ref_infer_cp(data.get("name") or "")
+        rows.append({"suite": labels.get("suite", ""), "ID_CASO_RAW": cp_raw, "status": data.get("status"),
+                     "duration_sec": (data["stop"] - data["start"]) / 1000.0})
+    df = pd.DataFrame(rows)
+    cps = df.dropna(subset=["ID_CASO_RAW"]).groupby("suite")["ID_CASO_RAW"].unique()
+    single = {suite: c[0] for suite, c in cps.items() if len(c) == 1}
+    df["ID_CASO"] = df["ID_CASO_RAW"].fillna(df["suite"].map(single))
+    return (
+        df.dropna(subset=["ID_CASO"]).groupby("ID_CASO")
+        .agg(Tiempo_Ejecucion_Automatizada_seg=("duration_sec", "sum"),
+             Resultado_Automatizado=("status", _ref_status("failed", "passed")))
+        .reset_index()
+    )
+
+
+def _ref_api(rows):
+    rows = [dict(r, ID_CASO=_ref_infer_cp(r["request_name"])) for r in rows]
+    df = pd.DataFrame([r for r in rows if r["ID_CASO"]])
+    return (
+        df.groupby("ID_CASO")
+        .agg(Tiempo_Ejecucion_API_seg=("duration_api_sec", "sum"),
+             Resultado_API=("status_api", _ref_status("FAILED", "PASSED")))
+        .reset_index()
+    )
+
+
+# ==========================
+# Datos sintéticos
+# ==========================
+
+# (suite, name, fullName, status, ms)
+UI_RESULTS = [
+    ("test_01_login_auth", "test_cp01_login_ok", "functional.test_01_login_auth#test_cp01_login_ok", "passed", 1200),
+    ("test_01_login_auth", "test_cp01_login_ok", "functional.test_01_login_auth#test_cp01_login_ok", "failed", 900),
+    ("test_01_login_auth", "test_helper", "functional.test_01_login_auth#test_helper", "passed", 300),
+    ("test_02_users", "test_cp_003_crear", "functional.test_02_users#test_cp_003_crear", "skipped", 10),
+    ("test_02_users", "test_CP-4 editar", "", "broken", 4000),
+    ("test_02_users", "test_sin_cp", "functional.test_02_users#test_sin_cp", "passed", 700),
+    ("test_05_update", "test_cp123_grande", "functional.test_05_update#test_cp123_grande", "passed", 50),
+    ("test_05_update", "test_cp0", "functional.test_05_update#test_cp0", "skipped", 5),
+    ("test_06_listado", "Caso cp 7", "functional.test_06_listado#test_listado", "passed", 2500),
+    ("test_06_listado", "test_sin_cp_propaga", "functional.test_06_listado#test_listado_2", "broken", 600),
+    ("test_14_bitacora", "test_bitacora", "functional.test_14_bitacora#test_bitacora", "passed", 800),
+]
+
+# (name, status, ms) en tests/api (label layer=api)
+API_RESULTS = [
+    ("CP01 - Login admin", "passed", 120),
+    ("CP01 - Login admin (repite)", "broken", 80),
+    ("CP_03 Crear usuario", "passed", 300),
+    ("Health check", "passed", 15),
+    ("cp-9 listar", "skipped", 0),
+]
+
+NEWMAN_EXECUTIONS = [
+    ("CP01 - Login", [], 110),
+    ("CP01 - Login inválido", [{"error": {"message": "x"}}], 90),
+    ("Sin CP", [], 40),
+    ("cp_12 Contrato", [], 500),
+]
+
+
+@pytest.fixture
+def allure_dir(tmp_path):
+    d = tmp_path / "allure-results"
+    d.mkdir()
+    for i, (suite, name, full_name, status, ms) in enumerate(UI_RESULTS):
+        res = {"name": name, "fullName": full_name, "status": status, "start": 1000, "stop": 1000 + ms,
+               "labels": [{"name": "suite", "value": suite}], "steps": [{"name": "paso", "steps": []}]}
+        (d / f"ui{i:02d}-result.json").write_text(json.dumps(res), encoding="utf-8")
+    for i, (name, status, ms) in enumerate(API_RESULTS):
+        res = {"name": name, "status": status, "start": 0, "stop": ms,
+               "labels": [{"name": "suite", "value": "test_postman_collections"}, {"name": "layer", "value": "api"}]}
+        (d / f"api{i:02d}-result.json").write_text(json.dumps(res), encoding="utf-8")
+    (d / "otro-container.json").write_text("{}", encoding="utf-8")
+    return d
+
+
+@pytest.fixture
+def newman_json(tmp_path):
+    path = tmp_path / "newman.json"
+    executions = [{"item": {"name": n}, "assertions": a, "response": {"responseTime": ms}}
+                  for n, a, ms in NEWMAN_EXECUTIONS]
+    path.write_text(json.dumps({"run": {"executions": executions}}), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def matriz():
+    ids = [f"CP_{n:02d}" for n in (0, 1, 3, 4, 7, 9, 12, 20, 123)]
+    return pd.DataFrame({"ID_CASO": ids, "Descripción": [f"Caso {i}" for i in ids]})
+
+
+def _api_rows():
+    return [{"request_name": n, "status_api": "FAILED" if s == "broken" else s.upper(), "duration_api_sec": ms / 1000.0}
+            for n, s, ms in API_RESULTS]
+
+
+def _newman_rows():
+    return [{"request_name": n, "status_api": "FAILED" if any(x.get("error") for x in a) else "PASSED",
+             "duration_api_sec": ms / 1000.0} for n, a, ms in NEWMAN_EXECUTIONS]
+
+
+def _sorted(df):
+    return df.sort_values("ID_CASO").reset_index(drop=True)
+
+
+# ==========================
+# Tests
+# ==========================
+
+@pytest.mark.parametrize("text", [
+    None, "", "sin caso", "cp1", "CP01", "cp_003", "Cp-4", "cp 7", "cp0", "cp123", "xcp12y",
+    "test_cp02 y cp05", "functional.test_02#test_cp10_algo", "cp_", "CP-",
+])
+def test_inferir_cp_igual_a_infer_cp_from_text(text):
+    vectorizado = merge.inferir_cp(pd.Series([text], dtype=object)).iloc[0]
+    esperado = merge.infer_cp_from_text(text)
+    assert (None if pd.isna(vectorizado) else vectorizado) == esperado == _ref_infer_cp(text)
+
+
+def test_resumen_ui_igual_a_referencia(allure_dir):
+    nuevo = merge.resumir_allure_por_cp(merge.leer_resultados_allure(str(allure_dir)))
+    pd.testing.assert_frame_equal(_sorted(nuevo), _sorted(_ref_ui(allure_dir)))
+
+
+def test_resumen_api_igual_a_referencia(allure_dir, newman_json):
+    api = merge.resumir_newman_por_cp(merge.leer_ejecuciones_api_allure(str(allure_dir)))
+    pd.testing.assert_frame_equal(_sorted(api), _sorted(_ref_api(_api_rows())))
+
+    newman = merge.resumir_newman_por_cp(merge.leer_ejecuciones_newman(str(newman_json)))
+    pd.testing.assert_frame_equal(_sorted(newman), _sorted(_ref_api(_newman_rows())))
+
+
+def test_duracion_api_sale_de_elapsed_sec_con_prefetch(tmp_path):
+    # Con postman_prefetch el primer test de la carpeta espera toda la carpeta
+    # (start/stop = 5 s) y los siguientes leen el resultado ya listo (~0 s).
+    d = tmp_path / "allure-results"
+    d.mkdir()
+    casos = [("CP_20 Crear banco", 0, 5000, 0.4), ("CP_21 Editar banco", 5000, 5001, 1.2),
+             ("CP_22 Eliminar banco", 5001, 5001, 3.1)]
+    for i, (name, start, stop, elapsed) in enumerate(casos):
+        res = {"name": name, "status": "passed", "start": start, "stop": stop,
+               "labels": [{"name": "layer", "value": "api"}, {"name": "elapsed_sec", "value": f"{elapsed:.6f}"}]}
+        (d / f"api{i:02d}-result.json").write_text(json.dumps(res), encoding="utf-8")
+
+    api = merge.leer_ejecuciones_api_allure(str(d))
+    assert dict(zip(api["ID_CASO"], api["duration_api_sec"])) == {"CP_20": 0.4, "CP_21": 1.2, "CP_22": 3.1}
+
+
+@pytest.mark.parametrize("lectura", ["secuencial", "paralela", "indice"])
+def test_matriz_extendida_identica(allure_dir, matriz, tmp_path, lectura):
+    if lectura == "secuencial":
+        df_ui = merge.leer_resultados_allure(str(allure_dir))
+        df_api = merge.leer_ejecuciones_api_allure(str(allure_dir))
+    elif lectura == "paralela":
+        df_ui, df_api = merge.leer_allure_paralelo(str(allure_dir), workers=2, lote=3)
+    else:
+        indice = merge.IndiceAllure(str(tmp_path / "indice.sqlite"))
+        indice.sincronizar(str(allure_dir))
+        df_ui, df_api = indice.resultados_ui(), indice.ejecuciones_api()
+        indice.close()
+
+    nueva = merge.construir_matriz_extendida(
+        matriz, merge.resumir_allure_por_cp(df_ui), merge.resumir_newman_por_cp(df_api))
+
+    esperada = matriz.merge(_ref_ui(allure_dir), on="ID_CASO", how="left", validate="1:1")
+    esperada = esperada.merge(_ref_api(_api_rows()), on="ID_CASO", how="left", validate="1:1")
+    esperada["Tiempo_Total_Automatizado_seg"] = (
+        esperada["Tiempo_Ejecucion_Automatizada_seg"].fillna(0) + esperada["Tiempo_Ejecucion_API_seg"].fillna(0)
+    )
+    pd.testing.assert_frame_equal(nueva, esperada)
+
+
+@pytest.fixture
+def excel_matriz(tmp_path):
+    path = tmp_path / "matriz_extendida.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["ID_CASO", "Descripción", "Resultado_Automatizado", "Tiempo_Ejecucion_Automatizada_seg"])
+    ws.append(["CP_01", "Login", "PASSED", 1.5])
+    ws.append(["CP_02", "Crear usuario", "FAILED", 3.0])
+    ws.append(["CP_03", "Editar usuario", None, None])
+    for cell in ws[1]:
+        cell.font = Font(bold=True)
+    ws["B3"].fill = PatternFill("solid", start_color="FFFF00")
+    ws["C4"].fill = PatternFill("solid", start_color="00FF00")
+    ws.column_dimensions["B"].width = 40
+    wb.save(path)
+    return path
+
+
+def test_actualizar_filas_excel_solo_toca_los_cp_cambiados(excel_matriz):
+    cambios = {"CP_02": {"Resultado_Automatizado": "PASSED", "Tiempo_Ejecucion_Automatizada_seg": 2.25}}
+    assert merge.actualizar_filas_excel(str(excel_matriz), cambios)
+
+    ws = load_workbook(excel_matriz).active
+    filas = [[c.value for c in row] for row in ws.iter_rows(min_row=2)]
+    assert filas == [
+        ["CP_01", "Login", "PASSED", 1.5],
+        ["CP_02", "Crear usuario", "PASSED", 2.25],
+        ["CP_03", "Editar usuario", None, None],
+    ]
+    # el formato del archivo (encabezado, rellenos, anchos) se conserva
+    assert all(c.font.bold for c in ws[1])
+    assert ws["B3"].fill.start_color.rgb.endswith("FFFF00")
+    assert ws["C4"].fill.start_color.rgb.endswith("00FF00")
+    assert ws.column_dimensions["B"].width == 40
+
+
+def test_actualizar_filas_excel_sin_columnas_pide_regenerar(excel_matriz):
+    antes = excel_matriz.read_bytes()
+    assert not merge.actualizar_filas_excel(str(excel_matriz), {"CP_01": {"Resultado_API": "PASSED"}})
+    assert excel_matriz.read_bytes() == antes
@@ -3,8 +3,8 @@ import pytest
 from urllib.parse import urlparse
 import allure
 
-from pages.login_page import LoginPage
 from pages.home_page import HomePage
+from pages.base_page import wait_spa_idle
 
 # ==========================
 # Utilidades
@@ -16,9 +16,9 @@ def _path(url: str) -> str:
     except Exception:
         return url
 
-def _open_and_wait(driver, url: str, pause: float = 0.6):
+def _open_and_wait(driver, url: str):
     driver.get(url)
-    time.sleep(pause)  # pequeña espera por SPA redirects
+    wait_spa_idle(driver)  # espera a que la SPA termine de redirigir
 
 def _is_home(driver) -> bool:
     """Heurística suave para detectar Home además del path '//'."""
@@ -72,14 +72,11 @@ PERMITE_ACCESO_ERRONEO = [
 # ==========================
 
 @pytest.fixture(scope="function")
-def login_as_candidate(driver, base_url):
-    login = LoginPage(driver, base_url)
-    login.open_login()
+def login_as_candidate(logged_in_as):
+    # Sesión cacheada: solo el primer test del worker pasa por el formulario de login
     candidate_email = "sabrina_rosales@ues.edu.sv"  # AJUSTA a un usuario candidato real
     candidate_pass  = "Sabr1na.2025"                # AJUSTA si aplica
-    login.login_as(candidate_email, candidate_pass)
-    assert login.is_logged_in(), "No se pudo iniciar sesión como Candidato."
-    time.sleep(1.5)
+    logged_in_as("candidato", creds={"email": candidate_email, "password": candidate_pass})
 
 @allure.epic("Seguridad y RBAC")
 @allure.feature("RBAC Frontend - Candidato")
@@ -146,7 +143,7 @@ def test_cp43_rbac_candidato_rutas_deberian_bloquear(driver, base_url, login_as_
 
     with allure.step(f"Candidato intenta acceder a ruta potencialmente vulnerable: {ruta!r}"):
         url = base_url.rstrip("/") + ruta
-        _open_and_wait(driver, url, pause=0.8)
+        _open_and_wait(driver, url)
         evidencia(f"rbac_bug__intentando_{ruta.strip('/') or 'root'}")
     with allure.step("Verificar que la ruta debería redirigir al home (comportamiento correcto esperado)"):
         # Assert del comportamiento correcto: debería estar en home
@@ -0,0 +1,98 @@
+"""
+Cliente HTTP mínimo para preparar datos de prueba por API.
+
+Usa un único `requests.Session` (keep-alive + pool de conexiones) por worker
+y guarda el token de cada rol, así preparar una precondición cuesta unas
+pocas llamadas HTTP en lugar de un recorrido completo por la UI.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.session_cache import extract_token
+
+
+class ApiClient:
+    def __init__(self, api_url: str, role_creds: dict, timeout: int = 20, pool_size: int = 10):
+        self.api_url = (api_url or "").rstrip("/")
+        self.role_creds = dict(role_creds)
+        self.timeout = timeout
+        self._tokens = {}   # rol -> token
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+        self.stats = {"requests": 0, "logins": 0}
+
+    # -----------------------------
+    # Autenticación
+    # -----------------------------
+    def add_role(self, role: str, creds: dict):
+        """Registra (o reemplaza) las credenciales de un rol extra, p. ej. un candidato."""
+        if self.role_creds.get(role) != creds:
+            self.role_creds[role] = creds
+            self._tokens.pop(role, None)
+
+    def token(self, role: str) -> str:
+        if role not in self._tokens:
+            creds = self.role_creds.get(role)
+            assert creds, f"Sin credenciales para el rol {role}: revisar sus variables en el .env"
+            resp = self.session.post(
+                self.api_url + "/auth/login",
+                json={"email": creds["email"], "password": creds["password"]},
+                timeout=self.timeout,
+            )
+            assert resp.status_code == 200, f"Login API como {role} devolvió {resp.status_code}"
+            token = extract_token(resp)
+            assert token, f"El login API como {role} no devolvió token"
+            self._tokens[role] = token
+            self.stats["logins"] += 1
+        return self._tokens[role]
+
+    # -----------------------------
+    # Requests
+    # -----------------------------
+    def request(self, method: str, path: str, role: str = None, expected=(200, 201), **kwargs):
+        """
+        Ejecuta la llamada (con el token del rol si se indica) y devuelve el
+        JSON de la respuesta ({} si no trae cuerpo JSON).
+        """
+        headers = kwargs.pop("headers", {}) or {}
+        if role:
+            headers["Authorization"] = f"Bearer {self.token(role)}"
+        kwargs.setdefault("timeout", self.timeout)
+
+        resp = self.session.request(method, self.api_url + "/" + path.lstrip("/"), headers=headers, **kwargs)
+        self.stats["requests"] += 1
+
+        if resp.status_code == 401 and role in self._tokens:
+            # token vencido: renovar una sola vez
+            self._tokens.pop(role, None)
+            headers["Authorization"] = f"Bearer {self.token(role)}"
+            resp = self.session.request(method, self.api_url + "/" + path.lstrip("/"), headers=headers, **kwargs)
+            self.stats["requests"] += 1
+
+        assert resp.status_code in expected, (
+            f"{method} {path} como {role or 'anónimo'} devolvió {resp.status_code}: {resp.text[:300]}"
+        )
+        try:
+            return resp.json()
+        except ValueError:
+            return {}
+
+    def get(self, path, role=None, **kwargs):
+        return self.request("GET", path, role, **kwargs)
+
+    def post(self, path, role=None, **kwargs):
+        return self.request("POST", path, role, **kwargs)
+
+    def put(self, path, role=None, **kwargs):
+        return self.request("PUT", path, role, **kwargs)
+
+    def delete(self, path, role=None, **kwargs):
+        return self.request("DELETE", path, role, **kwargs)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,154 @@
+"""
+Perfil de comandos WebDriver por page object.
+
+Se activa con `--profile-webdriver [ARCHIVO]`. Envuelve `execute` del
+command executor (RemoteConnection) de cada navegador del fixture `driver`:
+cada comando (findElement, clickElement, executeScript, screenshot, get, ...)
+se mide y se atribuye a la pila de llamadas del proyecto que lo originó,
+p.ej.
+
+    test_15_solicitud_contratacion_proceso::test_cp48;ContractDetailPage.select_all_functions;BasePage.click;clickElement
+
+Solo entran a la pila los frames de pages/ y tests/ (pytest, selenium y la
+stdlib se saltan), con el nombre calificado de la función: en un método
+heredado aparece la clase que lo define (BasePage.click).
+
+Al final de la sesión:
+- el archivo en formato "folded" (una pila por línea + microsegundos), que
+  abren flamegraph.pl, speedscope o inferno;
+- en la terminal, los métodos de page objects con más tiempo en comandos
+  (inclusivo) y los comandos más llamados.
+"""
+import os
+import sys
+import threading
+import time
+
+# pila plegada -> {"calls", "us"} (plano por clave: DriverPool.merge_stats lo suma entre workers)
+COMMAND_STATS = {}
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+_PAGES = os.path.join(_ROOT, "pages") + os.sep
+_TESTS = os.path.join(_ROOT, "tests") + os.sep
+# instrumentación propia: sus frames no son del código bajo prueba
+_SKIP = {os.path.abspath(__file__), os.path.join(_ROOT, "tests", "utils", "page_timing.py")}
+
+
+def _frame_label(code, filename: str) -> str:
+    qualname = getattr(code, "co_qualname", code.co_name).replace(".<locals>", "")
+    if filename.startswith(_PAGES):
+        return qualname
+    # tests y utilidades: "modulo::funcion" para distinguirlos de los page objects
+    return f"{os.path.splitext(os.path.basename(filename))[0]}::{qualname}"
+
+
+class CommandProfiler:
+    def __init__(self, stats: dict = None):
+        self.stats = COMMAND_STATS if stats is None else stats
+        self._lock = threading.Lock()
+        self._labels = {}         # code -> etiqueta, o "" si no es del proyecto
+
+    # -----------------------------
+    # Instalación
+    # -----------------------------
+    def install(self, driver):
+        """Envuelve el executor del driver (idempotente: el pool reusa navegadores)."""
+        executor = driver.command_executor
+        if getattr(executor, "_gc_profiled", False):
+            return driver
+        original = executor.execute
+
+        def execute(command, params=None):
+            stack = self.stack()
+            t0 = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                self.record(stack, command, time.perf_counter() - t0)
+
+        executor.execute = execute
+        executor._gc_profiled = True
+        return driver
+
+    # -----------------------------
+    # Atribución
+    # -----------------------------
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            path = os.path.abspath(code.co_filename)
+            inside = (path.startswith(_PAGES) or path.startswith(_TESTS)) and path not in _SKIP
+            label = self._labels[code] = _frame_label(code, path) if inside else ""
+        return label
+
+    def stack(self) -> tuple:
+        """Frames del proyecto desde el más externo (el test) hasta el que llamó al driver."""
+        labels = []
+        frame = sys._getframe(1)
+        while frame is not None:
+            label = self._label(frame.f_code)
+            if label:
+                labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return tuple(labels)
+
+    def record(self, stack: tuple, command: str, seconds: float):
+        key = ";".join(stack + (command,)) if stack else f"(fuera del proyecto);{command}"
+        with self._lock:
+            st = self.stats.setdefault(key, {"calls": 0, "us": 0})
+            st["calls"] += 1
+            st["us"] += int(seconds * 1_000_000)
+
+
+# ==========================================================
+# Reportes
+# ==========================================================
+
+def write_folded(path: str, stats: dict = None) -> int:
+    """Escribe el perfil en formato folded (microsegundos). Devuelve las pilas escritas."""
+    stats = COMMAND_STATS if stats is None else stats
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        for key, st in sorted(stats.items()):
+            fh.write(f"{key.replace(' ', '_')} {st['us']}\n")
+    return len(stats)
+
+
+def _is_page_method(label: str) -> bool:
+    return "::" not in label and not label.startswith("(")
+
+
+def profile_lines(stats: dict = None, top: int = 15) -> list:
+    stats = COMMAND_STATS if stats is None else stats
+    if not stats:
+        return []
+
+    by_method = {}    # método de page object -> [comandos, us] (inclusivo)
+    by_command = {}   # comando -> [llamadas, us]
+    total_calls = total_us = 0
+    for key, st in stats.items():
+        frames = key.split(";")
+        command = frames[-1]
+        total_calls += st["calls"]
+        total_us += st["us"]
+        cmd = by_command.setdefault(command, [0, 0])
+        cmd[0] += st["calls"]
+        cmd[1] += st["us"]
+        for label in set(frames[:-1]):
+            if _is_page_method(label):
+                m = by_method.setdefault(label, [0, 0])
+                m[0] += st["calls"]
+                m[1] += st["us"]
+
+    lines = [f"comandos WebDriver: {total_calls} en {total_us / 1e6:.1f}s"]
+    if by_method:
+        lines.append(f"métodos de page objects con más tiempo en comandos (top {top}, inclusivo):")
+        for label, (calls, us) in sorted(by_method.items(), key=lambda kv: kv[1][1], reverse=True)[:top]:
+            lines.append(f"  {label:<55} {us / 1e6:>8.2f}s  comandos={calls:<6} "
+                         f"promedio={us / 1000 / max(1, calls):.1f}ms")
+    lines.append(f"comandos más llamados (top {top}):")
+    for command, (calls, us) in sorted(by_command.items(), key=lambda kv: kv[1][0], reverse=True)[:top]:
+        lines.append(f"  {command:<30} llamadas={calls:<7} total={us / 1e6:>8.2f}s "
+                     f"promedio={us / 1000 / max(1, calls):.1f}ms")
+    return lines
@@ -0,0 +1,144 @@
+"""
+Pool de navegadores "calientes" para el fixture `driver`.
+
+Se activa con `--driver-pool`. En lugar de lanzar un Chrome/Firefox/Edge nuevo
+por cada test, se reutilizan navegadores ya abiertos y se limpian entre tests
+(cookies, localStorage, sessionStorage y navegación a about:blank).
+
+Un navegador se recicla (quit + relanzar) cuando:
+- alcanza `max_uses` tests,
+- no responde al health check (crash, sesión cerrada, etc.).
+"""
+import time
+
+
+class DriverPool:
+    def __init__(self, factory, size: int = 2, max_uses: int = 25):
+        # factory: callable sin argumentos que devuelve un WebDriver nuevo
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+
+        self._idle = []       # [driver, ...] listos para usarse
+        self._uses = {}       # id(driver) -> cantidad de tests atendidos
+
+        self.stats = {
+            "hits": 0,          # tests atendidos con un navegador ya abierto
+            "misses": 0,        # tests que requirieron lanzar navegador
+            "recycled": 0,      # navegadores cerrados por max_uses o crash
+            "launches": 0,
+            "launch_time_sec": 0.0,
+        }
+
+    # -----------------------------
+    # Ciclo de vida
+    # -----------------------------
+    def _launch(self):
+        t0 = time.perf_counter()
+        drv = self.factory()
+        self.stats["launches"] += 1
+        self.stats["launch_time_sec"] += time.perf_counter() - t0
+        self._uses[id(drv)] = 0
+        return drv
+
+    def _discard(self, drv):
+        self._uses.pop(id(drv), None)
+        try:
+            drv.quit()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """Entrega un navegador sano: reutiliza uno del pool o lanza uno nuevo."""
+        while self._idle:
+            drv = self._idle.pop()
+            if self.is_healthy(drv):
+                self.stats["hits"] += 1
+                self._uses[id(drv)] += 1
+                return drv
+            self.stats["recycled"] += 1
+            self._discard(drv)
+
+        self.stats["misses"] += 1
+        drv = self._launch()
+        self._uses[id(drv)] += 1
+        return drv
+
+    def release(self, drv):
+        """Devuelve el navegador al pool tras limpiar su estado (o lo recicla)."""
+        if self._uses.get(id(drv), 0) >= self.max_uses:
+            self.stats["recycled"] += 1
+            self._discard(drv)
+            return
+
+        if not self.reset(drv):
+            # no se pudo limpiar: probablemente el navegador murió
+            self.stats["recycled"] += 1
+            self._discard(drv)
+            return
+
+        if len(self._idle) >= self.size:
+            # pool lleno: no vale la pena mantener más navegadores abiertos
+            self._discard(drv)
+            return
+
+        self._idle.append(drv)
+
+    def close_all(self):
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    # -----------------------------
+    # Health check / limpieza
+    # -----------------------------
+    @staticmethod
+    def is_healthy(drv) -> bool:
+        try:
+            return drv.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def reset(drv) -> bool:
+        """
+        Deja el navegador como recién abierto.
+        El storage solo se puede limpiar estando en el origen de la app,
+        por eso se limpia ANTES de navegar a about:blank.
+        """
+        try:
+            if (drv.current_url or "").startswith("http"):
+                drv.execute_script(
+                    "try { window.localStorage.clear(); } catch (e) {}"
+                    "try { window.sessionStorage.clear(); } catch (e) {}"
+                )
+            drv.delete_all_cookies()
+            # delete_all_cookies solo borra las del dominio actual; en Chromium
+            # limpiamos todas vía CDP (si no está disponible, no pasa nada).
+            try:
+                drv.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                pass
+            drv.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    # -----------------------------
+    # Reporte
+    # -----------------------------
+    @staticmethod
+    def merge_stats(total: dict, other: dict) -> dict:
+        for k, v in (other or {}).items():
+            total[k] = total.get(k, 0) + v
+        return total
+
+    @staticmethod
+    def summary_lines(stats: dict) -> list:
+        launches = stats.get("launches", 0)
+        avg_launch = (stats.get("launch_time_sec", 0.0) / launches) if launches else 0.0
+        saved = stats.get("hits", 0) * avg_launch
+        return [
+            f"hits={stats.get('hits', 0)} misses={stats.get('misses', 0)} "
+            f"recycled={stats.get('recycled', 0)} launches={launches}",
+            f"lanzamiento promedio={avg_launch:.2f}s  tiempo ahorrado estimado={saved:.1f}s",
+        ]
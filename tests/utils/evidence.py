@@ -0,0 +1,152 @@
+"""
+Escritura de evidencias (screenshots) en segundo plano.
+
+El screenshot se toma UNA sola vez (bytes PNG) y esos mismos bytes se reparten
+a disco, Allure y pytest-html. Allure y pytest-html se adjuntan en el momento
+(tienen que quedar dentro del test); la escritura a disco se encola y la hace
+un hilo aparte, así el test y el driver siguen sin esperar al sistema de
+archivos.
+
+Además define la política de evidencias del fixture `evidencia`:
+- always:      cada punto de evidencia se guarda y adjunta al momento.
+- on-failure:  los puntos de evidencia no se capturan; solo queda el
+               screenshot automático de la falla.
+- ring-buffer: se capturan en memoria (últimos N) y solo se vuelcan a
+               disco/Allure/HTML si el test falla.
+"""
+import io
+import os
+import queue
+import threading
+from collections import deque
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow es opcional: sin él no hay miniaturas
+    Image = None
+
+POLICIES = ("always", "on-failure", "ring-buffer")
+COMPRESS_FORMATS = ("none", "jpeg", "webp")
+
+
+class EvidenceWriter:
+    _STOP = object()
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.stats = {"files": 0, "bytes": 0, "errors": 0}
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="evidence-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is self._STOP:
+                    return
+                path, data = job
+                os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                with open(path, "wb") as fh:
+                    fh.write(data)
+                self.stats["files"] += 1
+                self.stats["bytes"] += len(data)
+            except Exception as e:
+                self.stats["errors"] += 1
+                print(f"[EVIDENCIA] no se pudo escribir {job[0]}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def write(self, path: str, data: bytes) -> str:
+        """Encola la escritura y devuelve la ruta de inmediato."""
+        self._ensure_thread()
+        self._queue.put((path, data))
+        return path
+
+    def flush(self):
+        """Bloquea hasta que todo lo encolado esté en disco."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        if self._thread is None:
+            return
+        self.flush()
+        self._queue.put(self._STOP)
+        self._thread.join(timeout=10)
+        self._thread = None
+
+
+class EvidenceBuffer:
+    """Últimos `size` screenshots de un test, en memoria, listos para volcar."""
+
+    def __init__(self, size: int = 5):
+        self._items = deque(maxlen=max(1, int(size)))
+        self.dropped = 0
+
+    def add(self, name: str, image):
+        if len(self._items) == self._items.maxlen:
+            self.dropped += 1
+        self._items.append((name, image))
+
+    def drain(self) -> list:
+        items = list(self._items)
+        self._items.clear()
+        return items
+
+    def __len__(self):
+        return len(self._items)
+
+
+class EvidenceImage:
+    """Bytes de la imagen ya lista para adjuntar (PNG original o miniatura)."""
+
+    _MIME = {"png": "image/png", "jpg": "image/jpeg", "webp": "image/webp"}
+
+    def __init__(self, data: bytes, extension: str = "png"):
+        self.data = data
+        self.extension = extension
+
+    @property
+    def mime_type(self) -> str:
+        return self._MIME[self.extension]
+
+
+_warned_no_pillow = False
+
+
+def compress_png(png_bytes: bytes, fmt: str = "none", max_width: int = 960,
+                 quality: int = 70) -> EvidenceImage:
+    """
+    Reduce el screenshot a una miniatura JPEG/WebP de `max_width` px de ancho.
+    Con fmt="none" (o sin Pillow instalado) devuelve el PNG tal cual.
+    """
+    global _warned_no_pillow
+    if fmt == "none" or not png_bytes:
+        return EvidenceImage(png_bytes, "png")
+    if Image is None:
+        if not _warned_no_pillow:
+            print("[EVIDENCIA] Pillow no está instalado; se adjunta el PNG sin comprimir")
+            _warned_no_pillow = True
+        return EvidenceImage(png_bytes, "png")
+
+    img = Image.open(io.BytesIO(png_bytes))
+    if max_width and img.width > max_width:
+        height = round(img.height * max_width / img.width)
+        img = img.resize((max_width, height), Image.LANCZOS)
+    # JPEG no admite transparencia
+    img = img.convert("RGB")
+
+    out = io.BytesIO()
+    if fmt == "webp":
+        img.save(out, format="WEBP", quality=quality, method=4)
+        return EvidenceImage(out.getvalue(), "webp")
+    img.save(out, format="JPEG", quality=quality, optimize=True)
+    return EvidenceImage(out.getvalue(), "jpg")
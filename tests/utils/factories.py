@@ -0,0 +1,191 @@
+"""
+Fábrica de datos de prueba por API.
+
+Crea por HTTP las precondiciones que hoy se arman recorriendo la UI
+(usuarios con CreateUserPage, datos personales con los pasos de
+CandidatePersonalInfoStep*, solicitudes con ContractCreateWizard), con los
+POST de la colección de Postman.
+
+Al final del test (`cleanup`) se borra, en orden inverso, solo lo que tiene
+DELETE en la colección (bancos). Usuarios, personas y ciclos no tienen
+endpoint de borrado: quedan en el ambiente y `cleanup` los lista en un
+DataFactoryWarning, igual que cualquier borrado que falle, para que los
+datos que quedan no pasen desapercibidos.
+
+Uso típico (fixture `data_factory`):
+
+    usuario = data_factory.user(role="Candidato")
+    banco = data_factory.bank()
+    sol = data_factory.solicitud("enviada_rrhh")
+"""
+import random
+import time
+import warnings
+
+from faker import Faker
+
+from utils.provisioning import SolicitudProvisioner, _root
+
+
+class DataFactoryWarning(UserWarning):
+    """Datos creados por la fábrica que quedaron en el ambiente."""
+
+
+class DataFactory:
+    def __init__(self, api, admin_role: str = "admin", provisioner: SolicitudProvisioner = None):
+        self.api = api
+        self.admin_role = admin_role
+        self.provisioner = provisioner or SolicitudProvisioner(api)
+        self.fake = Faker("es_ES")
+        self._created = []   # [(descripción, path DELETE, rol), ...]
+        self._leftover = []  # ["usuario 17", ...]: sin DELETE en el API
+        self.stats = {"created": 0, "deleted": 0, "cleanup_errors": 0, "leftover": 0}
+
+    # -----------------------------
+    # Registro / limpieza
+    # -----------------------------
+    def _track(self, kind: str, delete_path: str, role: str):
+        self._created.append((kind, delete_path, role))
+        self.stats["created"] += 1
+
+    def _leave(self, kind: str, obj_id):
+        """Registra algo creado que el API no permite borrar."""
+        self._leftover.append(f"{kind} {obj_id}")
+        self.stats["created"] += 1
+        self.stats["leftover"] += 1
+
+    def cleanup(self):
+        """
+        Borra lo creado (lo último primero). Un error no detiene el resto; los
+        borrados fallidos y lo que no se puede borrar se avisan con
+        DataFactoryWarning (aparecen en el resumen de warnings de pytest).
+        """
+        failed = []
+        while self._created:
+            kind, path, role = self._created.pop()
+            try:
+                self.api.delete(path, role, expected=(200, 202, 204, 404))
+                self.stats["deleted"] += 1
+            except Exception as e:
+                self.stats["cleanup_errors"] += 1
+                failed.append(f"{kind} ({path}): {e}")
+        if failed:
+            warnings.warn(DataFactoryWarning("No se pudo borrar: " + "; ".join(failed)), stacklevel=2)
+        if self._leftover:
+            warnings.warn(DataFactoryWarning(
+                "Quedan en el ambiente (el API no tiene DELETE): " + ", ".join(self._leftover)), stacklevel=2)
+            self._leftover.clear()
+
+    def _suffix(self) -> str:
+        return f"{int(time.time()) % 100000}{random.randint(100, 999)}"
+
+    # -----------------------------
+    # Usuarios / candidatos
+    # -----------------------------
+    def user(self, role: str = "Candidato", name: str = None, email: str = None,
+             school_id: int = None) -> dict:
+        """
+        POST /users (como administrador). Devuelve el usuario creado + lo
+        enviado. No hay DELETE /users: el usuario queda en el ambiente.
+        """
+        suffix = self._suffix()
+        payload = {
+            "name": name or f"{self.fake.first_name()} {self.fake.last_name()} QA{suffix}",
+            "email": email or f"qa.auto+{suffix}@ues.edu.sv",
+            "role": role,
+        }
+        if school_id is not None:
+            payload["school_id"] = school_id
+
+        j = self.api.post("/users", self.admin_role, json=payload)
+        root = _root(j, "user", "data")
+        user_id = root.get("id") or j.get("id")
+        assert user_id, f"POST /users no devolvió id: {j}"
+        self._leave("usuario", user_id)
+        return {**payload, **root, "id": user_id}
+
+    def candidate(self, school_id: int = 8, **kwargs) -> dict:
+        """Usuario con rol Candidato (requiere escuela, igual que en la UI)."""
+        return self.user(role="Candidato", school_id=school_id, **kwargs)
+
+    def person(self, role: str, creds: dict = None, **overrides) -> dict:
+        """
+        POST /persons: datos personales del candidato autenticado como `role`.
+        Si se pasan `creds`, se registran para ese rol antes de llamar. No
+        hay DELETE /persons: la persona queda ligada al usuario.
+        """
+        from utils.generador_duis import generar_duis
+
+        if creds:
+            self.api.add_role(role, creds)
+        payload = {
+            "first_name": self.fake.first_name(),
+            "middle_name": self.fake.first_name(),
+            "last_name": f"{self.fake.last_name()} {self.fake.last_name()}",
+            "civil_status": "Soltero",
+            "gender": random.choice(["F", "M"]),
+            "birth_date": self.fake.date_of_birth(minimum_age=25, maximum_age=60).isoformat(),
+            "professional_title": "Ingeniero en Sistemas",
+            "other_title": False,
+            "address": self.fake.street_address(),
+            "distrito_id": 123,
+            "nationality": "El Salvador",
+            "is_nationalized": False,
+            "dui_number": generar_duis(1)[0],
+            "dui_expiration_date": "2031-11-25",
+            "nup": f"{random.randint(0, 10**12 - 1):012d}",
+            "isss_number": f"{random.randint(0, 10**10 - 1):010d}",
+            "alternate_mail": f"qa.alt+{self._suffix()}@ues.edu.sv",
+            "bank_id": 1,
+            "bank_account_type": "Cuenta de Ahorro",
+            "bank_account_number": f"{random.randint(0, 10**10 - 1):010d}",
+            "telephone": f"7{random.randint(0, 999):03d}-{random.randint(0, 9999):04d}",
+            "is_employee": False,
+        }
+        payload.update(overrides)
+
+        j = self.api.post("/persons", role, json=payload, expected=(200, 201))
+        root = _root(j, "person", "data")
+        person_id = root.get("id")
+        assert person_id, f"POST /persons no devolvió id: {j}"
+        self._leave("persona", person_id)
+        return {**payload, **root, "id": person_id}
+
+    # -----------------------------
+    # Catálogos
+    # -----------------------------
+    def semester(self, name: str = None, start_date: str = "2026-01-10",
+                 end_date: str = "2026-07-10", status: bool = True) -> dict:
+        """POST /semesters. No hay DELETE /semesters: el ciclo queda en el ambiente."""
+        payload = {
+            "name": name or f"Ciclo QA {self._suffix()}",
+            "start_date": start_date,
+            "end_date": end_date,
+            "status": status,
+        }
+        j = self.api.post("/semesters", self.admin_role, json=payload)
+        root = _root(j, "semester", "data")
+        assert root.get("id"), f"POST /semesters no devolvió id: {j}"
+        self._leave("ciclo", root["id"])
+        return {**payload, **root}
+
+    def bank(self, name: str = None, cleanup: bool = True) -> dict:
+        """POST /banks; se borra al final con DELETE /banks/{id} (salvo `cleanup=False`)."""
+        payload = {"name": name or f"Banco_QA_{self._suffix()}"}
+        j = self.api.post("/banks", self.admin_role, json=payload)
+        root = _root(j, "bank", "data")
+        assert root.get("id"), f"POST /banks no devolvió id: {j}"
+        if cleanup:
+            self._track("banco", f"/banks/{root['id']}", self.admin_role)
+        return {**payload, **root}
+
+    # -----------------------------
+    # Solicitudes de contratación
+    # -----------------------------
+    def solicitud(self, state: str = "creada"):
+        """
+        Solicitud creada y avanzada por API hasta `state` (ver
+        utils.provisioning.STATES). El API no expone borrado de solicitudes,
+        por eso no se registran para limpieza.
+        """
+        return self.provisioner.provision(state)
@@ -22,5 +22,6 @@ def generar_duis(n=10):
     return res
 
 # Ejemplos rápidos
-print(dui_valido("12345678"))  # 12345678-4
-print(generar_duis(1))
+if __name__ == "__main__":
+    print(dui_valido("12345678"))  # 12345678-4
+    print(generar_duis(1))
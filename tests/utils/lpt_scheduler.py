@@ -0,0 +1,206 @@
+"""
+Planificador LPT para pytest-xdist a partir de duraciones históricas.
+
+Se activa con `-n N --lpt`. La distribución por defecto de xdist reparte
+tests sin saber cuánto duran y los archivos largos (test_15, test_05,
+test_14) terminan en el mismo worker. Este planificador:
+
+- trabaja por unidad = módulo, en el orden del archivo (los tests de un
+  módulo encadenan estado con `cod_cache` y fixtures de módulo);
+- junta en una sola unidad los módulos de una misma cadena (`lpt_chains`
+  en pytest.ini): se ejecutan en el mismo worker y en ese orden, porque se
+  pasan datos por `config.cache` (p.ej. el candidato de test_07);
+- estima cada unidad con las duraciones de corridas anteriores (guardadas
+  en `.pytest_cache` o tomadas de `allure-results`) y entrega siempre la
+  unidad más larga pendiente al worker que se libera (longest processing
+  time first);
+- al final compara el makespan previsto con el real.
+"""
+import fnmatch
+import glob
+import json
+import os
+import time
+
+from xdist.scheduler import LoadScopeScheduling
+
+CACHE_KEY = "gc/test_durations"
+DEFAULT_SEC = 10.0
+
+
+class DurationStore:
+    """
+    Duración por nodeid (setup + call + teardown) de corridas anteriores.
+    Se actualiza con un promedio móvil para que un run atípico no arruine
+    el plan del siguiente.
+    """
+
+    def __init__(self, cache, alpha: float = 0.5):
+        self.cache = cache
+        self.alpha = alpha
+        self.durations = dict(cache.get(CACHE_KEY, {}) or {})
+        self._current = {}
+
+    def add_report(self, report):
+        self._current[report.nodeid] = self._current.get(report.nodeid, 0.0) + (report.duration or 0.0)
+
+    def get(self, nodeid: str):
+        return self.durations.get(nodeid)
+
+    def default(self) -> float:
+        known = sorted(self.durations.values())
+        return known[len(known) // 2] if known else DEFAULT_SEC
+
+    def seed_from_allure(self, results_dir: str, nodeids) -> int:
+        """
+        Completa los nodeids sin historial con los *-result.json de Allure
+        (fullName = "modulo.punteado#funcion"; los parametrizados se promedian).
+        """
+        by_name = {}
+        for path in glob.glob(os.path.join(results_dir, "*-result.json")):
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    res = json.load(fh)
+                sec = (res["stop"] - res["start"]) / 1000.0
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            by_name.setdefault(res.get("fullName", ""), []).append(sec)
+        added = 0
+        for nodeid in nodeids:
+            if nodeid in self.durations:
+                continue
+            path, _, func = nodeid.partition("::")
+            key = path[:-3].replace("/", ".") + "#" + func.split("[", 1)[0]
+            for full_name, secs in by_name.items():
+                if full_name == key or full_name.endswith("." + key):
+                    self.durations[nodeid] = sum(secs) / len(secs)
+                    added += 1
+                    break
+        return added
+
+    def save(self):
+        if not self._current:
+            return
+        for nodeid, sec in self._current.items():
+            old = self.durations.get(nodeid)
+            self.durations[nodeid] = sec if old is None else self.alpha * sec + (1 - self.alpha) * old
+        self.cache.set(CACHE_KEY, self.durations)
+
+
+def parse_chains(lines) -> list:
+    """Cada línea no vacía de `lpt_chains`: patrones de módulo separados por espacios."""
+    return [line.split() for line in lines or () if line.strip() and not line.strip().startswith("#")]
+
+
+def predict_makespan(unit_secs, workers: int) -> float:
+    """Simula LPT: unidades de mayor a menor, cada una al worker menos cargado."""
+    loads = [0.0] * max(1, workers)
+    for sec in sorted(unit_secs, reverse=True):
+        loads[loads.index(min(loads))] += sec
+    return max(loads) if unit_secs else 0.0
+
+
+class LptScheduling(LoadScopeScheduling):
+    def __init__(self, config, log=None, store: DurationStore = None, chains=(), allure_dir: str = None):
+        super().__init__(config, log)
+        self.store = store
+        self.chains = chains
+        self.allure_dir = allure_dir
+        self.unit_sec = {}          # unidad -> segundos previstos
+        self.predicted = None       # makespan previsto
+        self.known = 0              # tests con historial
+        self.n_tests = 0
+        self.actual = {}            # nodeid -> segundos reales
+        self.busy = {}              # worker -> segundos ejecutando tests
+        self.t_start = None
+        self.t_end = None
+
+    # -----------------------------
+    # Unidades de trabajo
+    # -----------------------------
+    def _split_scope(self, nodeid: str) -> str:
+        module = nodeid.split("::", 1)[0]
+        for chain in self.chains:
+            if any(fnmatch.fnmatch(module, pat) for pat in chain):
+                return "cadena: " + " -> ".join(chain)
+        return module
+
+    def _chain_rank(self, nodeid: str):
+        # dentro de una cadena: primero por posición del patrón y luego por colección
+        module = nodeid.split("::", 1)[0]
+        for chain in self.chains:
+            for i, pat in enumerate(chain):
+                if fnmatch.fnmatch(module, pat):
+                    return i
+        return 0
+
+    def _plan(self):
+        nodeids = [nid for unit in self.workqueue.values() for nid in unit]
+        if self.allure_dir and os.path.isdir(self.allure_dir):
+            self.store.seed_from_allure(self.allure_dir, nodeids)
+        default = self.store.default()
+        self.n_tests = len(nodeids)
+        self.known = sum(1 for nid in nodeids if self.store.get(nid) is not None)
+        position = {nid: i for i, nid in enumerate(self.collection)}
+        for scope, unit in list(self.workqueue.items()):
+            ordered = sorted(unit, key=lambda nid: (self._chain_rank(nid), position[nid]))
+            self.workqueue[scope] = {nid: unit[nid] for nid in ordered}
+            self.unit_sec[scope] = sum(self.store.get(nid) or default for nid in ordered)
+        self.predicted = predict_makespan(list(self.unit_sec.values()), len(self.nodes))
+        self.t_start = time.perf_counter()
+
+    # -----------------------------
+    # Reparto
+    # -----------------------------
+    def _assign_work_unit(self, node):
+        if self.predicted is None:
+            self._plan()
+        # LPT: la unidad pendiente más larga al worker que pide trabajo
+        scope = max(self.workqueue, key=lambda s: self.unit_sec.get(s, 0.0))
+        work_unit = self.workqueue.pop(scope)
+        self.assigned_work.setdefault(node, {})[scope] = work_unit
+        collection = self.registered_collections[node]
+        node.send_runtest_some([collection.index(nid) for nid, done in work_unit.items() if not done])
+
+    def _reschedule(self, node):
+        if node.shutting_down:
+            return
+        if not self.workqueue:
+            node.shutdown()
+            return
+        # el worker retiene su último test hasta conocer el siguiente: pedir
+        # trabajo recién ahí evita acaparar unidades que otro worker libre tomaría
+        if self._pending_of(self.assigned_work[node]) > 1:
+            return
+        self._assign_work_unit(node)
+
+    def mark_test_complete(self, node, item_index: int, duration: float = 0):
+        nodeid = self.registered_collections[node][item_index]
+        self.actual[nodeid] = duration
+        worker = node.gateway.id
+        self.busy[worker] = self.busy.get(worker, 0.0) + duration
+        self.t_end = time.perf_counter()
+        super().mark_test_complete(node, item_index, duration)
+
+    # -----------------------------
+    # Resumen
+    # -----------------------------
+    def summary_lines(self) -> list:
+        if self.predicted is None:
+            return []
+        wall = (self.t_end - self.t_start) if self.t_end else 0.0
+        lines = [
+            f"workers={len(self.busy) or self.numnodes} unidades={len(self.unit_sec)} "
+            f"tests con historial={self.known}/{self.n_tests}",
+            f"makespan previsto={self.predicted:.1f}s  real={max(self.busy.values(), default=0.0):.1f}s "
+            f"(reloj {wall:.1f}s, {len(self.actual)} tests)",
+            "ocupación por worker: " + "  ".join(f"{w}={sec:.1f}s" for w, sec in sorted(self.busy.items())),
+        ]
+        real_by_unit = {}
+        for nodeid, sec in self.actual.items():
+            scope = self._split_scope(nodeid)
+            real_by_unit[scope] = real_by_unit.get(scope, 0.0) + sec
+        for scope, sec in sorted(self.unit_sec.items(), key=lambda kv: kv[1], reverse=True)[:10]:
+            lines.append(f"  {scope[:70]:<70} previsto={sec:>7.1f}s real={real_by_unit.get(scope, 0.0):>7.1f}s")
+        return lines
+
@@ -0,0 +1,245 @@
+"""
+Captura de red del navegador (Chrome/Edge) vía CDP, para el fixture `network_capture`.
+
+`driver.start_devtools()` elige el módulo de devtools que corresponde a la
+versión del navegador, así que no hay que fijar `devtools.v129` ni
+actualizar el import cada vez que sube Chrome. Se habilita el dominio
+Network y se escuchan requestWillBeSent / responseReceived /
+loadingFinished / loadingFailed.
+
+Selenium entrega cada evento en su propio hilo y sin orden garantizado: las
+entradas se arman por request_id con lo que llegue, bajo un lock.
+
+Por request (XHR/fetch por defecto) queda: URL, método, status, tamaño y
+los tiempos de ResourceTiming (DNS, conexión, TLS, envío, TTFB y descarga).
+`har()` los exporta en HAR 1.2 (lo abre el panel Network de Chrome o
+cualquier visor de HAR). En Firefox o si CDP no está disponible, la captura
+queda `available=False` y no rompe el test.
+"""
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlparse
+
+RESOURCE_TYPES = ("XHR", "Fetch")
+
+# "METODO /ruta/{id}" -> {"calls", "total_ms", "ttfb_ms", "errors"} (plano: DriverPool.merge_stats)
+NETWORK_STATS = {}
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f-]{27,}|[0-9a-f]{16,})$", re.IGNORECASE)
+
+
+def path_template(url: str) -> str:
+    """/api/users/42/roles -> /api/users/{id}/roles (agrupa por endpoint)."""
+    parts = urlparse(url).path.split("/")
+    return "/".join("{id}" if _ID_SEGMENT.match(p) else p for p in parts) or "/"
+
+
+def _span(start, end) -> float:
+    # ResourceTiming usa -1 para "no aplica" (conexión reutilizada, caché, ...)
+    return round(end - start, 3) if start is not None and end is not None and start >= 0 and end >= 0 else -1
+
+
+def _value(obj):
+    return getattr(obj, "value", obj)
+
+
+class NetworkCapture:
+    def __init__(self, driver, resource_types=RESOURCE_TYPES):
+        self.driver = driver
+        self.resource_types = set(resource_types or ())
+        self.available = False
+        self.error = None
+        self._devtools = None
+        self._conn = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._raw = {}          # request_id -> dict con lo que llegó de cada evento
+
+    # -----------------------------
+    # Ciclo de vida
+    # -----------------------------
+    def start(self):
+        browser = (getattr(self.driver, "caps", None) or {}).get("browserName", "").lower()
+        if browser not in ("chrome", "chromium", "msedge", "microsoftedge") or not hasattr(self.driver, "start_devtools"):
+            self.error = f"CDP no disponible en {browser or 'este navegador'}"
+            return self
+        try:
+            devtools, conn = self.driver.start_devtools()
+            conn.execute(devtools.network.enable())
+            network = devtools.network
+            for event, handler in ((network.RequestWillBeSent, self._on_request),
+                                   (network.ResponseReceived, self._on_response),
+                                   (network.LoadingFinished, self._on_finished),
+                                   (network.LoadingFailed, self._on_failed)):
+                self._callbacks.append((event, conn.add_callback(event, handler)))
+        except Exception as e:
+            self.error = f"no se pudo habilitar CDP Network: {e}"
+            return self
+        self._devtools, self._conn = devtools, conn
+        self.available = True
+        return self
+
+    def stop(self):
+        """Quita los listeners (el navegador puede volver al pool) y deshabilita Network."""
+        if not self.available:
+            return
+        for event, callback_id in self._callbacks:
+            self._conn.remove_callback(event, callback_id)
+        self._callbacks.clear()
+        try:
+            self._conn.execute(self._devtools.network.disable())
+        except Exception:
+            pass  # navegador ya cerrado
+        self.available = False
+
+    # -----------------------------
+    # Eventos CDP (cada uno en su hilo)
+    # -----------------------------
+    def _merge(self, request_id, **fields):
+        with self._lock:
+            self._raw.setdefault(str(request_id), {}).update(fields)
+
+    def _on_request(self, ev):
+        req = ev.request
+        self._merge(ev.request_id, url=req.url, method=req.method, type=_value(ev.type_),
+                    wall_time=float(ev.wall_time), ts_request=float(ev.timestamp))
+
+    def _on_response(self, ev):
+        resp = ev.response
+        self._merge(ev.request_id, url=resp.url, type=_value(ev.type_), status=resp.status,
+                    status_text=resp.status_text, mime=resp.mime_type, headers=dict(resp.headers or {}),
+                    protocol=getattr(resp, "protocol", None), remote_ip=getattr(resp, "remote_ip_address", None),
+                    timing=resp.timing, ts_response=float(ev.timestamp))
+
+    def _on_finished(self, ev):
+        self._merge(ev.request_id, size=int(ev.encoded_data_length), ts_end=float(ev.timestamp))
+
+    def _on_failed(self, ev):
+        self._merge(ev.request_id, type=_value(ev.type_), error=ev.error_text, ts_end=float(ev.timestamp))
+
+    # -----------------------------
+    # Consultas
+    # -----------------------------
+    @staticmethod
+    def _timings(raw: dict) -> dict:
+        t = raw.get("timing")
+        out = {"blocked": -1, "dns": -1, "connect": -1, "ssl": -1, "send": 0, "wait": 0, "receive": 0}
+        if t is not None:
+            first = next((v for v in (t.dns_start, t.connect_start, t.send_start) if v is not None and v >= 0), -1)
+            out.update(
+                blocked=round(first, 3) if first >= 0 else -1,
+                dns=_span(t.dns_start, t.dns_end),
+                connect=_span(t.connect_start, t.connect_end),
+                ssl=_span(t.ssl_start, t.ssl_end),
+                send=max(0, _span(t.send_start, t.send_end)),
+                wait=max(0, _span(t.send_end, t.receive_headers_end)),          # TTFB
+            )
+            if raw.get("ts_end") is not None:
+                out["receive"] = max(0, round((raw["ts_end"] - t.request_time) * 1000 - t.receive_headers_end, 3))
+        return out
+
+    def entries(self, all_types: bool = False) -> list:
+        """Requests capturadas (XHR/fetch salvo `all_types`), en orden de inicio."""
+        with self._lock:
+            raws = [dict(r, request_id=rid) for rid, r in self._raw.items() if "url" in r]
+        out = []
+        for raw in sorted(raws, key=lambda r: r.get("ts_request", r.get("ts_response", 0))):
+            if not all_types and self.resource_types and raw.get("type") not in self.resource_types:
+                continue
+            timings = self._timings(raw)
+            # como en HAR: ssl ya está dentro de connect
+            total = sum(v for k, v in timings.items() if v > 0 and k != "ssl")
+            if raw.get("timing") is None and raw.get("ts_request") is not None:
+                end = raw.get("ts_end", raw.get("ts_response"))
+                total = round((end - raw["ts_request"]) * 1000, 3) if end is not None else 0
+            out.append({
+                "request_id": raw["request_id"], "url": raw["url"], "method": raw.get("method"),
+                "type": raw.get("type"), "status": raw.get("status"), "status_text": raw.get("status_text", ""),
+                "mime": raw.get("mime", ""), "size": raw.get("size", -1), "error": raw.get("error"),
+                "protocol": raw.get("protocol"), "remote_ip": raw.get("remote_ip"),
+                "headers": raw.get("headers", {}), "wall_time": raw.get("wall_time"),
+                "timings": timings, "ttfb_ms": timings["wait"], "total_ms": round(total, 3),
+                "done": "ts_end" in raw,
+            })
+        return out
+
+    def find(self, url_contains: str = "", method: str = None) -> list:
+        needle = url_contains.lower()
+        return [e for e in self.entries()
+                if needle in e["url"].lower() and (method is None or (e["method"] or "").upper() == method.upper())]
+
+    def wait_for(self, url_contains: str = "", method: str = None, timeout: float = 10, poll: float = 0.1):
+        """
+        Última request que coincide y ya tiene respuesta (o falló). None si no
+        llegó a tiempo o la captura no está disponible.
+        """
+        if not self.available:
+            return None
+        end = time.monotonic() + timeout
+        while True:
+            done = [e for e in self.find(url_contains, method) if e["status"] is not None or e["error"]]
+            if done:
+                return done[-1]
+            if time.monotonic() >= end:
+                return None
+            time.sleep(poll)
+
+    # -----------------------------
+    # Exportación
+    # -----------------------------
+    def har(self) -> dict:
+        entries = []
+        for e in self.entries():
+            started = datetime.fromtimestamp(e["wall_time"] or time.time(), tz=timezone.utc)
+            entries.append({
+                "startedDateTime": started.isoformat().replace("+00:00", "Z"),
+                "time": e["total_ms"],
+                "request": {
+                    "method": e["method"] or "GET", "url": e["url"], "httpVersion": e["protocol"] or "",
+                    "headers": [], "cookies": [], "headersSize": -1, "bodySize": -1,
+                    "queryString": [{"name": k, "value": v} for k, v in parse_qsl(urlparse(e["url"]).query)],
+                },
+                "response": {
+                    "status": e["status"] or 0, "statusText": e["status_text"], "httpVersion": e["protocol"] or "",
+                    "headers": [{"name": k, "value": str(v)} for k, v in e["headers"].items()],
+                    "cookies": [], "redirectURL": "", "headersSize": -1, "bodySize": e["size"],
+                    "content": {"size": e["size"], "mimeType": e["mime"]},
+                },
+                "cache": {},
+                "timings": e["timings"],
+                "serverIPAddress": e["remote_ip"] or "",
+                "_resourceType": e["type"],
+                "_error": e["error"],
+            })
+        return {"log": {"version": "1.2", "creator": {"name": "network_capture", "version": "1.0"},
+                        "pages": [], "entries": entries}}
+
+    def record_stats(self, stats: dict = None) -> int:
+        """Acumula por endpoint en NETWORK_STATS. Devuelve las requests contadas."""
+        stats = NETWORK_STATS if stats is None else stats
+        n = 0
+        for e in self.entries():
+            if not e["done"]:
+                continue
+            st = stats.setdefault(f"{e['method']} {path_template(e['url'])}",
+                                  {"calls": 0, "total_ms": 0.0, "ttfb_ms": 0.0, "errors": 0})
+            st["calls"] += 1
+            st["total_ms"] += e["total_ms"]
+            st["ttfb_ms"] += e["ttfb_ms"]
+            if e["error"] or (e["status"] or 0) >= 400:
+                st["errors"] += 1
+            n += 1
+        return n
+
+
+def network_lines(stats: dict = None, top: int = 20) -> list:
+    stats = NETWORK_STATS if stats is None else stats
+    rows = sorted(stats.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)[:top]
+    return [
+        f"{endpoint[:60]:<60} llamadas={st['calls']:<5} total={st['total_ms'] / 1000:>7.2f}s "
+        f"promedio={st['total_ms'] / max(1, st['calls']):.0f}ms ttfb={st['ttfb_ms'] / max(1, st['calls']):.0f}ms"
+        + (f" errores={st['errors']}" if st["errors"] else "")
+        for endpoint, st in rows
+    ]
@@ -0,0 +1,144 @@
+"""
+Tiempos por método de page object (opt-in con `--page-timing`).
+
+`instrument_pages()` recorre los módulos de pages/ y envuelve los métodos
+públicos de cada clase (los de BasePage también). Cada llamada:
+- se mide y se acumula por "Clase.metodo", con la clase real del objeto
+  (un `click` de UsersPage cuenta como UsersPage.click);
+- con `--page-timing=steps`, además queda como step de Allure anidado
+  (Allure guarda inicio y fin, así que el reporte muestra la duración).
+
+Al final de la sesión se escribe un resumen con llamadas, total, p50, p95 y
+máximo por método (JSON o CSV según la extensión) y se muestra el top en la
+terminal. Los tiempos son inclusivos: ensure_row_visible incluye los click
+y las esperas que hace adentro.
+"""
+import csv
+import functools
+import importlib
+import inspect
+import json
+import math
+import os
+import pkgutil
+import time
+
+import allure
+
+# "Clase.metodo" -> {"durations": [seg, ...], "errors": n}
+PAGE_TIMINGS = {}
+
+MODES = ("off", "metrics", "steps")
+
+
+def _record(key: str, seconds: float, failed: bool):
+    st = PAGE_TIMINGS.setdefault(key, {"durations": [], "errors": 0})
+    st["durations"].append(seconds)
+    if failed:
+        st["errors"] += 1
+
+
+def _timed(func, name: str, steps: bool):
+    # el nombre del code object lo usa pages.base_page._caller_name para saltarlo
+    @functools.wraps(func)
+    def _page_timing_wrapper(self, *args, **kwargs):
+        key = f"{type(self).__name__}.{name}"
+        t0 = time.perf_counter()
+        failed = True
+        try:
+            if steps:
+                with allure.step(key):
+                    result = func(self, *args, **kwargs)
+            else:
+                result = func(self, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _record(key, time.perf_counter() - t0, failed)
+
+    _page_timing_wrapper._gc_timed = True
+    return _page_timing_wrapper
+
+
+def instrument_class(cls, steps: bool = False) -> int:
+    """Envuelve los métodos públicos definidos en `cls` (no heredados). Idempotente."""
+    wrapped = 0
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(attr) or getattr(attr, "_gc_timed", False):
+            continue  # privados, staticmethod/classmethod/property y ya envueltos
+        setattr(cls, name, _timed(attr, name, steps))
+        wrapped += 1
+    return wrapped
+
+
+def instrument_pages(package: str = "pages", steps: bool = False) -> int:
+    """Instrumenta todas las clases definidas en los módulos de `package`. Devuelve los métodos envueltos."""
+    pkg = importlib.import_module(package)
+    wrapped = 0
+    for info in pkgutil.iter_modules(pkg.__path__):
+        module = importlib.import_module(f"{package}.{info.name}")
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__:
+                wrapped += instrument_class(cls, steps=steps)
+    return wrapped
+
+
+def merge_timings(total: dict, other: dict) -> dict:
+    """Junta lo reportado por un worker de xdist (las duraciones se concatenan)."""
+    for key, st in (other or {}).items():
+        dst = total.setdefault(key, {"durations": [], "errors": 0})
+        dst["durations"].extend(st.get("durations", []))
+        dst["errors"] += st.get("errors", 0)
+    return total
+
+
+# ==========================================================
+# Resumen
+# ==========================================================
+
+def _percentile(sorted_values: list, p: float) -> float:
+    # nearest-rank, como LatencyHistogram.percentile de loadgen
+    return sorted_values[max(1, math.ceil(len(sorted_values) * p / 100.0)) - 1]
+
+
+def summary_rows(stats: dict = None) -> list:
+    stats = PAGE_TIMINGS if stats is None else stats
+    rows = []
+    for key, st in stats.items():
+        durations = sorted(st["durations"])
+        if not durations:
+            continue
+        rows.append({
+            "method": key,
+            "calls": len(durations),
+            "total_sec": round(sum(durations), 3),
+            "p50_sec": round(_percentile(durations, 50), 3),
+            "p95_sec": round(_percentile(durations, 95), 3),
+            "max_sec": round(durations[-1], 3),
+            "errors": st["errors"],
+        })
+    return sorted(rows, key=lambda r: r["total_sec"], reverse=True)
+
+
+def write_summary(path: str, stats: dict = None) -> int:
+    """JSON (lista de filas) o CSV si `path` termina en .csv. Devuelve las filas escritas."""
+    rows = summary_rows(stats)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if path.endswith(".csv"):
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(rows[0]) if rows else ["method"])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(rows, fh, ensure_ascii=False, indent=2)
+    return len(rows)
+
+
+def page_timing_lines(stats: dict = None, top: int = 20) -> list:
+    return [
+        f"{r['method']:<55} llamadas={r['calls']:<5} total={r['total_sec']:>7.2f}s "
+        f"p50={r['p50_sec']:.2f}s p95={r['p95_sec']:.2f}s máx={r['max_sec']:.2f}s"
+        + (f" errores={r['errors']}" if r["errors"] else "")
+        for r in summary_rows(stats)[:top]
+    ]
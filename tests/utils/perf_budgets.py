@@ -0,0 +1,106 @@
+"""
+Presupuestos de rendimiento por ruta (performance_budgets.yaml).
+
+Un test marcado con
+
+    @pytest.mark.perf_budget("/usuarios")       # solo esas rutas
+    @pytest.mark.perf_budget()                  # cualquier ruta con presupuesto
+
+se compara, si pasó la parte funcional, contra las muestras que
+--frontend-metrics tomó durante el test: cada muestra de una ruta con
+presupuesto se revisa métrica por métrica y cada exceso es una violación.
+Según el modo (por ruta, del marker o de --perf-budget-mode) el test falla,
+queda como xfail o solo se reporta. Las métricas que el navegador no
+entregó (None) no se controlan.
+
+Las violaciones de toda la corrida se juntan entre workers y se listan en
+el resumen de la terminal.
+"""
+import fnmatch
+
+MODES = ("fail", "xfail", "warn")
+
+METRICS = ("ttfb_ms", "lcp_ms", "fcp_ms", "load_ms", "duration_ms",
+           "api_calls", "transfer_bytes", "long_tasks", "long_task_ms")
+
+# violaciones de la sesión: {"test", "route", "metric", "value", "limit", "mode"}
+BUDGET_VIOLATIONS = []
+
+
+class BudgetError(ValueError):
+    """performance_budgets.yaml mal formado."""
+
+
+class Budgets:
+    def __init__(self, routes: dict, mode: str = "fail"):
+        self.routes = routes      # patrón de ruta -> {"limits": {métrica: máximo}, "mode"}
+        self.mode = mode
+
+    @classmethod
+    def load(cls, path: str) -> "Budgets":
+        import yaml  # PyYAML (requirements.txt); solo hace falta si hay tests con presupuesto
+
+        with open(path, encoding="utf-8") as fh:
+            data = yaml.safe_load(fh) or {}
+        mode = (data.get("defaults") or {}).get("mode", "fail")
+        if mode not in MODES:
+            raise BudgetError(f"{path}: mode '{mode}' inválido (usar {', '.join(MODES)})")
+        routes = {}
+        for route, spec in (data.get("routes") or {}).items():
+            spec = dict(spec or {})
+            route_mode = spec.pop("mode", None) or mode
+            unknown = set(spec) - set(METRICS)
+            if unknown or route_mode not in MODES:
+                raise BudgetError(f"{path}: ruta {route}: métricas desconocidas {sorted(unknown)} "
+                                  f"o mode '{route_mode}' inválido")
+            routes[route] = {"limits": {k: float(v) for k, v in spec.items()}, "mode": route_mode}
+        return cls(routes, mode)
+
+    def budget_for(self, route: str):
+        """Presupuesto de la ruta: coincidencia exacta primero, después el primer glob."""
+        if route in self.routes:
+            return route, self.routes[route]
+        for pattern, budget in self.routes.items():
+            if fnmatch.fnmatch(route, pattern):
+                return pattern, budget
+        return None, None
+
+    def check(self, samples, routes=(), mode: str = None) -> list:
+        """
+        Violaciones de las muestras (solo de `routes` si se indican, como
+        patrones glob). `mode` pisa el de cada ruta.
+        """
+        violations = []
+        for sample in samples:
+            route = sample.get("route") or ""
+            if routes and not any(fnmatch.fnmatch(route, r) for r in routes):
+                continue
+            pattern, budget = self.budget_for(route)
+            if budget is None:
+                continue
+            for metric, limit in budget["limits"].items():
+                value = sample.get(metric)
+                if value is not None and value > limit:
+                    violations.append({
+                        "test": sample.get("test"), "route": route, "kind": sample.get("kind"),
+                        "metric": metric, "value": value, "limit": limit,
+                        "mode": mode or budget["mode"],
+                    })
+        return violations
+
+
+def effective_mode(violations) -> str:
+    """El más estricto entre las violaciones: fail > xfail > warn."""
+    modes = {v["mode"] for v in violations}
+    return next((m for m in MODES if m in modes), "warn")
+
+
+def describe(v: dict) -> str:
+    unit = "ms" if v["metric"].endswith("_ms") else ""
+    return (f"{v['route']} ({v['kind']}): {v['metric']}={v['value']:.0f}{unit} "
+            f"> presupuesto {v['limit']:.0f}{unit}")
+
+
+def budget_lines(violations: list = None) -> list:
+    violations = BUDGET_VIOLATIONS if violations is None else violations
+    return [f"[{v['mode']:<5}] {describe(v)}  {v.get('test') or ''}" for v in violations]
@@ -0,0 +1,717 @@
+"""
+Ejecutor nativo (sin Newman/Node) de las colecciones de Postman de api_test/.
+
+Carga la colección + el environment y ejecuta cada request con un
+`requests.Session` compartido (keep-alive). Las carpetas de primer nivel
+(USUARIOS, BANCOS, FACULTADES, CICLOS, ...) son independientes entre sí y se
+ejecutan en paralelo; dentro de una carpeta el orden se respeta porque las
+requests se encadenan por variables ({{bank_id}}, {{faculty_id}},
+{{xss_item_id}}, {{hiringRequestId}}, ...).
+
+Los scripts de Postman son JavaScript y no se ejecutan; se interpreta el
+subconjunto que usa esta colección:
+- Autenticación por rol (script de colección): login con user_<rol>/pass_<rol>
+  del environment y token cacheado en token_<rol>. Como en Postman, el auth
+  propio de la request pisa un header Authorization puesto a mano.
+- Variables seteadas en los tests (`pm.*.set('x', expr)`): se resuelve `expr`
+  cuando es un camino sobre el JSON de la respuesta (`res.person.id`,
+  `j.hiringRequest || j.data || j` + `.id`, `responseData[0].id`, ...),
+  también a través de funciones flecha de una línea (`pickId(chosen)` con
+  `const pickId = o => o.facultyId ?? o.id`).
+- Variables seteadas en pre-request: literales, copias de otras variables
+  (`const bankId = pm.environment.get("bank_id")`), más generadores para los
+  valores aleatorios conocidos (RUN_ID, bank_name, xss_payload, ...). Un set
+  dentro de `if (!pm.environment.get("x"))` no pisa un `x` que ya tiene valor.
+- Aserciones: códigos de estado esperados, `to.not.match(/.../)` sobre el
+  texto de la respuesta y `responseTime` máximo.
+
+El resultado de cada request lo consume tests/api/test_postman_collections.py
+(un test de pytest por request, con resultado en Allure).
+"""
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.session_cache import extract_token
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+ROLES = ("admin", "secretaria", "rrhh", "director", "candidato")
+
+# Carpetas que usan datos creados por otra y se ejecutan después de ella
+# (EMPLEADO da por registrada la persona que crea CANDIDATOS en CP_12)
+FOLDER_DEPENDS = {"EMPLEADO": ("CANDIDATOS",)}
+
+_VAR_RE = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+_SET_RE = re.compile(
+    r"pm\.(?:environment|collectionVariables|variables|globals)\.set\(\s*['\"]([\w.-]+)['\"]\s*,\s*(.+)$",
+    re.M,
+)
+# if (!pm.environment.get("x")) { ... set("x", ...) }: solo asigna si no hay valor
+_UNSET_GUARD_RE = re.compile(
+    r"if\s*\(\s*!\s*pm\.(?:environment|collectionVariables|variables|globals)\.get\(\s*['\"]([\w.-]+)['\"]\s*\)\s*\)"
+)
+_DEF_RE = re.compile(r"(?:\b(?:const|let|var)\s+)?\b(\w+)\s*(?<![=!<>])=(?![=>])\s*([^;\n]+)")
+_PATH_RE = re.compile(r"^([A-Za-z_$][\w$]*)((?:\??\.[A-Za-z_$][\w$]*|\[\d+\])*)$")
+_CALL_RE = re.compile(r"^([A-Za-z_$][\w$]*)\((.*)\)$")
+_ARROW_RE = re.compile(r"^\(?\s*([A-Za-z_$][\w$]*)\s*\)?\s*=>\s*(.+)$")
+
+_STATUS_PATTERNS = (
+    re.compile(r"to\.have\.status\(\s*(\d{3})\s*\)"),
+    re.compile(r"\[([\d,\s]+)\]\s*\)\s*\.to\.include\(\s*pm\.response\.code\s*\)"),
+    re.compile(r"pm\.response\.code\s*\)\s*\.to\.(?:be\.)?oneOf\(\s*\[([\d,\s]+)\]"),
+    re.compile(r"pm\.response\.code\s*\)\s*\.to\.(?:eql|equal|eq)\(\s*(\d{3})\s*\)"),
+    re.compile(r"pm\.test\([^\n]*=>\s*pm\.response\.code\s*===?\s*(\d{3})"),
+)
+_NOT_MATCH_RE = re.compile(r"pm\.expect\(\s*([\w.()]+)\s*\)\s*\.to\.not\.match\(\s*/(.+?)/([gimsuy]*)\s*\)")
+_BELOW_RE = re.compile(r"pm\.response\.responseTime\s*\)\s*\.to\.be\.below\(\s*(\d+)\s*\)")
+
+# Valores que en Postman arma un pre-request con Date.now()/Math.random()
+_GENERATORS = {
+    "RUN_ID": lambda: _base36(int(time.time() * 1000)),
+    "randomCode": lambda: str(random.randint(0, 999999)),
+    "timestamp": lambda: str(int(time.time() * 1000)),
+    "today": lambda: date.today().isoformat(),
+    "bank_name": lambda: f"Banco_{random.randint(0, 999999)}",
+    "new_bank_name": lambda: f"Banco_Edit_{random.randint(0, 999999)}",
+    "faculty_name": lambda: f"Facultad_{random.randint(0, 999999)}",
+    "faculty_name_edit": lambda: f"FacultadEdit_{random.randint(0, 999999)}",
+    "xss_payload": lambda: f"<img src=xx onerror=alert(1)>_{int(time.time() * 1000)}",
+    "payload": lambda: "' OR 1=1 --",
+    "codigo_grupo": lambda: f"G{random.randint(0, 9999)}",
+}
+
+# Variables dinámicas de Postman ({{$randomInt}}, ...)
+_DYNAMIC = {
+    "$randomInt": lambda: str(random.randint(0, 1000)),
+    "$timestamp": lambda: str(int(time.time())),
+    "$isoTimestamp": lambda: datetime.now(timezone.utc).isoformat(),
+    "$guid": lambda: str(uuid.uuid4()),
+    "$randomUUID": lambda: str(uuid.uuid4()),
+}
+
+
+def _base36(n: int) -> str:
+    chars = "0123456789abcdefghijklmnopqrstuvwxyz"
+    out = ""
+    while n:
+        n, r = divmod(n, 36)
+        out = chars[r] + out
+    return out or "0"
+
+
+def _script(item: dict, listen: str) -> str:
+    for ev in item.get("event", []) or []:
+        if ev.get("listen") == listen:
+            exec_ = (ev.get("script") or {}).get("exec") or []
+            return "\n".join(exec_) if isinstance(exec_, list) else str(exec_)
+    return ""
+
+
+# ================= Modelo =================
+
+
+class PostmanCase:
+    """Una request de la colección, con su carpeta y scripts."""
+
+    def __init__(self, item: dict, path: tuple, index: int, folder_scripts: list):
+        self.item = item
+        self.request = item.get("request") or {}
+        self.name = item.get("name", "")
+        self.path = path                    # ("EMPLEADO", "CONTRATOS")
+        self.folder = path[0] if path else "(raíz)"
+        self.index = index                  # orden dentro de la carpeta de primer nivel
+        self.prerequest = "\n".join(folder_scripts + [_script(item, "prerequest")])
+        self.test_script = _script(item, "test")
+
+    @property
+    def id(self) -> str:
+        return "/".join(self.path + (self.name,))
+
+    @property
+    def method(self) -> str:
+        return (self.request.get("method") or "GET").upper()
+
+    @property
+    def url_template(self) -> str:
+        url = self.request.get("url") or ""
+        return url.get("raw", "") if isinstance(url, dict) else url
+
+    def expected_status(self) -> set:
+        codes = set()
+        for pattern in _STATUS_PATTERNS:
+            for m in pattern.finditer(self.test_script):
+                codes.update(int(c) for c in re.findall(r"\d{3}", m.group(1)))
+        return codes
+
+    def __repr__(self):
+        return f"PostmanCase({self.id!r})"
+
+
+class PostmanResult:
+    def __init__(self, case: PostmanCase):
+        self.case = case
+        self.method = case.method
+        self.url = ""
+        self.request_headers = {}
+        self.request_body = None
+        self.status = None
+        self.elapsed_sec = 0.0
+        self.response_text = ""
+        self.response_headers = {}
+        self.failures = []       # mensajes de aserciones fallidas
+        self.error = None        # error de red / armado de la request
+        self.skipped = None      # motivo si no se pudo ejecutar
+
+    @property
+    def passed(self) -> bool:
+        return self.skipped is None and self.error is None and not self.failures
+
+
+def folder_group(folder: str) -> str:
+    """Grupo de xdist de una carpeta: el de la carpeta de la que depende, si hay."""
+    deps = FOLDER_DEPENDS.get(folder)
+    return folder_group(deps[0]) if deps else folder
+
+
+def load_collection(path: str) -> list:
+    """Lista de PostmanCase en el orden de la colección."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    cases = []
+    counters = {}
+
+    def walk(items, trail, scripts):
+        for it in items:
+            if "item" in it:
+                walk(it["item"], trail + (it.get("name", ""),), scripts + [_script(it, "prerequest")])
+                continue
+            top = trail[0] if trail else "(raíz)"
+            counters[top] = counters.get(top, 0) + 1
+            cases.append(PostmanCase(it, trail, counters[top], scripts))
+
+    walk(data.get("item", []), (), [_script(data, "prerequest")])
+    return cases
+
+
+def load_environment(path: str) -> dict:
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {v["key"]: v.get("value", "") for v in data.get("values", []) if v.get("enabled", True)}
+
+
+def environment_users(env: dict) -> dict:
+    """
+    Cuentas del environment por rol: pares user_<x>/pass_<x> y <x>_user/<x>_pass
+    (admin2, prueba_login, candidatoA, ...). El rol es el de ROLES con el que
+    empieza <x>; si no hay ninguno, candidato.
+    """
+    keys = {k.replace(" ", "_"): k for k in env}
+    users = {}
+    for key, raw_key in keys.items():
+        if key.startswith("user_"):
+            name, pass_key = key[len("user_"):], "pass_" + key[len("user_"):]
+        elif key.endswith("_user"):
+            name, pass_key = key[:-len("_user")], key[:-len("_user")] + "_pass"
+        else:
+            continue
+        email, password = env[raw_key], env.get(keys.get(pass_key, ""))
+        if email and password:
+            role = next((r for r in ROLES if name.startswith(r)), "candidato")
+            users.setdefault(role, []).append({"email": email, "password": password})
+    return users
+
+
+def collection_variables(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {v["key"]: v.get("value", "") for v in data.get("variable", []) or [] if "key" in v}
+
+
+# ================= Evaluación de expresiones JS simples =================
+
+
+def _set_argument(expr: str) -> str:
+    """Segundo argumento de `pm.*.set('x', expr); // comentario` (lo que capturó _SET_RE)."""
+    expr = re.sub(r"\)\s*;?\s*//.*$", ")", expr.strip())
+    expr = expr.rstrip(";").strip()
+    if expr.endswith(")") and expr.count(")") > expr.count("("):
+        expr = expr[:-1].strip()
+    return expr
+
+
+def _split_top(expr: str, seps=("||", "??")) -> list:
+    parts, depth, buf, i = [], 0, "", 0
+    while i < len(expr):
+        ch = expr[i]
+        if ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+        if depth == 0 and any(expr.startswith(s, i) for s in seps):
+            parts.append(buf)
+            buf = ""
+            i += 2
+            continue
+        buf += ch
+        i += 1
+    parts.append(buf)
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _walk_path(value, path: str):
+    for token in re.findall(r"\.([A-Za-z_$][\w$]*)|\[(\d+)\]", path):
+        key, idx = token
+        if value is None:
+            return None
+        if key:
+            value = value.get(key) if isinstance(value, dict) else None
+        else:
+            i = int(idx)
+            value = value[i] if isinstance(value, list) and i < len(value) else None
+    return value
+
+
+class _ScriptEval:
+    """Resuelve `expr` de `pm.*.set('x', expr)` contra el JSON de la respuesta."""
+
+    def __init__(self, script: str, response_json, response_text: str, scope: dict):
+        # `const x =\n  a ||\n  b;` -> una sola línea
+        script = re.sub(r"(\|\||\?\?|&&|=)\s*\n\s*", r"\1 ", script)
+        self.defs = {}
+        for m in _DEF_RE.finditer(script):
+            self.defs.setdefault(m.group(1), []).append(m.group(2).strip())
+        self.json = response_json
+        self.text = response_text
+        self.scope = scope
+        self.locals = {}    # parámetro de la función flecha que se está evaluando
+
+    def eval(self, expr: str, depth: int = 0):
+        if depth > 6:
+            return None
+        expr = expr.strip().rstrip(";").strip()
+        for alt in _split_top(expr):
+            value = self._eval_one(alt, depth)
+            if value not in (None, "", {}, []):
+                return value
+        return None
+
+    def _eval_one(self, expr: str, depth: int):
+        conj = _split_top(expr, seps=("&&",))
+        if len(conj) > 1:
+            values = [self.eval(c, depth + 1) for c in conj]
+            return values[-1] if all(values) else None
+        # envoltorios habituales
+        m = re.match(r"^(?:String|Number)\((.*)\)$", expr)
+        if m:
+            v = self.eval(m.group(1), depth + 1)
+            return None if v is None else (str(v) if expr.startswith("String") else v)
+        if expr.endswith(".toString()"):
+            v = self.eval(expr[: -len(".toString()")], depth + 1)
+            return None if v is None else str(v)
+        if expr.startswith("(") and expr.endswith(")"):
+            return self.eval(expr[1:-1], depth + 1)
+
+        # literales
+        if re.match(r"^(['\"]).*\1$", expr):
+            return expr[1:-1]
+        if re.match(r"^-?\d+(\.\d+)?$", expr):
+            return expr
+        if expr in ("true", "false"):
+            return expr
+
+        if expr.startswith("pm.response.json()"):
+            return _walk_path(self.json, expr[len("pm.response.json()"):])
+        m = re.match(r"^pm\.(?:environment|collectionVariables|variables)\.get\(\s*['\"]([\w.-]+)['\"]\s*\)$", expr)
+        if m:
+            return self.scope.get(m.group(1))
+
+        m = _CALL_RE.match(expr)
+        if m:
+            return self._call(m.group(1), m.group(2), depth)
+
+        m = _PATH_RE.match(expr)
+        if not m:
+            return None
+        ident, rest = m.group(1), m.group(2).replace("?.", ".")
+        if ident in self.locals:
+            return _walk_path(self.locals[ident], rest) if rest else self.locals[ident]
+        for definition in reversed(self.defs.get(ident, [])):
+            if definition.startswith(ident):
+                continue
+            base = self.eval(definition, depth + 1)
+            if base not in (None, "", {}, []):
+                return _walk_path(base, rest) if rest else base
+        return None
+
+    def _call(self, ident: str, arg: str, depth: int):
+        """`pickId(chosen)` con `const pickId = obj => obj.facultyId ?? obj.id`."""
+        for definition in reversed(self.defs.get(ident, [])):
+            m = _ARROW_RE.match(definition)
+            if not m:
+                continue
+            param, body = m.groups()
+            outer = dict(self.locals)
+            self.locals[param] = self.eval(arg, depth + 1)
+            try:
+                return self.eval(body, depth + 1)
+            finally:
+                self.locals = outer
+        return None
+
+
+# ================= Ejecución =================
+
+
+class PostmanRunner:
+    def __init__(self, collection_path: str, environment_path: str = None,
+                 workers: int = 4, timeout: int = 30, pool_size: int = 16, overrides: dict = None):
+        self.collection_path = collection_path
+        self.cases = load_collection(collection_path)
+        self.base_scope = {
+            **collection_variables(collection_path),
+            **load_environment(environment_path),
+            **(overrides or {}),   # p. ej. base_url del backend simulado
+        }
+        # Algunas requests tienen la URL escrita a mano en lugar de {{base_url}}:
+        # si se cambia base_url, esas también se redirigen.
+        env_base = str(load_environment(environment_path).get("base_url") or "").rstrip("/")
+        new_base = str((overrides or {}).get("base_url") or "").rstrip("/")
+        self._rebase = (env_base, new_base) if env_base and new_base and env_base != new_base else None
+        self.workers = max(1, int(workers))
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._tokens = {}
+        self._token_lock = threading.Lock()
+        self._folder_locks = {}
+        self._folders_done = {}        # carpeta -> {case.id: PostmanResult}
+        self._executor = None
+        self._futures = {}
+
+    # -----------------------------
+    # API para los tests
+    # -----------------------------
+    def folders(self, cases=None) -> list:
+        seen = []
+        for c in cases or self.cases:
+            if c.folder not in seen:
+                seen.append(c.folder)
+        return seen
+
+    def prefetch(self, folders):
+        """Arranca en paralelo las carpetas indicadas (no bloquea)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="postman")
+        for folder in folders:
+            if folder not in self._futures:
+                self._futures[folder] = self._executor.submit(self.run_folder, folder)
+
+    def result(self, case: PostmanCase) -> PostmanResult:
+        future = self._futures.get(case.folder)
+        results = future.result() if future is not None else self.run_folder(case.folder)
+        return results[case.id]
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.session.close()
+
+    # -----------------------------
+    # Carpetas
+    # -----------------------------
+    def run_folder(self, folder: str) -> dict:
+        for dep in FOLDER_DEPENDS.get(folder, ()):
+            if any(c.folder == dep for c in self.cases):
+                self.run_folder(dep)
+        lock = self._folder_locks.setdefault(folder, threading.Lock())
+        with lock:
+            if folder in self._folders_done:
+                return self._folders_done[folder]
+            scope = dict(self.base_scope)
+            results = {}
+            for case in (c for c in self.cases if c.folder == folder):
+                results[case.id] = self.run_case(case, scope)
+            self._folders_done[folder] = results
+            return results
+
+    # -----------------------------
+    # Variables
+    # -----------------------------
+    def _apply_prerequest(self, case: PostmanCase, scope: dict):
+        guarded = set(_UNSET_GUARD_RE.findall(case.prerequest))
+        for name, expr in _SET_RE.findall(case.prerequest):
+            if name in guarded and scope.get(name) not in (None, ""):
+                continue
+            expr = _set_argument(expr)
+            literal = re.match(r"^(['\"])(.*)\1$", expr)
+            if literal:
+                scope[name] = literal.group(2)
+            elif name in _GENERATORS:
+                scope[name] = _GENERATORS[name]()
+            elif name.startswith("token"):
+                # p. ej. token = pm.environment.get("token_admin")
+                m = re.search(r"get\(\s*['\"](token_\w+)['\"]", expr)
+                if m:
+                    scope[name] = self._lookup(m.group(1), scope, case)
+            else:
+                # p. ej. const bankId = pm.environment.get("bank_id"); pm.environment.set("bankId", bankId)
+                value = _ScriptEval(case.prerequest, None, "", scope).eval(expr)
+                if value is not None:
+                    scope[name] = value
+
+    def _role(self, scope: dict) -> str:
+        role = str(scope.get("role") or "admin").strip().lower()
+        return role if role in ROLES else "admin"
+
+    @staticmethod
+    def _token_role(name: str, scope: dict):
+        """Rol detrás de una variable de token: token_<rol> con user_<rol> en el environment."""
+        role = name[len("token_"):] if name.startswith("token_") else None
+        if role and (role.lower() in ROLES or scope.get(f"user_{role}")):
+            return role
+        return None
+
+    def _lookup(self, name: str, scope: dict, case: PostmanCase) -> str:
+        if name in _DYNAMIC:
+            return _DYNAMIC[name]()
+        value = scope.get(name)
+        if value not in (None, ""):
+            return str(value)
+        if name in _GENERATORS:
+            scope[name] = _GENERATORS[name]()
+            return scope[name]
+        if name == "token":
+            return self.token_for(self._role(scope), scope) or ""
+        role = self._token_role(name, scope)
+        if role:
+            return self.token_for(role, scope) or ""
+        return ""
+
+    def resolve(self, text: str, scope: dict, case: PostmanCase) -> str:
+        if not text:
+            return text
+        return _VAR_RE.sub(lambda m: self._lookup(m.group(1), scope, case), text)
+
+    # -----------------------------
+    # Autenticación por rol
+    # -----------------------------
+    def token_for(self, role: str, scope: dict, fresh: bool = False):
+        """
+        Token del rol, compartido por todas las carpetas. Con `fresh=True` hace
+        un login propio que no se cachea (para requests que lo invalidan).
+        """
+        with self._token_lock:
+            if role in self._tokens and not fresh:
+                return self._tokens[role]
+            email = scope.get(f"user_{role}")
+            password = scope.get(f"pass_{role}")
+            base = str(scope.get("base_url") or "").rstrip("/")
+            if not (email and password and base):
+                return None
+            try:
+                resp = self.session.post(
+                    base + "/auth/login",
+                    json={"email": email, "password": password},
+                    headers={"Accept": "application/json"},
+                    timeout=self.timeout,
+                )
+            except requests.RequestException:
+                return None
+            token = extract_token(resp) if resp.ok else None
+            if token and not fresh:
+                self._tokens[role] = token
+            return token
+
+    def _isolate_logout(self, case: PostmanCase, scope: dict):
+        """
+        Un logout con el token compartido dejaría sin sesión a las carpetas que
+        corren en paralelo: la variable de token que usa se llena con un login
+        propio, y la request siguiente ("el token ya no es válido") usa ese mismo.
+        """
+        auth = case.request.get("auth") or {}
+        entries = {b.get("key"): b.get("value") for b in auth.get("bearer", [])}
+        names = _VAR_RE.findall(entries.get("token", "") or "")
+        name = names[0] if names else "token"
+        role = self._role(scope) if name == "token" else self._token_role(name, scope)
+        if role:
+            token = self.token_for(role, scope, fresh=True)
+            if token:
+                scope[name] = token
+
+    # -----------------------------
+    # Request
+    # -----------------------------
+    def _auth_header(self, case: PostmanCase, scope: dict, url: str):
+        auth = case.request.get("auth")
+        if auth and auth.get("type") == "noauth":
+            return None
+        if re.search(r"/auth/login(\b|/|\?|$)", url):
+            return None
+        if auth and auth.get("type") == "bearer":
+            entries = {b.get("key"): b.get("value") for b in auth.get("bearer", [])}
+            token = self.resolve(entries.get("token", ""), scope, case)
+            if token:
+                return f"Bearer {token}"
+        token = self.token_for(self._role(scope), scope)
+        return f"Bearer {token}" if token else None
+
+    def _body(self, case: PostmanCase, scope: dict):
+        body = case.request.get("body") or {}
+        mode = body.get("mode")
+        if mode == "raw":
+            raw = self.resolve(body.get("raw", ""), scope, case)
+            # la colección tiene comentarios // dentro de algunos JSON
+            raw = re.sub(r"(?m)\s//[^\n\"]*$", "", raw)
+            return {"data": raw.encode("utf-8")} if raw.strip() else {}
+        if mode == "urlencoded":
+            return {"data": {
+                p["key"]: self.resolve(p.get("value", ""), scope, case)
+                for p in body.get("urlencoded", []) if not p.get("disabled")
+            }}
+        if mode == "formdata":
+            data, files = {}, {}
+            for p in body.get("formdata", []):
+                if p.get("disabled"):
+                    continue
+                if p.get("type") == "file":
+                    files[p["key"]] = self._file_for(p.get("src"))
+                else:
+                    data[p["key"]] = self.resolve(p.get("value", ""), scope, case)
+            return {"data": data, "files": files}
+        return {}
+
+    @staticmethod
+    def _file_for(src):
+        # Las rutas de la colección son de la máquina de quien la exportó
+        if isinstance(src, list):
+            src = src[0] if src else None
+        if not (src and os.path.exists(src)):
+            src = os.path.join(_ROOT, "fixtures", "acuerdo_demo.pdf")
+        if os.path.exists(src):
+            with open(src, "rb") as f:
+                return (os.path.basename(src), f.read(), "application/pdf")
+        return ("documento.pdf", b"%PDF-1.4\n%%EOF\n", "application/pdf")
+
+    def run_case(self, case: PostmanCase, scope: dict) -> PostmanResult:
+        res = PostmanResult(case)
+
+        if "pm.request.body.update" in case.prerequest and not (case.request.get("body") or {}).get("raw", "").strip():
+            res.skipped = "El body lo arma el pre-request en JavaScript; no se puede reproducir."
+            return res
+
+        try:
+            self._apply_prerequest(case, scope)
+            if re.search(r"/auth/logout\b", case.url_template):
+                self._isolate_logout(case, scope)
+            url = self.resolve(case.url_template, scope, case)
+            if self._rebase and url.startswith(self._rebase[0]):
+                url = self._rebase[1] + url[len(self._rebase[0]):]
+            res.url = url
+
+            headers = {"Accept": "application/json"}
+            for h in case.request.get("header", []) or []:
+                if not h.get("disabled"):
+                    headers[h["key"]] = self.resolve(h.get("value", ""), scope, case)
+            if scope.get("contractVersion"):
+                headers["X-Contract-Version"] = str(scope["contractVersion"])
+
+            body = self._body(case, scope)
+            if "data" in body and isinstance(body["data"], bytes):
+                headers.setdefault("Content-Type", "application/json")
+
+            auth = self._auth_header(case, scope, url)
+            # como en Postman, el auth propio de la request pisa un Authorization
+            # puesto a mano en los headers (CP_85: header de admin, auth de rrhh)
+            own_auth = (case.request.get("auth") or {}).get("type") == "bearer"
+            manual = [k for k, v in headers.items() if k.lower() == "authorization" and v.strip() not in ("", "Bearer")]
+            if auth and (own_auth or not manual):
+                for k in manual:
+                    del headers[k]
+                headers["Authorization"] = auth
+            res.request_headers = {k: ("Bearer ***" if k.lower() == "authorization" else v) for k, v in headers.items()}
+            res.request_body = body.get("data")
+        except Exception as e:
+            res.error = f"No se pudo armar la request: {e}"
+            return res
+
+        t0 = time.perf_counter()
+        try:
+            resp = self.session.request(case.method, url, headers=headers, timeout=self.timeout, **body)
+        except requests.RequestException as e:
+            res.elapsed_sec = time.perf_counter() - t0
+            res.error = f"{type(e).__name__}: {e}"
+            return res
+        res.elapsed_sec = time.perf_counter() - t0
+        res.status = resp.status_code
+        res.response_text = resp.text
+        res.response_headers = dict(resp.headers)
+
+        try:
+            response_json = resp.json()
+        except ValueError:
+            response_json = None
+
+        self._check(case, res, response_json)
+        self._capture(case, scope, response_json, res.response_text)
+        return res
+
+    # -----------------------------
+    # Aserciones y variables de salida
+    # -----------------------------
+    def _check(self, case: PostmanCase, res: PostmanResult, response_json):
+        expected = case.expected_status()
+        if expected:
+            if res.status not in expected:
+                res.failures.append(f"Status {res.status}, se esperaba uno de {sorted(expected)}")
+        elif res.status >= 500:
+            res.failures.append(f"Status {res.status} (error del servidor)")
+
+        text_aliases = {"pm.response.text()"}
+        for m in re.finditer(r"\b(\w+)\s*=\s*pm\.response\.text\(\)", case.test_script):
+            text_aliases.add(m.group(1))
+        for subject, pattern, flags in _NOT_MATCH_RE.findall(case.test_script):
+            if subject.replace(".toLowerCase()", "") not in text_aliases:
+                continue
+            re_flags = re.IGNORECASE if "i" in flags else 0
+            try:
+                if re.search(pattern, res.response_text, re_flags):
+                    res.failures.append(f"La respuesta coincide con /{pattern}/{flags}")
+            except re.error:
+                pass
+
+        for limit in _BELOW_RE.findall(case.test_script):
+            if res.elapsed_sec * 1000 >= int(limit):
+                res.failures.append(f"Tiempo de respuesta {res.elapsed_sec * 1000:.0f} ms >= {limit} ms")
+
+    def _capture(self, case: PostmanCase, scope: dict, response_json, response_text: str):
+        sets = _SET_RE.findall(case.test_script)
+        if not sets:
+            return
+        ev = _ScriptEval(case.test_script, response_json, response_text, scope)
+        for name, expr in sets:
+            expr = _set_argument(expr)
+            value = ev.eval(expr)
+            if value is not None:
+                scope[name] = value
+                # token_<rol> obtenido por un login de la colección: reutilizarlo
+                role = self._token_role(name, scope)
+                if role:
+                    with self._token_lock:
+                        self._tokens.setdefault(role, str(value))
@@ -0,0 +1,251 @@
+"""
+Aprovisionamiento de solicitudes de contratación para la cadena de test_15.
+
+Cada etapa del flujo (cp30 → cp31 → cp33 → cp34 → cp35 → cp40 → cp41 → cp42)
+necesita una solicitud en un estado concreto. La etapa la obtiene así:
+
+1. Si en este mismo worker la etapa anterior ya terminó, toma la solicitud
+   que esa etapa dejó publicada (mismo comportamiento que el viejo
+   `cod_cache`, pero con una clave por worker y por estado).
+2. Si no hay ninguna, la crea por API y la avanza hasta el estado pedido
+   con los mismos endpoints de la colección de Postman.
+
+Así los tests se pueden repartir entre workers de pytest-xdist: cada uno
+prepara su propia precondición y nadie pisa el código de otro.
+"""
+import os
+from contextlib import contextmanager
+from datetime import date
+
+import requests
+
+# Estados del flujo en orden. Cada uno indica cómo queda la solicitud
+# DESPUÉS de la etapa que lo produce.
+STATES = (
+    "creada",               # cp30: Director crea la solicitud (cabecera)
+    "con_detalle",          # cp31: Director agrega candidato/carga/compensación
+    "enviada_rrhh",         # cp33: Director envía a RRHH
+    "validada_rrhh",        # cp34: RRHH valida sin observaciones
+    "enviada_secretaria",   # cp35: Director envía a Secretaría (genera PDF)
+    "acuerdo_subido",       # cp41: Asistente recibe y sube el acuerdo de Junta
+)
+
+# PDF mínimo válido para el acuerdo de Junta
+MIN_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Count 1/Kids[3 0 R]>>endobj\n"
+    b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n"
+    b"xref\n0 4\n0000000000 65535 f \n"
+    b"0000000010 00000 n \n0000000061 00000 n \n0000000112 00000 n \n"
+    b"trailer<</Size 4/Root 1 0 R>>\nstartxref\n164\n%%EOF\n"
+)
+
+
+class PreconditionUnavailable(Exception):
+    """No se pudo llegar al API para preparar la precondición (red, timeout)."""
+
+
+@contextmanager
+def _api_reachable(what: str):
+    """Solo la falta de conexión es "precondición no disponible"; un error del API se propaga."""
+    try:
+        yield
+    except (requests.ConnectionError, requests.Timeout) as e:
+        raise PreconditionUnavailable(f"{what}: API no disponible ({e})") from e
+
+
+def worker_id() -> str:
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def _root(j: dict, *keys) -> dict:
+    """Las respuestas vienen envueltas de distintas formas (hiringRequest, data, ...)."""
+    for k in keys:
+        if isinstance(j.get(k), dict):
+            return j[k]
+    return j
+
+
+class Solicitud:
+    def __init__(self, code: str, state: str, id=None, source: str = "ui"):
+        self.code = code
+        self.state = state
+        self.id = id
+        self.source = source   # "ui" (etapa anterior) o "api" (aprovisionada)
+
+    def __repr__(self):
+        return f"Solicitud({self.code!r}, {self.state!r}, source={self.source!r})"
+
+
+class SolicitudProvisioner:
+    """
+    `cache` es el `config.cache` de pytest: las solicitudes publicadas se
+    guardan bajo `gc/solicitudes/<worker>` para que una etapa corrida en otra
+    invocación (p. ej. `-k cp31` después de `-k cp30`) también las encuentre.
+    """
+
+    def __init__(self, api, cache=None, worker: str = None, payloads: dict = None):
+        self.api = api
+        self.cache = cache
+        self.worker = worker or worker_id()
+        self.payloads = payloads or default_payloads()
+        self._pending = self._load()   # estado -> [ {code, id}, ... ]
+        self.stats = {"handoffs": 0, "provisioned": 0}
+
+    # -----------------------------
+    # Handoff entre etapas
+    # -----------------------------
+    @property
+    def _cache_key(self) -> str:
+        return f"gc/solicitudes/{self.worker}"
+
+    def _load(self) -> dict:
+        if self.cache is None:
+            return {}
+        return self.cache.get(self._cache_key, {}) or {}
+
+    def _save(self):
+        if self.cache is not None:
+            self.cache.set(self._cache_key, self._pending)
+
+    def publish(self, sol_or_code, state: str, id=None):
+        """La etapa que terminó bien deja la solicitud lista para la siguiente."""
+        assert state in STATES, f"Estado desconocido: {state}"
+        if isinstance(sol_or_code, Solicitud):
+            code, id = sol_or_code.code, sol_or_code.id
+        else:
+            code = sol_or_code
+        self._pending.setdefault(state, []).append({"code": code, "id": id})
+        self._save()
+
+    def peek(self, state: str):
+        """Solicitud publicada en `state` sin consumirla (o None)."""
+        items = self._pending.get(state) or []
+        if not items:
+            return None
+        return Solicitud(items[-1]["code"], state, items[-1].get("id"))
+
+    def take(self, state: str):
+        items = self._pending.get(state) or []
+        if not items:
+            return None
+        item = items.pop()
+        self._save()
+        self.stats["handoffs"] += 1
+        return Solicitud(item["code"], state, item.get("id"))
+
+    def obtain(self, state: str) -> Solicitud:
+        """
+        Devuelve una solicitud en `state`: la que dejó la etapa anterior en
+        este worker o, si no hay, una nueva creada y avanzada por API.
+        """
+        sol = self.take(state)
+        if sol is not None:
+            return sol
+        return self.provision(state)
+
+    # -----------------------------
+    # Aprovisionamiento por API
+    # -----------------------------
+    def provision(self, state: str) -> Solicitud:
+        assert state in STATES, f"Estado desconocido: {state}"
+        with _api_reachable(f"solicitud en estado '{state}'"):
+            sol = self._create()
+            for next_state in STATES[1:STATES.index(state) + 1]:
+                getattr(self, f"_to_{next_state}")(sol)
+                sol.state = next_state
+        self.stats["provisioned"] += 1
+        return sol
+
+    def candidate_name(self) -> str:
+        """
+        Nombre con el que se busca en la UI (primer y segundo nombre) al
+        candidato que usa la etapa con_detalle (CONTRACT_PERSON_ID), leído
+        por API.
+        """
+        person_id = self.payloads["detail_spnp"]["person_id"]
+        with _api_reachable(f"candidato {person_id}"):
+            j = self.api.get(f"/persons/{person_id}", "director")
+        root = _root(j, "person", "data")
+        name = f"{root.get('first_name') or ''} {root.get('middle_name') or ''}".strip()
+        assert name, f"GET /persons/{person_id} no devolvió nombre: {j}"
+        return name
+
+    def _create(self) -> Solicitud:
+        j = self.api.post("/hiringRequest", "director", json=self.payloads["hiring_request"])
+        root = _root(j, "hiringRequest", "data")
+        assert root.get("id") and root.get("code"), f"POST /hiringRequest no devolvió id/código: {j}"
+        return Solicitud(root["code"], "creada", root["id"], source="api")
+
+    def _to_con_detalle(self, sol):
+        self.api.post(f"/hiringRequest/{sol.id}/details/SPNP", "director", json=self.payloads["detail_spnp"])
+
+    def _to_enviada_rrhh(self, sol):
+        self.api.post(f"/hiringRequest/{sol.id}/sendToHR", "director")
+
+    def _to_validada_rrhh(self, sol):
+        self.api.post(
+            f"/hiringRequest/{sol.id}/validateHR", "rrhh",
+            json={"validated": True, "comments": "Validada por aprovisionamiento de QA."},
+        )
+
+    def _to_enviada_secretaria(self, sol):
+        self.api.get(f"/hiringRequestSPNP/{sol.id}/create/PDF/store", "director")
+
+    def _to_acuerdo_subido(self, sol):
+        self.api.put(
+            f"/hiringRequest/{sol.id}/secretary/reception", "asistente",
+            json={"comments": "Recibida por aprovisionamiento de QA."},
+        )
+        self.api.post(
+            f"/hiringRequest/{sol.id}/agreement", "asistente",
+            data={
+                "code": f"AJ-QA-{sol.id}",
+                "approved": "1",
+                "agreed_on": date.today().isoformat(),
+                "comments": "Acta cargada por aprovisionamiento de QA.",
+            },
+            files={"file": ("acuerdo_demo.pdf", MIN_PDF, "application/pdf")},
+        )
+
+
+def default_payloads() -> dict:
+    """
+    Cuerpos de las llamadas, iguales a los de la colección de Postman.
+    Los IDs de catálogo se pueden cambiar por .env sin tocar el código.
+    """
+    env = os.getenv
+    return {
+        "hiring_request": {
+            "contract_type_id": int(env("CONTRACT_TYPE_ID", "3")),
+            "school_id": int(env("CONTRACT_SCHOOL_ID", "8")),
+            "modality": env("CONTRACT_MODALITY", "Modalidad Presencial"),
+            "message": "Solicitud creada por aprovisionamiento de QA",
+        },
+        "detail_spnp": {
+            "start_date": env("CONTRACT_START_DATE", "2025-06-01"),
+            "finish_date": env("CONTRACT_FINISH_DATE", "2025-11-09"),
+            "person_id": int(env("CONTRACT_PERSON_ID", "118")),
+            "groups": [
+                {
+                    "group_id": int(env("CONTRACT_GROUP_ID", "225")),
+                    "hourly_rate": 15,
+                    "weekly_hours": 4,
+                }
+            ],
+            "position_activities": [
+                {
+                    "position_id": int(env("CONTRACT_POSITION_ID", "4")),
+                    "activities": [
+                        "Impartir clases teoricas de la asignatura",
+                        "Preparar material de apoyo de asignatura",
+                        "Elaborar evaluaciones de asignatura",
+                        "Administrar evaluaciones de asignatura",
+                        "Calificar evaluaciones de asignatura",
+                        "Atender consultas de asignatura",
+                    ],
+                }
+            ],
+        },
+    }
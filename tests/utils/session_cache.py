@@ -0,0 +1,236 @@
+"""
+Caché de sesiones autenticadas por rol.
+
+La primera vez que un test pide un rol, se hace login (por UI o por API) y se
+guarda una "foto" de la sesión: cookies + localStorage + sessionStorage.
+Los siguientes tests del mismo worker inyectan esa foto en su navegador y
+entran directo a la ruta que necesitan, sin pasar por el formulario de login.
+
+La entrada se descarta cuando:
+- el API responde 401 al validar el token (se consulta en cada hit, antes
+  de inyectar la foto),
+- la app redirige al login (token vencido o invalidado por un logout),
+- supera el TTL configurado.
+"""
+import time
+from urllib.parse import urlparse
+
+import requests
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from pages.frontend_metrics import record_navigation, tag_role
+from pages.login_page import LoginPage
+
+
+class SessionSnapshot:
+    def __init__(self, role, email, cookies, local_storage, session_storage):
+        self.role = role
+        self.email = email
+        self.cookies = cookies or []
+        self.local_storage = local_storage or {}
+        self.session_storage = session_storage or {}
+        self.created_at = time.time()
+
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+
+class SessionCache:
+    # misma señal que LoginPage.is_logged_in
+    APP_LAYOUT = (By.CSS_SELECTOR, "[data-test='user-badge'], .ant-layout")
+
+    # JS que devuelve ambos storages en un solo round-trip
+    _DUMP_STORAGE_JS = """
+        const dump = (s) => { const o = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); o[k] = s.getItem(k); } return o; };
+        return [dump(window.localStorage), dump(window.sessionStorage)];
+    """
+    _LOAD_STORAGE_JS = """
+        const [local, session] = arguments;
+        for (const k in local) window.localStorage.setItem(k, local[k]);
+        for (const k in session) window.sessionStorage.setItem(k, session[k]);
+    """
+
+    def __init__(self, base_url, api_url="", mode="ui", token_key="token",
+                 ttl_sec=1800, bootstrap_path="/favicon.ico"):
+        self.base_url = base_url.rstrip("/")
+        self.api_url = (api_url or "").rstrip("/")
+        self.mode = mode
+        self.token_key = token_key
+        self.ttl_sec = ttl_sec
+        # ruta liviana del mismo origen para poder escribir cookies/storage
+        # sin arrancar la SPA completa
+        self.bootstrap_path = bootstrap_path
+        self._entries = {}   # (role, email) -> SessionSnapshot
+        self.stats = {}      # rol -> {"hits", "logins", "expired"} (plano: DriverPool.merge_stats)
+
+    def _count(self, role: str, key: str):
+        st = self.stats.setdefault(role, {"hits": 0, "logins": 0, "expired": 0})
+        st[key] += 1
+
+    # -----------------------------
+    # API pública
+    # -----------------------------
+    def get(self, role: str, creds: dict):
+        """Devuelve la foto vigente del rol o None si hay que loguearse."""
+        key = (role, creds["email"])
+        snap = self._entries.get(key)
+        if snap is None:
+            return None
+        if self.ttl_sec and snap.age() > self.ttl_sec:
+            self.invalidate(role, creds)
+            return None
+        return snap
+
+    def invalidate(self, role: str, creds: dict):
+        if self._entries.pop((role, creds["email"]), None) is not None:
+            self._count(role, "expired")
+
+    def login(self, driver, role: str, creds: dict) -> SessionSnapshot:
+        """Hace login (UI o API) y guarda la foto de la sesión resultante."""
+        if self.mode == "api":
+            snap = self._login_api(role, creds)
+        else:
+            snap = self._login_ui(driver, role, creds)
+        self._entries[(role, creds["email"])] = snap
+        self._count(role, "logins")
+        return snap
+
+    def inject(self, driver, snap: SessionSnapshot):
+        """Carga cookies y storage de la foto en el navegador (mismo origen)."""
+        driver.get(self.base_url + self.bootstrap_path)
+        host = urlparse(self.base_url).hostname
+        for c in snap.cookies:
+            cookie = {k: v for k, v in c.items() if k in ("name", "value", "path", "secure", "httpOnly", "expiry", "sameSite")}
+            if c.get("domain") and host and host.endswith(c["domain"].lstrip(".")):
+                cookie["domain"] = c["domain"]
+            try:
+                driver.add_cookie(cookie)
+            except Exception:
+                pass
+        driver.execute_script(self._LOAD_STORAGE_JS, snap.local_storage, snap.session_storage)
+
+    def open_as(self, driver, role: str, creds: dict, path: str = "/"):
+        """
+        Deja el navegador autenticado como `role` y parado en `path`.
+        Si la foto cacheada ya no sirve (redirige al login), se descarta y se
+        repite el login una sola vez.
+        """
+        snap = self.get(role, creds)
+        if snap is not None and not self.token_is_valid(role, creds):
+            snap = None  # 401 del API: ya se descartó la entrada
+        if snap is not None:
+            self.inject(driver, snap)
+            driver.get(self._url(path))
+            if not self._redirected_to_login(driver):
+                self._count(role, "hits")
+                tag_role(driver, role)
+                record_navigation(driver, owner="SessionCache", role=role)
+                return driver
+            self.invalidate(role, creds)
+
+        snap = self.login(driver, role, creds)
+        if self.mode == "api":
+            self.inject(driver, snap)
+        driver.get(self._url(path))
+        assert not self._redirected_to_login(driver), f"No se pudo iniciar sesión como {role}."
+        tag_role(driver, role)
+        record_navigation(driver, owner="SessionCache", role=role)
+        return driver
+
+    def token_is_valid(self, role: str, creds: dict, probe_path: str = "/users/me/has-registered") -> bool:
+        """
+        Valida el token contra el API; si responde 401 expira la entrada.
+        Sin token en la foto, sin API_URL o con el API inaccesible no se puede
+        saber: se da por válido y decide la redirección al login.
+        """
+        snap = self.get(role, creds)
+        token = snap.local_storage.get(self.token_key) if snap else None
+        if not token or not self.api_url:
+            return snap is not None
+        try:
+            resp = requests.get(
+                self.api_url + probe_path,
+                headers={"Authorization": f"Bearer {token}", "Accept": "application/json"},
+                timeout=10,
+            )
+        except requests.RequestException:
+            return True
+        if resp.status_code == 401:
+            self.invalidate(role, creds)
+            return False
+        return True
+
+    # -----------------------------
+    # Login
+    # -----------------------------
+    def _login_ui(self, driver, role, creds) -> SessionSnapshot:
+        login = LoginPage(driver, self.base_url)
+        login.open_login()
+        login.login_as(creds["email"], creds["password"])
+        assert login.is_logged_in(), f"No se pudo iniciar sesión como {role}."
+        return self.capture(driver, role, creds["email"])
+
+    def _login_api(self, role, creds) -> SessionSnapshot:
+        assert self.api_url, "Falta API_URL en el .env para el login por API"
+        resp = requests.post(
+            self.api_url + "/auth/login",
+            json={"email": creds["email"], "password": creds["password"]},
+            headers={"Accept": "application/json"},
+            timeout=15,
+        )
+        assert resp.status_code == 200, f"Login API como {role} devolvió {resp.status_code}"
+        token = extract_token(resp)
+        assert token, f"El login API como {role} no devolvió token"
+        return SessionSnapshot(role, creds["email"], [], {self.token_key: token}, {})
+
+    def capture(self, driver, role, email) -> SessionSnapshot:
+        local, session = driver.execute_script(self._DUMP_STORAGE_JS)
+        return SessionSnapshot(role, email, driver.get_cookies(), local, session)
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _url(self, path: str) -> str:
+        return self.base_url + "/" + path.lstrip("/")
+
+    def _redirected_to_login(self, driver, timeout: int = 10) -> bool:
+        # La SPA decide la redirección después del primer render: esperar a que
+        # aparezca el formulario de login o el layout autenticado.
+        login = LoginPage(driver, self.base_url)
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: login.is_login_screen() or d.find_elements(*self.APP_LAYOUT)
+            )
+        except TimeoutException:
+            pass
+        return login.is_login_screen()
+
+
+def extract_token(resp):
+    """Mismas variantes que usa el pre-request de la colección de Postman."""
+    try:
+        d = resp.json() or {}
+    except ValueError:
+        d = {}
+    token = (
+        d.get("token")
+        or d.get("access_token")
+        or (d.get("data") or {}).get("token")
+        or d.get("api_token")
+        or (d.get("user") or {}).get("api_token")
+    )
+    if not token:
+        h = resp.headers.get("Authorization", "")
+        if h.lower().startswith("bearer "):
+            token = h[7:].strip()
+    return token
+
+
+def session_cache_lines(stats: dict) -> list:
+    rows = sorted(stats.items())
+    return [
+        f"{role:<12} hits={st['hits']:<5} logins={st['logins']:<4} expiradas={st['expired']}"
+        for role, st in rows
+    ]